@@ -0,0 +1,33 @@
+import mongoose from "mongoose";
+
+import { rebuildStaffStats } from "./src/utils/staffStats.js";
+
+// Recompute every staff member's stats rollup (User.stats) from their offers.
+//   node rebuild_staff_stats.js            repair drifted accounts
+//   node rebuild_staff_stats.js --verify   only report drift (exit code 2 if any)
+
+const MONGO_URI = process.env.MONGO_URI;
+if (!MONGO_URI) {
+    console.error("❌ Missing MONGO_URI env var");
+    process.exit(1);
+}
+
+const dryRun = process.argv.includes("--verify");
+
+async function main() {
+    await mongoose.connect(MONGO_URI);
+    console.log("✅ Connected to Mongo");
+
+    const result = await rebuildStaffStats({ dryRun });
+    console.log(`Checked ${result.checked} staff, ${result.drifted} drifted, ${result.fixed} fixed`);
+    if (result.sample.length) console.log("Drifted:", result.sample.join(", "));
+
+    await mongoose.disconnect();
+    if (dryRun && result.drifted) process.exit(2);
+}
+
+main().catch(async(e) => {
+    console.error("❌ Error:", e);
+    try { await mongoose.disconnect(); } catch {}
+    process.exit(1);
+});
@@ -11,6 +11,9 @@ import offerRoutes from "./src/routes/offers.js";
 import adminRoutes from "./src/routes/admin.js";
 import telegramRoutes from "./src/routes/telegram.js";
 import deviceTokenRoutes from "./src/routes/deviceToken.js";
+import User from "./src/models/User.js";
+import { rebuildStaffStats } from "./src/utils/staffStats.js";
+import { flushAudit } from "./src/utils/audit.js";
 
 const app = express();
 
@@ -33,5 +36,20 @@ mongoose
     .then(() => {
         const port = process.env.PORT || 4000;
         app.listen(port, "0.0.0.0", () => console.log(`Server running on ${port}`));
+
+        // staff search keys for accounts created before search was indexed
+        User.backfillSearchKeys()
+            .then((n) => n && console.log(`Indexed ${n} users for search`))
+            .catch((err) => console.error("Search key backfill failed:", err));
+
+        // stats rollup for staff accounts created before it existed (see utils/staffStats.js)
+        rebuildStaffStats({ missingOnly: true })
+            .then((r) => r.fixed && console.log(`Built stats for ${r.fixed} staff`))
+            .catch((err) => console.error("Staff stats backfill failed:", err));
     })
-    .catch((err) => console.error("MongoDB connection error:", err));
\ No newline at end of file
+    .catch((err) => console.error("MongoDB connection error:", err));
+
+// dyno restarts send SIGTERM: write buffered audit entries before exiting
+process.on("SIGTERM", () => {
+    flushAudit().finally(() => process.exit(0));
+});
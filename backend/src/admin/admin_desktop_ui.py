@@ -1,19 +1,38 @@
+import os
 import sys
 import csv
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
 
 from PySide6.QtWidgets import QLineEdit, QCompleter
 from PySide6.QtCore import Qt, QStringListModel
-from PySide6.QtCore import Qt, QTimer, QPoint
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QTimer, QPoint, QStandardPaths
+from PySide6.QtGui import QFont, QKeySequence, QShortcut
 from PySide6.QtWidgets import QComboBox, QCheckBox
 from PySide6.QtWidgets import (
     QApplication, QWidget,QSizePolicy, QMainWindow, QHBoxLayout, QVBoxLayout, QLabel,
-    QPushButton, QLineEdit, QStackedWidget, QListWidget, QListWidgetItem,
-    QFrame, QMessageBox, QGridLayout, QScrollArea, QTextEdit, QInputDialog, QFileDialog, QDialog, QTableWidget, QTableWidgetItem
+    QPushButton, QLineEdit, QStackedWidget, QAbstractItemView,
+    QFrame, QMessageBox, QGridLayout, QScrollArea, QTextEdit, QInputDialog, QFileDialog, QDialog, QTableWidget, QTableWidgetItem,
+    QProgressBar
 )
 
 from api_client import ApiClient
+from calendar_view import MONTH, WEEK, CalendarGrid, WindowCache, calendar_window, step
+from conflicts import ConflictIndex, conflict_text, fetch_bookings
+from dispatch import CONFLICT, DONE, FAILED, QUEUED, SENDING, SENT, SKIPPED, BulkDispatcher, DispatchItem, parse_dates
+from local_store import LocalStore
+from entity_store import EntityStore, follow
+from live_events import EventStream
+from list_models import ColumnCardDelegate, RecordListModel, RecordFilterProxy, RecordRole, card_list_view
+from records import (
+    NO_DAY, Offer, PayrollShift, PayrollTotal, Placement,
+    day_text, hours_text, minutes_hours, parse_day, parse_time, pence_text, shift_minutes, time_text,
+)
+from search_index import RankedIndex
+from workers import TaskRunner
+from paging import CursorPager
+from payroll_engine import PayrollEngine, ShiftColumns
+from startup import WarmupOrchestrator
 
 BASE_URL = "https://recruitment-apk-3b409a7f0460.herokuapp.com"
 
@@ -112,6 +131,52 @@ def make_search_row(placeholder: str):
 
     return row, search, clear_btn, timer
 
+def busy_bar(runner: TaskRunner):
+    """Thin indeterminate bar that is visible while the page's runner has work in flight."""
+    bar = QProgressBar()
+    bar.setRange(0, 0)
+    bar.setTextVisible(False)
+    bar.setFixedHeight(4)
+    bar.setStyleSheet("""
+        QProgressBar { background: transparent; border: none; border-radius: 2px; }
+        QProgressBar::chunk { background: #5B5CE5; border-radius: 2px; }
+    """)
+    bar.setVisible(runner.is_busy())
+    runner.busy_changed.connect(bar.setVisible)
+    return bar
+
+
+def staff_card(s: dict):
+    name = s.get("fullName") or s.get("username") or "Staff"
+    badge = "" if bool(s.get("isActive", True)) else "⛔ SUSPENDED"
+    subtitle = f"@{s.get('username', '')}"
+    if s.get("totalHoursWorked"):
+        subtitle += f" · {s['totalHoursWorked']:g} h worked"  # the server's stats rollup
+    return name, subtitle, badge
+
+
+# Staff list orderings over the stats rollup every roster row carries: label -> (key, descending)
+STAFF_SORTS = {
+    "Roster order": None,
+    "Most hours": (lambda s: float(s.get("totalHoursWorked") or 0), True),
+    "Latest job": (lambda s: s.get("lastJobAt") or "", True),
+}
+
+
+def staff_search(s: dict) -> str:
+    return f"{s.get('fullName') or s.get('username') or 'Staff'} {s.get('username', '')} {s.get('email', '')}"
+
+
+def offer_search_text(o: Offer) -> str:
+    """What the history search boxes match against (venue/date/status/time/rate)."""
+    p = o.placement
+    if p is None:
+        return o.status
+    return " ".join(v for v in (
+        p.venue, p.role, p.date_text, p.start_text, p.end_text, p.rate_text, o.status,
+    ) if v)
+
+
 class DropUpComboBox(QComboBox):
     def showPopup(self):
         super().showPopup()
@@ -140,11 +205,14 @@ class LoginPage(QWidget):
         super().__init__()
         self.api = api
         self.on_success = on_success
+        self.tasks = TaskRunner(self)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(36, 36, 36, 36)
         root.setSpacing(16)
 
+        root.addWidget(busy_bar(self.tasks))
+
         title = QLabel("Admin Login")
         title.setStyleSheet("font-size: 26px; font-weight: 900; color: #111;")
         root.addWidget(title)
@@ -170,37 +238,65 @@ class LoginPage(QWidget):
         if not u or not p:
             QMessageBox.warning(self, "Missing fields", "Enter username and password.")
             return
-        try:
-            data = self.api.login(u, p)
-            role = (data.get("user") or {}).get("role")
-            if role not in ("admin", "manager"):
-                QMessageBox.warning(self, "Access denied", "This portal is for admin/manager only.")
-                return
-            self.on_success()
-        except Exception as e:
-            QMessageBox.critical(self, "Login failed", str(e))
+        self.btn.setEnabled(False)
+        self.tasks.submit(
+            "login", self.api.login, u, p,
+            on_result=self._on_login,
+            on_error=lambda e: QMessageBox.critical(self, "Login failed", str(e)),
+            on_finished=lambda: self.btn.setEnabled(True),
+        )
+
+    def _on_login(self, data):
+        role = (data.get("user") or {}).get("role")
+        if role not in ("admin", "manager"):
+            QMessageBox.warning(self, "Access denied", "This portal is for admin/manager only.")
+            return
+        self.on_success()
 
 
 # ----------------- Dashboard Page -----------------
+# offer status -> dashboard counter it is counted in
+DASHBOARD_COUNTERS = {
+    "offered": "pendingOffers",
+    "user_accepted": "acceptedOffers",
+    "booking_confirmed": "acceptedOffers",
+    "completed": "completedOffers",
+}
+
+
+def dashboard_counts(data: dict) -> dict:
+    """The page's counters from GET /admin/dashboard (staffTotal + offersByStatus)."""
+    counts = {"totalStaff": data.get("staffTotal", 0)}
+    for status, n in (data.get("offersByStatus") or {}).items():
+        counter = DASHBOARD_COUNTERS.get(status)
+        if counter:
+            counts[counter] = counts.get(counter, 0) + n
+    return counts
+
+
 class DashboardPage(QWidget):
+    warmup = ("admin_dashboard",)
+
     def __init__(self, api: ApiClient):
         super().__init__()
         self.api = api
+        self.tasks = TaskRunner(self)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         root.addWidget(card_title("Dashboard"))
+        root.addWidget(busy_bar(self.tasks))
 
         self.stats_grid = QGridLayout()
         self.stats_grid.setHorizontalSpacing(16)
         self.stats_grid.setVerticalSpacing(10)
 
-        self.lbl_total_staff = value_label("0")
-        self.lbl_pending = value_label("0")
-        self.lbl_accepted = value_label("0")
-        self.lbl_completed = value_label("0")
+        self.lbl_total_staff = value_label("…")
+        self.lbl_pending = value_label("…")
+        self.lbl_accepted = value_label("…")
+        self.lbl_completed = value_label("…")
 
         self._stat_card(0, "Total Staff", self.lbl_total_staff)
         self._stat_card(1, "Pending Offers", self.lbl_pending)
@@ -219,8 +315,6 @@ class DashboardPage(QWidget):
 
         root.addStretch(1)
 
-        self.load()
-
     def _stat_card(self, col, label, value):
         card = QFrame()
         card.setStyleSheet("background: white; border-radius: 18px;")
@@ -235,14 +329,35 @@ class DashboardPage(QWidget):
         self.stats_grid.addWidget(card, 0, col)
 
     def load(self):
-        try:
-            data = self.api.admin_dashboard()
-            self.lbl_total_staff.setText(str(data.get("totalStaff", 0)))
-            self.lbl_pending.setText(str(data.get("pendingOffers", 0)))
-            self.lbl_accepted.setText(str(data.get("acceptedOffers", 0)))
-            self.lbl_completed.setText(str(data.get("completedOffers", 0)))
-        except Exception as e:
-            QMessageBox.critical(self, "Dashboard error", str(e))
+        self.tasks.submit(
+            "dashboard", self.api.admin_dashboard,
+            on_result=self._render,
+            on_error=lambda e: QMessageBox.critical(self, "Dashboard error", str(e)),
+        )
+
+    def apply_warmup(self, name, data):
+        self._render(data)
+
+    def _render(self, data):
+        self.counts = dashboard_counts(data or {})
+        self._show()
+
+    def _show(self):
+        self.lbl_total_staff.setText(str(self.counts.get("totalStaff", 0)))
+        self.lbl_pending.setText(str(self.counts.get("pendingOffers", 0)))
+        self.lbl_accepted.setText(str(self.counts.get("acceptedOffers", 0)))
+        self.lbl_completed.setText(str(self.counts.get("completedOffers", 0)))
+
+    def apply_status_change(self, before: str, after: str):
+        """A live offer event: move one offer between counters (before is "" for a new offer)."""
+        counts = getattr(self, "counts", None)
+        if counts is None:
+            return  # not loaded yet; the first load counts it
+        for status, step in ((before, -1), (after, 1)):
+            counter = DASHBOARD_COUNTERS.get(status)
+            if counter:
+                counts[counter] = max(0, counts.get(counter, 0) + step)
+        self._show()
 
 
 # ----------------- New User Page -----------------
@@ -250,12 +365,14 @@ class NewUserPage(QWidget):
     def __init__(self, api: ApiClient):
         super().__init__()
         self.api = api
+        self.tasks = TaskRunner(self)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         root.addWidget(card_title("Create New User"))
+        root.addWidget(busy_bar(self.tasks))
 
         form = QFrame()
         form.setStyleSheet("background: rgba(255,255,255,0.55); border-radius: 22px;")
@@ -306,27 +423,28 @@ class NewUserPage(QWidget):
             "password": self.password.text().strip(),
         }
 
-    def create_staff(self):
+    def _set_buttons_enabled(self, enabled: bool):
+        self.btn_create_staff.setEnabled(enabled)
+        self.btn_create_manager.setEnabled(enabled)
+
+    def _create(self, fn, done_text):
         payload = self._get_payload()
         if not payload["username"] or not payload["password"]:
             QMessageBox.warning(self, "Missing fields", "Username and password are required.")
             return
-        try:
-            self.api.create_staff(payload)
-            QMessageBox.information(self, "Success", "Staff created.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        self._set_buttons_enabled(False)
+        self.tasks.submit(
+            None, fn, payload,
+            on_result=lambda _: QMessageBox.information(self, "Success", done_text),
+            on_error=lambda e: QMessageBox.critical(self, "Error", str(e)),
+            on_finished=lambda: self._set_buttons_enabled(True),
+        )
+
+    def create_staff(self):
+        self._create(self.api.create_staff, "Staff created.")
 
     def create_manager(self):
-        payload = self._get_payload()
-        if not payload["username"] or not payload["password"]:
-            QMessageBox.warning(self, "Missing fields", "Username and password are required.")
-            return
-        try:
-            self.api.create_manager(payload)
-            QMessageBox.information(self, "Success", "Manager created.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        self._create(self.api.create_manager, "Manager created.")
 
 
 class OfferEditDialog(QDialog):
@@ -334,13 +452,13 @@ class OfferEditDialog(QDialog):
     Edit Placement details in a separate window.
     Returns patch dict via self.patch on accept.
     """
-    def __init__(self, parent=None, title="Edit Offer", placement=None):
+    def __init__(self, parent=None, title="Edit Offer", placement: Placement = None):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setMinimumWidth(520)
         self.patch = None
 
-        placement = placement or {}
+        placement = placement or Placement("")
 
         root = QVBoxLayout(self)
         root.setContentsMargins(18, 18, 18, 18)
@@ -372,18 +490,18 @@ class OfferEditDialog(QDialog):
         self.postcode = input_box("Postcode")
         self.notes = input_box("Notes")
 
-        # prefill (support both roleTitle + position)
-        self.venue.setText(str(placement.get("venue", "") or ""))
-        self.position.setText(str(placement.get("roleTitle") or placement.get("position") or ""))
-        self.date.setText(str(placement.get("date", ""))[:10])
-        self.start.setText(str(placement.get("startTime", "") or ""))
-        self.end.setText(str(placement.get("endTime", "") or ""))
-        self.rate.setText(str(placement.get("hourlyRate", "") or ""))
+        # prefill
+        self.venue.setText(placement.venue)
+        self.position.setText(placement.role)
+        self.date.setText(placement.date_text)
+        self.start.setText(placement.start_text)
+        self.end.setText(placement.end_text)
+        self.rate.setText(placement.rate_text if placement.rate else "")
 
-        self.address.setText(str(placement.get("addressLine", "") or ""))
-        self.city.setText(str(placement.get("city", "") or ""))
-        self.postcode.setText(str(placement.get("postcode", "") or ""))
-        self.notes.setText(str(placement.get("notes") or placement.get("note") or ""))
+        self.address.setText(placement.address)
+        self.city.setText(placement.city)
+        self.postcode.setText(placement.postcode)
+        self.notes.setText(placement.notes)
 
         # layout rows
         r = 0
@@ -421,18 +539,9 @@ class OfferEditDialog(QDialog):
         self.recalc_hours()
 
     def recalc_hours(self):
-        start = self.start.text().strip()
-        end = self.end.text().strip()
-        hrs = 0.0
-        try:
-            t1 = datetime.strptime(start, "%H:%M")
-            t2 = datetime.strptime(end, "%H:%M")
-            if t2 < t1:
-                t2 = t2 + timedelta(days=1)
-            hrs = (t2 - t1).total_seconds() / 3600.0
-        except Exception:
-            hrs = 0.0
-        self.hours.setText(str(round(hrs, 2)))
+        # an end before the start runs past midnight
+        minutes = shift_minutes(parse_time(self.start.text()), parse_time(self.end.text()))
+        self.hours.setText(hours_text(minutes_hours(minutes)))
 
     def on_save(self):
         venue = self.venue.text().strip()
@@ -477,45 +586,26 @@ class OfferEditDialog(QDialog):
 
 
 class PendingApprovalsPage(QWidget):
-    def __init__(self, api: ApiClient):
+    warmup = ("pending_offers",)
+
+    def __init__(self, api: ApiClient, entities: EntityStore):
         super().__init__()
         self.api = api
+        self.entities = entities
+        self.tasks = TaskRunner(self)
         self.selected_offer_id = None
-        self.offers = []
+        self.model = RecordListModel(self._card, parent=self)
+        follow(self.model, entities, "offers")
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         root.addWidget(card_title("Pending Approvals"))
+        root.addWidget(busy_bar(self.tasks))
 
-        self.list = QListWidget()
-        self.list.setStyleSheet("""
-    QListWidget {
-        background: rgba(255,255,255,0.55);
-        border: none;
-        border-radius: 18px;
-        padding: 8px;
-        selection-background-color: transparent;
-        selection-color: #000;
-        outline: 0px;
-    }
-    QListWidget::item {
-        background: white;
-        margin: 6px;
-        padding: 14px;
-        border-radius: 14px;
-        font-weight: 700;
-    }
-    QListWidget::item:selected {
-        background: white;
-        border: 2px solid #5B5CE5;
-    }
-    QListWidget::item:selected:!active {
-        background: white;
-        border: 2px solid #5B5CE5;
-    }""")
-        self.list.itemClicked.connect(self.pick_offer)
+        self.list = card_list_view(self.model)
+        self.list.clicked.connect(self.pick_offer)
         root.addWidget(self.list, stretch=1)
 
         btns = QHBoxLayout()
@@ -538,125 +628,137 @@ class PendingApprovalsPage(QWidget):
 
         root.addLayout(btns)
 
-        self.load()
+        self.model.show_skeleton()
+
+    def apply_warmup(self, name, data):
+        self._render(data)
 
     def edit_offer(self):
         if not self.selected_offer_id:
             QMessageBox.warning(self, "Pick offer", "Select an offer first.")
             return
 
-        offer = next((o for o in self.offers if str(o.get("_id")) == str(self.selected_offer_id)), None)
+        offer = self.entities.offer(self.selected_offer_id)
         if not offer:
             QMessageBox.warning(self, "Not found", "Offer not found.")
             return
 
-        placement = offer.get("placementId") or {}
-        if not isinstance(placement, dict):
+        if offer.placement is None:
             QMessageBox.warning(self, "Not loaded", "Placement details not loaded. Click Refresh.")
             return
 
-        dlg = OfferEditDialog(self, title="Edit Pending Offer", placement=placement)
+        dlg = OfferEditDialog(self, title="Edit Pending Offer", placement=offer.placement)
         if dlg.exec() == QDialog.Accepted and dlg.patch:
-            try:
-                self.api.admin_edit_offer(self.selected_offer_id, dlg.patch)
-                QMessageBox.information(self, "Saved", "Offer updated ✅")
-                self.load()
-            except Exception as e:
-                QMessageBox.critical(self, "Edit error", str(e))
+            self.tasks.submit(
+                None, self.api.admin_edit_offer, self.selected_offer_id, dlg.patch,
+                on_result=self._after_edit,
+                on_error=lambda e: QMessageBox.critical(self, "Edit error", str(e)),
+            )
 
     def load(self):
-        try:
-            self.selected_offer_id = None
-            self.list.clear()
-
-            self.offers = self.api.pending_offers()
-            for o in self.offers:
-                user = o.get("userId") or {}
-                placement = o.get("placementId") or {}
-
-                username = user.get("username", "staff")
-                venue = placement.get("venue", "")
-                date = placement.get("date", "")
-                start = placement.get("startTime", "")
-                end = placement.get("endTime", "")
-                rate = placement.get("hourlyRate", "")
-
-                item = QListWidgetItem(
-                    f"@{username}\n{venue} | {date} | {start}-{end} | £{rate}/hr"
-                )
-                item.setData(Qt.UserRole, str(o.get("_id")))
-                self.list.addItem(item)
+        self.selected_offer_id = None
+        self.tasks.submit(
+            "pending", self.api.pending_offers,
+            on_result=self._render,
+            on_error=lambda e: QMessageBox.critical(self, "Pending load error", str(e)),
+        )
 
-        except Exception as e:
-            QMessageBox.critical(self, "Pending load error", str(e))
+    def _render(self, offers):
+        self.selected_offer_id = None
+        self.model.set_records(self.entities.upsert("offers", offers))
+
+    def apply_offer(self, offer: Offer):
+        """A live offer event: add a newly accepted offer on top, drop one that left user_accepted."""
+        row = self.model.row_of(offer.id)
+        pending = offer.status == "user_accepted"
+        if pending and row < 0:
+            self.model.set_records([offer] + self.model.records())
+        elif not pending and row >= 0:
+            self.model.set_records([o for o in self.model.records() if o.id != offer.id])
+            if self.selected_offer_id == offer.id:
+                self.selected_offer_id = None
+
+    @staticmethod
+    def _card(o: Offer):
+        p = o.placement or Placement("")
+        return (
+            f"@{o.username or 'staff'}",
+            f"{p.venue} | {p.date_text} | {p.start_text}-{p.end_text} | £{p.rate_text}/hr",
+            "",
+        )
+
+    def pick_offer(self, index):
+        offer = index.data(RecordRole)
+        self.selected_offer_id = offer.id if offer else None
+
+    def _after_mutation(self, title, text):
+        QMessageBox.information(self, title, text)
+        self.load()
+
+    def _after_edit(self, data):
+        offer = (data or {}).get("offer")
+        if not isinstance(offer, dict):
+            self._after_mutation("Saved", "Offer updated ✅")  # a server without it: reload
+            return
+        # the store patches every page showing the offer
+        self.entities.upsert("offers", [offer])
+        QMessageBox.information(self, "Saved", "Offer updated ✅")
 
-    def pick_offer(self, item: QListWidgetItem):
-        self.selected_offer_id = item.data(Qt.UserRole)
+    def _set_decision_enabled(self, enabled: bool):
+        self.btn_approve.setEnabled(enabled)
+        self.btn_reject.setEnabled(enabled)
 
     def decide(self, decision: str):
         if not self.selected_offer_id:
             QMessageBox.warning(self, "Pick offer", "Select a pending offer first.")
             return
-        try:
-            self.api.offer_decision(self.selected_offer_id, decision)
-            QMessageBox.information(self, "Done", f"{decision.title()} successful.")
-            self.load()
-        except Exception as e:
-            QMessageBox.critical(self, "Decision error", str(e))
+        self._set_decision_enabled(False)
+        self.tasks.submit(
+            None, self.api.offer_decision, self.selected_offer_id, decision,
+            on_result=lambda _: self._after_mutation("Done", f"{decision.title()} successful."),
+            on_error=lambda e: QMessageBox.critical(self, "Decision error", str(e)),
+            on_finished=lambda: self._set_decision_enabled(True),
+        )
 
 
 # ----------------- Schedule List Page (with Search) -----------------
 class ScheduleListPage(QWidget):
-    def __init__(self, api: ApiClient, on_pick_staff):
+    warmup = ("admin_staff",)
+
+    def __init__(self, api: ApiClient, entities: EntityStore, on_pick_staff):
         super().__init__()
         self.api = api
+        self.entities = entities
         self.on_pick_staff = on_pick_staff
+        self.tasks = TaskRunner(self)
 
-        self.all_staff = []
-        self.filtered_staff = []
+        self.model = RecordListModel(staff_card, staff_search, self, index_type=RankedIndex)
+        self.proxy = RecordFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        follow(self.model, entities, "staff")
+        entities.reloaded.connect(self._on_reloaded)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         root.addWidget(card_title("Staff List"))
+        root.addWidget(busy_bar(self.tasks))
 
         # ✅ Search row
         search_row, self.search_input, self.btn_clear_search, self._search_timer = make_search_row(
-            "Search staff (name or username)…"
+            "Search staff (name, username or email)…"
         )
+        self.sort_box = QComboBox()
+        self.sort_box.addItems(list(STAFF_SORTS))
+        self.sort_box.currentTextChanged.connect(lambda *_: self._on_reloaded("staff"))
+        search_row.addWidget(self.sort_box)
         root.addLayout(search_row)
-        self._search_timer.timeout.connect(self.apply_search)
-        self.search_input.textChanged.connect(lambda: self._search_timer.start(250))
+        # ranked index lookups are cheap enough to run on every keystroke
+        self.search_input.textChanged.connect(self.apply_search)
 
-        self.list = QListWidget()
-        self.list.setStyleSheet("""
-    QListWidget {
-        background: rgba(255,255,255,0.55);
-        border: none;
-        border-radius: 18px;
-        padding: 8px;
-        selection-background-color: transparent;
-        selection-color: #000;
-        outline: 0px;
-    }
-    QListWidget::item {
-        background: white;
-        margin: 6px;
-        padding: 14px;
-        border-radius: 14px;
-        font-weight: 700;
-    }
-    QListWidget::item:selected {
-        background: white;
-        border: 2px solid #5B5CE5;
-    }
-    QListWidget::item:selected:!active {
-        background: white;
-        border: 2px solid #5B5CE5;
-    }
-        """)
-        self.list.itemClicked.connect(self.pick)
+        self.list = card_list_view(self.proxy)
+        self.list.clicked.connect(self.pick)
         root.addWidget(self.list, stretch=1)
 
         btns = QHBoxLayout()
@@ -666,62 +768,331 @@ class ScheduleListPage(QWidget):
         btns.addStretch(1)
         root.addLayout(btns)
 
-        self.load()
+        self.model.show_skeleton()
+
+    def apply_warmup(self, name, data):
+        self.set_staff_list(data)
 
     def load(self):
-        try:
-            self.list.clear()
-            self.all_staff = self.api.admin_staff() or []
-            self.apply_search()  # render with current search
-        except Exception as e:
-            QMessageBox.critical(self, "Load staff error", str(e))
+        self.tasks.submit(
+            "staff", self.api.admin_staff,
+            on_result=self.set_staff_list,
+            on_error=lambda e: QMessageBox.critical(self, "Load staff error", str(e)),
+        )
+
+    def set_staff_list(self, staff):
+        # every staff list shares the store's records; _on_reloaded repaints them
+        self.entities.replace("staff", staff)
+        if not self.model.records():
+            self._on_reloaded("staff")
+
+    def _on_reloaded(self, kind):
+        if kind != "staff":
+            return
+        staff = self.entities.all("staff")
+        order = STAFF_SORTS.get(self.sort_box.currentText())
+        if order is not None:
+            staff.sort(key=order[0], reverse=order[1])
+        self.model.set_records(staff)
+        # build the search index once the list is painted, not on the first keystroke
+        QTimer.singleShot(0, lambda: self.model.search_index().warm())
 
     def apply_search(self):
-        q = (self.search_input.text() or "").strip().lower()
-        if not q:
-            self.filtered_staff = self.all_staff[:]
-        else:
-            out = []
-            for s in self.all_staff:
-                name = (s.get("fullName") or s.get("username") or "Staff")
-                username = (s.get("username") or "")
-                hay = f"{name} {username}".lower()
-                if q in hay:
-                    out.append(s)
-            self.filtered_staff = out
-
-        self.render()
-
-    def render(self):
-        self.list.clear()
-        for s in self.filtered_staff:
-            name = s.get("fullName") or s.get("username") or "Staff"
-            active = bool(s.get("isActive", True))
-            badge = "" if active else "\n⛔ SUSPENDED"
-            item = QListWidgetItem(f"{name}\n@{s.get('username','')}{badge}")
-            item.setData(Qt.UserRole, (str(s.get("_id")), name))
-            self.list.addItem(item)
-
-    def pick(self, item: QListWidgetItem):
-        staff_id, staff_name = item.data(Qt.UserRole)
+        self.proxy.set_query(self.search_input.text())
+
+    def pick(self, index):
+        s = index.data(RecordRole) or {}
+        staff_id, staff_name = str(s.get("_id")), staff_card(s)[0]
         if self.on_pick_staff:
             self.on_pick_staff(staff_id, staff_name)
 
+def dispatch_card(item: DispatchItem):
+    badge = {
+        SENDING: "Sending…", SENT: "✅ Sent", CONFLICT: "⚠ Conflict", FAILED: "❌ Failed", SKIPPED: "Skipped",
+    }.get(item.state, "Queued")
+    if item.state == CONFLICT and item.conflicts:
+        detail = "; ".join(
+            f"{c.get('venue', '')} {c.get('startTime', '')}-{c.get('endTime', '')} ({c.get('status', '')})"
+            for c in item.conflicts
+        )
+    else:
+        detail = item.message
+    return item.staff_name, f"{item.date} | {detail}" if detail else item.date, badge
+
+
+class BulkSendDialog(QDialog):
+    """
+    Send one placement template to many staff on many dates (dispatch.BulkDispatcher).
+
+    Click staff to pick them, list the dates (ranges like 2026-01-05..2026-01-09) and Send.
+    Every offer shows its own progress; the ones that clash with existing bookings gather
+    in the conflict list, to be forced or skipped together.
+    """
+    PRECHECK_DAYS = 92  # longest date span checked for clashes before sending
+
+    def __init__(self, api: ApiClient, entities: EntityStore, placement: dict, staff_ids=(),
+                 conflicts: ConflictIndex = None, parent=None):
+        super().__init__(parent)
+        self.api = api
+        self.entities = entities
+        self.placement = placement
+        self.conflict_index = conflicts if conflicts is not None else ConflictIndex()
+        self.tasks = TaskRunner(self)
+        self.picked = {str(s) for s in staff_ids if s}
+        self.sent_staff = set()
+        self.dispatcher = None
+
+        self.setWindowTitle("Bulk send")
+        self.setMinimumSize(760, 640)
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(18, 18, 18, 18)
+        root.setSpacing(10)
+
+        header = QLabel("Bulk send")
+        header.setStyleSheet("font-size: 18px; font-weight: 900;")
+        root.addWidget(header)
+        root.addWidget(value_label(
+            f"{placement.get('venue', '')} · {placement.get('roleTitle', '')} · "
+            f"{placement.get('startTime', '')}-{placement.get('endTime', '')} · £{placement.get('hourlyRate', 0)}"
+        ))
+        root.addWidget(busy_bar(self.tasks))
+
+        # ---------- what to send ----------
+        self.staff_model = RecordListModel(self._staff_card, staff_search, self, index_type=RankedIndex)
+        self.staff_proxy = RecordFilterProxy(self)
+        self.staff_proxy.setSourceModel(self.staff_model)
+        self.staff_search = input_box("Search staff…")
+        self.staff_search.textChanged.connect(self.staff_proxy.set_query)
+        self.staff_list = card_list_view(self.staff_proxy)
+        self.staff_list.setMinimumHeight(240)
+        self.staff_list.clicked.connect(self._toggle_staff)
+
+        self.dates = input_box("2026-01-05, 2026-01-10..2026-01-14")
+        self.dates.setText(placement.get("date", ""))
+        self.dates.textChanged.connect(self._update_summary)
+        self.lbl_summary = QLabel("")
+
+        pick = QGridLayout()
+        pick.addWidget(section_label("Staff"), 0, 0)
+        pick.addWidget(self.staff_search, 0, 1)
+        pick.addWidget(self.staff_list, 1, 0, 1, 2)
+        pick.addWidget(section_label("Dates"), 2, 0)
+        pick.addWidget(self.dates, 2, 1)
+        pick.addWidget(self.lbl_summary, 3, 1)
+        root.addLayout(pick, stretch=1)
+
+        btns = QHBoxLayout()
+        self.btn_send = primary_btn("Send")
+        self.btn_close = ghost_btn("Close")
+        self.btn_send.clicked.connect(self.send)
+        self.btn_close.clicked.connect(self.reject)
+        btns.addStretch(1)
+        btns.addWidget(self.btn_close)
+        btns.addWidget(self.btn_send)
+        root.addLayout(btns)
+
+        # ---------- progress ----------
+        self.progress = QProgressBar()
+        self.progress.setVisible(False)
+        self.lbl_progress = QLabel("")
+        root.addWidget(self.progress)
+        root.addWidget(self.lbl_progress)
+
+        self.results_model = RecordListModel(dispatch_card, parent=self)
+        self.results = card_list_view(self.results_model)
+        self.results.setVisible(False)
+        root.addWidget(self.results, stretch=1)
+
+        # ---------- conflict review ----------
+        # rows are dispatcher rows, so a selection maps straight back to items
+        self.conflict_model = RecordListModel(lambda row: dispatch_card(self.dispatcher.items[row]), parent=self)
+        self.conflicts = card_list_view(self.conflict_model)
+        self.conflicts.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.btn_force_selected = ghost_btn("Force selected")
+        self.btn_force_all = primary_btn("Force all")
+        self.btn_skip_all = ghost_btn("Skip all")
+        self.btn_retry = ghost_btn("Retry failed")
+        self.btn_force_selected.clicked.connect(lambda: self.dispatcher.force(self._selected_conflicts()))
+        self.btn_force_all.clicked.connect(lambda: self.dispatcher.force(self.dispatcher.rows(CONFLICT)))
+        self.btn_skip_all.clicked.connect(lambda: self.dispatcher.skip(self.dispatcher.rows(CONFLICT)))
+        self.btn_retry.clicked.connect(lambda: self.dispatcher.retry(self.dispatcher.rows(FAILED)))
+
+        self.review = QFrame()
+        review = QVBoxLayout(self.review)
+        review.setContentsMargins(0, 0, 0, 0)
+        review.addWidget(section_label("Conflicts"))
+        review.addWidget(self.conflicts)
+        review_btns = QHBoxLayout()
+        review_btns.addWidget(self.btn_force_selected)
+        review_btns.addWidget(self.btn_skip_all)
+        review_btns.addWidget(self.btn_retry)
+        review_btns.addStretch(1)
+        review_btns.addWidget(self.btn_force_all)
+        review.addLayout(review_btns)
+        self.review.setVisible(False)
+        root.addWidget(self.review, stretch=1)
+
+        # item changes arrive a row at a time; totals and the conflict list follow once per batch
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._refresh)
+
+        staff = self.entities.all("staff")
+        if staff:
+            self._set_staff(staff)
+        else:
+            self.staff_model.show_skeleton()
+            self.tasks.submit(
+                "staff", self.api.admin_staff,
+                on_result=lambda data: self._set_staff(self.entities.replace("staff", data)),
+                on_error=lambda e: QMessageBox.critical(self, "Load staff error", str(e)),
+            )
+        self._update_summary()
+
+    # ---------- picking ----------
+    def _staff_card(self, s: dict):
+        name, username, badge = staff_card(s)
+        return name, username, "✓ Picked" if str(s.get("_id")) in self.picked else badge
+
+    def _set_staff(self, staff):
+        self.staff_model.set_records([s for s in staff or [] if s.get("isActive", True) is not False])
+
+    def _toggle_staff(self, index):
+        if self.dispatcher is not None:
+            return
+        s = index.data(RecordRole) or {}
+        staff_id = str(s.get("_id"))
+        self.picked.symmetric_difference_update({staff_id})
+        row = self.staff_model.row_of(staff_id)
+        if row >= 0:
+            self.staff_model.update_record(row, s)
+        self._update_summary()
+
+    def _dates(self):
+        try:
+            return parse_dates(self.dates.text())
+        except ValueError:
+            return []
+
+    def _update_summary(self):
+        dates = self._dates()
+        staff = len(self.picked)
+        text = f"{staff} staff × {len(dates)} dates = {staff * len(dates)} offers"
+        clashes = self._precheck(dates)
+        if clashes:
+            text += f" · ⚠ {clashes} would clash with existing bookings"
+        self.lbl_summary.setText(text)
+
+    def _precheck(self, dates) -> int:
+        """Offers of the batch the conflict index expects the server to report (0 until loaded)."""
+        if self.dispatcher is not None or not dates or not self.picked:
+            return 0
+        days = [parse_day(d) for d in dates]
+        start, end = parse_time(self.placement.get("startTime")), parse_time(self.placement.get("endTime"))
+        if start < 0 or end < 0 or days[-1] - days[0] > self.PRECHECK_DAYS:
+            return 0
+        if not all(self.conflict_index.covers(day) for day in days):
+            self.tasks.submit(
+                "conflicts", fetch_bookings, self.api.admin_calendar, days[0] - 1, days[-1] + 1,
+                on_result=self._on_bookings,
+                on_error=lambda _e: None,  # the server still checks every item
+            )
+            return 0
+        items = [(staff_id, day) for staff_id in sorted(self.picked) for day in days]
+        return sum(1 for found in self.conflict_index.check_batch(items, start, end) if found)
+
+    def _on_bookings(self, loaded):
+        self.conflict_index.load(*loaded)
+        self._update_summary()
+
+    # ---------- sending ----------
+    def send(self):
+        try:
+            dates = parse_dates(self.dates.text())
+        except ValueError as e:
+            QMessageBox.warning(self, "Dates", str(e))
+            return
+        names = {str(s.get("_id")): staff_card(s)[0] for s in self.staff_model.records()}
+        staff = [staff_id for staff_id in names if staff_id in self.picked]
+        if not staff or not dates:
+            QMessageBox.warning(self, "Nothing to send", "Pick at least one staff member and one date.")
+            return
+
+        items = [DispatchItem(staff_id, names[staff_id], day) for staff_id in staff for day in dates]
+        self.dispatcher = BulkDispatcher(self.api.send_offers_batch, self.placement, items, parent=self)
+        self.dispatcher.item_changed.connect(self._on_item_changed)
+        self.dispatcher.finished.connect(self._refresh)
+
+        # the picks are fixed now: give the room to progress and conflicts
+        self.btn_send.setEnabled(False)
+        self.staff_search.setEnabled(False)
+        self.staff_list.setVisible(False)
+        self.dates.setEnabled(False)
+        self.progress.setRange(0, len(items))
+        self.progress.setVisible(True)
+        self.results_model.set_records(items)
+        self.results.setVisible(True)
+        self.dispatcher.start()
+
+    def _on_item_changed(self, row):
+        item = self.dispatcher.items[row]
+        self.results_model.update_record(row, item)
+        if item.state == SENT:
+            self.sent_staff.add(item.staff_id)
+        self._refresh_timer.start(0)
+
+    def _refresh(self):
+        counts = self.dispatcher.counts()
+        self.progress.setValue(sum(counts[state] for state in DONE))
+        self.lbl_progress.setText(
+            f"Sent {counts[SENT]} · conflicts {counts[CONFLICT]} · failed {counts[FAILED]} · "
+            f"skipped {counts[SKIPPED]} · waiting {counts[QUEUED] + counts[SENDING]}"
+        )
+        conflicts = self.dispatcher.rows(CONFLICT)
+        if conflicts != self.conflict_model.records():
+            self.conflict_model.set_records(conflicts)
+        self.review.setVisible(bool(conflicts or counts[FAILED]))
+        for btn in (self.btn_force_selected, self.btn_force_all, self.btn_skip_all):
+            btn.setEnabled(bool(conflicts))
+        self.btn_retry.setEnabled(bool(counts[FAILED]))
+
+    def _selected_conflicts(self):
+        return sorted({self.conflict_model.record(i.row()) for i in self.conflicts.selectionModel().selectedRows()})
+
+    def reject(self):
+        # offers already sent stay sent; only what has not left yet is dropped
+        if self.dispatcher is not None:
+            self.dispatcher.cancel()
+        super().reject()
+
 
-# ----------------- Schedule Detail Page (history Search added) -----------------
 class ScheduleDetailPage(QWidget):
-    def __init__(self, api: ApiClient):
+    cancel_on_leave = True
+    warmup = ("venues_list",)
+
+    def __init__(self, api: ApiClient, entities: EntityStore):
         super().__init__()
         self.api = api
+        self.entities = entities
+        self.tasks = TaskRunner(self)
         self.staff_id = None
         self.staff_name = ""
         self.offer_id = None
-        self.offers_cache = []
-        self.filtered_offers = []
+        self.history_model = RecordListModel(self._history_card, offer_search_text, self)  # rows loaded so far
+        self.history_proxy = RecordFilterProxy(self)
+        self.history_proxy.setSourceModel(self.history_model)
+        follow(self.history_model, entities, "offers")
         self.selected_offer = None
 
-        # venue templates cache
-        self.venues_cache = []  # list of dicts {name,address,note}
+        self.history_pager = CursorPager(self.tasks, self.api.admin_offers_by_staff_page, key="history", parent=self)
+        self.history_pager.page_loaded.connect(self._add_history_page)
+        self.history_pager.failed.connect(lambda e: QMessageBox.critical(self, "History error", str(e)))
+
+        # venue templates by lower-cased name (records live in the entity store)
+        self._venues_by_name = {}
+        entities.reloaded.connect(self._on_entities_changed)
+        entities.changed.connect(self._on_entities_changed)
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
@@ -730,6 +1101,8 @@ class ScheduleDetailPage(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         outer.addWidget(scroll)
+        # history grows the page, so more rows load as the page scrolls to the bottom
+        self.history_pager.watch(scroll.verticalScrollBar())
 
         content = QWidget()
         scroll.setWidget(content)
@@ -741,6 +1114,7 @@ class ScheduleDetailPage(QWidget):
 
         self.title = card_title("Schedule")
         root.addWidget(self.title)
+        root.addWidget(busy_bar(self.tasks))
 
         # ---------- top row ----------
         top_row = QHBoxLayout()
@@ -829,15 +1203,30 @@ class ScheduleDetailPage(QWidget):
         gl.addWidget(section_label("Address"), r, 0); gl.addWidget(self.address, r, 1); r += 1
         gl.addWidget(section_label("Note"), r, 0); gl.addWidget(self.note, r, 1); r += 1
 
+        # live clash check against the staff member's bookings while the shift is typed
+        self.lbl_conflict = QLabel("")
+        self.lbl_conflict.setWordWrap(True)
+        gl.addWidget(self.lbl_conflict, r, 1); r += 1
+
         root.addWidget(form)
 
+        self.conflict_index = ConflictIndex()
+        self._conflict_timer = QTimer(self)
+        self._conflict_timer.setSingleShot(True)
+        self._conflict_timer.timeout.connect(self.check_conflicts)
+        for box in (self.date, self.start, self.end):
+            box.textChanged.connect(lambda: self._conflict_timer.start(250))
+
         # ---------- buttons ----------
         btns = QHBoxLayout()
         self.btn_send = primary_btn("Send Offer")
         self.btn_save = ghost_btn("Save Offer")
+        self.btn_bulk = ghost_btn("Bulk send…")
         self.btn_send.clicked.connect(self.send_offer)
         self.btn_save.clicked.connect(self.save_offer)
+        self.btn_bulk.clicked.connect(self.bulk_send)
         btns.addWidget(self.btn_send)
+        btns.addWidget(self.btn_bulk)
         btns.addWidget(self.btn_save)
         btns.addStretch(1)
         root.addLayout(btns)
@@ -850,37 +1239,16 @@ class ScheduleDetailPage(QWidget):
         )
         root.addLayout(search_row)
         self._history_search_timer.timeout.connect(self.apply_history_search)
+        # filter the loaded rows instantly; the debounced reload fetches the rest from the server
+        self.history_search.textChanged.connect(self.history_proxy.set_query)
         self.history_search.textChanged.connect(lambda: self._history_search_timer.start(250))
 
-        self.history = QListWidget()
+        self.history = card_list_view(self.history_proxy)
         self.history.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.history.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.history.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.history.setMinimumHeight(260)
-        self.history.setStyleSheet("""
-            QListWidget {
-                background: rgba(255,255,255,0.55);
-                border: none;
-                border-radius: 18px;
-                padding: 8px;
-                selection-background-color: transparent;
-                selection-color: #000;
-                outline: 0px;
-            }
-            QListWidget::item {
-                background: white;
-                margin: 6px;
-                padding: 14px;
-                border-radius: 14px;
-                font-weight: 700;
-            }
-            QListWidget::item:selected {
-                background: white;
-                border: 2px solid #5B5CE5;
-            }
-        """)
         form.setMaximumHeight(450)  # try 380–450
-        self.history.itemClicked.connect(self.pick_offer)
+        self.history.clicked.connect(self.pick_offer)
         self.history.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         root.addWidget(self.history)
@@ -900,8 +1268,9 @@ class ScheduleDetailPage(QWidget):
         actions.addStretch(1)
         root.addLayout(actions)
 
-        # initial load for suggestions/templates
-        self.reload_venues_dropdown()
+    def apply_warmup(self, name, data):
+        # initial suggestions/templates
+        self._set_venues(data)
 
     def set_staff(self, staff_id, staff_name):
         self.staff_id = staff_id
@@ -909,26 +1278,39 @@ class ScheduleDetailPage(QWidget):
         self.lbl_staff.setText(f"{staff_name}  (ID: {staff_id})")
         self.load_history()
         self.reload_venues_dropdown()
+        self.check_conflicts()
 
     # -------- venue templates -> suggestions ----------
     def reload_venues_dropdown(self):
-        try:
-            self.venues_cache = self.api.venues_list() or []
-        except Exception:
-            self.venues_cache = []
+        self.tasks.submit(
+            "venues", self.api.venues_list,
+            on_result=self._set_venues,
+            on_error=lambda _e: None,  # keep the venues we already have
+        )
 
-        names = [v.get("name", "").strip() for v in self.venues_cache if v.get("name")]
-        self._venue_names = names
+    def _set_venues(self, venues):
+        self.entities.replace("venues", venues or [])
+        if not self._venues_by_name:
+            self._on_entities_changed("venues")
+
+    def _on_entities_changed(self, kind, ids=None):
+        if kind == "offers" and ids:
+            # a cancelled or moved booking stops (or starts) clashing
+            self.conflict_index.update(self.entities.offers(ids))
+            self._conflict_timer.start(250)
+        if kind != "venues":
+            return
+        venues = self.entities.all("venues")
+        self._venues_by_name = {
+            (v.get("name", "") or "").strip().lower(): v for v in venues if v.get("name")
+        }
+        self._venue_names = [v.get("name", "").strip() for v in venues if v.get("name")]
         self._venue_model.setStringList(self._venue_names)
 
     def _find_venue_by_name(self, name: str):
         if not name:
             return None
-        target = name.strip().lower()
-        for v in self.venues_cache:
-            if (v.get("name", "") or "").strip().lower() == target:
-                return v
-        return None
+        return self._venues_by_name.get(name.strip().lower())
 
     def _on_quick_text_selected(self, name: str):
         name = (name or "").strip()
@@ -989,48 +1371,97 @@ class ScheduleDetailPage(QWidget):
             QMessageBox.warning(self, "Missing fields", "Venue, Position and Date are required.")
             return
 
-        try:
-            self.api.send_offer(self.staff_id, placement, force=False)
-            QMessageBox.information(self, "Sent", "Offer sent.")
+        self._submit_send(self.staff_id, placement, force=False)
+
+    def bulk_send(self):
+        placement = self._placement_payload()
+        if not placement["venue"] or not placement["position"]:
+            QMessageBox.warning(self, "Missing fields", "Venue and Position are required.")
+            return
+
+        dlg = BulkSendDialog(self.api, self.entities, placement, [self.staff_id], self.conflict_index, self)
+        dlg.exec()
+        if dlg.sent_staff:
+            self.conflict_index.clear()
+        if self.staff_id in dlg.sent_staff:
+            self.load_history()
+            self.check_conflicts()
+
+    def _submit_send(self, staff_id, placement, force: bool):
+        self.btn_send.setEnabled(False)
+        self.tasks.submit(
+            None, self.api.send_offer, staff_id, placement, force=force,
+            on_result=lambda _: self._on_sent(staff_id, force),
+            on_error=lambda e: self._on_send_error(e, staff_id, placement, force),
+            on_finished=lambda: self.btn_send.setEnabled(True),
+        )
+
+    def _on_sent(self, staff_id, forced: bool):
+        QMessageBox.information(self, "Sent", "Offer sent (forced)." if forced else "Offer sent.")
+        # the new booking is not in the index yet
+        self.conflict_index.clear()
+        if staff_id == self.staff_id:
             self.load_history()
+            self.check_conflicts()
+
+    # ---------------- Conflicts ----------------
+    def check_conflicts(self):
+        """Flag overlaps with the staff member's bookings; loads the week around the date once."""
+        day = parse_day(self.date.text().strip())
+        start, end = parse_time(self.start.text()), parse_time(self.end.text())
+        if not self.staff_id or day == NO_DAY or start < 0 or end < 0:
+            self.lbl_conflict.setText("")
+            return
+        if not self.conflict_index.covers(day):
+            self.lbl_conflict.setText("Checking for clashes…")
+            self.lbl_conflict.setStyleSheet("color: #777;")
+            self.tasks.submit(
+                "conflicts", fetch_bookings, self.api.admin_calendar, day - 3, day + 3,
+                on_result=self._on_bookings,
+                on_error=lambda _e: self.lbl_conflict.setText(""),  # the server still checks on send
+            )
             return
-        
-        except Exception as e:
-            status = None
-            data = None
-            msg = str(e)
-
-            # Try to extract HTTP status + JSON from requests HTTPError
-            r = getattr(e, "response", None)
-            if r is not None:
-                status = r.status_code
-                try:
-                    data = r.json()
-                except Exception:
-                    data = None
-
-              # ✅ Conflict detection
-            if status == 409 and isinstance(data, dict) and data.get("code") == "CONFLICT":
-                ok = QMessageBox.question(
-                    self,
-                    "Conflict detected",
-                    "This staff already has a booking that overlaps this time.\n\nSend offer anyway?",
-                    QMessageBox.Yes | QMessageBox.No,
-                )
-                if ok == QMessageBox.Yes:
-                    try:
-                        self.api.send_offer(self.staff_id, placement, force=True)
-                        QMessageBox.information(self, "Sent", "Offer sent (forced).")
-                        self.load_history()
-                        return
-                    except Exception as e2:
-                        QMessageBox.critical(self, "Send failed", str(e2))
-                        return
-                else:
-                # ✅ If admin clicks NO, just stop quietly (no error popup)
-                     return
-
-            QMessageBox.critical(self, "Send failed", msg)
+
+        clashes = self.conflict_index.conflicts(self.staff_id, day, start, end)
+        if clashes:
+            self.lbl_conflict.setText(f"⚠ Overlaps {conflict_text(clashes)}")
+            self.lbl_conflict.setStyleSheet("color: #C62828; font-weight: 700;")
+        else:
+            self.lbl_conflict.setText("✓ No clashing bookings")
+            self.lbl_conflict.setStyleSheet("color: #16A34A;")
+
+    def _on_bookings(self, loaded):
+        self.conflict_index.load(*loaded)
+        self.check_conflicts()
+
+    def _on_send_error(self, e, staff_id, placement, forced: bool):
+        status = None
+        data = None
+        msg = str(e)
+
+        # Try to extract HTTP status + JSON from requests HTTPError
+        r = getattr(e, "response", None)
+        if r is not None:
+            status = r.status_code
+            try:
+                data = r.json()
+            except Exception:
+                data = None
+
+        # ✅ Conflict detection
+        if not forced and status == 409 and isinstance(data, dict) and data.get("code") == "CONFLICT":
+            ok = QMessageBox.question(
+                self,
+                "Conflict detected",
+                "This staff already has a booking that overlaps this time.\n\nSend offer anyway?",
+                QMessageBox.Yes | QMessageBox.No,
+            )
+            if ok == QMessageBox.Yes:
+                self._submit_send(staff_id, placement, force=True)
+            # ✅ If admin clicks NO, just stop quietly (no error popup)
+            return
+
+        QMessageBox.critical(self, "Send failed", msg)
 
 
         
@@ -1041,84 +1472,68 @@ class ScheduleDetailPage(QWidget):
     def load_history(self):
         if not self.staff_id:
             return
-        try:
-            self.history.clear()
-            self.offers_cache = self.api.admin_offers_by_staff(self.staff_id) or []
-            self.apply_history_search()
-        except Exception as e:
-            QMessageBox.critical(self, "History error", str(e))
-
-    def _offer_search_text(self, o: dict) -> str:
-        placement = o.get("placementId")
-        if isinstance(placement, dict):
-            venue = placement.get("venue", "")
-            date = str(placement.get("date", ""))[:10]
-            start = placement.get("startTime", "")
-            end = placement.get("endTime", "")
-            rate = str(placement.get("hourlyRate", ""))
-        else:
-            venue, date, start, end, rate = "", "", "", "", ""
-        status = str(o.get("status", ""))
-        return f"{venue} {date} {start} {end} {rate} {status}".lower()
+        self.history_model.set_records([])
+        self.selected_offer = None
+        self.history_pager.reset(staff_id=self.staff_id, q=self._history_query())
+
+    def _history_query(self) -> str:
+        return (self.history_search.text() or "").strip()
 
     def apply_history_search(self):
-        q = (self.history_search.text() or "").strip().lower()
-        if not q:
-            self.filtered_offers = self.offers_cache[:]
+        # search runs on the server; start again from the first page
+        self.load_history()
+
+    def _add_history_page(self, offers, first):
+        offers = self.entities.upsert("offers", offers)
+        if first:
+            self.history_model.set_records(offers)
         else:
-            self.filtered_offers = [o for o in self.offers_cache if q in self._offer_search_text(o)]
-        self.render_history_list()
-
-    def render_history_list(self):
-        self.history.clear()
-        for o in self.filtered_offers:
-            placement = o.get("placementId")
-            if isinstance(placement, dict):
-                venue = placement.get("venue", "")
-                date = str(placement.get("date", ""))[:10]
-                rate = placement.get("hourlyRate", 0)
-                start = placement.get("startTime", "")
-                end = placement.get("endTime", "")
-            else:
-                venue, date, rate, start, end = "", "", 0, "", ""
-
-            status = o.get("status", "")
-
-            item = QListWidgetItem(f"{venue}  |  {date}  |  {start}-{end}  |  £{rate}/hr\nStatus: {status}")
-            item.setData(Qt.UserRole, o)
-            self.history.addItem(item)
-            # auto adjust height so page scroll is used instead of list scroll
-            row_h = 70   # adjust if needed
-            count = self.history.count()
-            self.history.setFixedHeight(max(260, min(900, count * row_h + 20)))
-
-
-    def pick_offer(self, item: QListWidgetItem):
-        self.selected_offer = item.data(Qt.UserRole)
+            self.history_model.append_records(offers)
+
+        self._fit_history()
+
+    def _fit_history(self):
+        # auto adjust height so page scroll is used instead of list scroll
+        count = self.history_proxy.rowCount()
+        row_h = self.history.verticalHeader().defaultSectionSize()
+        self.history.setFixedHeight(max(260, count * row_h + 20))
+
+    @staticmethod
+    def _history_card(o: Offer):
+        p = o.placement or Placement("")
+        return f"{p.venue}  |  {p.date_text}  |  {p.start_text}-{p.end_text}  |  £{p.rate_text}/hr", f"Status: {o.status}", ""
+
+    def pick_offer(self, index):
+        self.selected_offer = index.data(RecordRole)
 
     def mark_completed(self):
         if not self.selected_offer:
             QMessageBox.warning(self, "Pick shift", "Select a shift first.")
             return
-        offer_id = str(self.selected_offer.get("_id"))
-        try:
-            self.api.admin_complete_offer(offer_id)
-            QMessageBox.information(self, "Done", "Marked as completed ✅")
-            self.load_history()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        offer_id = self.selected_offer.id
+        self.tasks.submit(
+            None, self.api.admin_complete_offer, offer_id,
+            on_result=lambda offer: self._after_mutation("Done", "Marked as completed ✅", offer),
+            on_error=lambda e: QMessageBox.critical(self, "Error", str(e)),
+        )
+
+    def _after_mutation(self, title, text, offer):
+        QMessageBox.information(self, title, text)
+        # patches this row (and any other page showing the offer) in place
+        self.entities.upsert("offers", [offer])
+        self.selected_offer = None
+        self._fit_history()
 
     def cancel_offer(self):
         if not self.selected_offer:
             QMessageBox.warning(self, "Pick shift", "Select a shift first.")
             return
-        offer_id = str(self.selected_offer.get("_id"))
-        try:
-            self.api.admin_cancel_offer(offer_id, "")
-            QMessageBox.information(self, "Cancelled", "Cancelled ✅")
-            self.load_history()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        offer_id = self.selected_offer.id
+        self.tasks.submit(
+            None, self.api.admin_cancel_offer, offer_id, "",
+            on_result=lambda offer: self._after_mutation("Cancelled", "Cancelled ✅", offer),
+            on_error=lambda e: QMessageBox.critical(self, "Error", str(e)),
+        )
 
     def export_csv(self):
         if not self.staff_id:
@@ -1127,21 +1542,28 @@ class ScheduleDetailPage(QWidget):
         path, _ = QFileDialog.getSaveFileName(self, "Export CSV", "schedule_history.csv", "CSV Files (*.csv)")
         if not path:
             return
+
+        # every matching row is already loaded: export straight from the filtered list
+        if not self.history_pager.has_more and not self.history_pager.loading:
+            self._write_csv(path, self.history_proxy.records())
+            return
+
+        # otherwise export every matching row, not just the pages scrolled into view
+        staff_id, q = self.staff_id, self._history_query()
+        self.tasks.submit(
+            None, lambda: [Offer.from_json(o) for page in self.api.iter_offers_by_staff(staff_id, q=q) for o in page],
+            on_result=lambda offers: self._write_csv(path, offers),
+            on_error=lambda e: QMessageBox.critical(self, "Export failed", str(e)),
+        )
+
+    def _write_csv(self, path, offers):
         try:
-            import csv
             with open(path, "w", newline="", encoding="utf-8") as f:
                 w = csv.writer(f)
                 w.writerow(["Venue", "Date", "Start", "End", "Rate", "Status"])
-                for o in self.filtered_offers:
-                    p = o.get("placementId") if isinstance(o.get("placementId"), dict) else {}
-                    w.writerow([
-                        p.get("venue", ""),
-                        str(p.get("date", ""))[:10],
-                        p.get("startTime", ""),
-                        p.get("endTime", ""),
-                        p.get("hourlyRate", ""),
-                        o.get("status", ""),
-                    ])
+                for o in offers:
+                    p = o.placement or Placement("")
+                    w.writerow([p.venue, p.date_text, p.start_text, p.end_text, p.rate_text, o.status])
             QMessageBox.information(self, "Exported", f"Saved to {path}")
         except Exception as e:
             QMessageBox.critical(self, "Export failed", str(e))
@@ -1149,9 +1571,13 @@ class ScheduleDetailPage(QWidget):
 
 # ----------------- Staff Profile Page -----------------
 class StaffProfilePage(QWidget):
-    def __init__(self, api: ApiClient, on_back=None):
+    cancel_on_leave = True
+
+    def __init__(self, api: ApiClient, entities: EntityStore, on_back=None):
         super().__init__()
         self.api = api
+        self.entities = entities
+        self.tasks = TaskRunner(self)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
@@ -1165,6 +1591,7 @@ class StaffProfilePage(QWidget):
         top.addWidget(self.title)
         top.addStretch(1)
         root.addLayout(top)
+        root.addWidget(busy_bar(self.tasks))
 
         wrap = QFrame()
         wrap.setStyleSheet("background: rgba(255,255,255,0.55); border-radius: 22px;")
@@ -1221,30 +1648,37 @@ class StaffProfilePage(QWidget):
 
     def load_staff(self, staff_id, staff_name=""):
         self._staff_id = staff_id
-        try:
-            data = self.api.admin_staff_profile(staff_id)
-            
-            self.title.setText(f"Staff Profile — {staff_name or data.get('username','')}")
-            self.v_name.setText(data.get("fullName", ""))
-            self.v_email.setText(data.get("email", ""))
-            self.v_dob.setText(str(data.get("dob", "")))
-            self.v_username.setText(data.get("username", ""))
-            self.v_created.setText(str(data.get("createdAt", "")))
-            self.v_jobs.setText(str(data.get("totalJobsWorked", 0)))
-            self.v_hours.setText(str(data.get("totalHoursWorked", 0)))
-            self.v_earnings.setText(f"£{data.get('totalEarnings', 0)}")
-            self._is_active = bool(data.get("isActive", True))
-            if self._is_active:
-               self.lbl_status.setText("Status: ✅ Active")
-               self.btn_suspend.show()
-               self.btn_unsuspend.hide()
-            else:
-               self.lbl_status.setText("Status: ⛔ Suspended")
-               self.btn_suspend.hide()
-               self.btn_unsuspend.show()
-        except Exception as e:
-            QMessageBox.critical(self, "Profile error", str(e))
-            
+        # roster rows carry the same stats rollup: show it now, the fetch below refreshes it
+        known = self.entities.get("staff", staff_id)
+        if known is not None and "totalJobsWorked" in known:
+            self._render(known, staff_name)
+        self.tasks.submit(
+            "profile", self.api.admin_staff_profile, staff_id,
+            on_result=lambda data: self._render(data, staff_name),
+            on_error=lambda e: QMessageBox.critical(self, "Profile error", str(e)),
+        )
+
+    def _render(self, data, staff_name=""):
+        self.entities.upsert("staff", [data])
+        self.title.setText(f"Staff Profile — {staff_name or data.get('username','')}")
+        self.v_name.setText(data.get("fullName", ""))
+        self.v_email.setText(data.get("email", ""))
+        self.v_dob.setText(str(data.get("dob", "")))
+        self.v_username.setText(data.get("username", ""))
+        self.v_created.setText(str(data.get("createdAt", "")))
+        self.v_jobs.setText(str(data.get("totalJobsWorked", 0)))
+        self.v_hours.setText(str(data.get("totalHoursWorked", 0)))
+        self.v_earnings.setText(f"£{data.get('totalEarnings', 0)}")
+        self._is_active = bool(data.get("isActive", True))
+        if self._is_active:
+           self.lbl_status.setText("Status: ✅ Active")
+           self.btn_suspend.show()
+           self.btn_unsuspend.hide()
+        else:
+           self.lbl_status.setText("Status: ⛔ Suspended")
+           self.btn_suspend.hide()
+           self.btn_unsuspend.show()
+
     def set_active(self, active: bool):
         if not self._staff_id:
             return
@@ -1259,106 +1693,224 @@ class StaffProfilePage(QWidget):
              if ok != QMessageBox.Yes:
                  return
 
-        try:
-            self.api.admin_set_staff_active(self._staff_id, active)
-            self.load_staff(self._staff_id)
-            QMessageBox.information(self, "Done", "Staff status updated")
-        except Exception as e:
-            QMessageBox.critical(self, "Failed", str(e))
+        staff_id = self._staff_id
+        self.tasks.submit(
+            None, self.api.admin_set_staff_active, staff_id, active,
+            on_result=lambda data: self._on_active_set(staff_id, data),
+            on_error=lambda e: QMessageBox.critical(self, "Failed", str(e)),
+        )
+
+    def _on_active_set(self, staff_id, data):
+        # the staff lists repaint the SUSPENDED badge from the store
+        self.entities.upsert("staff", [data])
+        if staff_id == self._staff_id:
+            self.load_staff(staff_id)
+        QMessageBox.information(self, "Done", "Staff status updated")
 
 
 
 # ----------------- Calendar Page -----------------
+def calendar_card(o: Offer):
+    p = o.placement or Placement("")
+    return f"{p.start_text}-{p.end_text}  {p.venue}", f"@{o.username} | {p.role} | {o.status}", ""
+
+
 class CalendarPage(QWidget):
-    def __init__(self, api: ApiClient):
+    """
+    Bookings across all staff by month or week (GET /admin/calendar).
+
+    Windows are cached (WindowCache) and the ones either side of the visible one are
+    prefetched, so paging back and forth repaints from memory. Offers changed on other
+    pages are patched into the cached windows through the entity store.
+    """
+    PREFETCH = 1  # windows either side of the visible one
+
+    def __init__(self, api: ApiClient, entities: EntityStore):
         super().__init__()
         self.api = api
+        self.entities = entities
+        self.mode = MONTH
+        self.anchor = date.today()
+        self.window = None
+
+        self.cache = WindowCache(api.admin_calendar, parent=self)
+        self.cache.loaded.connect(self._on_loaded)
+        self.cache.failed.connect(self._on_failed)
+        entities.changed.connect(self._on_entities_changed)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         root.addWidget(card_title("Calendar"))
-        lab = QLabel("Calendar feature coming soon.")
-        lab.setStyleSheet("font-weight: 700;")
-        root.addWidget(lab)
-        root.addStretch(1)
+        root.addWidget(busy_bar(self.cache.tasks))
 
+        top_card = QFrame()
+        top_card.setStyleSheet("background: rgba(255,255,255,0.55); border-radius: 18px;")
+        top_l = QHBoxLayout(top_card)
+        top_l.setContentsMargins(14, 10, 14, 10)
+        top_l.setSpacing(10)
 
-# ----------------- Payroll Page -----------------
-class StaffPayrollCard(QFrame):
-    def __init__(self, username: str, hours: float, pay: float):
-        super().__init__()
-        self.username = username
-        self.setStyleSheet("""
-            QFrame {
-                background: #ffffff;
-                border-radius: 16px;
-                padding: 12px;
-            }
-            QFrame:hover { background: #f2f6ff; }
-        """)
-        self.setCursor(Qt.PointingHandCursor)
+        self.btn_prev = ghost_btn("◀")
+        self.btn_today = ghost_btn("Today")
+        self.btn_next = ghost_btn("▶")
+        self.lbl_range = QLabel("")
+        self.lbl_range.setStyleSheet("font-size: 16px; font-weight: 800;")
+        self.mode_box = QComboBox()
+        self.mode_box.addItems([MONTH, WEEK])
+        self.btn_refresh = ghost_btn("Refresh")
+
+        top_l.addWidget(self.btn_prev)
+        top_l.addWidget(self.btn_today)
+        top_l.addWidget(self.btn_next)
+        top_l.addWidget(self.lbl_range)
+        top_l.addStretch(1)
+        top_l.addWidget(self.mode_box)
+        top_l.addWidget(self.btn_refresh)
+        root.addWidget(top_card)
 
-        row = QHBoxLayout(self)
-        row.setContentsMargins(14, 10, 14, 10)
+        body = QHBoxLayout()
+        body.setSpacing(14)
+        root.addLayout(body, 1)
 
-        name = QLabel(username)
-        name.setStyleSheet("font-size: 14px; font-weight: 600;")
+        self.grid = CalendarGrid()
+        body.addWidget(self.grid, 1)
+
+        # ----- selected day -----
+        right = QFrame()
+        right.setStyleSheet("background: rgba(255,255,255,0.35); border-radius: 18px;")
+        right.setFixedWidth(320)
+        right_l = QVBoxLayout(right)
+        right_l.setContentsMargins(14, 14, 14, 14)
+        right_l.setSpacing(10)
+        self.lbl_day = section_label("Pick a day")
+        right_l.addWidget(self.lbl_day)
+        self.day_model = RecordListModel(calendar_card, parent=self)
+        self.day_list = card_list_view(self.day_model)
+        right_l.addWidget(self.day_list, 1)
+        body.addWidget(right)
+
+        self.btn_prev.clicked.connect(lambda: self.go(step(self.mode, self.anchor, -1)))
+        self.btn_next.clicked.connect(lambda: self.go(step(self.mode, self.anchor, 1)))
+        self.btn_today.clicked.connect(lambda: self.go(date.today()))
+        self.btn_refresh.clicked.connect(self.refresh)
+        self.mode_box.currentTextChanged.connect(self.set_mode)
+        self.grid.day_clicked.connect(self._show_day)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.window is None:
+            self.go(self.anchor)
+
+    def set_mode(self, mode: str):
+        self.mode = mode
+        self.go(self.anchor)
+
+    def go(self, anchor: date):
+        self.anchor = anchor
+        self.window = calendar_window(self.mode, anchor)
+        first, last = self.window
+        if self.mode == MONTH:
+            self.lbl_range.setText(anchor.strftime("%B %Y"))
+        else:
+            self.lbl_range.setText(f"{first:%d %b} – {last:%d %b %Y}")
+
+        data = self.cache.get(self.window)
+        self.grid.set_window(first, 6 if self.mode == MONTH else 1, anchor.month if self.mode == MONTH else None, data)
+        self._show_day(self.grid.selected)
+        if data is None:
+            self.cache.request(self.window)
+        self.cache.prefetch(
+            calendar_window(self.mode, step(self.mode, anchor, n))
+            for n in range(-self.PREFETCH, self.PREFETCH + 1) if n
+        )
 
-        hrs = QLabel(f"{hours:.2f}")
-        hrs.setAlignment(Qt.AlignCenter)
-        hrs.setFixedWidth(60)
+    def refresh(self):
+        self.cache.clear()
+        self.go(self.anchor)
 
-        pay_lbl = QLabel(f"{pay:.2f}")
-        pay_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        pay_lbl.setFixedWidth(70)
+    def _on_loaded(self, window):
+        if window == self.window:
+            self.grid.set_data(self.cache.get(window))
+            self._show_day(self.grid.selected)
 
-        row.addWidget(name, 1)
-        row.addWidget(hrs)
-        row.addWidget(pay_lbl)
+    def _on_failed(self, window, e):
+        if window == self.window:
+            QMessageBox.critical(self, "Calendar error", str(e))
 
-class ShiftRowCard(QFrame):
-    def __init__(self, venue: str, time_txt: str, date_txt: str, hours: float, pay: float):
-        super().__init__()
-        self.setStyleSheet("""
-            QFrame {
-                background: #ffffff;
-                border-radius: 14px;
-                padding: 10px;
-            }
-        """)
+    def _show_day(self, day):
+        data = self.grid.data
+        if day is None or data is None or not data.first <= day <= data.last:
+            self.lbl_day.setText("Pick a day")
+            self.day_model.set_records([])
+            return
+        offers = data.days.get(day, [])
+        self.lbl_day.setText(f"{date.fromordinal(day):%a %d %b %Y} · {len(offers)} booking(s)")
+        self.day_model.set_records(list(offers))
 
-        row = QHBoxLayout(self)
-        row.setContentsMargins(14, 8, 14, 8)
+    def _on_entities_changed(self, kind, ids):
+        if kind != "offers":
+            return
+        offers = self.entities.offers(ids)
+        touched = False
+        for data in self.cache.windows():
+            for offer in offers:
+                if data.patch(offer) and data is self.grid.data:
+                    touched = True
+        if touched:
+            self.grid.update()
+            self._show_day(self.grid.selected)
 
-        c1 = QLabel(venue); c1.setFixedWidth(90)
-        c2 = QLabel(time_txt); c2.setFixedWidth(120)
-        c3 = QLabel(date_txt); c3.setFixedWidth(90)
-        c4 = QLabel(f"{hours:.1f}"); c4.setFixedWidth(80); c4.setAlignment(Qt.AlignCenter)
-        c5 = QLabel(f"{pay:.2f}"); c5.setFixedWidth(80); c5.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
 
-        row.addWidget(c1)
-        row.addWidget(c2)
-        row.addWidget(c3)
-        row.addWidget(c4)
-        row.addWidget(c5)
-        row.addStretch(1)
+# ----------------- Payroll Page -----------------
+# Painted payroll rows: same look as the old per-row QFrame cards, O(visible rows) to show
+PAYROLL_STAFF_COLUMNS = [
+    (None, Qt.AlignLeft, True),               # username
+    (60, Qt.AlignCenter, False),              # hours
+    (70, Qt.AlignRight, False),               # pay
+]
+PAYROLL_SHIFT_COLUMNS = [
+    (90, Qt.AlignLeft, False),                # venue
+    (120, Qt.AlignLeft, False),               # start-end
+    (90, Qt.AlignLeft, False),                # date
+    (80, Qt.AlignCenter, False),              # hours
+    (80, Qt.AlignRight, False),               # pay
+]
+
+
+def payroll_staff_cells(s: PayrollTotal):
+    return s.username, hours_text(s.hours), pence_text(s.pay)
+
+
+def payroll_shift_cells(s: PayrollShift):
+    return (
+        s.venue,
+        f"{time_text(s.start)}-{time_text(s.end)}",
+        day_text(s.day),
+        hours_text(s.hours, 1),
+        pence_text(s.pay),
+    )
 
 
 class PayrollPage(QWidget):
+    warmup = ("payroll_periods",)
+
     def __init__(self, api):
         super().__init__()
         self.api = api
+        self.tasks = TaskRunner(self)
         self.current_period = None
         self.current_staff = None
         self.current_shifts = []
+        self.bundle = None  # see _build_bundle
+        self.engine = PayrollEngine([])
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         root.addWidget(card_title("Payroll"))
+        root.addWidget(busy_bar(self.tasks))
 
         # ===== Top bar card =====
         top_card = QFrame()
@@ -1392,6 +1944,14 @@ class PayrollPage(QWidget):
         top_l.addWidget(self.btn_load)
         top_l.addWidget(self.btn_export)
         top_l.addStretch(1)
+
+        # local totals that disagree with the server's
+        self.lbl_frozen = QLabel("")
+        self.lbl_frozen.setStyleSheet("color:#555; font-weight:600;")
+        top_l.addWidget(self.lbl_frozen)
+        self.lbl_check = QLabel("")
+        self.lbl_check.setStyleSheet("color:#b42318; font-weight:600;")
+        top_l.addWidget(self.lbl_check)
         root.addWidget(top_card)
 
         # ===== Main panels =====
@@ -1413,9 +1973,12 @@ class PayrollPage(QWidget):
         header.addWidget(h1, 1); header.addWidget(h2); header.addWidget(h3)
         left_l.addLayout(header)
 
-        self.staff_list = QListWidget()
-        self.staff_list.setSpacing(10)
-        self.staff_list.setStyleSheet("QListWidget{background: transparent; border:none;}")
+        self.staff_model = RecordListModel(payroll_staff_cells, parent=self)
+        self.staff_list = card_list_view(
+            self.staff_model, delegate=ColumnCardDelegate(PAYROLL_STAFF_COLUMNS, height=56, radius=16, hover=True)
+        )
+        self.staff_list.setStyleSheet("QTableView{background: transparent; border:none; outline:0px;}")
+        self.staff_list.viewport().setCursor(Qt.PointingHandCursor)
         left_l.addWidget(self.staff_list, 1)
 
         left.setFixedWidth(320)
@@ -1450,106 +2013,140 @@ class PayrollPage(QWidget):
         cols.addStretch(1)
         right_l.addLayout(cols)
 
-        # Scroll area of shift cards
-        self.shift_container = QWidget()
-        self.shift_v = QVBoxLayout(self.shift_container)
-        self.shift_v.setContentsMargins(0, 0, 0, 0)
-        self.shift_v.setSpacing(10)
-        self.shift_v.addStretch(1)
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setWidget(self.shift_container)
-        right_l.addWidget(scroll, 1)
+        # Shift rows
+        self.shift_model = RecordListModel(payroll_shift_cells, parent=self)
+        self.shift_list = card_list_view(
+            self.shift_model, delegate=ColumnCardDelegate(PAYROLL_SHIFT_COLUMNS, height=48)
+        )
+        self.shift_list.setStyleSheet("QTableView{background: transparent; border:none; outline:0px;}")
+        self.shift_list.setSelectionMode(QAbstractItemView.NoSelection)
+        right_l.addWidget(self.shift_list, 1)
 
         body.addWidget(right, 1)
 
         # signals
         self.btn_load.clicked.connect(self.load_staff_summary)
         self.btn_export.clicked.connect(self.export_csv)
-        self.staff_list.itemClicked.connect(self.on_staff_clicked)
+        self.staff_list.clicked.connect(self.on_staff_clicked)
         self.period_box.currentIndexChanged.connect(lambda *_: self.load_staff_summary())
 
-        self.load_pay_dates()
-        if self.period_box.count() > 0:
-            self.load_staff_summary()
+        self.staff_model.show_skeleton()
+
+    def apply_warmup(self, name, data):
+        self._set_pay_dates(data)
 
     def load_pay_dates(self):
+        self.tasks.submit(
+            "periods", self.api.payroll_periods,
+            on_result=self._set_pay_dates,
+            on_error=lambda e: QMessageBox.critical(self, "Payroll error", str(e)),
+        )
+
+    def _set_pay_dates(self, periods):
+        self.engine = PayrollEngine(periods)
+        self.period_box.blockSignals(True)
         self.period_box.clear()
-        for p in self.api.payroll_periods():
+        for p in periods or []:
             self.period_box.addItem(p["payDate"])
+        self.period_box.blockSignals(False)
+        if self.period_box.count() > 0:
+            self.load_staff_summary()
 
     def load_staff_summary(self):
-        self.staff_list.clear()
+        self.staff_model.set_records([])
         self.current_staff = None
         self.current_shifts = []
+        self.bundle = None
         self.lbl_staff.setText("")
         self.lbl_summary.setText("Select a staff member")
-        self._render_shift_cards([])
+        self.lbl_check.setText("")
+        self.lbl_frozen.setText("")
+        self.shift_model.set_records([])
 
         pay_date = self.period_box.currentText().strip()
         if not pay_date:
             return
 
-        data = self.api.payroll_by_paydate(pay_date)
-        self.current_period = data.get("period")
+        # fetch and total the period off the GUI thread
+        engine = self.engine
+        self.tasks.submit(
+            "summary", lambda: self._build_bundle(engine, pay_date, self.api.payroll_bundle(pay_date)),
+            on_result=self._set_bundle,
+            on_error=lambda e: QMessageBox.critical(self, "Payroll error", str(e)),
+        )
 
-        for s in data.get("staff", []):
-            username = s.get("username", "Unknown")
-            hours = float(s.get("totalHours", 0) or 0)
-            pay = float(s.get("totalPay", 0) or 0)
+    @staticmethod
+    def _build_bundle(engine, pay_date, data):
+        """
+        The whole period in memory; drill-down and export read from here. Staff totals are
+        worked out locally (PayrollEngine) and checked against the server's.
+        """
+        fields, rows = data.get("fields", []), data.get("shifts", [])
+        columns = ShiftColumns.from_rows(fields, rows)
+        server = [PayrollTotal.from_json(s) for s in data.get("staff", [])]
+        if pay_date in engine.pay_dates:
+            totals = engine.totals(columns)
+            staff, mismatches = totals.staff_totals(pay_date), totals.mismatches(pay_date, server)
+        else:
+            staff, mismatches = server, []
 
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, username)
+        return {
+            "payDate": pay_date,
+            "period": data.get("period") or {},
+            "staff": staff,
+            "mismatches": mismatches,
+            "fields": fields,
+            "rows": rows,          # decoded per staff member on drill-down
+            "columns": columns,
+            "snapshot": data.get("snapshot"),  # set once the period is closed and frozen
+        }
 
-            card = StaffPayrollCard(username, hours, pay)
-            item.setSizeHint(card.sizeHint())
+    def _set_bundle(self, bundle):
+        self.bundle = bundle
+        self._render_summary(bundle)
 
-            self.staff_list.addItem(item)
-            self.staff_list.setItemWidget(item, card)
+    def _render_summary(self, bundle):
+        self.current_period = bundle["period"]
+        self.staff_model.set_records(bundle["staff"])
 
-    def on_staff_clicked(self, item: QListWidgetItem):
-        username = item.data(Qt.UserRole)
-        pay_date = self.period_box.currentText().strip()
-        if not username or not pay_date:
+        snapshot = bundle["snapshot"]
+        self.lbl_frozen.setText(f"🔒 Closed · frozen {str(snapshot.get('frozenAt', ''))[:10]}" if snapshot else "")
+        self.lbl_frozen.setToolTip(f"Snapshot {snapshot.get('hash', '')}" if snapshot else "")
+
+        mismatches = bundle["mismatches"]
+        self.lbl_check.setText(f"⚠ {len(mismatches)} staff totals differ from the server" if mismatches else "")
+        self.lbl_check.setToolTip("\n".join(
+            f"{name}: £{pence_text(mine.pay)} here, £{pence_text(theirs.pay)} on the server"
+            for name, mine, theirs in mismatches[:20]
+        ))
+
+    def on_staff_clicked(self, index):
+        total = index.data(RecordRole)
+        if total is None or self.bundle is None:
             return
 
-        data = self.api.payroll_staff_detail(pay_date, username)
+        rows = self.bundle["rows"]
+        self._render_staff_detail(total, {
+            "period": self.bundle["period"],
+            "shifts": PayrollShift.from_rows(
+                self.bundle["fields"], [rows[i] for i in self.bundle["columns"].rows_of(total.username)]
+            ),
+        })
+
+    def _render_staff_detail(self, total: PayrollTotal, data):
         period = data.get("period") or self.current_period or {"from": "", "to": ""}
         shifts = data.get("shifts", [])
 
-        self.current_staff = username
+        self.current_staff = total.username
         self.current_shifts = shifts
 
-        total_h = sum(float(s.get("hours", 0) or 0) for s in shifts)
-        total_p = sum(float(s.get("pay", 0) or 0) for s in shifts)
-
-        self.lbl_staff.setText(username)
+        self.lbl_staff.setText(total.username)
         self.lbl_summary.setText(
             f"Period: {period.get('from','')} → {period.get('to','')}    "
-            f"Total hours: {total_h:.2f}    Total pay: £{total_p:.2f}"
+            f"Total hours: {hours_text(total.hours)}    Total pay: £{pence_text(total.pay)}"
         )
 
-        self._render_shift_cards(shifts)
-
-    def _render_shift_cards(self, shifts):
-        # Clear previous cards
-        while self.shift_v.count():
-            item = self.shift_v.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-
-        for s in shifts:
-            venue = str(s.get("venue", ""))
-            time_txt = f"{s.get('startTime','')}-{s.get('endTime','')}"
-            date_txt = str(s.get("date", ""))
-            hours = float(s.get("hours", 0) or 0)
-            pay = float(s.get("pay", 0) or 0)
-            self.shift_v.addWidget(ShiftRowCard(venue, time_txt, date_txt, hours, pay))
-
-        self.shift_v.addStretch(1)
+        self.shift_model.set_records(shifts)
 
     def export_csv(self):
         path, _ = QFileDialog.getSaveFileName(self, "Export Payroll CSV", "payroll.csv", "CSV Files (*.csv)")
@@ -1557,7 +2154,20 @@ class PayrollPage(QWidget):
             return
 
         pay_date = self.period_box.currentText().strip()
-        data = self.api.payroll_by_paydate(pay_date)
+        if self.bundle is not None and self.bundle["payDate"] == pay_date:
+            self._write_csv(path, pay_date, self.bundle)
+            return
+
+        self.tasks.submit(
+            None, self.api.payroll_bundle, pay_date,
+            on_result=lambda data: self._write_csv(path, pay_date, {
+                "period": data.get("period") or {},
+                "staff": [PayrollTotal.from_json(s) for s in data.get("staff", [])],
+            }),
+            on_error=lambda e: QMessageBox.critical(self, "Export failed", str(e)),
+        )
+
+    def _write_csv(self, path, pay_date, data):
         period = data.get("period", {})
         staff = data.get("staff", [])
 
@@ -1569,24 +2179,36 @@ class PayrollPage(QWidget):
                     pay_date,
                     period.get("from", ""),
                     period.get("to", ""),
-                    s.get("username", ""),
-                    s.get("totalHours", 0),
-                    f"{float(s.get('totalPay',0) or 0):.2f}",
+                    s.username,
+                    hours_text(s.hours),
+                    pence_text(s.pay),
                 ])
 
 class VenueTemplatesPage(QWidget):
-    def __init__(self, api: ApiClient):
+    warmup = ("venues_list",)
+
+    def __init__(self, api: ApiClient, entities: EntityStore):
         super().__init__()
         self.api = api
+        self.entities = entities
+        self.tasks = TaskRunner(self)
         self.selected_id = None
-        self.venues_cache = []
-        self.filtered = []
+        self.model = RecordListModel(
+            lambda v: (v.get("name", ""), v.get("address", ""), ""),
+            lambda v: v.get("name", ""),
+            self,
+        )
+        self.proxy = RecordFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        follow(self.model, entities, "venues")
+        entities.reloaded.connect(self._on_reloaded)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         root.addWidget(card_title("Save Offer"))
+        root.addWidget(busy_bar(self.tasks))
 
         # ---- form card ----
         form = QFrame()
@@ -1648,33 +2270,15 @@ class VenueTemplatesPage(QWidget):
         self._timer.timeout.connect(self.apply_search)
         self.search_input.textChanged.connect(lambda: self._timer.start(250))
 
-        self.list = QListWidget()
-        self.list.setStyleSheet("""
-            QListWidget {
-                background: rgba(255,255,255,0.55);
-                border: none;
-                border-radius: 18px;
-                padding: 8px;
-                selection-background-color: transparent;
-                selection-color: #000;
-                outline: 0px;
-            }
-            QListWidget::item {
-                background: white;
-                margin: 6px;
-                padding: 14px;
-                border-radius: 14px;
-                font-weight: 700;
-            }
-            QListWidget::item:selected {
-                background: white;
-                border: 2px solid #5B5CE5;
-            }
-        """)
-        self.list.itemClicked.connect(self.pick_item)
+        self.list = card_list_view(self.proxy)
+        self.list.clicked.connect(self.pick_item)
         root.addWidget(self.list, 1)
 
-        self.load()
+        self.clear_form()
+        self.model.show_skeleton()
+
+    def apply_warmup(self, name, data):
+        self._set_venues(data)
 
     def clear_form(self):
         self.selected_id = None
@@ -1692,33 +2296,28 @@ class VenueTemplatesPage(QWidget):
         }
 
     def load(self):
-        try:
-            self.venues_cache = self.api.venues_list() or []
-            self.apply_search()
-            self.clear_form()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        self.tasks.submit(
+            "venues", self.api.venues_list,
+            on_result=self._set_venues,
+            on_error=lambda e: QMessageBox.critical(self, "Error", str(e)),
+        )
+
+    def _set_venues(self, venues):
+        self.entities.replace("venues", venues)
+        if not self.model.records():
+            self._on_reloaded("venues")
+        self.clear_form()
+
+    def _on_reloaded(self, kind):
+        if kind == "venues":
+            self.model.set_records(self.entities.all("venues"))
 
     def apply_search(self):
-        q = (self.search_input.text() or "").strip().lower()
-        if not q:
-            self.filtered = self.venues_cache[:]
-        else:
-            self.filtered = [v for v in self.venues_cache if q in (v.get("name", "").lower())]
-
-        self.list.clear()
-        for v in self.filtered:
-            vid = v.get("_id") or v.get("id")
-            name = v.get("name", "")
-            addr = v.get("address", "")
-            item = QListWidgetItem(f"{name}\n{addr}")
-            item.setData(Qt.UserRole, {"id": vid, "venue": v})
-            self.list.addItem(item)
-
-    def pick_item(self, item: QListWidgetItem):
-        data = item.data(Qt.UserRole) or {}
-        v = data.get("venue") or {}
-        self.selected_id = data.get("id")
+        self.proxy.set_query(self.search_input.text())
+
+    def pick_item(self, index):
+        v = index.data(RecordRole) or {}
+        self.selected_id = v.get("_id") or v.get("id")
 
         self.v_name.setText(v.get("name", ""))
         self.v_address.setText(v.get("address", ""))
@@ -1732,14 +2331,16 @@ class VenueTemplatesPage(QWidget):
         if not payload["name"]:
             QMessageBox.warning(self, "Missing", "Venue name is required.")
             return
-        try:
-            self.api.venues_create(payload)
-            QMessageBox.information(self, "Saved", "Venue template saved.")
-            self.load()
-            if hasattr(self, "on_changed") and callable(self.on_changed):
-                self.on_changed()
-        except Exception as e:
-            QMessageBox.critical(self, "Save failed", str(e))
+        self.tasks.submit(
+            None, self.api.venues_create, payload,
+            on_result=lambda _: self._after_mutation("Saved", "Venue template saved."),
+            on_error=lambda e: QMessageBox.critical(self, "Save failed", str(e)),
+        )
+
+    def _after_mutation(self, title, text):
+        QMessageBox.information(self, title, text)
+        # the reload goes through the entity store, which also refreshes Schedule's venue picker
+        self.load()
 
     def update_selected(self):
         if not self.selected_id:
@@ -1749,14 +2350,11 @@ class VenueTemplatesPage(QWidget):
         if not payload["name"]:
             QMessageBox.warning(self, "Missing", "Venue name is required.")
             return
-        try:
-            self.api.venues_update(self.selected_id, payload)
-            QMessageBox.information(self, "Updated", "Venue updated.")
-            self.load()
-            if hasattr(self, "on_changed") and callable(self.on_changed):
-                self.on_changed()
-        except Exception as e:
-            QMessageBox.critical(self, "Update failed", str(e))
+        self.tasks.submit(
+            None, self.api.venues_update, self.selected_id, payload,
+            on_result=lambda _: self._after_mutation("Updated", "Venue updated."),
+            on_error=lambda e: QMessageBox.critical(self, "Update failed", str(e)),
+        )
 
     def delete_selected(self):
         if not self.selected_id:
@@ -1770,133 +2368,116 @@ class VenueTemplatesPage(QWidget):
         if ok != QMessageBox.Yes:
             return
 
-        try:
-            self.api.venues_delete(self.selected_id)
-            QMessageBox.information(self, "Deleted", "Venue deleted.")
-            self.load()
-            if hasattr(self, "on_changed") and callable(self.on_changed):
-                self.on_changed()
-        except Exception as e:
-            QMessageBox.critical(self, "Delete failed", str(e))
+        self.tasks.submit(
+            None, self.api.venues_delete, self.selected_id,
+            on_result=lambda _: self._after_mutation("Deleted", "Venue deleted."),
+            on_error=lambda e: QMessageBox.critical(self, "Delete failed", str(e)),
+        )
 
 
 # ----------------- History List Page (staff picker with Search) -----------------
 class HistoryListPage(QWidget):
-    def __init__(self, api: ApiClient, on_pick):
+    warmup = ("admin_staff",)
+
+    def __init__(self, api: ApiClient, entities: EntityStore, on_pick):
         super().__init__()
         self.api = api
+        self.entities = entities
         self.on_pick = on_pick
+        self.tasks = TaskRunner(self)
 
-        self.all_staff = []
-        self.filtered_staff = []
+        self.model = RecordListModel(staff_card, staff_search, self, index_type=RankedIndex)
+        self.proxy = RecordFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        follow(self.model, entities, "staff")
+        entities.reloaded.connect(self._on_reloaded)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         root.addWidget(card_title("Schedule History"))
+        root.addWidget(busy_bar(self.tasks))
 
         # ✅ Search
         search_row, self.search_input, self.btn_clear_search, self._search_timer = make_search_row(
-            "Search staff (name or username)…"
+            "Search staff (name, username or email)…"
         )
         root.addLayout(search_row)
-        self._search_timer.timeout.connect(self.apply_search)
-        self.search_input.textChanged.connect(lambda: self._search_timer.start(250))
+        # ranked index lookups are cheap enough to run on every keystroke
+        self.search_input.textChanged.connect(self.apply_search)
 
-        self.list = QListWidget()
-        self.list.setStyleSheet("""
-    QListWidget {
-        background: rgba(255,255,255,0.55);
-        border: none;
-        border-radius: 18px;
-        padding: 8px;
-        selection-background-color: transparent;
-        selection-color: #000;
-        outline: 0px;
-    }
-    QListWidget::item {
-        background: white;
-        margin: 6px;
-        padding: 14px;
-        border-radius: 14px;
-        font-weight: 700;
-    }
-    QListWidget::item:selected {
-        background: white;
-        border: 2px solid #5B5CE5;
-    }
-    QListWidget::item:selected:!active {
-        background: white;
-        border: 2px solid #5B5CE5;
-    }""")
-        self.list.itemClicked.connect(self.pick)
+        self.list = card_list_view(self.proxy)
+        self.list.clicked.connect(self.pick)
         root.addWidget(self.list, stretch=1)
 
         self.btn_refresh = ghost_btn("Refresh")
         self.btn_refresh.clicked.connect(self.load)
         root.addWidget(self.btn_refresh)
 
-        self.load()
+        self.model.show_skeleton()
+
+    def apply_warmup(self, name, data):
+        self.set_staff_list(data)
 
     def load(self):
-        try:
-            self.list.clear()
-            self.all_staff = self.api.admin_staff() or []
-            self.apply_search()
-        except Exception as e:
-            QMessageBox.critical(self, "Load staff error", str(e))
+        self.tasks.submit(
+            "staff", self.api.admin_staff,
+            on_result=self.set_staff_list,
+            on_error=lambda e: QMessageBox.critical(self, "Load staff error", str(e)),
+        )
+
+    def set_staff_list(self, staff):
+        # every staff list shares the store's records; _on_reloaded repaints them
+        self.entities.replace("staff", staff)
+        if not self.model.records():
+            self._on_reloaded("staff")
+
+    def _on_reloaded(self, kind):
+        if kind != "staff":
+            return
+        self.model.set_records(self.entities.all("staff"))
+        # build the search index once the list is painted, not on the first keystroke
+        QTimer.singleShot(0, lambda: self.model.search_index().warm())
 
     def apply_search(self):
-        q = (self.search_input.text() or "").strip().lower()
-        if not q:
-            self.filtered_staff = self.all_staff[:]
-        else:
-            out = []
-            for st in self.all_staff:
-                name = st.get("fullName") or st.get("username") or "Staff"
-                username = st.get("username", "")
-                if q in f"{name} {username}".lower():
-                    out.append(st)
-            self.filtered_staff = out
-        self.render()
-
-    def render(self):
-        self.list.clear()
-        for st in self.filtered_staff:
-            name = st.get("fullName") or st.get("username") or "Staff"
-            username = st.get("username", "")
-            active = bool(st.get("isActive", True))
-            badge = "" if active else "\n⛔ SUSPENDED"
-            item = QListWidgetItem(f"{name}\n@{username}{badge}")
-            item.setData(Qt.UserRole, (str(st.get("_id")), name))
-            self.list.addItem(item)
-
-    def pick(self, item: QListWidgetItem):
-        staff_id, staff_name = item.data(Qt.UserRole)
-        self.on_pick(staff_id, staff_name)
+        self.proxy.set_query(self.search_input.text())
 
+    def pick(self, index):
+        s = index.data(RecordRole) or {}
+        staff_id, staff_name = str(s.get("_id")), staff_card(s)[0]
+        self.on_pick(staff_id, staff_name)
 
 class HistoryPage(QWidget):
-    def __init__(self, api: ApiClient):
+    cancel_on_leave = True
+
+    def __init__(self, api: ApiClient, entities: EntityStore):
         super().__init__()
         self.api = api
+        self.entities = entities
+        self.tasks = TaskRunner(self)
 
         self.selected = None
         self.staff_id = None
         self.staff_name = ""
 
-        self.all_items = []
-        self.items = []
-        self.display_items = []
+        self.model = RecordListModel(self._card, offer_search_text, self)  # rows loaded so far for the week filter + search
+        self.proxy = RecordFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        follow(self.model, entities, "offers")
         self.current_filter = "all"
 
+        self.pager = CursorPager(self.tasks, self.api.admin_offers_by_staff_page, key="history", parent=self)
+        self.pager.page_loaded.connect(self._add_page)
+        self.pager.failed.connect(lambda e: QMessageBox.critical(self, "History load error", str(e)))
+
         root = QVBoxLayout(self)
         root.setContentsMargins(14, 14, 14, 14)
         root.setSpacing(14)
 
         self.title = card_title("History")
         root.addWidget(self.title)
+        root.addWidget(busy_bar(self.tasks))
 
         # Week filters
         filters = QHBoxLayout()
@@ -1920,39 +2501,17 @@ class HistoryPage(QWidget):
         )
         root.addLayout(search_row)
         self._search_timer.timeout.connect(self.apply_search)
+        # filter the loaded rows instantly; the debounced reload fetches the rest from the server
+        self.search_input.textChanged.connect(self.proxy.set_query)
         self.search_input.textChanged.connect(lambda: self._search_timer.start(250))
 
         # --- split view: list (left) + details (right) ---
         row = QHBoxLayout()
         row.setSpacing(14)
 
-        self.list = QListWidget()
-        self.list.setStyleSheet("""
-    QListWidget {
-        background: rgba(255,255,255,0.55);
-        border: none;
-        border-radius: 18px;
-        padding: 8px;
-        selection-background-color: transparent;
-        selection-color: #000;
-        outline: 0px;
-    }
-    QListWidget::item {
-        background: white;
-        margin: 6px;
-        padding: 14px;
-        border-radius: 14px;
-        font-weight: 700;
-    }
-    QListWidget::item:selected {
-        background: white;
-        border: 2px solid #5B5CE5;
-    }
-    QListWidget::item:selected:!active {
-        background: white;
-        border: 2px solid #5B5CE5;
-    }""")
-        self.list.itemClicked.connect(self.pick_offer)
+        self.list = card_list_view(self.proxy)
+        self.list.clicked.connect(self.pick_offer)
+        self.pager.watch(self.list.verticalScrollBar())
         row.addWidget(self.list, stretch=2)
 
         self.detail = QFrame()
@@ -2024,110 +2583,70 @@ class HistoryPage(QWidget):
         self.load()
 
     def load(self):
-        try:
-            if not self.staff_id:
-                return
-
-            self.selected = None
-            self._clear_detail()
-
-            data = self.api.admin_offers_by_staff(self.staff_id)
-            offers = data.get("offers") if isinstance(data, dict) else data
-            offers = offers or []
+        if not self.staff_id:
+            return
 
-            self.all_items = offers[:]
-            self.apply_week_filter(self.current_filter or "all")
+        self.selected = None
+        self._clear_detail()
+        self.model.set_records([])
+        self.pager.reset(staff_id=self.staff_id, **self._filters())
 
-        except Exception as e:
-            QMessageBox.critical(self, "History load error", str(e))
+    def _filters(self) -> dict:
+        """Server-side filters for the current week button + search box."""
+        filters = {"q": (self.search_input.text() or "").strip()}
+        if self.current_filter in ("this", "last"):
+            today = datetime.now().date()
+            start = today - timedelta(days=today.weekday())
+            if self.current_filter == "last":
+                start -= timedelta(days=7)
+            filters["date_from"] = start.isoformat()
+            filters["date_to"] = (start + timedelta(days=6)).isoformat()
+        return filters
+
+    def _add_page(self, offers, first):
+        offers = self.entities.upsert("offers", offers)
+        if first:
+            self.model.set_records(offers)
+        else:
+            self.model.append_records(offers)
 
     def cancel_selected(self):
         if not self.selected:
             QMessageBox.warning(self, "Pick shift", "Select a shift first.")
             return
 
-        offer_id = str(self.selected.get("_id"))
+        offer_id = self.selected.id
         reason, ok = QInputDialog.getText(self, "Cancel shift", "Reason (optional):")
         if not ok:
             return
 
-        try:
-            self.api.admin_cancel_offer(offer_id, reason.strip())
-            QMessageBox.information(self, "Cancelled", "Shift cancelled ✅")
-            self.load()
-        except Exception as e:
-            QMessageBox.critical(self, "Cancel error", str(e))
+        self.tasks.submit(
+            None, self.api.admin_cancel_offer, offer_id, reason.strip(),
+            on_result=self._after_cancel,
+            on_error=lambda e: QMessageBox.critical(self, "Cancel error", str(e)),
+        )
+
+    def _after_cancel(self, offer):
+        QMessageBox.information(self, "Cancelled", "Shift cancelled ✅")
+        # patches this row (and any other page showing the offer) in place
+        self.entities.upsert("offers", [offer])
+        self.selected = None
+        self._clear_detail()
 
     def apply_week_filter(self, mode: str):
         self.current_filter = mode
-
-        if mode == "all":
-            filtered = self.all_items
-        else:
-            today = datetime.now().date()
-            this_monday = today - timedelta(days=today.weekday())
-
-            if mode == "this":
-                start = this_monday
-                end = this_monday + timedelta(days=7)
-            else:  # last
-                start = this_monday - timedelta(days=7)
-                end = this_monday
-
-            filtered = []
-            for o in self.all_items:
-                p = o.get("placementId") if isinstance(o.get("placementId"), dict) else {}
-                d = str(p.get("date", ""))[:10]
-                try:
-                    dt = datetime.strptime(d, "%Y-%m-%d").date()
-                except Exception:
-                    continue
-
-                if start <= dt < end:
-                    filtered.append(o)
-
-        self.items = filtered
-        self.apply_search()
-
-    def _offer_search_text(self, o: dict) -> str:
-        p = o.get("placementId") if isinstance(o.get("placementId"), dict) else {}
-        venue = p.get("venue", "")
-        date = str(p.get("date", ""))[:10]
-        st = p.get("startTime", "")
-        en = p.get("endTime", "")
-        status = str(o.get("status", ""))
-        rate = str(p.get("hourlyRate", ""))
-        return f"{venue} {date} {st} {en} {status} {rate}".lower()
+        self.load()
 
     def apply_search(self):
-        q = (self.search_input.text() or "").strip().lower()
-        if not q:
-            self.display_items = self.items[:]
-        else:
-            self.display_items = [o for o in self.items if q in self._offer_search_text(o)]
-        self.render_list()
+        self.load()
 
-    def render_list(self):
-        self.list.clear()
-        self._clear_detail()
+    @staticmethod
+    def _card(o: Offer):
+        p = o.placement or Placement("")
+        return f"{p.venue} | {p.date_text} | {p.start_text}-{p.end_text}", f"Status: {o.status} | £{p.rate_text}/hr", ""
 
-        for o in self.display_items:
-            p = o.get("placementId") if isinstance(o.get("placementId"), dict) else {}
-            venue = p.get("venue", "")
-            date = str(p.get("date", ""))[:10]
-            st = p.get("startTime", "")
-            en = p.get("endTime", "")
-            status = o.get("status", "")
-            rate = p.get("hourlyRate", "")
-
-            text = f"{venue} | {date} | {st}-{en}\nStatus: {status} | £{rate}/hr"
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, str(o.get("_id")))
-            self.list.addItem(item)
-
-    def pick_offer(self, item: QListWidgetItem):
-        offer_id = item.data(Qt.UserRole)
-        offer = next((x for x in self.display_items if str(x.get("_id")) == str(offer_id)), None)
+    def pick_offer(self, index):
+        offer = index.data(RecordRole)
         if not offer:
             return
         self.selected = offer
@@ -2146,41 +2665,23 @@ class HistoryPage(QWidget):
         self.d_updated.setText("")
         self.d_notes.setText("")
 
-    def _fill_detail(self, offer: dict):
-        p = offer.get("placementId") if isinstance(offer.get("placementId"), dict) else {}
-
-        venue = p.get("venue", "")
-        role = p.get("roleTitle") or p.get("position", "")
-        date = str(p.get("date", ""))[:10]
-        st = p.get("startTime", "")
-        en = p.get("endTime", "")
-        hours = p.get("totalHours", "")
-        rate = p.get("hourlyRate", "")
-        notes = p.get("notes") or p.get("note") or ""
-
-        status = offer.get("status", "")
-        created = str(offer.get("createdAt", ""))
-        updated = str(offer.get("updatedAt", ""))
-
-        try:
-            earn = float(hours) * float(rate)
-        except Exception:
-            earn = 0.0
-
-        self.d_venue.setText(str(venue))
-        self.d_role.setText(str(role))
-        self.d_date.setText(str(date))
-        self.d_time.setText(f"{st} - {en}")
-        self.d_hours.setText(str(hours))
-        self.d_rate.setText(str(rate))
-        self.d_earn.setText(f"£{earn:.2f}")
-        self.d_status.setText(str(status))
-        self.d_created.setText(created)
-        self.d_updated.setText(updated)
-        self.d_notes.setText(str(notes))
+    def _fill_detail(self, offer: Offer):
+        p = offer.placement or Placement("")
+
+        self.d_venue.setText(p.venue)
+        self.d_role.setText(p.role)
+        self.d_date.setText(p.date_text)
+        self.d_time.setText(f"{p.start_text} - {p.end_text}")
+        self.d_hours.setText(p.hours_text)
+        self.d_rate.setText(p.rate_text)
+        self.d_earn.setText(f"£{pence_text(p.pay)}")
+        self.d_status.setText(offer.status)
+        self.d_created.setText(offer.created)
+        self.d_updated.setText(offer.updated)
+        self.d_notes.setText(p.notes)
 
     def export_csv(self):
-        if not self.display_items:
+        if not self.model.rowCount():
             QMessageBox.information(self, "Export", "No history to export.")
             return
 
@@ -2190,28 +2691,259 @@ class HistoryPage(QWidget):
         if not path:
             return
 
+        # every matching row is already loaded: export straight from the filtered list
+        if not self.pager.has_more and not self.pager.loading:
+            self._write_csv(path, self.proxy.records())
+            return
+
+        # every row matching the filters, not just the pages loaded so far
+        staff_id, filters = self.staff_id, self._filters()
+        self.tasks.submit(
+            None, lambda: [Offer.from_json(o) for page in self.api.iter_offers_by_staff(staff_id, **filters) for o in page],
+            on_result=lambda offers: self._write_csv(path, offers),
+            on_error=lambda e: QMessageBox.critical(self, "Export failed", str(e)),
+        )
+
+    def _write_csv(self, path, offers):
         with open(path, "w", newline="", encoding="utf-8") as f:
             w = csv.writer(f)
             w.writerow(["venue", "roleTitle/position", "date", "start", "end", "hourlyRate", "totalHours", "status"])
-            for o in self.display_items:
-                p = o.get("placementId") if isinstance(o.get("placementId"), dict) else {}
-                w.writerow([
-                    p.get("venue", ""),
-                    p.get("roleTitle") or p.get("position", ""),
-                    str(p.get("date", ""))[:10],
-                    p.get("startTime", ""),
-                    p.get("endTime", ""),
-                    p.get("hourlyRate", ""),
-                    p.get("totalHours", ""),
-                    o.get("status", ""),
-                ])
+            for o in offers:
+                p = o.placement or Placement("")
+                w.writerow([p.venue, p.role, p.date_text, p.start_text, p.end_text, p.rate_text, p.hours_text, o.status])
 
         QMessageBox.information(self, "Export", "CSV exported successfully.")
 
 
+# Actions the server records (routes/admin.js); the filter box also takes any other
+AUDIT_ACTIONS = ["", "UPDATE_AVAILABILITY", "SET_STAFF_ACTIVE", "CANCEL_OFFER", "COMPLETE_OFFER"]
+
+
+def audit_card(e: dict):
+    actor = e.get("actorId") if isinstance(e.get("actorId"), dict) else {}
+    when = (e.get("createdAt") or "").replace("T", " ")[:19]
+    target = f"{e.get('targetType') or ''} {e.get('targetId') or ''}".strip()
+    return e.get("action") or "—", f"@{actor.get('username') or 'unknown'} · {when}", target
+
+
+class AuditLogPage(QWidget):
+    """Who did what, newest first, paged from the server as the list scrolls."""
+
+    def __init__(self, api: ApiClient):
+        super().__init__()
+        self.api = api
+        self.tasks = TaskRunner(self)
+
+        self.model = RecordListModel(audit_card, None, self)
+        self.pager = CursorPager(self.tasks, self.api.admin_audit_page, key="audit", parent=self)
+        self.pager.page_loaded.connect(self._add_page)
+        self.pager.failed.connect(lambda e: QMessageBox.critical(self, "Audit load error", str(e)))
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(14, 14, 14, 14)
+        root.setSpacing(14)
+
+        root.addWidget(card_title("Audit Log"))
+        root.addWidget(busy_bar(self.tasks))
+
+        filters = QHBoxLayout()
+        self.actor_input = input_box("Actor username")
+        self.action_box = QComboBox()
+        self.action_box.setEditable(True)
+        self.action_box.addItems(AUDIT_ACTIONS)
+        self.action_box.lineEdit().setPlaceholderText("Any action")
+        self.target_type_box = QComboBox()
+        self.target_type_box.addItems(["", "Offer", "User"])
+        self.target_id_input = input_box("Target id")
+        self.btn_apply = primary_btn("Apply")
+        self.btn_apply.clicked.connect(self.load)
+        self.actor_input.returnPressed.connect(self.load)
+        self.target_id_input.returnPressed.connect(self.load)
+
+        filters.addWidget(self.actor_input, 2)
+        filters.addWidget(self.action_box, 2)
+        filters.addWidget(self.target_type_box, 1)
+        filters.addWidget(self.target_id_input, 2)
+        filters.addWidget(self.btn_apply)
+        root.addLayout(filters)
+
+        self.list = card_list_view(self.model)
+        self.pager.watch(self.list.verticalScrollBar())
+        root.addWidget(self.list, stretch=1)
+
+        self.lbl_count = QLabel("")
+        self.lbl_count.setStyleSheet("font-size: 12px; color: #555;")
+        root.addWidget(self.lbl_count)
+
+        btns = QHBoxLayout()
+        self.btn_refresh = ghost_btn("Refresh")
+        self.btn_export = ghost_btn("Export CSV")
+        self.btn_refresh.clicked.connect(self.load)
+        self.btn_export.clicked.connect(self.export_csv)
+        btns.addWidget(self.btn_refresh)
+        btns.addWidget(self.btn_export)
+        btns.addStretch(1)
+        root.addLayout(btns)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.pager.loaded and not self.pager.loading:
+            self.load()  # nothing fetched until the page is first opened
+
+    def _filters(self) -> dict:
+        return {
+            "actor": self.actor_input.text().strip(),
+            "action": self.action_box.currentText().strip(),
+            "target_type": self.target_type_box.currentText(),
+            "target_id": self.target_id_input.text().strip(),
+        }
+
+    def load(self):
+        self.model.set_records([])
+        self.lbl_count.setText("")
+        self.pager.reset(**self._filters())
+
+    def _add_page(self, entries, first):
+        if first:
+            self.model.set_records(entries)
+        else:
+            self.model.append_records(entries)
+        more = "+" if self.pager.has_more else ""
+        self.lbl_count.setText(f"{self.pager.loaded}{more} entries")
+
+    def export_csv(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save CSV", "audit_log.csv", "CSV Files (*.csv)")
+        if not path:
+            return
+
+        # streamed by the server straight to disk: every matching entry, not just the loaded pages
+        self.tasks.submit(
+            None, self.api.export_audit_csv, path, **self._filters(),
+            on_result=lambda size: QMessageBox.information(self, "Export", f"Audit log exported ({size // 1024} KB)."),
+            on_error=lambda e: QMessageBox.critical(self, "Export failed", str(e)),
+        )
+
+
+def _ms(value):
+    return "—" if value is None else f"{value:.0f}"
+
+
+class DiagnosticsPage(QWidget):
+    """
+    Request telemetry (telemetry.RequestTelemetry) while it happens: per-endpoint latency,
+    payload size, statuses, retries and cache hits, and how long pages take to render
+    results. No sidebar button: Ctrl+Shift+D opens it.
+    """
+    ENDPOINT_COLUMNS = ["Endpoint", "Calls", "Network", "Cache", "p50 ms", "p95 ms", "p99 ms", "Avg KB", "Statuses", "Retries"]
+    HANDLER_COLUMNS = ["Task", "Results", "p50 ms", "p95 ms", "Max ms", "Queued p95 ms"]
+
+    def __init__(self, api: ApiClient):
+        super().__init__()
+        self.api = api
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(14, 14, 14, 14)
+        root.setSpacing(14)
+
+        root.addWidget(card_title("Diagnostics"))
+        self.lbl_totals = value_label("")
+        root.addWidget(self.lbl_totals)
+
+        root.addWidget(section_label("Requests (slowest in total first)"))
+        self.endpoints = self._table(self.ENDPOINT_COLUMNS)
+        root.addWidget(self.endpoints, stretch=3)
+
+        root.addWidget(section_label("Rendering results"))
+        self.handlers = self._table(self.HANDLER_COLUMNS)
+        root.addWidget(self.handlers, stretch=2)
+
+        btns = QHBoxLayout()
+        self.btn_dump = ghost_btn("Dump JSON…")
+        self.btn_clear = ghost_btn("Clear")
+        self.btn_dump.clicked.connect(self.dump_json)
+        self.btn_clear.clicked.connect(self.clear)
+        btns.addWidget(self.btn_dump)
+        btns.addWidget(self.btn_clear)
+        btns.addStretch(1)
+        root.addLayout(btns)
+
+        # live while shown, idle otherwise
+        self._timer = QTimer(self)
+        self._timer.setInterval(1000)
+        self._timer.timeout.connect(self.refresh)
+
+    @staticmethod
+    def _table(columns):
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    @staticmethod
+    def _fill(table, rows):
+        table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, text in enumerate(row):
+                item = QTableWidgetItem(str(text))
+                if c:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(r, c, item)
+        table.resizeColumnToContents(0)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        snap = self.api.telemetry.snapshot()
+        extra = self.api.diagnostics()
+        t, cache = snap["totals"], extra["cache"]
+        self.lbl_totals.setText(
+            f"{t['requests']} requests · {t['network']} to the server ({t['bytes'] // 1024} KB) · "
+            f"{t['local']} local · {t['retries']} retries · {t['errors']} errors · "
+            f"cache hit ratio {cache['hit_ratio']:.0%} · circuit {extra['transport']['circuit']}"
+        )
+        self._fill(self.endpoints, [
+            (
+                f"{e['method']} {e['endpoint']}", e["count"], e["network"], e["cache"] + e["coalesced"] + e["disk"],
+                _ms(e["p50"]), _ms(e["p95"]), _ms(e["p99"]), f"{e['avg_bytes'] / 1024:.1f}",
+                " ".join(f"{code}×{n}" for code, n in sorted(e["statuses"].items())), e["retries"],
+            )
+            for e in snap["endpoints"]
+        ])
+        self._fill(self.handlers, [
+            (h["task"], h["count"], _ms(h["p50"]), _ms(h["p95"]), _ms(h["max"]), _ms(h["wait_p95"]))
+            for h in snap["handlers"]
+        ])
+
+    def dump_json(self):
+        name = f"adolphus-diagnostics-{datetime.now():%Y%m%d-%H%M%S}.json"
+        path, _ = QFileDialog.getSaveFileName(self, "Save diagnostics", name, "JSON Files (*.json)")
+        if not path:
+            return
+        try:
+            self.api.telemetry.dump(path, self.api.diagnostics())
+        except OSError as e:
+            QMessageBox.critical(self, "Dump error", str(e))
+            return
+        QMessageBox.information(self, "Diagnostics", f"Saved to {path}")
+
+    def clear(self):
+        self.api.telemetry.clear()
+        self.refresh()
+
+
 # ----------------- Main Window -----------------
 class MainWindow(QMainWindow):
-    def __init__(self, api: ApiClient):
+    def __init__(self, api: ApiClient, started_at: float | None = None):
         super().__init__()
         self.api = api
 
@@ -2232,6 +2964,12 @@ class MainWindow(QMainWindow):
         title.setStyleSheet("color: white; font-size: 18px; padding-left: 16px; font-weight: 900;")
         top_layout.addWidget(title)
         top_layout.addStretch(1)
+        self.lbl_startup = QLabel("Loading…")
+        self.lbl_startup.setStyleSheet("color: rgba(255,255,255,0.75); font-size: 11px; padding-right: 16px;")
+        top_layout.addWidget(self.lbl_startup)
+        self.lbl_live = QLabel("○ Offline")
+        self.lbl_live.setStyleSheet("color: rgba(255,255,255,0.75); font-size: 11px; padding-right: 16px;")
+        top_layout.addWidget(self.lbl_live)
         root_layout.addWidget(topbar)
 
         # Body
@@ -2264,6 +3002,7 @@ class MainWindow(QMainWindow):
         self.btn_profile = self._nav_button("🪪", "Profile")
         self.btn_payroll = self._nav_button("💷", "Payroll")
         self.btn_cal = self._nav_button("📆", "Calendar")
+        self.btn_audit = self._nav_button("🧾", "Audit")
 
         sb.addWidget(self.btn_dash)
         sb.addWidget(self.btn_venues)
@@ -2274,6 +3013,7 @@ class MainWindow(QMainWindow):
         sb.addWidget(self.btn_profile)
         sb.addWidget(self.btn_payroll)
         sb.addWidget(self.btn_cal)
+        sb.addWidget(self.btn_audit)
         sb.addStretch(1)
 
         # Main card
@@ -2282,25 +3022,39 @@ class MainWindow(QMainWindow):
         card_layout = QVBoxLayout(self.card)
         card_layout.setContentsMargins(24, 24, 24, 24)
 
+        # Shown while the current page is rendering last-known data from disk
+        self.stale_banner = QLabel("")
+        self.stale_banner.setStyleSheet("""
+            background: #FFF4D6; color: #7A5B00; border-radius: 12px;
+            padding: 6px 12px; font-weight: 700;
+        """)
+        self.stale_banner.hide()
+        card_layout.addWidget(self.stale_banner)
+        self._offline = False
+
         # Pages stack
         self.stack = QStackedWidget()
+        TaskRunner.telemetry = api.telemetry  # time how long pages take to render results
+
+        # one shared copy of staff/offers/placements/venues for every page
+        self.entities = EntityStore(self)
 
-        self.history_page = HistoryPage(self.api)
-        self.venues_page = VenueTemplatesPage(self.api)
-        self.history_list_page = HistoryListPage(self.api, self.open_history_for_staff)
+        self.history_page = HistoryPage(self.api, self.entities)
+        self.venues_page = VenueTemplatesPage(self.api, self.entities)
+        self.history_list_page = HistoryListPage(self.api, self.entities, self.open_history_for_staff)
         self.dashboard_page = DashboardPage(self.api)
         self.new_user_page = NewUserPage(self.api)
-        self.schedule_list_page = ScheduleListPage(self.api, on_pick_staff=self.open_detail)
-        self.detail_page = ScheduleDetailPage(self.api)
-        self.venues_page.on_changed = self.detail_page.reload_venues_dropdown
-
+        self.schedule_list_page = ScheduleListPage(self.api, self.entities, on_pick_staff=self.open_detail)
+        self.detail_page = ScheduleDetailPage(self.api, self.entities)
 
         # Profile list uses same ScheduleListPage => already has search ✅
-        self.profile_list_page = ScheduleListPage(self.api, on_pick_staff=self.open_profile_from_list)
-        self.profile_page = StaffProfilePage(self.api)
-        self.calendar_page = CalendarPage(self.api)
+        self.profile_list_page = ScheduleListPage(self.api, self.entities, on_pick_staff=self.open_profile_from_list)
+        self.profile_page = StaffProfilePage(self.api, self.entities)
+        self.calendar_page = CalendarPage(self.api, self.entities)
         self.payroll_page = PayrollPage(self.api)
-        self.pending_page = PendingApprovalsPage(self.api)
+        self.pending_page = PendingApprovalsPage(self.api, self.entities)
+        self.audit_page = AuditLogPage(self.api)
+        self.diagnostics_page = DiagnosticsPage(self.api)
 
         self.detail_page.on_open_profile = self.open_profile
         self.profile_page.back_btn.clicked.connect(self.back_from_profile)
@@ -2318,9 +3072,15 @@ class MainWindow(QMainWindow):
         self.stack.addWidget(self.profile_page)
         self.stack.addWidget(self.calendar_page)
         self.stack.addWidget(self.payroll_page)
+        self.stack.addWidget(self.audit_page)
+        self.stack.addWidget(self.diagnostics_page)
 
         card_layout.addWidget(self.stack)
 
+        # Drop in-flight reads of staff-scoped pages once the admin navigates away
+        self._current_page = None
+        self.stack.currentChanged.connect(self._on_page_changed)
+
         # Wire sidebar
         self.btn_dash.clicked.connect(lambda: self.stack.setCurrentWidget(self.dashboard_page))
         self.btn_venues.clicked.connect(lambda: self.stack.setCurrentWidget(self.venues_page))
@@ -2331,6 +3091,9 @@ class MainWindow(QMainWindow):
         self.btn_cal.clicked.connect(lambda: self.stack.setCurrentWidget(self.calendar_page))
         self.btn_payroll.clicked.connect(lambda: self.stack.setCurrentWidget(self.payroll_page))
         self.btn_history.clicked.connect(lambda: self.stack.setCurrentWidget(self.history_list_page))
+        self.btn_audit.clicked.connect(lambda: self.stack.setCurrentWidget(self.audit_page))
+        # hidden page for bug reports: no sidebar button
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=lambda: self.stack.setCurrentWidget(self.diagnostics_page))
 
         body_layout.addWidget(self.sidebar)
         body_layout.addWidget(self.card, stretch=1)
@@ -2340,6 +3103,84 @@ class MainWindow(QMainWindow):
 
         self.stack.setCurrentWidget(self.dashboard_page)
 
+        # One request per endpoint for every page's initial data, all in parallel
+        self.warmup = WarmupOrchestrator(
+            self.api,
+            [self.dashboard_page, self.venues_page, self.pending_page, self.schedule_list_page,
+             self.detail_page, self.profile_list_page, self.history_list_page, self.payroll_page],
+            window=self,
+            started_at=started_at,
+            parent=self,
+        )
+        self.warmup.failed.connect(self._on_warmup_failed)
+        self.warmup.stale_changed.connect(lambda *_: self._update_stale_banner())
+        self.warmup.ready.connect(self._on_warmup_ready)
+        self.stack.currentChanged.connect(lambda *_: self._update_stale_banner())
+        self.warmup.start()
+
+        if self.api.store is not None:
+            self.warmup.tasks.submit(None, self.api.store.compact)
+
+        # live offer events patch the open pages instead of Refresh clicks
+        self.events = EventStream(self.api, self)
+        self.events.event.connect(self._on_live_event)
+        self.events.reset.connect(self._on_live_reset)
+        self.events.connected_changed.connect(
+            lambda up: self.lbl_live.setText("● Live" if up else "○ Reconnecting…")
+        )
+
+    def closeEvent(self, event):
+        self.events.stop()
+        super().closeEvent(event)
+
+    def _on_live_event(self, kind, data):
+        if kind == "offer.removed":
+            self.api.offers_changed(data.get("userId"))
+            self.entities.remove("offers", [data.get("offerId")])
+            self.dashboard_page.apply_status_change(data.get("previousStatus", ""), "")
+            return
+        if not kind.startswith("offer.") or not isinstance(data.get("offer"), dict):
+            return
+
+        # the store patches every page showing the offer (history, calendar, ...)
+        offer = self.entities.upsert("offers", [data["offer"]])[0]
+        self.api.offers_changed(offer.staff_id)
+        self.pending_page.apply_offer(offer)
+        if kind != "offer.updated":
+            self.dashboard_page.apply_status_change(data.get("previousStatus", ""), offer.status)
+
+    def _on_live_reset(self):
+        # the server could not replay what we missed: reload what the live pages show
+        self.api.offers_changed()
+        self.dashboard_page.load()
+        self.pending_page.load()
+
+    def _on_warmup_failed(self, name, e):
+        if self.api.last_known(name) is not None:
+            # pages keep showing the offline copy; the banner says it could not be refreshed
+            self._offline = True
+            self._update_stale_banner()
+            return
+        QMessageBox.critical(self, "Load error", f"{name}: {e}")
+
+    def _update_stale_banner(self):
+        since = self.warmup.stale_since(self.stack.currentWidget())
+        if since is None:
+            self.stale_banner.hide()
+            return
+        when = datetime.fromtimestamp(since).strftime("%d %b %H:%M")
+        tail = "could not refresh (offline)" if self._offline else "refreshing…"
+        self.stale_banner.setText(f"⚠ Showing saved data from {when} — {tail}")
+        self.stale_banner.show()
+
+    def _on_warmup_ready(self, metrics):
+        self.startup_metrics = metrics
+        self.events.start()  # after the first data, so no event is overwritten by an older load
+        cached = f"cached {metrics['cached_ms']} ms · " if metrics.get("cached_ms") is not None else ""
+        self.lbl_startup.setText(
+            f"{cached}First paint {metrics['first_paint_ms']} ms · ready {metrics['ready_ms']} ms"
+        )
+
     def _nav_button(self, icon_text, label):
         b = QPushButton(f"{icon_text}\n{label}")
         b.setCursor(Qt.PointingHandCursor)
@@ -2361,6 +3202,18 @@ class MainWindow(QMainWindow):
         """)
         return b
 
+    def _on_page_changed(self, _index):
+        prev = self._current_page
+        self._current_page = self.stack.currentWidget()
+        if prev is self._current_page:
+            return
+        # a page left mid-load stops its reads, and finishes them when the user comes back
+        # (Detail -> Profile -> Back must not return to an empty history)
+        if prev is not None and getattr(prev, "cancel_on_leave", False):
+            prev.tasks.suspend()
+        if getattr(self._current_page, "cancel_on_leave", False):
+            self._current_page.tasks.resume()
+
     def open_history_for_staff(self, staff_id, staff_name):
         self.history_page.set_staff(staff_id, staff_name)
         self.stack.setCurrentWidget(self.history_page)
@@ -2390,13 +3243,16 @@ class MainWindow(QMainWindow):
 def main():
     app = QApplication(sys.argv)
     app.setFont(QFont("Segoe UI", 10))
+    app.setApplicationName("Adolphus Admin")
 
-    api = ApiClient(BASE_URL)
+    data_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    store = LocalStore(os.path.join(data_dir, "offline_cache.sqlite3"))
+    api = ApiClient(BASE_URL, store=store)
     main_win = None
 
     def start_admin():
         nonlocal main_win
-        main_win = MainWindow(api)
+        main_win = MainWindow(api, started_at=time.perf_counter())
         main_win.show()
 
     login = LoginPage(api, on_success=start_admin)
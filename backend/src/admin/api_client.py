@@ -1,14 +1,84 @@
+import os
+import threading
+import time
+
 import requests
 
+from local_store import LocalStore, StoredResponse
+from replica import Replica
+from response_cache import ResponseCache
+from telemetry import RequestTelemetry
+from transport import Transport
+
+# Reads written through to the on-disk store so the next launch can render before the network answers
+PERSISTED_PATHS = frozenset({
+    "/admin/staff",
+    "/admin/venues",
+    "/offers/pending",
+    "/admin/payroll/periods",
+    "/admin/dashboard",
+})
+
+# ApiClient read method -> persisted path (what the UI can ask for via last_known)
+OFFLINE_READS = {
+    "admin_staff": "/admin/staff",
+    "list_staff": "/admin/staff",
+    "venues_list": "/admin/venues",
+    "list_venues": "/admin/venues",
+    "pending_offers": "/offers/pending",
+    "payroll_periods": "/admin/payroll/periods",
+    "admin_dashboard": "/admin/dashboard",
+}
+
+# Lists kept as a local copy refreshed with deltas (ApiClient.sync): path or prefix ->
+# (sort field, newest first, rows kept) matching the server's full list
+SYNCED_LISTS = {
+    "/admin/staff": ("_id", False, None),
+    "/admin/venues": ("createdAt", True, None),
+    "/offers/pending": ("createdAt", True, None),
+    "/admin/offers/by-staff/": ("createdAt", True, 200),
+}
+
+
+class _Flight:
+    """One in-flight GET that identical concurrent callers wait on."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
 
 class ApiClient:
-    def __init__(self, base_url: str, token: str | None = None):
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        cache: ResponseCache | None = None,
+        transport: Transport | None = None,
+        store: LocalStore | None = None,
+        telemetry: RequestTelemetry | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.token = token
-        self.session = requests.Session()
+        self.transport = transport or Transport()
+        self.session = self.transport.session  # pooled, safe to share across worker threads
+        self.cache = cache if cache is not None else ResponseCache()
+        self.store = store
+        self.store_scope = None  # "<base_url>|<username>" once logged in
+
+        # single-flight: (path, params) -> _Flight
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self.coalesced_calls = 0  # network calls saved by joining an in-flight GET
+
+        self._replicas = {}  # path -> Replica (see sync)
+        self.telemetry = telemetry if telemetry is not None else RequestTelemetry()
 
     def set_token(self, token: str | None):
         self.token = token
+        self.cache.clear()  # cached reads belong to the previous login
+        with self._inflight_lock:
+            self._replicas.clear()
 
     def headers(self):
         h = {"Content-Type": "application/json"}
@@ -19,8 +89,8 @@ class ApiClient:
 
     # ---------- AUTH ----------
     def login(self, username: str, password: str):
-        r = self.session.post(
-            f"{self.base_url}/auth/login",
+        r = self._request(
+            "POST", "/auth/login",
             json={"username": username, "password": password},
             headers={"Content-Type": "application/json"},
         )
@@ -29,7 +99,9 @@ class ApiClient:
         token = data.get("token")
         if not token:
             raise Exception("Login failed: token not returned")
-        self.token = token
+        # scope first: replicas rebuilt after set_token() clears them load this account's copy
+        self.store_scope = f"{self.base_url}|{username}"
+        self.set_token(token)
         return data  # includes user role
 
     # ---------- EXISTING (your app) ----------
@@ -46,8 +118,8 @@ class ApiClient:
      else:
          payload = dict(kwargs)
 
-     r = self.session.post(
-        f"{self.base_url}/auth/create-staff",
+     r = self._request(
+        "POST", "/auth/create-staff",
         json=payload,
         headers=self.headers(),
     )
@@ -56,8 +128,8 @@ class ApiClient:
     
     def create_manager(self, payload: dict):
         # payload: {fullName,email,dob,username,password}
-        r = self.session.post(
-            f"{self.base_url}/auth/create-manager",
+        r = self._request(
+            "POST", "/auth/create-manager",
             json=payload,
             headers=self.headers(),
         )
@@ -65,79 +137,126 @@ class ApiClient:
         return r.json()
 
     def list_staff(self):
-        r = self.session.get(f"{self.base_url}/admin/staff", headers=self.headers())
-        r.raise_for_status()
-        return r.json()
+        return self._get("/admin/staff")
 
     def send_offer(self, staff_id: str, placement: dict, force: bool = False):
         payload = {"userId": staff_id, "placement": placement, "force": bool(force)}
-        r = self.session.post(
-            f"{self.base_url}/offers/send",
+        r = self._request(
+            "POST", "/offers/send",
             json=payload,
             headers=self.headers(),
         )
         r.raise_for_status()
+        self._invalidate_staff_offers(staff_id)
         return r.json()
 
+    def send_offers_batch(self, placement: dict, items: list, force: bool = False) -> list:
+        """
+        One placement template to many staff x dates. items are {"userId", "date"} (plus
+        "force": True to book over a conflict); returns one result per item, in order, with
+        status "sent" (offerId), "conflict" (conflicts) or "error" (message).
+        """
+        payload = {"placement": placement, "items": items, "force": bool(force)}
+        r = self._request(
+            "POST", "/offers/send-batch",
+            json=payload,
+            headers=self.headers(),
+        )
+        r.raise_for_status()
+        results = r.json().get("results") or []
+        for staff_id in {res.get("userId") for res in results if res.get("status") == "sent"}:
+            self._invalidate_staff_offers(staff_id)
+        return results
+
 
 
     def pending_offers(self):
-        r = self.session.get(f"{self.base_url}/offers/pending", headers=self.headers())
-        r.raise_for_status()
-        return r.json()
+        return self._get("/offers/pending")
 
     def offer_decision(self, offer_id: str, decision: str):
-        r = self.session.patch(
-        f"{self.base_url}/offers/{offer_id}/decision",
+        r = self._request(
+        "PATCH", f"/offers/{offer_id}/decision",
         json={"decision": decision},
         headers=self.headers(),
        )
         r.raise_for_status()
+        self._invalidate_offer(offer_id)
         return r.json()
 
 
 
     # ---------- ADMIN ROUTES (from your admin.js) ----------
     def admin_dashboard(self):
-            r = self.session.get(f"{self.base_url}/admin/dashboard", headers=self.headers())
-            r.raise_for_status()
-            return r.json()
+        return self._get("/admin/dashboard")
 
     def admin_staff(self):
         # ✅ FIX: this is what your UI calls
-        r = self.session.get(f"{self.base_url}/admin/staff", headers=self.headers())
-        r.raise_for_status()
-        return r.json()
+        return self._get("/admin/staff")
     
+    def search_staff(self, q: str, limit: int = 50):
+        """Server-ranked staff matches (exact, prefix, then typo-tolerant), best first."""
+        return self._get("/admin/staff", params={"q": q, "limit": limit})
+
     def admin_staff_profile(self, staff_id: str):
-        r = self.session.get(f"{self.base_url}/admin/staff/{staff_id}", headers=self.headers())
-        r.raise_for_status()
-        return r.json()
+        return self._get(f"/admin/staff/{staff_id}")
     def admin_set_staff_active(self, staff_id: str, is_active: bool):
-        r = self.session.patch(
-        f"{self.base_url}/admin/staff/{staff_id}/active",
+        r = self._request(
+        "PATCH", f"/admin/staff/{staff_id}/active",
         json={"isActive": bool(is_active)},
         headers=self.headers(),
     )
         r.raise_for_status()
+        self.cache.invalidate("/admin/staff")
         return r.json()
 
 
     def admin_offers_by_staff(self, staff_id: str):
-        r = self.session.get(
-            f"{self.base_url}/admin/offers/by-staff/{staff_id}",
-            headers=self.headers()
-        )
-        r.raise_for_status()
-        return r.json()
+        return self._get(f"/admin/offers/by-staff/{staff_id}")
+
+    def admin_offers_by_staff_page(
+        self,
+        staff_id: str,
+        cursor: str | None = None,
+        limit: int = 50,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        q: str | None = None,
+    ):
+        """
+        One page of a staff member's offers, newest placement date first.
+        Returns {"items": [...], "nextCursor": str | None}; pass nextCursor back for the next page.
+        """
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        if date_from:
+            params["from"] = date_from
+        if date_to:
+            params["to"] = date_to
+        if q:
+            params["q"] = q
+        return self._get(f"/admin/offers/by-staff/{staff_id}", params=params)
+
+    def iter_offers_by_staff(self, staff_id: str, limit: int = 100, **filters):
+        """Yield pages (lists of offers) until the server runs out. filters: date_from, date_to, q."""
+        cursor = None
+        while True:
+            page = self.admin_offers_by_staff_page(staff_id, cursor=cursor, limit=limit, **filters)
+            items = page.get("items") or []
+            if items:
+                yield items
+            cursor = page.get("nextCursor")
+            if not cursor:
+                return
 
     def admin_edit_offer(self, offer_id: str, placement_patch: dict):
-        r = self.session.put(
-            f"{self.base_url}/offers/admin/offers/{offer_id}",  # ✅ FIXED PATH
+        r = self._request(
+            "PUT", f"/offers/admin/offers/{offer_id}",  # ✅ FIXED PATH
             json=placement_patch,                               # ✅ correct body
             headers=self.headers()
         )
         r.raise_for_status()
+        self._invalidate_offer(offer_id)
         return r.json()
 
     
@@ -145,29 +264,32 @@ class ApiClient:
         return self.admin_edit_offer(offer_id, placement_patch)
 
     def admin_delete_offer(self, offer_id: str):
-        r = self.session.delete(
-        f"{self.base_url}/admin/offers/{offer_id}",
+        r = self._request(
+        "DELETE", f"/admin/offers/{offer_id}",
         headers=self.headers(),
         )
         r.raise_for_status()
+        self._invalidate_offer(offer_id)
         return r.json()
 
 
     def admin_cancel_offer(self, offer_id: str, reason: str = ""):
-        r = self.session.post(
-            f"{self.base_url}/admin/offers/{offer_id}/cancel",
+        r = self._request(
+            "POST", f"/admin/offers/{offer_id}/cancel",
             json={"reason": reason},
             headers=self.headers()
         )
         r.raise_for_status()
+        self._invalidate_offer(offer_id)
         return r.json()
 
     def admin_complete_offer(self, offer_id: str):
-        r = self.session.post(
-        f"{self.base_url}/admin/offers/{offer_id}/complete",
+        r = self._request(
+        "POST", f"/admin/offers/{offer_id}/complete",
         headers=self.headers(),
         )
         r.raise_for_status()
+        self._invalidate_offer(offer_id)
         return r.json()
 
     def admin_mark_completed(self, offer_id: str):
@@ -175,18 +297,61 @@ class ApiClient:
         return self.admin_complete_offer(offer_id)
 
     def admin_calendar(self, date_from: str, date_to: str):
-        r = self.session.get(
-            f"{self.base_url}/admin/calendar",
-            params={"from": date_from, "to": date_to},
-            headers=self.headers()
-        )
-        r.raise_for_status()
-        return r.json()
+        return self._get("/admin/calendar", params={"from": date_from, "to": date_to})
 
     def admin_audit(self):
-        r = self.session.get(f"{self.base_url}/admin/audit", headers=self.headers())
-        r.raise_for_status()
-        return r.json()
+        return self._get("/admin/audit")
+
+    def admin_audit_page(
+        self,
+        cursor: str | None = None,
+        limit: int = 50,
+        actor: str | None = None,
+        action: str | None = None,
+        target_type: str | None = None,
+        target_id: str | None = None,
+    ):
+        """
+        One page of the audit log, newest first. actor is a username.
+        Returns {"items": [...], "nextCursor": str | None}; pass nextCursor back for the next page.
+        """
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        if actor:
+            params["actor"] = actor
+        if action:
+            params["action"] = action
+        if target_type:
+            params["targetType"] = target_type
+        if target_id:
+            params["targetId"] = target_id
+        return self._get("/admin/audit", params=params)
+
+    def export_audit_csv(self, path: str, actor=None, action=None, target_type=None, target_id=None) -> int:
+        """
+        Stream the (filtered) audit log as CSV into `path` without holding it in memory.
+        Written to a side file first so a failed export never leaves half a file behind.
+        Returns the number of bytes written.
+        """
+        params = {k: v for k, v in (
+            ("actor", actor), ("action", action), ("targetType", target_type), ("targetId", target_id),
+        ) if v}
+        part = path + ".part"
+        written = 0
+        with self._request("GET", "/admin/audit/export.csv", headers=self.headers(), params=params, stream=True) as r:
+            r.raise_for_status()
+            try:
+                with open(part, "wb") as f:
+                    for chunk in r.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                        written += len(chunk)
+                os.replace(part, path)
+            except BaseException:
+                if os.path.exists(part):
+                    os.remove(part)
+                raise
+        return written
     
     def payroll_periods(self):
         return self._get("/admin/payroll/periods")
@@ -194,29 +359,191 @@ class ApiClient:
     def payroll_by_paydate(self, pay_date: str):
         return self._get(f"/admin/payroll/period/{pay_date}")
 
+    def payroll_bundle(self, pay_date: str):
+        """
+        Summary + every shift row for a pay period in one response (shifts are positional, see `fields`).
+        A closed period comes back frozen (`snapshot`: {hash, frozenAt}) and never changes again:
+        it is kept on disk by hash and later reads of it are local.
+        """
+        if self.store is not None and self.store_scope is not None:
+            frozen = self.store.get_snapshot(self.store_scope, f"payroll:{pay_date}")
+            if frozen is not None:
+                self.telemetry.record_local(f"/admin/payroll/period/{pay_date}/bundle", "disk")
+                return frozen
+        data = self._get(f"/admin/payroll/period/{pay_date}/bundle")
+        snapshot = data.get("snapshot") if isinstance(data, dict) else None
+        if snapshot and self.store is not None and self.store_scope is not None:
+            self.store.put_snapshot(self.store_scope, f"payroll:{pay_date}", snapshot["hash"], data)
+        return data
+
     
         # ---------------- HTTP helpers ----------------
     def _get(self, path: str, params: dict | None = None):
-        url = f"{self.base_url}{path}"
-        r = self.session.get(url, headers=self.headers(), params=params)
+        """
+        GET through the response cache, with single-flight: concurrent calls for the same
+        path + params share one network request and all receive the same (read-only)
+        result or exception.
+        """
+        key = (path, tuple(sorted((params or {}).items())))
+        entry = self.cache.fresh(key)
+        if entry is not None:
+            self.telemetry.record_local(path, "cache")
+            return entry.value
+
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self.coalesced_calls += 1
+
+        if not leader:
+            self.telemetry.record_local(path, "coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._fetch(key, path, params)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        try:
+            r = self.transport.request(method, f"{self.base_url}{path}", path=path, **kwargs)
+        except requests.RequestException as e:
+            ms = (time.perf_counter() - started) * 1000
+            self.telemetry.record_request(method, path, 0, ms, 0, getattr(e, "retries", 0))
+            raise
+        ms = (time.perf_counter() - started) * 1000
+        if kwargs.get("stream"):
+            size = int(r.headers.get("Content-Length") or 0)  # body not read yet: time is to the headers
+        else:
+            size = len(r.content)
+        self.telemetry.record_request(method, path, r.status_code, ms, size, getattr(r, "retries", 0))
+        return r
+
+    def _persisted(self, path: str, params) -> bool:
+        return self.store is not None and self.store_scope is not None and not params and path in PERSISTED_PATHS
+
+    def _fetch(self, key, path: str, params: dict | None = None):
+        if not params and self._sync_spec(path) is not None:
+            return self.sync(path)
+
+        headers = self.headers()
+        generation = self.cache.generation
+        entry = self.cache.stale(key)
+        if entry is None and self._persisted(path, params):
+            entry = self.store.get(self.store_scope, path)  # revalidate the on-disk copy instead
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        r = self._request("GET", path, headers=headers, params=params)
+        if r.status_code == 304 and entry is not None:
+            if isinstance(entry, StoredResponse):
+                self.cache.store(key, entry.value, entry.etag, entry.last_modified, entry.size, generation)
+                self.store.touch(self.store_scope, path)
+            else:
+                self.cache.mark_revalidated(key, entry)
+            return entry.value
         r.raise_for_status()
-        return r.json()
+        data = r.json()
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        self.cache.store(key, data, etag=etag, last_modified=last_modified, size=len(r.content), generation=generation)
+        if self._persisted(path, params):
+            self.store.put(self.store_scope, path, None, data, etag, last_modified)
+        return data
+
+    # ---------------- delta sync ----------------
+    @staticmethod
+    def _sync_spec(path: str):
+        spec = SYNCED_LISTS.get(path)
+        if spec is None and path.startswith("/admin/offers/by-staff/") and path.count("/") == 4:
+            spec = SYNCED_LISTS["/admin/offers/by-staff/"]
+        return spec
+
+    def sync(self, path: str) -> list:
+        """
+        Bring the local copy of a synced list (SYNCED_LISTS) up to date and return it.
+        The first call downloads the whole list (GET path?since=0); later ones only what
+        changed since (records and deletions), merged by _id. Reads of these paths through
+        _get land here once the cached copy goes stale or is invalidated.
+
+        Persisted lists keep their copy on disk, cursor included, so a restart also only
+        downloads the delta.
+        """
+        spec = self._sync_spec(path)
+        if spec is None:
+            raise ValueError(f"{path} is not a synced list")
+        key = (path, ())
+        generation = self.cache.generation
+        replica = self._replica(path, spec)
+
+        with replica.lock:
+            r = self._request(
+                "GET", path, headers=self.headers(), params={"since": replica.cursor or "0"}
+            )
+            r.raise_for_status()
+            items = replica.apply(r.json(), size=len(r.content))
+            if replica.needs_full:
+                # a removal left a capped copy short of rows only the server has
+                r = self._request("GET", path, headers=self.headers(), params={"since": "0"})
+                r.raise_for_status()
+                items = replica.apply(r.json(), size=len(r.content))
+
+        self.cache.store(key, items, size=replica.size, generation=generation)
+        if self._persisted(path, None):
+            # the cursor is this copy's validator: it rides in the etag column
+            self.store.put(self.store_scope, path, None, items, replica.cursor)
+        return items
+
+    def _replica(self, path: str, spec) -> Replica:
+        with self._inflight_lock:
+            replica = self._replicas.get(path)
+            if replica is not None:
+                return replica
+            field, newest_first, limit = spec
+            stored = self.store.get(self.store_scope, path) if self._persisted(path, None) else None
+            if stored is not None and isinstance(stored.value, list):
+                # a copy saved before delta sync carries a real ETag: the server answers that in full
+                replica = Replica(stored.value, stored.etag, (field, newest_first), limit)
+            else:
+                replica = Replica(order=(field, newest_first), limit=limit)
+            self._replicas[path] = replica
+            return replica
+
+    def last_known(self, method_name: str) -> StoredResponse | None:
+        """Last response saved on disk for an ApiClient read method, without touching the network."""
+        path = OFFLINE_READS.get(method_name)
+        if path is None or self.store is None or self.store_scope is None:
+            return None
+        return self.store.get(self.store_scope, path)
 
     def _post(self, path: str, payload: dict | None = None):
-        url = f"{self.base_url}{path}"
-        r = self.session.post(url, headers=self.headers(), json=payload or {})
+        r = self._request("POST", path, headers=self.headers(), json=payload or {})
         r.raise_for_status()
         return r.json()
 
     def _patch(self, path: str, payload: dict | None = None):
-        url = f"{self.base_url}{path}"
-        r = self.session.patch(url, headers=self.headers(), json=payload or {})
+        r = self._request("PATCH", path, headers=self.headers(), json=payload or {})
         r.raise_for_status()
         return r.json()
 
     def _delete(self, path: str):
-        url = f"{self.base_url}{path}"
-        r = self.session.delete(url, headers=self.headers())
+        r = self._request("DELETE", path, headers=self.headers())
         r.raise_for_status()
         return r.json()
     
@@ -231,13 +558,72 @@ class ApiClient:
         return self._get("/admin/venues")
 
     def venues_create(self, payload: dict):
-        return self._post("/admin/venues", payload)
+        data = self._post("/admin/venues", payload)
+        self.cache.invalidate("/admin/venues")
+        return data
     
     def venues_update(self, venue_id: str, payload: dict):
-        return self._patch(f"/admin/venues/{venue_id}", payload)
+        data = self._patch(f"/admin/venues/{venue_id}", payload)
+        self.cache.invalidate("/admin/venues")
+        return data
 
     def venues_delete(self, venue_id: str):
-        return self._delete(f"/admin/venues/{venue_id}")
+        data = self._delete(f"/admin/venues/{venue_id}")
+        self.cache.invalidate("/admin/venues")
+        return data
+
+    # ---------------- cache invalidation ----------------
+    def cache_stats(self) -> dict:
+        return self.cache.stats()
+
+    def diagnostics(self) -> dict:
+        """Client-wide counters to show next to telemetry.snapshot() (and to dump with it)."""
+        return {
+            "cache": self.cache.stats(),
+            "coalesced_calls": self.coalesced_calls,
+            "transport": {"retries": self.transport.retries, "circuit": self.transport.breaker.state},
+        }
+
+    def open_events(self, last_event_id=None) -> requests.Response:
+        """
+        Streaming GET /admin/events (server-sent events) for live_events.EventStream; the
+        caller reads and closes it. Opened outside the pooled session: a stream holds its
+        connection for hours. The read timeout outlasts the server's 25s heartbeat.
+        """
+        headers = dict(self.headers(), Accept="text/event-stream")
+        if last_event_id:
+            headers["Last-Event-ID"] = str(last_event_id)
+        return requests.get(f"{self.base_url}/admin/events", headers=headers, stream=True, timeout=(3.05, 60))
+
+    def offers_changed(self, staff_id: str | None = None):
+        """Evict cached reads an offer change made elsewhere (a live event) made stale; all staff when None."""
+        self._invalidate_staff_offers(staff_id or "")  # "" prefixes every staff member's paths
+
+    def _invalidate_staff_offers(self, staff_id: str):
+        self.cache.invalidate(
+            f"/admin/offers/by-staff/{staff_id}",
+            f"/admin/staff/{staff_id}",
+            "/offers/pending",
+            "/admin/dashboard",
+            "/admin/calendar",
+            "/admin/payroll/period/",
+        )
+
+    def _invalidate_offer(self, offer_id: str):
+        """Evict the owning staff's offers; if we never cached them, evict every staff's."""
+        def has_offer(offers):
+            if isinstance(offers, dict):
+                offers = offers.get("items")  # a cursor page
+            return isinstance(offers, list) and any(
+                isinstance(o, dict) and str(o.get("_id")) == str(offer_id) for o in offers
+            )
+
+        paths = self.cache.find("/admin/offers/by-staff/", has_offer)
+        if not paths:
+            self._invalidate_staff_offers("")
+            return
+        for path in paths:
+            self._invalidate_staff_offers(path.rsplit("/", 1)[-1])
 
 
 
@@ -0,0 +1,269 @@
+from array import array
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+# Fixed "today": offer statuses and closed pay periods must not drift with the wall clock,
+# or two runs of the same scenario would not be measuring the same thing.
+EPOCH = date(2025, 12, 1)
+TODAY = date(2026, 6, 1)
+DAYS = 395  # placements span EPOCH .. end of 2026
+
+FIRST_NAMES = [
+    "Amelia", "Oliver", "Isla", "George", "Ava", "Noah", "Mia", "Arthur", "Ivy", "Leo",
+    "Freya", "Oscar", "Lily", "Harry", "Grace", "Jack", "Sophia", "Charlie", "Ella", "Muhammad",
+    "Evie", "Theo", "Rosie", "Henry", "Florence", "Jacob", "Poppy", "Archie", "Willow", "Thomas",
+]
+LAST_NAMES = [
+    "Smith", "Jones", "Taylor", "Brown", "Williams", "Wilson", "Johnson", "Davies", "Patel", "Robinson",
+    "Wright", "Thompson", "Evans", "Walker", "White", "Roberts", "Green", "Hall", "Wood", "Jackson",
+    "Clarke", "Khan", "Hughes", "Edwards", "Turner", "Hill", "Moore", "Cooper", "Ward", "Morris",
+]
+VENUE_WORDS = [
+    "Grand", "Royal", "Riverside", "Park", "Crown", "Harbour", "Regent", "Kings", "Abbey", "Station",
+    "Garden", "Victoria", "Mill", "Castle", "Bridge",
+]
+VENUE_KINDS = ["Hotel", "Hall", "Suites", "Arms", "Rooms", "Lodge"]
+CITIES = ["London", "Leeds", "Bristol", "Liverpool", "York", "Bath", "Manchester", "Oxford"]
+ROLES = ["Waiter", "Bartender", "Porter", "Kitchen Assistant", "Host", "Chef de Partie"]
+RATES = [11.44, 11.5, 12.0, 12.5, 13.0, 13.75, 14.5, 15.0, 16.25]
+PAST_STATUSES = ["completed"] * 22 + ["cancelled"] * 2 + ["rejected"]
+FUTURE_STATUSES = ["offered"] * 60 + ["booking_confirmed"] * 34 + ["user_accepted"] + ["cancelled"] * 5
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(*values) -> int:
+    """splitmix64 over the values: a cheap, stable stand-in for a seeded RNG per record."""
+    h = 0x9E3779B97F4A7C15
+    for v in values:
+        h = (h ^ v) * 0xBF58476D1CE4E5B9 & _MASK
+        h = (h ^ (h >> 31)) * 0x94D049BB133111EB & _MASK
+        h ^= h >> 29
+    return h
+
+
+def _oid(kind: int, n: int) -> str:
+    """24-hex id in the ObjectId format the real API returns, unique per (kind, n)."""
+    return f"{kind:02x}{n:022x}"
+
+
+def _iso(day: date, minutes: int = 0) -> str:
+    at = datetime(day.year, day.month, day.day, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+    return at.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _hundredths(value) -> int:
+    # utils/pay.js
+    return int(float(value or 0) * 100 + 0.5 + 1e-7)
+
+
+def shift_pay_pence(hours, rate) -> int:
+    return (_hundredths(hours) * _hundredths(rate) + 50) // 100
+
+
+class Dataset:
+    """
+    Synthetic staff, offers, venues and audit entries, derived from (seed, index) so every
+    run of a scenario sees byte-identical responses without storing 500k documents.
+
+    Offers are numbered n = staff_index * per_staff + k; their fields are recomputed on
+    demand. One pass at start-up builds what the server would answer from indexes: staff
+    stats rollups, completed shifts per day (payroll, calendar) and the pending list.
+    """
+    def __init__(self, staff: int = 10_000, offers: int = 500_000, venues: int = 300,
+                 audit: int = 5_000, seed: int = 1):
+        self.seed = seed
+        self.n_staff = staff
+        self.per_staff = max(1, offers // staff)
+        self.n_offers = staff * self.per_staff
+        self.n_venues = venues
+        self.n_audit = audit
+        self.today = TODAY
+
+        self.by_day = [array("l") for _ in range(DAYS)]  # offer numbers placed on each day
+        self.pending = array("l")                        # offer numbers awaiting approval
+        self.status_counts = Counter()
+        stats = [[0, 0, 0, -1] for _ in range(staff)]    # jobs, hours (hundredths), pay (pence), last day
+
+        today = (TODAY - EPOCH).days
+        for n in range(self.n_offers):
+            day, _venue, _start, hours, rate, status, _created = self._core(n)
+            self.by_day[day].append(n)
+            self.status_counts[status] += 1
+            if status == "user_accepted":
+                self.pending.append(n)
+            elif status == "completed":
+                s = stats[n // self.per_staff]
+                s[0] += 1
+                s[1] += _hundredths(hours)
+                s[2] += shift_pay_pence(hours, rate)
+                s[3] = max(s[3], day)
+        self._stats = stats
+        # GET /offers/pending sorts by createdAt, newest first
+        self.pending = array("l", sorted(self.pending, key=lambda n: self._core(n)[6], reverse=True))
+        self.today_index = today
+
+        self.staff_rows = [self._staff(i) for i in range(staff)]
+        self.staff_index = {s["_id"]: i for i, s in enumerate(self.staff_rows)}
+        self.username_index = {s["username"]: i for i, s in enumerate(self.staff_rows)}
+        self.venue_rows = [self._venue(k) for k in range(venues)]
+        self.venue_rows.sort(key=lambda v: v["createdAt"], reverse=True)
+        self.audit_rows = [self._audit(k) for k in range(audit)]  # newest first
+
+    # ---------- staff ----------
+    def staff_id(self, i: int) -> str:
+        return _oid(0xA1, i)
+
+    def _staff(self, i: int) -> dict:
+        h = _mix(self.seed, 1, i)
+        first, last = FIRST_NAMES[h % len(FIRST_NAMES)], LAST_NAMES[(h >> 8) % len(LAST_NAMES)]
+        username = f"{first.lower()}.{last.lower()}{i}"
+        jobs, hours, pay, last_day = self._stats[i]
+        return {
+            "_id": self.staff_id(i),
+            "username": username,
+            "fullName": f"{first} {last}",
+            "email": f"{username}@example.com",
+            "dob": _iso(date(1970 + (h >> 16) % 35, 1 + (h >> 24) % 12, 1 + (h >> 28) % 28)),
+            "createdAt": _iso(EPOCH - timedelta(days=1 + (h >> 32) % 700)),
+            "isActive": (h >> 40) % 53 != 0,
+            "availability": {"days": [], "timeFrom": "", "timeTo": "", "unavailableDates": []},
+            "totalJobsWorked": jobs,
+            "totalHoursWorked": hours / 100,
+            "totalEarnings": pay / 100,
+            "lastJobAt": _iso(EPOCH + timedelta(days=last_day), 23 * 60) if last_day >= 0 else "",
+        }
+
+    # ---------- offers ----------
+    def _core(self, n: int):
+        """(day, venue, start minutes, hours, rate, status, created minutes since EPOCH)"""
+        h = _mix(self.seed, 2, n)
+        day = h % DAYS
+        start = (6 + (h >> 12) % 14) * 60 + 30 * ((h >> 16) & 1)
+        hours = 4 + (h >> 20) % 17 * 0.5  # 4 .. 12 h
+        rate = RATES[(h >> 28) % len(RATES)]
+        statuses = PAST_STATUSES if day < (TODAY - EPOCH).days else FUTURE_STATUSES
+        status = statuses[(h >> 32) % len(statuses)]
+        created = (day - 1 - (h >> 40) % 21) * 1440 + (h >> 48) % 1440
+        return day, (h >> 8) % self.n_venues, start, hours, rate, status, created
+
+    def offer_id(self, n: int) -> str:
+        return _oid(0xB2, n)
+
+    def offer_number(self, offer_id: str):
+        try:
+            n = int(offer_id, 16) - (0xB2 << 88)
+        except (TypeError, ValueError):
+            return None
+        return n if 0 <= n < self.n_offers else None
+
+    def placement(self, n: int) -> dict:
+        day, venue, start, hours, rate, _status, created = self._core(n)
+        end = (start + int(hours * 60)) % 1440
+        v = self._venue(venue)
+        created_at = _iso(EPOCH, created)
+        return {
+            "_id": _oid(0xC3, n),
+            "venue": v["name"],
+            "roleTitle": ROLES[_mix(self.seed, 3, n) % len(ROLES)],
+            "date": _iso(EPOCH + timedelta(days=day)),
+            "startTime": f"{start // 60:02d}:{start % 60:02d}",
+            "endTime": f"{end // 60:02d}:{end % 60:02d}",
+            "hourlyRate": rate,
+            "totalHours": hours,
+            "addressLine": v["address"],
+            "city": v["city"],
+            "postcode": "",
+            "notes": "",
+            "createdAt": created_at,
+            "updatedAt": created_at,
+            "__v": 0,
+        }
+
+    def offer(self, n: int, user=None) -> dict:
+        """One offer as the API returns it (placementId populated); user: populated userId."""
+        day, _venue, _start, hours, rate, status, created = self._core(n)
+        done = status == "completed"
+        updated = _iso(EPOCH + timedelta(days=day), 23 * 60) if done else _iso(EPOCH, created)
+        return {
+            "_id": self.offer_id(n),
+            "userId": user if user is not None else self.staff_id(n // self.per_staff),
+            "placementId": self.placement(n),
+            "status": status,
+            "cancelReason": "",
+            "cancelledAt": None,
+            "completedAt": updated if done else None,
+            "checkInAt": None,
+            "checkOutAt": None,
+            "totalHoursWorked": hours if done else 0,
+            "amountWorked": shift_pay_pence(hours, rate) / 100 if done else 0,
+            "createdAt": _iso(EPOCH, created),
+            "updatedAt": updated,
+            "__v": 0,
+        }
+
+    def offers_of(self, i: int) -> range:
+        return range(i * self.per_staff, (i + 1) * self.per_staff)
+
+    def day_of(self, n: int) -> int:
+        return self._core(n)[0]
+
+    def created_of(self, n: int) -> int:
+        return self._core(n)[6]
+
+    def status_of(self, n: int) -> str:
+        return self._core(n)[5]
+
+    def days_between(self, date_from: str, date_to: str) -> range:
+        a = (date.fromisoformat(date_from) - EPOCH).days
+        b = (date.fromisoformat(date_to) - EPOCH).days
+        return range(max(0, a), min(DAYS - 1, b) + 1)
+
+    def shift_row(self, n: int) -> dict:
+        """A completed offer as a payroll row (completedShiftsInPeriod)."""
+        day, venue, start, hours, rate, _status, _created = self._core(n)
+        p = self.placement(n)
+        return {
+            "username": self.staff_rows[n // self.per_staff]["username"],
+            "date": p["date"][:10],
+            "venue": p["venue"],
+            "startTime": p["startTime"],
+            "endTime": p["endTime"],
+            "hours": hours,
+            "rate": rate,
+            "pay": shift_pay_pence(hours, rate) / 100,
+        }
+
+    # ---------- venues ----------
+    def _venue(self, k: int) -> dict:
+        h = _mix(self.seed, 4, k)
+        name = f"{VENUE_WORDS[h % len(VENUE_WORDS)]} {VENUE_KINDS[(h >> 8) % len(VENUE_KINDS)]} {k}"
+        created = _iso(EPOCH - timedelta(days=1 + (h >> 16) % 400), (h >> 32) % 1440)
+        return {
+            "_id": _oid(0xD4, k),
+            "name": name,
+            "address": f"{1 + (h >> 40) % 200} {VENUE_WORDS[(h >> 48) % len(VENUE_WORDS)]} Street",
+            "city": CITIES[(h >> 52) % len(CITIES)],
+            "note": "",
+            "createdBy": None,
+            "createdAt": created,
+            "updatedAt": created,
+            "__v": 0,
+        }
+
+    # ---------- audit ----------
+    def _audit(self, k: int) -> dict:
+        h = _mix(self.seed, 5, k)
+        action = ["CANCEL_OFFER", "COMPLETE_OFFER", "SET_STAFF_ACTIVE", "UPDATE_AVAILABILITY"][h % 4]
+        on_user = action in ("SET_STAFF_ACTIVE", "UPDATE_AVAILABILITY")
+        target = self.staff_id((h >> 8) % self.n_staff) if on_user else self.offer_id((h >> 8) % self.n_offers)
+        at = datetime(TODAY.year, TODAY.month, TODAY.day, tzinfo=timezone.utc) - timedelta(minutes=7 * k + 1)
+        return {
+            "_id": _oid(0xE5, k),
+            "actorId": {"_id": _oid(0xF6, h % 3), "username": f"admin{h % 3}"},
+            "action": action,
+            "targetType": "User" if on_user else "Offer",
+            "targetId": target,
+            "meta": {"isActive": bool(h & 1)} if action == "SET_STAFF_ACTIVE" else {},
+            "createdAt": at.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        }
@@ -0,0 +1,506 @@
+"""
+Local stand-in for the Express API, serving a synthetic Dataset with the same routes,
+response shapes, ETags / 304s, delta sync and gzipped payroll snapshots as the real server.
+
+Run on its own (the benchmark runner starts it as a subprocess, so serving never competes
+with the client for the GIL):
+
+    python -m bench.fake_backend --port 8787 --staff 10000 --offers 500000 --venues 300
+
+Prints "listening <url>" once the dataset is built. GET /__bench/stats returns the requests
+served since the last POST /__bench/reset.
+"""
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from bench.dataset import Dataset, shift_pay_pence
+from search_index import tokenize
+
+TOKEN = "bench-token"
+SNAPSHOT_GRACE_DAYS = 3
+SYNC_SKEW_MS = 5000
+HEARTBEAT_S = 25
+
+CALENDAR_JS = os.path.join(os.path.dirname(__file__), "..", "..", "config", "payrollCalender.js")
+
+
+def load_pay_periods(path: str = CALENDAR_JS) -> list:
+    """PAYROLL_CALENDER_2026 from the server's config, so both sides agree on the periods."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    return [
+        {"from": a, "to": b, "payDate": c}
+        for a, b, c in re.findall(r'from:\s*"([\d-]+)",\s*to:\s*"([\d-]+)",\s*payDate:\s*"([\d-]+)"', text)
+    ]
+
+
+def _route(path: str) -> str:
+    """Path with ids folded, for per-route request counts."""
+    return re.sub(r"/[0-9a-f]{24}(?=/|$)", "/:id", re.sub(r"/\d{4}-\d{2}-\d{2}(?=/|$)", "/:date", path))
+
+
+class FakeBackend:
+    def __init__(self, data: Dataset):
+        self.data = data
+        self.periods = load_pay_periods()
+        self.stopping = threading.Event()
+        self.counts = Counter()
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._memo = {}  # (path, query) -> (body, etag): the dataset never changes
+        self._snapshots = {}  # payDate -> (hash, gzipped body)
+
+    # ---------- bookkeeping ----------
+    def count(self, method: str, path: str, size: int):
+        with self._lock:
+            self.counts[f"{method} {_route(path)}"] += 1
+            self.bytes_sent += size
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"requests": sum(self.counts.values()), "bytes": self.bytes_sent, "routes": dict(self.counts)}
+
+    def reset(self):
+        with self._lock:
+            self.counts.clear()
+            self.bytes_sent = 0
+
+    def memo(self, key, build):
+        hit = self._memo.get(key)
+        if hit is None:
+            body = json.dumps(build(), separators=(",", ":")).encode()
+            hit = self._memo[key] = (body, 'W/"' + hashlib.sha1(body).hexdigest() + '"')
+        return hit
+
+    # ---------- delta sync (utils/deltaSync.js) ----------
+    @staticmethod
+    def since_cursor() -> str:
+        ms = int(time.time() * 1000) - SYNC_SKEW_MS
+        return base64.urlsafe_b64encode(str(ms).encode()).decode().rstrip("=")
+
+    def delta(self, query, full):
+        """A full list for since=0 (or a cursor we can't read); nothing changes after that."""
+        since = query.get("since", "0")
+        if since in ("", "0"):
+            return {"items": full(), "removed": [], "cursor": self.since_cursor(), "full": True}
+        return {"items": [], "removed": [], "cursor": self.since_cursor(), "full": False}
+
+    # ---------- staff ----------
+    def staff_search(self, q: str, limit: int) -> list:
+        words = q.lower().split()
+        found = []
+        for s in self.data.staff_rows:
+            text = f"{s['fullName']} {s['username']} {s['email']}".lower()
+            if all(w in text for w in words):
+                found.append(s)
+                if len(found) >= limit:
+                    break
+        return found
+
+    def staff_profile(self, staff_id: str):
+        i = self.data.staff_index.get(staff_id)
+        return None if i is None else dict(self.data.staff_rows[i], role="staff", managerId=None)
+
+    # ---------- offers ----------
+    def staff_offers(self, staff_id: str):
+        """A staff member's offer numbers, or None for an unknown id."""
+        i = self.data.staff_index.get(staff_id)
+        return None if i is None else self.data.offers_of(i)
+
+    def newest_offers(self, numbers, limit: int = 200) -> list:
+        numbers = sorted(numbers, key=lambda n: (self.data.created_of(n), n), reverse=True)[:limit]
+        return [self.data.offer(n) for n in numbers]
+
+    def offers_page(self, numbers, query) -> dict:
+        """offersByStaffPage: newest placement date first, from/to/q filters, opaque cursor."""
+        limit = min(max(int(query.get("limit") or 50), 1), 200)
+        offers = [self.data.offer(n) for n in numbers]
+        date_from, date_to = query.get("from", ""), query.get("to", "")
+        if date_from:
+            offers = [o for o in offers if o["placementId"]["date"][:10] >= date_from]
+        if date_to:
+            offers = [o for o in offers if o["placementId"]["date"][:10] <= date_to]
+        terms = tokenize(query.get("q", ""))
+        if terms:
+            def text(o):
+                p = o["placementId"]
+                return " ".join([p["venue"], p["roleTitle"], p["date"][:10], p["startTime"], p["endTime"],
+                                 f"{p['hourlyRate']:.2f}", o["status"]]).lower()
+            offers = [o for o in offers if all(t in text(o) for t in terms)]
+        offers.sort(key=lambda o: (o["placementId"]["date"], o["_id"]), reverse=True)
+        start = int(query.get("cursor") or 0)
+        items = offers[start:start + limit]
+        more = start + limit < len(offers)
+        return {"items": items, "nextCursor": str(start + limit) if more else None}
+
+    def pending(self) -> list:
+        staff = self.data.staff_rows
+        rows = []
+        for n in self.data.pending:
+            s = staff[n // self.data.per_staff]
+            user = {"_id": s["_id"], "username": s["username"], "fullName": s["fullName"], "managerId": None}
+            rows.append(self.data.offer(n, user))
+        return rows
+
+    def calendar(self, date_from: str, date_to: str) -> list:
+        rows = []
+        fields = ("_id", "venue", "roleTitle", "date", "startTime", "endTime", "hourlyRate", "totalHours")
+        for day in self.data.days_between(date_from, date_to):
+            for n in self.data.by_day[day]:
+                status = self.data.status_of(n)
+                if status == "cancelled":
+                    continue
+                s = self.data.staff_rows[n // self.data.per_staff]
+                p = self.data.placement(n)
+                rows.append({
+                    "_id": self.data.offer_id(n),
+                    "userId": {"_id": s["_id"], "username": s["username"]},
+                    "placementId": {k: p[k] for k in fields},
+                    "status": status,
+                })
+        return rows
+
+    # ---------- payroll ----------
+    def period(self, pay_date: str):
+        return next((p for p in self.periods if p["payDate"] == pay_date), None)
+
+    def period_closed(self, period) -> bool:
+        end = date.fromisoformat(period["to"]) + timedelta(days=1 + SNAPSHOT_GRACE_DAYS)
+        return self.data.today >= end
+
+    def shift_rows(self, period, username: str | None = None) -> list:
+        rows = []
+        for day in self.data.days_between(period["from"], period["to"]):
+            for n in self.data.by_day[day]:
+                if self.data.status_of(n) == "completed":
+                    rows.append(self.data.shift_row(n))
+        if username is not None:
+            rows = [r for r in rows if r["username"] == username]
+        rows.sort(key=lambda r: r["date"])
+        return rows
+
+    @staticmethod
+    def summary(rows) -> list:
+        totals = {}
+        for r in rows:
+            t = totals.setdefault(r["username"], [0, 0])
+            t[0] += int(r["hours"] * 100 + 0.5 + 1e-7)
+            t[1] += shift_pay_pence(r["hours"], r["rate"])
+        return [{"username": u, "totalHours": h / 100, "totalPay": p / 100} for u, (h, p) in totals.items()]
+
+    def bundle(self, period) -> dict:
+        fields = ["username", "date", "venue", "startTime", "endTime", "hours", "rate", "pay"]
+        rows = self.shift_rows(period)
+        return {
+            "period": period,
+            "staff": self.summary(rows),
+            "fields": fields,
+            "shifts": [[r[f] for f in fields] for r in rows],
+        }
+
+    def snapshot(self, period):
+        """(hash, gzipped body) of a closed period, frozen on first request (utils/payrollSnapshots.js)."""
+        with self._lock:
+            snap = self._snapshots.get(period["payDate"])
+        if snap is None:
+            content = self.bundle(period)
+            digest = hashlib.sha256(json.dumps(content, separators=(",", ":")).encode()).hexdigest()
+            frozen_at = (date.fromisoformat(period["to"]) + timedelta(days=1 + SNAPSHOT_GRACE_DAYS)).isoformat()
+            body = dict(content, snapshot={"hash": digest, "frozenAt": f"{frozen_at}T00:00:00.000Z"})
+            snap = (digest, gzip.compress(json.dumps(body, separators=(",", ":")).encode(), 6))
+            with self._lock:
+                self._snapshots[period["payDate"]] = snap
+        return snap
+
+    # ---------- audit ----------
+    def audit_rows(self, query) -> list:
+        rows = self.data.audit_rows
+        actor = query.get("actor", "")
+        if actor:
+            rows = [r for r in rows if r["actorId"]["username"] == actor]
+        for field in ("action", "targetType", "targetId"):
+            if query.get(field):
+                rows = [r for r in rows if r[field] == query[field]]
+        return rows
+
+    def dashboard(self) -> dict:
+        c = self.data.status_counts
+        return {
+            "staffTotal": self.data.n_staff,
+            "offersPending": c.get("pending", 0),
+            "offersAccepted": c.get("accepted", 0),
+            "offersCompleted": c.get("completed", 0),
+            "offersByStatus": {status: n for status, n in c.items() if n},
+        }
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the Heroku router
+    backend: FakeBackend = None
+
+    def log_message(self, *_args):
+        pass
+
+    # ---------- responses ----------
+    def _send(self, code: int, body: bytes, headers=None):
+        self.send_response(code)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+        self.backend.count(self.command, self.path_only, len(body))
+
+    def _json(self, code: int, obj=None, memo_key=None, build=None):
+        """JSON with a weak ETag (Express default) and 304 for a matching If-None-Match."""
+        if memo_key is not None:
+            body, etag = self.backend.memo(memo_key, build)
+        else:
+            body = json.dumps(obj, separators=(",", ":")).encode()
+            etag = 'W/"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.command == "GET" and code == 200 and self.headers.get("If-None-Match") == etag:
+            return self._send(304, b"", {"ETag": etag})
+        self._send(code, body, {"Content-Type": "application/json; charset=utf-8", "ETag": etag})
+
+    def _error(self, code: int, message: str):
+        self._send(code, json.dumps({"message": message}).encode(), {"Content-Type": "application/json"})
+
+    def _body(self) -> dict:
+        n = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(n) or b"{}") if n else {}
+
+    def _authorized(self) -> bool:
+        if self.headers.get("Authorization") == f"Bearer {TOKEN}":
+            return True
+        self._error(401, "Missing or invalid token")
+        return False
+
+    # ---------- GET ----------
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.path_only = path = url.path
+        query = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        key = (path, tuple(sorted(query.items())))
+        b = self.backend
+
+        if path == "/__bench/stats":
+            return self._send(200, json.dumps(b.stats()).encode(), {"Content-Type": "application/json"})
+        if not self._authorized():
+            return
+
+        if path == "/admin/events":
+            return self._events()
+        if path == "/admin/dashboard":
+            return self._json(200, b.dashboard())
+
+        if path == "/admin/staff":
+            q = query.get("q", "").strip()
+            if "since" in query and not q:
+                return self._json(200, b.delta(query, lambda: b.data.staff_rows))
+            if q:
+                return self._json(200, memo_key=key, build=lambda: b.staff_search(q, int(query.get("limit") or 50)))
+            return self._json(200, memo_key=key, build=lambda: b.data.staff_rows)
+        m = re.match(r"^/admin/staff/(\w+)$", path)
+        if m:
+            profile = b.staff_profile(m.group(1))
+            return self._json(200, profile) if profile else self._error(404, "Staff not found")
+
+        m = re.match(r"^/admin/offers/by-staff/(\w+)$", path)
+        if m:
+            numbers = b.staff_offers(m.group(1))
+            if numbers is None:
+                return self._json(200, {"items": [], "nextCursor": None} if "limit" in query else [])
+            if "limit" in query:
+                return self._json(200, memo_key=key, build=lambda: b.offers_page(numbers, query))
+            if "since" in query:
+                return self._json(200, b.delta(query, lambda: b.newest_offers(numbers)))
+            return self._json(200, memo_key=key, build=lambda: b.newest_offers(numbers))
+
+        if path == "/offers/pending":
+            if "since" in query:
+                return self._json(200, b.delta(query, b.pending))
+            return self._json(200, memo_key=key, build=b.pending)
+
+        if path == "/admin/venues":
+            if "since" in query:
+                return self._json(200, b.delta(query, lambda: b.data.venue_rows))
+            return self._json(200, memo_key=key, build=lambda: b.data.venue_rows)
+
+        if path == "/admin/calendar":
+            if not query.get("from") or not query.get("to"):
+                return self._error(400, "from and to are required")
+            return self._json(200, memo_key=key, build=lambda: b.calendar(query["from"], query["to"]))
+
+        if path == "/admin/payroll/periods":
+            return self._json(200, b.periods)
+        m = re.match(r"^/admin/payroll/period/([\d-]+)(/bundle|/staff/([^/]+))?$", path)
+        if m:
+            return self._payroll(m.group(1), m.group(2) or "", m.group(3), key)
+
+        if path == "/admin/audit":
+            if "limit" not in query:
+                return self._json(200, memo_key=key, build=lambda: b.data.audit_rows[:200])
+            rows = b.audit_rows(query)
+            limit = min(max(int(query["limit"] or 50), 1), 200)
+            start = int(query.get("cursor") or 0)
+            more = start + limit < len(rows)
+            return self._json(200, {"items": rows[start:start + limit], "nextCursor": str(start + limit) if more else None})
+        if path == "/admin/audit/export.csv":
+            return self._audit_csv(b.audit_rows(query))
+
+        self._error(404, f"Cannot GET {path}")
+
+    def _payroll(self, pay_date: str, tail: str, username, key):
+        b = self.backend
+        period = b.period(pay_date)
+        if period is None:
+            return self._error(404, "Payroll period not found")
+
+        if tail == "/bundle" and b.period_closed(period):
+            digest, body = b.snapshot(period)
+            headers = {
+                "ETag": f'"{digest}"',
+                "Cache-Control": "private, max-age=31536000, immutable",
+                "X-Payroll-Snapshot": digest,
+                "Content-Type": "application/json; charset=utf-8",
+            }
+            if self.headers.get("If-None-Match") == f'"{digest}"':
+                return self._send(304, b"", headers)
+            if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                return self._send(200, body, dict(headers, **{"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}))
+            return self._send(200, gzip.decompress(body), headers)
+        if tail == "/bundle":
+            return self._json(200, memo_key=key, build=lambda: b.bundle(period))
+        if username:
+            def shifts():
+                rows = b.shift_rows(period, username)
+                return {"period": period, "username": username,
+                        "shifts": [{k: v for k, v in r.items() if k != "username"} for r in rows]}
+            return self._json(200, memo_key=key, build=shifts)
+        return self._json(200, memo_key=key, build=lambda: {"period": period, "staff": b.summary(b.shift_rows(period))})
+
+    def _audit_csv(self, rows):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        sent = 0
+
+        def chunk(data: bytes):
+            nonlocal sent
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            sent += len(data)
+
+        chunk(b"time,actor,action,targetType,targetId,meta\n")
+        for start in range(0, len(rows), 500):
+            lines = []
+            for r in rows[start:start + 500]:
+                meta = '"' + json.dumps(r["meta"]).replace('"', '""') + '"' if r["meta"] else ""
+                lines.append(f'{r["createdAt"]},{r["actorId"]["username"]},{r["action"]},'
+                             f'{r["targetType"]},{r["targetId"]},{meta}\n')
+            chunk("".join(lines).encode())
+        self.wfile.write(b"0\r\n\r\n")
+        self.backend.count("GET", self.path_only, sent)
+
+    def _events(self):
+        """Server-sent events: hello, then heartbeats; the dataset never changes."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        # not counted: the stream outlives the interaction being measured
+        try:
+            self.wfile.write(f"retry: 3000\n\nid: 1\nevent: hello\ndata: {{}}\n\n".encode())
+            self.wfile.flush()
+            while not self.backend.stopping.wait(HEARTBEAT_S):
+                self.wfile.write(b": ping\n\n")
+                self.wfile.flush()
+        except OSError:
+            pass  # client went away
+
+    # ---------- mutations ----------
+    def _offer_mutation(self, offer_id: str, status: str):
+        n = self.backend.data.offer_number(offer_id)
+        if n is None:
+            return self._error(404, "Offer not found")
+        self._json(200, dict(self.backend.data.offer(n), status=status))
+
+    def do_POST(self):
+        self.path_only = path = urlparse(self.path).path
+        body = self._body()
+        if path == "/__bench/reset":
+            self.backend.reset()
+            return self._send(200, b"{}", {"Content-Type": "application/json"})
+        if path == "/auth/login":
+            if not body.get("username") or not body.get("password"):
+                return self._error(400, "Username and password required")
+            return self._json(200, {"token": TOKEN, "user": {
+                "id": "f60000000000000000000000", "username": body["username"], "role": "admin", "isActive": True,
+            }})
+        if not self._authorized():
+            return
+        m = re.match(r"^/admin/offers/(\w+)/(cancel|complete)$", path)
+        if m:
+            return self._offer_mutation(m.group(1), "cancelled" if m.group(2) == "cancel" else "completed")
+        self._error(404, f"Cannot POST {path}")
+
+    def do_PATCH(self):
+        self.path_only = path = urlparse(self.path).path
+        self._body()
+        if not self._authorized():
+            return
+        m = re.match(r"^/offers/(\w+)/decision$", path)
+        if m:
+            return self._offer_mutation(m.group(1), "booking_confirmed")
+        self._error(404, f"Cannot PATCH {path}")
+
+
+def serve(data: Dataset, host: str = "127.0.0.1", port: int = 0):
+    """Start serving on a daemon thread; returns (server, backend, base url)."""
+    backend = FakeBackend(data)
+    handler = type("BoundHandler", (Handler,), {"backend": backend})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-backend", daemon=True).start()
+    return server, backend, f"http://{host}:{server.server_address[1]}"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=0)
+    ap.add_argument("--staff", type=int, default=10_000)
+    ap.add_argument("--offers", type=int, default=500_000)
+    ap.add_argument("--venues", type=int, default=300)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+
+    data = Dataset(staff=args.staff, offers=args.offers, venues=args.venues, seed=args.seed)
+    server, backend, url = serve(data, args.host, args.port)
+    print(f"listening {url}", flush=True)
+    try:
+        # until stdin closes (the parent exited) or Ctrl+C
+        sys.stdin.read()
+    except KeyboardInterrupt:
+        pass
+    backend.stopping.set()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
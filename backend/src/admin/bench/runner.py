@@ -0,0 +1,381 @@
+"""
+Benchmarks for the admin desktop client, run headless against a local fake backend.
+
+From backend/src/admin:
+
+    python -m bench                        # every scenario, compared with bench/baseline.json
+    python -m bench payroll_period_open    # just one
+    python -m bench --save-baseline        # record the current numbers as the baseline
+    python -m bench --list
+
+Each scenario runs `--warmup` untimed times (fills the fake backend's response memo), then
+`--repeat` timed times, every run in a fresh interpreter with its own disk cache: a real
+first launch, and a peak RSS that belongs to that run alone. Reported per scenario: median
+wall time of the measured interaction, requests and KB the backend served during it, reads
+answered locally (cache / coalesced / disk, from ApiClient telemetry), peak RSS, and the
+scenario's own phase timings (informational). Wall time or peak RSS above the baseline by
+more than --tolerance (and more than the noise floor), or any extra request, is a
+regression: the exit status is 1.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # before anything imports Qt
+
+import requests
+from PySide6.QtWidgets import QApplication, QFileDialog, QMessageBox
+
+import admin_desktop_ui as ui
+from local_store import LocalStore
+from bench.scenarios import SCENARIOS
+
+ADMIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+NOISE_MS = 20    # timing differences below this are never called regressions
+NOISE_MB = 8
+SUMMARY_ONLY = ("runs", "wall_min_ms", "wall_max_ms")
+SAMPLE_PREFIX = "bench-sample "
+
+
+# ----------------- Peak RSS -----------------
+def reset_peak_rss() -> bool:
+    """Restart the kernel's high-water mark (Linux), so the peak is the scenario's own."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None where it can't be read."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # whole-process peak here
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+# ----------------- Fake backend -----------------
+class BackendProcess:
+    """bench.fake_backend in a child process, so serving doesn't share the client's GIL."""
+    def __init__(self, staff: int, offers: int, venues: int, seed: int):
+        self.config = {"staff": staff, "offers": offers, "venues": venues, "seed": seed}
+        self.url = None
+        self.proc = None
+        self.http = requests.Session()
+
+    @classmethod
+    def attached(cls, url: str) -> "BackendProcess":
+        """A handle on a backend another process started (what a scenario run talks to)."""
+        backend = cls.__new__(cls)
+        backend.config, backend.url, backend.proc = None, url, None
+        backend.http = requests.Session()
+        return backend
+
+    def __enter__(self):
+        args = [sys.executable, "-m", "bench.fake_backend"]
+        for k, v in self.config.items():
+            args += [f"--{k}", str(v)]
+        self.proc = subprocess.Popen(args, cwd=ADMIN_DIR, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        line = self.proc.stdout.readline().strip()
+        if not line.startswith("listening "):
+            self.proc.kill()
+            raise RuntimeError(f"fake backend failed to start: {line or self.proc.wait()}")
+        self.url = line.split(" ", 1)[1]
+        return self
+
+    def __exit__(self, *_exc):
+        self.proc.stdin.close()  # the backend exits when its stdin closes
+        try:
+            self.proc.wait(10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+    def reset(self):
+        self.http.post(f"{self.url}/__bench/reset").raise_for_status()
+
+    def stats(self) -> dict:
+        r = self.http.get(f"{self.url}/__bench/stats")
+        r.raise_for_status()
+        return r.json()
+
+
+# ----------------- One scenario run -----------------
+class Bench:
+    """What a scenario drives: fresh clients and windows, the event loop, dialogs, timing."""
+    def __init__(self, app: QApplication, backend: BackendProcess, tmp: str):
+        self.app = app
+        self.backend = backend
+        self.tmp = tmp
+        self.infos = []    # information boxes shown (exports report completion with one)
+        self.errors = []   # critical / warning boxes: the scenario fails
+        self.sample = None
+        self._apis = []
+        self._windows = []
+        self._save_path = os.path.join(tmp, "export.csv")
+
+        QMessageBox.information = staticmethod(lambda _parent, title, text, *a, **k: self.infos.append((title, text)))
+        QMessageBox.warning = staticmethod(lambda _parent, title, text, *a, **k: self.errors.append((title, text)))
+        QMessageBox.critical = staticmethod(lambda _parent, title, text, *a, **k: self.errors.append((title, text)))
+        QFileDialog.getSaveFileName = staticmethod(lambda *a, **k: (self._save_path, ""))
+
+    def api(self, login: bool = False) -> ui.ApiClient:
+        """A new client with its own empty disk cache (a first launch on this machine)."""
+        store = LocalStore(os.path.join(self.tmp, f"store{len(self._apis)}.sqlite3"))
+        api = ui.ApiClient(self.backend.url, store=store)
+        if login:
+            api.login("bench", "bench")
+        self._apis.append(api)
+        return api
+
+    def window(self, api: ui.ApiClient, wait_ready: bool = True) -> ui.MainWindow:
+        w = ui.MainWindow(api, started_at=time.perf_counter())
+        w.show()
+        self._windows.append(w)
+        if wait_ready:
+            self.wait(lambda: getattr(w, "startup_metrics", None) is not None)
+        return w
+
+    def save_as(self, path: str):
+        """Where the next save-file dialog "chooses"."""
+        self._save_path = path
+
+    def pump(self, seconds: float):
+        end = time.perf_counter() + seconds
+        while True:
+            self.app.processEvents()
+            if time.perf_counter() >= end:
+                return
+            time.sleep(0.001)
+
+    def wait(self, condition, timeout: float = 120.0):
+        """Run the event loop until condition() holds; a dialog error fails the scenario."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            self.app.processEvents()
+            if self.errors:
+                raise RuntimeError(": ".join(self.errors[0]))
+            if condition():
+                return
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"condition not met within {timeout:.0f}s")
+            time.sleep(0.001)
+
+    @contextmanager
+    def timed(self):
+        """The measured interaction: wall time, backend requests and bytes, local reads, peak RSS."""
+        self.backend.reset()
+        for api in self._apis:
+            api.telemetry.clear()
+        gc.collect()
+        reset_peak_rss()
+        started = time.perf_counter()
+        yield
+        wall = (time.perf_counter() - started) * 1000
+        served = self.backend.stats()
+        self.sample = {
+            "wall_ms": round(wall, 1),
+            "requests": served["requests"],
+            "kb": round(served["bytes"] / 1024, 1),
+            "local_reads": sum(api.telemetry.snapshot()["totals"]["local"] for api in self._apis),
+            "peak_rss_mb": peak_rss_mb(),
+            "routes": served["routes"],
+        }
+
+    def close(self):
+        for w in self._windows:
+            w.close()
+            w.deleteLater()
+        self.pump(0.05)
+
+
+def run_once(name: str, url: str) -> dict:
+    """One run of a scenario in this process (the --child side of run_scenario)."""
+    app = QApplication.instance() or QApplication([])
+    tmp = tempfile.mkdtemp(prefix="adolphus-bench-")
+    bench = Bench(app, BackendProcess.attached(url), tmp)
+    try:
+        extra = SCENARIOS[name](bench) or {}
+    finally:
+        bench.close()
+        shutil.rmtree(tmp, ignore_errors=True)
+    if bench.sample is None:
+        raise RuntimeError(f"{name} never entered bench.timed()")
+    return dict(bench.sample, **extra)
+
+
+def run_scenario(backend: BackendProcess, name: str, repeat: int, warmup: int) -> dict:
+    samples = []
+    for k in range(warmup + repeat):
+        proc = subprocess.run(
+            [sys.executable, "-m", "bench", "--child", name, "--url", backend.url],
+            cwd=ADMIN_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=900,
+        )
+        sample = next((json.loads(line[len(SAMPLE_PREFIX):]) for line in proc.stdout.splitlines()
+                       if line.startswith(SAMPLE_PREFIX)), None)
+        if sample is None:
+            sys.stderr.write(proc.stderr[-4000:])  # Qt is chatty: only shown when a run fails
+            raise RuntimeError(f"{name} failed (exit status {proc.returncode})")
+        if k >= warmup:
+            samples.append(sample)
+    return summarize(samples)
+
+
+def summarize(samples: list) -> dict:
+    """Median of every number over the timed runs (routes: those of the last run)."""
+    walls = [s["wall_ms"] for s in samples]
+    summary = {"runs": len(samples), "wall_min_ms": min(walls), "wall_max_ms": max(walls)}
+    for key, value in samples[0].items():
+        values = [s.get(key) for s in samples]
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            summary[key] = round(statistics.median(values), 2)
+    summary["routes"] = samples[-1]["routes"]
+    return summary
+
+
+# ----------------- Baselines -----------------
+def machine() -> dict:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "node": platform.node(),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Regressions of results against baseline["scenarios"], as readable lines."""
+    problems = []
+    for name, now in results.items():
+        then = baseline.get("scenarios", {}).get(name)
+        if not then:
+            continue
+        for key, value in now.items():
+            old = then.get(key)
+            if key in SUMMARY_ONLY or not isinstance(value, (int, float)) or not isinstance(old, (int, float)):
+                continue
+            if key == "wall_ms":
+                limit = max(old * (1 + tolerance), old + NOISE_MS)
+            elif key == "peak_rss_mb":
+                limit = max(old * (1 + tolerance), old + NOISE_MB)
+            elif key == "requests":
+                limit = old  # deterministic: any extra request is a change in behaviour
+            elif key == "kb":
+                limit = old * 1.05 + 1
+            else:
+                continue  # phase timings, rows, sizes: informational
+            if value > limit:
+                problems.append(f"{name}: {key} {value:g} vs baseline {old:g}")
+    return problems
+
+
+def report(results: dict, baseline: dict | None):
+    then = (baseline or {}).get("scenarios", {})
+    print(f"\n{'scenario':<24}{'wall ms':>10}{'min':>9}{'max':>9}{'reqs':>6}{'KB':>10}{'local':>7}{'RSS MB':>9}{'Δ wall':>9}")
+    for name, r in results.items():
+        old = then.get(name, {}).get("wall_ms")
+        delta = f"{(r['wall_ms'] - old) / old:+.0%}" if old else ""
+        rss = r.get("peak_rss_mb")
+        print(f"{name:<24}{r['wall_ms']:>10.1f}{r['wall_min_ms']:>9.1f}{r['wall_max_ms']:>9.1f}"
+              f"{r['requests']:>6g}{r['kb']:>10.1f}{r['local_reads']:>7g}{'—' if rss is None else rss:>9}{delta:>9}")
+        skip = {"wall_ms", "requests", "kb", "local_reads", "peak_rss_mb", "routes", *SUMMARY_ONLY}
+        extra = [f"{k}={v:g}" for k, v in r.items() if k not in skip]
+        if extra:
+            print(f"{'':<24}{'  '.join(extra)}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m bench", description="Admin client benchmarks against a local fake backend.")
+    ap.add_argument("scenarios", nargs="*", help="scenario names (default: all)")
+    ap.add_argument("--list", action="store_true", help="list scenarios and exit")
+    ap.add_argument("--repeat", type=int, default=3, help="timed runs per scenario (median reported)")
+    ap.add_argument("--warmup", type=int, default=1, help="untimed runs first")
+    ap.add_argument("--staff", type=int, default=10_000)
+    ap.add_argument("--offers", type=int, default=500_000)
+    ap.add_argument("--venues", type=int, default=300)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline file to compare with / save to")
+    ap.add_argument("--save-baseline", action="store_true", help="write this run's numbers as the baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    ap.add_argument("--json", help="also write the results to this file")
+    ap.add_argument("--child", help=argparse.SUPPRESS)  # run one scenario once, for run_scenario
+    ap.add_argument("--url", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        print(SAMPLE_PREFIX + json.dumps(run_once(args.child, args.url)), flush=True)
+        return 0
+
+    if args.list:
+        for name, fn in SCENARIOS.items():
+            print(f"{name:<24}{(fn.__doc__ or '').strip()}")
+        return 0
+    unknown = [n for n in args.scenarios if n not in SCENARIOS]
+    if unknown:
+        ap.error(f"unknown scenario(s): {', '.join(unknown)} (see --list)")
+    names = args.scenarios or list(SCENARIOS)
+
+    results = {}
+    with BackendProcess(args.staff, args.offers, args.venues, args.seed) as backend:
+        config = dict(backend.config)
+        for name in names:
+            print(f"running {name} ({args.warmup} warm-up + {args.repeat})…", file=sys.stderr, flush=True)
+            results[name] = run_scenario(backend, name, args.repeat, args.warmup)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("dataset") != config:
+            print(f"baseline was recorded with dataset {baseline.get('dataset')}: not comparing", file=sys.stderr)
+            baseline = None
+        elif baseline.get("machine", {}).get("node") != machine()["node"]:
+            print("note: baseline was recorded on another machine", file=sys.stderr)
+
+    report(results, baseline)
+    output = {"created": datetime.now().isoformat(timespec="seconds"), "dataset": config,
+              "machine": machine(), "scenarios": results}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+
+    if args.save_baseline:
+        if baseline is not None and args.scenarios:
+            # re-recording some scenarios keeps the others' numbers
+            output["scenarios"] = dict(baseline.get("scenarios", {}), **results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+        print(f"\nbaseline saved to {args.baseline}")
+        return 0
+
+    problems = compare(results, baseline, args.tolerance) if baseline else []
+    if problems:
+        print("\nregressions:")
+        for line in problems:
+            print(f"  {line}")
+        return 1
+    if baseline:
+        print("\nno regressions against the baseline")
+    return 0
@@ -0,0 +1,147 @@
+"""
+Scripted admin-client sessions against the fake backend. Each scenario gets a Bench
+(runner.py), does its setup untimed, and wraps the interaction being measured in
+`with bench.timed():`. Extra numbers it returns (phase times, rows shown) are reported and
+kept in the baseline next to wall time, requests and peak RSS.
+"""
+import os
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+
+# Fixed picks so every run touches the same records (see dataset.Dataset)
+STAFF_INDEX = 4242
+HISTORY_QUERY = "grand"          # a venue word: matches a few of the staff member's shifts
+CLOSED_PAY_DATE = "2026-04-22"   # closed and frozen on the dataset's fixed "today"
+OPEN_PAY_DATE = "2026-06-17"
+KEY_INTERVAL_MS = 80             # a quick typist
+
+
+def _staff(bench, window):
+    s = window.entities.all("staff")[STAFF_INDEX % len(window.entities.all("staff"))]
+    return str(s.get("_id")), s.get("fullName") or s.get("username") or "Staff"
+
+
+def login_to_ready(bench) -> dict:
+    """Log in through LoginPage with an empty disk cache; done when every start-up page has its data."""
+    import admin_desktop_ui as ui
+
+    api = bench.api()
+    windows = []
+    login = ui.LoginPage(api, on_success=lambda: windows.append(bench.window(api, wait_ready=False)))
+    login.user.setText("bench")
+    login.passw.setText("bench")
+    login.show()
+    bench.pump(0.05)
+
+    with bench.timed():
+        QTest.mouseClick(login.btn, Qt.LeftButton)
+        bench.wait(lambda: windows and getattr(windows[0], "startup_metrics", None))
+    metrics = windows[0].startup_metrics
+    login.close()
+    return {"first_paint_ms": metrics["first_paint_ms"], "ready_ms": metrics["ready_ms"]}
+
+
+def open_schedule_detail(bench) -> dict:
+    """Pick a staff member on the Schedule list: profile, venues, first history page, conflicts."""
+    api = bench.api(login=True)
+    w = bench.window(api)
+    staff_id, name = _staff(bench, w)
+    page = w.detail_page
+
+    with bench.timed():
+        w.open_detail(staff_id, name)
+        bench.wait(lambda: not page.tasks.is_busy() and page.history_model.rowCount())
+    return {"rows": page.history_model.rowCount()}
+
+
+def history_search_typing(bench) -> dict:
+    """Type into the History search box: instant local filter per key, one debounced reload."""
+    api = bench.api(login=True)
+    w = bench.window(api)
+    staff_id, name = _staff(bench, w)
+    w.open_history_for_staff(staff_id, name)
+    page = w.history_page
+    bench.wait(lambda: not page.tasks.is_busy() and page.model.rowCount())
+
+    keys = []
+    with bench.timed():
+        for ch in HISTORY_QUERY:
+            started = time.perf_counter()
+            QTest.keyClick(page.search_input, ch)
+            keys.append((time.perf_counter() - started) * 1000)
+            bench.pump(KEY_INTERVAL_MS / 1000)
+        typed = time.perf_counter()
+        bench.wait(lambda: not page._search_timer.isActive() and not page.tasks.is_busy())
+        settle = (time.perf_counter() - typed) * 1000
+    keys.sort()
+    return {
+        "key_p95_ms": round(keys[max(0, int(len(keys) * 0.95) - 1)], 2),
+        "key_max_ms": round(keys[-1], 2),
+        "settle_ms": round(settle, 1),
+        "rows": page.proxy.rowCount(),
+    }
+
+
+def payroll_period_open(bench) -> dict:
+    """Open a closed (frozen) period, an open one, then the closed one again (disk snapshot)."""
+    api = bench.api(login=True)
+    w = bench.window(api)
+    page = w.payroll_page
+    w.stack.setCurrentWidget(page)
+    bench.wait(lambda: not page.tasks.is_busy())
+
+    def open_period(pay_date):
+        started = time.perf_counter()
+        page.period_box.setCurrentText(pay_date)
+        bench.wait(lambda: page.bundle is not None and page.bundle["payDate"] == pay_date and not page.tasks.is_busy())
+        return round((time.perf_counter() - started) * 1000, 1)
+
+    with bench.timed():
+        closed = open_period(CLOSED_PAY_DATE)
+        current = open_period(OPEN_PAY_DATE)
+        reopen = open_period(CLOSED_PAY_DATE)
+    return {
+        "closed_ms": closed, "open_ms": current, "reopen_closed_ms": reopen,
+        "staff_rows": page.staff_model.rowCount(),
+    }
+
+
+def bulk_export(bench) -> dict:
+    """Export CSVs: a pay period that is not loaded yet, a staff member's history, the whole audit log."""
+    api = bench.api(login=True)
+    w = bench.window(api)
+    staff_id, name = _staff(bench, w)
+    w.open_history_for_staff(staff_id, name)
+    bench.wait(lambda: not w.history_page.tasks.is_busy())
+    payroll, history, audit = w.payroll_page, w.history_page, w.audit_page
+
+    # the period box shows the first period; export another one (fetched for the export)
+    payroll.period_box.blockSignals(True)
+    payroll.period_box.setCurrentText(OPEN_PAY_DATE)
+    payroll.period_box.blockSignals(False)
+
+    phases = {}
+    with bench.timed():
+        for label, page in (("payroll", payroll), ("history", history), ("audit", audit)):
+            target = os.path.join(bench.tmp, f"{label}.csv")
+            started = time.perf_counter()
+            bench.save_as(target)
+            page.export_csv()
+            # files are written whole on the GUI thread (audit: renamed into place), and
+            # payroll reports nothing, so "done" is the file being there with nothing pending
+            bench.wait(lambda: os.path.exists(target) and not page.tasks.is_busy())
+            phases[f"{label}_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    sizes = {f"{label}_kb": round(os.path.getsize(os.path.join(bench.tmp, f"{label}.csv")) / 1024, 1)
+             for label in ("payroll", "history", "audit")}
+    return dict(phases, **sizes)
+
+
+SCENARIOS = {
+    "login_to_ready": login_to_ready,
+    "open_schedule_detail": open_schedule_detail,
+    "history_search_typing": history_search_typing,
+    "payroll_period_open": payroll_period_open,
+    "bulk_export": bulk_export,
+}
@@ -0,0 +1,275 @@
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from PySide6.QtCore import Qt, QObject, QRectF, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath
+from PySide6.QtWidgets import QWidget
+
+from records import Offer
+from workers import TaskRunner
+
+MONTH, WEEK = "Month", "Week"
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# dot colour per offer status
+STATUS_COLORS = {
+    "offered": QColor("#9AA3B2"),
+    "user_accepted": QColor("#F59E0B"),
+    "booking_confirmed": QColor("#16A34A"),
+    "completed": QColor("#5B5CE5"),
+    "rejected": QColor("#C62828"),
+}
+
+
+# ----------------- Windows -----------------
+def calendar_window(mode: str, anchor: date) -> tuple:
+    """
+    (first, last) dates the view shows around anchor: Monday to Sunday for a week, the
+    six full weeks holding the month for a month (so every month grid has the same shape).
+    """
+    if mode == WEEK:
+        first = anchor - timedelta(days=anchor.weekday())
+        return first, first + timedelta(days=6)
+    month_start = anchor.replace(day=1)
+    first = month_start - timedelta(days=month_start.weekday())
+    return first, first + timedelta(days=41)
+
+
+def step(mode: str, anchor: date, n: int) -> date:
+    """anchor moved n weeks or months (months land on the 1st)."""
+    if mode == WEEK:
+        return anchor + timedelta(weeks=n)
+    months = anchor.year * 12 + anchor.month - 1 + n
+    return date(months // 12, months % 12 + 1, 1)
+
+
+class WindowData:
+    """
+    One fetched window bucketed by day: days maps a date ordinal to that day's offers in
+    start-time order. Built once on a worker thread, then only patched (patch()) when an
+    offer changes elsewhere in the app.
+    """
+    __slots__ = ("first", "last", "days", "day_of", "count")
+
+    def __init__(self, first: date, last: date, offers):
+        self.first, self.last = first.toordinal(), last.toordinal()
+        self.days = {}
+        self.day_of = {}  # offer id -> day ordinal
+        for offer in offers:
+            self._add(offer)
+        for day, bucket in self.days.items():
+            self.days[day] = sorted(bucket, key=_shift_order)
+        self.count = len(self.day_of)
+
+    @classmethod
+    def from_json(cls, first: date, last: date, offers) -> "WindowData":
+        return cls(first, last, (Offer.from_json(o) for o in offers or []))
+
+    def _add(self, offer: Offer):
+        day = offer.placement.day if offer.placement is not None else 0
+        if offer.status == "cancelled" or not self.first <= day <= self.last:
+            return False
+        self.days.setdefault(day, []).append(offer)
+        self.day_of[offer.id] = day
+        return True
+
+    def patch(self, offer: Offer) -> bool:
+        """Swap in a changed offer (moving, adding or dropping it); True when the window changed."""
+        old_day = self.day_of.pop(offer.id, None)
+        if old_day is not None:
+            self.days[old_day] = [o for o in self.days[old_day] if o.id != offer.id]
+        if self._add(offer):
+            day = self.day_of[offer.id]
+            self.days[day] = sorted(self.days[day], key=_shift_order)
+        elif old_day is None:
+            return False
+        self.count = len(self.day_of)
+        return True
+
+
+def _shift_order(offer: Offer):
+    p = offer.placement
+    return p.start, p.venue, offer.username
+
+
+# ----------------- Window cache -----------------
+class WindowCache(QObject):
+    """
+    Fetched calendar windows keyed by (first, last), least recently used evicted past
+    `capacity`. request() loads the window the user is looking at; prefetch() warms the
+    neighbours on a separate runner so the busy bar only tracks what is on screen.
+    Windows are decoded and bucketed on the worker thread.
+
+    `fetch(date_from, date_to)` is ApiClient.admin_calendar.
+    """
+    loaded = Signal(object)          # window (first, last)
+    failed = Signal(object, object)  # window, error
+
+    def __init__(self, fetch, capacity: int = 12, parent=None):
+        super().__init__(parent)
+        self.fetch = fetch
+        self.capacity = capacity
+        self.tasks = TaskRunner(self)
+        self.prefetch_tasks = TaskRunner(self)
+        self._windows = OrderedDict()  # (first, last) -> WindowData
+        self._in_flight = set()
+
+    def get(self, window):
+        data = self._windows.get(window)
+        if data is not None:
+            self._windows.move_to_end(window)
+        return data
+
+    def windows(self) -> list:
+        return list(self._windows.values())
+
+    def clear(self):
+        self._windows.clear()
+
+    def request(self, window):
+        self._load(window, self.tasks)
+
+    def prefetch(self, windows):
+        for window in windows:
+            self._load(window, self.prefetch_tasks)
+
+    def _load(self, window, runner):
+        if window in self._windows or window in self._in_flight:
+            return
+        self._in_flight.add(window)
+        first, last = window
+        runner.submit(
+            None, lambda: WindowData.from_json(first, last, self.fetch(first.isoformat(), last.isoformat())),
+            on_result=lambda data: self._store(window, data),
+            on_error=lambda e: self.failed.emit(window, e),
+            on_finished=lambda: self._in_flight.discard(window),
+        )
+
+    def _store(self, window, data):
+        self._windows[window] = data
+        self._windows.move_to_end(window)
+        while len(self._windows) > self.capacity:
+            self._windows.popitem(last=False)
+        self.loaded.emit(window)
+
+
+# ----------------- Painting -----------------
+class CalendarGrid(QWidget):
+    """
+    Month (6 x 7) or week (1 x 7) grid painted in one pass. Each day cell lists as many
+    bookings as fit and a "+N more" line, so a paint costs the same with 50 or 5,000
+    bookings in the window; clicking a day emits day_clicked(ordinal).
+    """
+    day_clicked = Signal(int)
+
+    HEADER = 26
+    GAP = 6
+    RADIUS = 10
+    PADDING = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.first = date.today().toordinal()
+        self.rows = 6
+        self.month = None          # dims days outside it (month view)
+        self.data = None           # WindowData, or None while loading
+        self.selected = None
+        self.setMinimumSize(560, 320)
+
+        self._font = QFont()
+        self._small = QFont()
+        self._small.setPixelSize(11)
+        self._bold = QFont()
+        self._bold.setBold(True)
+        self._line_h = QFontMetrics(self._small).height() + 2
+
+    def set_window(self, first: date, rows: int, month, data):
+        self.first, self.rows, self.month, self.data = first.toordinal(), rows, month, data
+        self.update()
+
+    def set_data(self, data):
+        self.data = data
+        self.update()
+
+    def select(self, day):
+        self.selected = day
+        self.update()
+
+    # ---------- geometry ----------
+    def _cell(self, index) -> QRectF:
+        w = (self.width() - self.GAP * 6) / 7
+        h = (self.height() - self.HEADER - self.GAP * (self.rows - 1)) / self.rows
+        row, col = divmod(index, 7)
+        return QRectF(col * (w + self.GAP), self.HEADER + row * (h + self.GAP), w, h)
+
+    def _day_at(self, pos):
+        for index in range(self.rows * 7):
+            if self._cell(index).contains(pos):
+                return self.first + index
+        return None
+
+    def mousePressEvent(self, event):
+        day = self._day_at(event.position())
+        if day is not None:
+            self.select(day)
+            self.day_clicked.emit(day)
+
+    # ---------- paint ----------
+    def paintEvent(self, _event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        today = date.today().toordinal()
+
+        painter.setFont(self._bold)
+        painter.setPen(QColor("#555"))
+        for col, name in enumerate(WEEKDAYS):
+            cell = self._cell(col)
+            painter.drawText(QRectF(cell.x(), 0, cell.width(), self.HEADER), Qt.AlignCenter, name)
+
+        for index in range(self.rows * 7):
+            self._paint_day(painter, self._cell(index), self.first + index, today)
+        painter.end()
+
+    def _paint_day(self, painter, cell: QRectF, day: int, today: int):
+        path = QPainterPath()
+        path.addRoundedRect(cell, self.RADIUS, self.RADIUS)
+        outside = self.month is not None and date.fromordinal(day).month != self.month
+        painter.fillPath(path, QColor("#F4F5F8") if outside else QColor("white"))
+        if day == self.selected:
+            painter.setPen(QColor("#5B5CE5"))
+            painter.drawPath(path)
+
+        inner = cell.adjusted(self.PADDING, self.PADDING - 2, -self.PADDING, -self.PADDING)
+        offers = self.data.days.get(day, ()) if self.data is not None else ()
+
+        painter.setFont(self._bold)
+        painter.setPen(QColor("#5B5CE5") if day == today else QColor("#9AA3B2") if outside else QColor("#111"))
+        painter.drawText(QRectF(inner.x(), inner.y(), inner.width(), self._line_h + 2),
+                         Qt.AlignLeft | Qt.AlignVCenter, str(date.fromordinal(day).day))
+        if offers:
+            painter.setPen(QColor("#555"))
+            painter.drawText(QRectF(inner.x(), inner.y(), inner.width(), self._line_h + 2),
+                             Qt.AlignRight | Qt.AlignVCenter, str(len(offers)))
+
+        top = inner.y() + self._line_h + 4
+        fits = max(0, int((inner.bottom() - top) // self._line_h))
+        if not offers or not fits:
+            return
+        shown = offers[:fits] if len(offers) <= fits else offers[:fits - 1]
+
+        fm = QFontMetrics(self._small)
+        painter.setFont(self._small)
+        text_x, text_w = inner.x() + 10, int(inner.width() - 10)
+        for i, offer in enumerate(shown):
+            y = top + i * self._line_h
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(STATUS_COLORS.get(offer.status, QColor("#9AA3B2")))
+            painter.drawEllipse(QRectF(inner.x(), y + self._line_h / 2 - 3, 6, 6))
+            p = offer.placement
+            painter.setPen(QColor("#222"))
+            painter.drawText(QRectF(text_x, y, text_w, self._line_h), Qt.AlignLeft | Qt.AlignVCenter,
+                             fm.elidedText(f"{p.start_text} {p.venue} · {offer.username}", Qt.ElideRight, text_w))
+        if len(shown) < len(offers):
+            painter.setPen(QColor("#5B5CE5"))
+            painter.drawText(QRectF(text_x, top + len(shown) * self._line_h, text_w, self._line_h),
+                             Qt.AlignLeft | Qt.AlignVCenter, f"+{len(offers) - len(shown)} more")
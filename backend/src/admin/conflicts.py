@@ -0,0 +1,148 @@
+from bisect import bisect_left, bisect_right
+
+from records import DAY_MINUTES, NO_DAY, Offer, day_text
+
+INACTIVE = ("cancelled", "rejected")  # statuses that never block a booking
+
+
+def shift_span(day: int, start: int, end: int):
+    """
+    (from, to) minutes on one axis across days, or None for a shift without a date or times.
+    An end at or before the start runs into the next day, as hmToMin is used in
+    routes/offers.js (22:00-06:00 is overnight, 09:00-09:00 a full day).
+    """
+    if day <= NO_DAY or start < 0 or end < 0:
+        return None
+    base = day * DAY_MINUTES
+    return base + start, base + (end if end > start else end + DAY_MINUTES)
+
+
+def fetch_bookings(fetch, first: int, last: int) -> tuple:
+    """
+    (first, last, offers) for ConflictIndex.load, run on a worker thread. `fetch` is
+    ApiClient.admin_calendar: every staff member's bookings in the range.
+    """
+    return first, last, [Offer.from_json(o) for o in fetch(day_text(first), day_text(last)) or []]
+
+
+def conflict_text(offers) -> str:
+    return "; ".join(
+        f"{o.placement.venue} {o.placement.date_text} {o.placement.start_text}-{o.placement.end_text} ({o.status})"
+        for o in offers
+    )
+
+
+class _StaffIntervals:
+    """One staff member's shifts sorted by start; spans are (from, to, offer id)."""
+    __slots__ = ("starts", "spans", "longest")
+
+    def __init__(self):
+        self.starts = []
+        self.spans = []
+        self.longest = 0
+
+    def add(self, span, offer_id):
+        entry = (span[0], span[1], offer_id)
+        i = bisect_right(self.spans, entry)
+        self.spans.insert(i, entry)
+        self.starts.insert(i, span[0])
+        self.longest = max(self.longest, span[1] - span[0])
+
+    def remove(self, span, offer_id):
+        i = bisect_left(self.spans, (span[0], span[1], offer_id))
+        if i < len(self.spans) and self.spans[i][2] == offer_id:
+            del self.spans[i]
+            del self.starts[i]
+
+    def overlapping(self, lo, hi) -> list:
+        # nothing starting at or before lo - longest can still be running at lo
+        first = bisect_right(self.starts, lo - self.longest)
+        last = bisect_left(self.starts, hi)
+        return [offer_id for _from, to, offer_id in self.spans[first:last] if to > lo]
+
+
+# ----------------- Conflict index -----------------
+class ConflictIndex:
+    """
+    Per-staff interval index over the active offers the app has seen, answering "would this
+    shift overlap one of their bookings" without a round trip: a lookup is two bisects.
+
+    The index only knows the days it was filled for: feed it a date range with load() (e.g.
+    GET /admin/calendar for those days) and ask covers() before trusting an empty answer.
+    Checking a day needs the day either side too, for overnight shifts. The server repeats
+    the check when the offer is sent (POST /offers/send, /offers/send-batch).
+    """
+
+    def __init__(self):
+        self._staff = {}      # staff id -> _StaffIntervals
+        self._where = {}      # offer id -> (staff id, span)
+        self._offers = {}     # offer id -> Offer
+        self._covered = set()  # day ordinals loaded
+
+    # ---------- filling ----------
+    def load(self, first: int, last: int, offers):
+        """Every active booking dated first..last (day ordinals): replaces what those days held."""
+        days = range(first, last + 1)
+        for offer_id, offer in list(self._offers.items()):
+            if offer.placement is not None and offer.placement.day in days:
+                self._drop(offer_id)
+        self.update(offers)
+        self._covered.update(days)
+
+    def update(self, offers):
+        """Add, move or drop offers (a cancelled or rejected one stops blocking)."""
+        for offer in offers:
+            self._drop(offer.id)
+            p = offer.placement
+            span = shift_span(p.day, p.start, p.end) if p is not None else None
+            if span is None or offer.status in INACTIVE or not offer.staff_id:
+                continue
+            self._staff.setdefault(offer.staff_id, _StaffIntervals()).add(span, offer.id)
+            self._where[offer.id] = (offer.staff_id, span)
+            self._offers[offer.id] = offer
+
+    def clear(self):
+        self._staff.clear()
+        self._where.clear()
+        self._offers.clear()
+        self._covered.clear()
+
+    def _drop(self, offer_id):
+        where = self._where.pop(offer_id, None)
+        self._offers.pop(offer_id, None)
+        if where is not None:
+            self._staff[where[0]].remove(where[1], offer_id)
+
+    # ---------- queries ----------
+    def covers(self, day: int) -> bool:
+        """True when the day and both neighbours are loaded, so no answer is missing."""
+        return {day - 1, day, day + 1} <= self._covered
+
+    def conflicts(self, staff_id, day: int, start: int, end: int) -> list:
+        """The staff member's loaded bookings overlapping this shift, as Offers."""
+        span = shift_span(day, start, end)
+        intervals = self._staff.get(str(staff_id))
+        if span is None or intervals is None:
+            return []
+        return [self._offers[offer_id] for offer_id in intervals.overlapping(*span)]
+
+    def check_batch(self, items, start: int, end: int) -> list:
+        """
+        Conflicts for a bulk send: items are (staff id, day) pairs of one shift template.
+        Like /offers/send-batch, an earlier item of the batch also blocks a later one for the
+        same staff member (reported as the item's index). One list per item, in order.
+        """
+        out = []
+        batch = {}  # staff id -> _StaffIntervals of this batch's items
+        for i, (staff_id, day) in enumerate(items):
+            span = shift_span(day, start, end)
+            if span is None:
+                out.append([])
+                continue
+            found = self.conflicts(staff_id, day, start, end)
+            mine = batch.setdefault(str(staff_id), _StaffIntervals())
+            found += mine.overlapping(*span)
+            if not found:
+                mine.add(span, i)
+            out.append(found)
+        return out
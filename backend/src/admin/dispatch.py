@@ -0,0 +1,163 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from PySide6.QtCore import QObject, Signal
+
+from workers import TaskRunner
+
+QUEUED, SENDING, SENT, CONFLICT, FAILED, SKIPPED = "queued", "sending", "sent", "conflict", "failed", "skipped"
+DONE = (SENT, CONFLICT, FAILED, SKIPPED)
+
+MAX_RANGE_DAYS = 366
+
+
+def parse_dates(text: str) -> list:
+    """
+    "2026-01-05, 2026-01-10..2026-01-14" -> sorted distinct "YYYY-MM-DD" dates.
+    Raises ValueError naming the first bad entry.
+    """
+    days = set()
+    for part in (text or "").replace(";", ",").replace("\n", ",").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition("..")
+        try:
+            first = date.fromisoformat(first.strip())
+            last = date.fromisoformat(last.strip()) if sep else first
+        except ValueError:
+            raise ValueError(f"Not a date or date range: {part}") from None
+        if last < first or (last - first).days >= MAX_RANGE_DAYS:
+            raise ValueError(f"Bad date range: {part}")
+        days.update(first + timedelta(days=n) for n in range((last - first).days + 1))
+    return [d.isoformat() for d in sorted(days)]
+
+
+@dataclass(slots=True)
+class DispatchItem:
+    """One offer of a bulk send: a staff member on a date and where it got to."""
+    staff_id: str
+    staff_name: str
+    date: str
+    state: str = QUEUED
+    force: bool = False
+    offer_id: str = ""
+    conflicts: list = field(default_factory=list)
+    message: str = ""
+
+
+# ----------------- Bulk dispatcher -----------------
+class BulkDispatcher(QObject):
+    """
+    Sends many offers of one placement template through POST /offers/send-batch.
+
+    Items go out in chunks of `chunk_size`, at most `concurrency` chunks in flight on the
+    shared pool, so a few hundred offers take a handful of requests without one huge
+    request holding the server (or the GUI) up. Conflicting items come back as CONFLICT
+    and wait: force() sends them again over the conflict, skip() drops them.
+
+    `send_batch(placement, items)` is ApiClient.send_offers_batch. Sent offers cannot be
+    recalled, so cancel() only stops what has not left yet.
+    """
+    item_changed = Signal(int)   # row in items
+    finished = Signal()          # nothing queued or in flight any more
+
+    def __init__(self, send_batch, placement: dict, items, chunk_size: int = 20, concurrency: int = 3, parent=None):
+        super().__init__(parent)
+        self.send_batch = send_batch
+        self.placement = placement
+        self.items = list(items)
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.tasks = TaskRunner(self)
+        self._queue = []     # rows waiting to be sent
+        self._in_flight = 0  # chunks
+
+    def start(self):
+        self._enqueue([row for row, item in enumerate(self.items) if item.state == QUEUED])
+
+    def force(self, rows):
+        """Send conflicting items again, booking over the conflict."""
+        rows = [row for row in rows if self.items[row].state == CONFLICT]
+        for row in rows:
+            self.items[row].force = True
+        self._enqueue(rows)
+
+    def retry(self, rows):
+        self._enqueue([row for row in rows if self.items[row].state == FAILED])
+
+    def skip(self, rows):
+        for row in rows:
+            if self.items[row].state in (CONFLICT, FAILED):
+                self._set(row, SKIPPED)
+
+    def cancel(self):
+        queue, self._queue = self._queue, []
+        for row in queue:
+            self._set(row, SKIPPED, message="Cancelled")
+        if not self._in_flight and queue:
+            self.finished.emit()
+
+    def is_running(self) -> bool:
+        return bool(self._queue or self._in_flight)
+
+    def rows(self, state) -> list:
+        return [row for row, item in enumerate(self.items) if item.state == state]
+
+    def counts(self) -> dict:
+        counts = dict.fromkeys((QUEUED, SENDING) + DONE, 0)
+        for item in self.items:
+            counts[item.state] += 1
+        return counts
+
+    # ---------- pipeline ----------
+    def _enqueue(self, rows):
+        for row in rows:
+            self._set(row, QUEUED, message="")
+        self._queue.extend(rows)
+        self._pump()
+
+    def _pump(self):
+        while self._queue and self._in_flight < self.concurrency:
+            rows, self._queue = self._queue[:self.chunk_size], self._queue[self.chunk_size:]
+            for row in rows:
+                self._set(row, SENDING)
+            payload = [
+                {"userId": self.items[row].staff_id, "date": self.items[row].date, "force": self.items[row].force}
+                for row in rows
+            ]
+            self._in_flight += 1
+            self.tasks.submit(
+                None, self.send_batch, self.placement, payload,
+                on_result=lambda results, rows=rows: self._on_results(rows, results),
+                on_error=lambda e, rows=rows: self._on_error(rows, e),
+                on_finished=self._on_chunk_done,
+            )
+
+    def _on_results(self, rows, results):
+        for i, row in enumerate(rows):
+            res = results[i] if i < len(results) else {}
+            status = res.get("status")
+            if status == "sent":
+                self._set(row, SENT, offer_id=str(res.get("offerId") or ""), conflicts=[], message="")
+            elif status == "conflict":
+                self._set(row, CONFLICT, conflicts=res.get("conflicts") or [], message="")
+            else:
+                self._set(row, FAILED, message=res.get("message") or "No result from server")
+
+    def _on_error(self, rows, e):
+        for row in rows:
+            self._set(row, FAILED, message=str(e))
+
+    def _on_chunk_done(self):
+        self._in_flight -= 1
+        self._pump()
+        if not self.is_running():
+            self.finished.emit()
+
+    def _set(self, row, state, **changes):
+        item = self.items[row]
+        item.state = state
+        for name, value in changes.items():
+            setattr(item, name, value)
+        self.item_changed.emit(row)
@@ -0,0 +1,176 @@
+from PySide6.QtCore import QObject, Signal
+
+from records import Offer, Placement
+
+KINDS = ("staff", "offers", "placements", "venues")
+
+
+def entity_id(record) -> str:
+    """API records use "_id" (venues sometimes "id"), typed records .id; "" when there is none."""
+    if isinstance(record, dict):
+        return str(record.get("_id") or record.get("id") or "")
+    if isinstance(record, (Offer, Placement)):
+        return record.id
+    return str(record or "")
+
+
+# ----------------- Entity store -----------------
+class EntityStore(QObject):
+    """
+    One id-keyed copy of staff, offers, placements and venues shared by every page.
+
+    Staff and venues are plain dicts updated in place, so every model holding one sees new
+    values. Offers and placements are decoded once into frozen records (records.py) and
+    swapped on change: a populated placementId becomes a Placement in "placements" that
+    every offer of it shares, and a placement change re-attaches it to those offers.
+    Only the GUI thread writes (TaskRunner delivers results there).
+
+    Signals carry only what changed so pages patch rows instead of reloading:
+      changed(kind, ids)  records added or modified (a placement change also reports the
+                          offers that reference it)
+      removed(kind, ids)
+      reloaded(kind)      a list endpoint replaced the collection (membership or order)
+    """
+    changed = Signal(str, list)
+    removed = Signal(str, list)
+    reloaded = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tables = {kind: {} for kind in KINDS}
+        self._offers_by_placement = {}  # placement id -> {offer ids}
+
+    # ---------- reads ----------
+    def get(self, kind: str, id_):
+        return self._tables[kind].get(str(id_))
+
+    def all(self, kind: str) -> list:
+        """Every record of a kind, in the order the last replace() (then upserts) gave."""
+        return list(self._tables[kind].values())
+
+    def offer(self, offer_id):
+        """The Offer (placement attached when it has been loaded), or None."""
+        return self._tables["offers"].get(str(offer_id))
+
+    def offers(self, ids) -> list:
+        return [offer for offer in map(self.offer, ids) if offer is not None]
+
+    # ---------- writes ----------
+    def upsert(self, kind: str, records) -> list:
+        """
+        Merge API JSON (or already decoded records) into the store and report the ones that
+        changed. Returns what pages should hold: the stored dicts or records.
+        """
+        records = [r for r in (records or []) if entity_id(r)]
+        if kind == "offers":
+            self._split_placements(records)
+
+        table = self._tables[kind]
+        changed = []
+        for record in records:
+            key = entity_id(record)
+            current = table.get(key)
+            if kind in ("offers", "placements"):
+                record = self._decode(kind, record, current)
+                if record != current:
+                    table[key] = record
+                    changed.append(key)
+            elif current is None:
+                table[key] = dict(record)
+                changed.append(key)
+            elif any(current.get(field) != value for field, value in record.items()):
+                current.update(record)
+                changed.append(key)
+
+        if kind == "placements":
+            self._attach(changed)
+        self._emit_changed(kind, changed)
+        return [table[entity_id(r)] for r in records]
+
+    def replace(self, kind: str, records) -> list:
+        """
+        A list endpoint's full answer: upsert it, drop records it no longer contains and
+        keep its order. reloaded is only sent when membership or order actually changed.
+        """
+        table = self._tables[kind]
+        before = list(table)
+        result = self.upsert(kind, records)
+
+        order = [entity_id(r) for r in records or [] if entity_id(r)]
+        keep = set(order)
+        gone = [key for key in before if key not in keep]
+        self._tables[kind] = {key: table[key] for key in order}
+        if gone:
+            self.removed.emit(kind, gone)
+        if order != before:
+            self.reloaded.emit(kind)
+        return result
+
+    def remove(self, kind: str, ids):
+        table = self._tables[kind]
+        gone = [str(i) for i in ids if table.pop(str(i), None) is not None]
+        if gone:
+            self.removed.emit(kind, gone)
+
+    # ---------- offers <-> placements ----------
+    def _decode(self, kind, record, current):
+        if kind == "placements":
+            return record if isinstance(record, Placement) else Placement.from_json(record)
+        if isinstance(record, Offer):
+            offer = record
+        else:
+            placement = self._tables["placements"].get(entity_id(record.get("placementId")))
+            offer = Offer.from_json(record, placement, previous=current)
+        if offer.placement_id:
+            self._offers_by_placement.setdefault(offer.placement_id, set()).add(offer.id)
+        return offer
+
+    def _split_placements(self, offers):
+        placements = [o.get("placementId") for o in offers if isinstance(o, dict)]
+        placements = [p for p in placements if isinstance(p, dict) and entity_id(p)]
+        if placements:
+            self.upsert("placements", placements)
+
+    def _attach(self, placement_ids):
+        """Hand changed placements to the offers that show them."""
+        offers, placements = self._tables["offers"], self._tables["placements"]
+        for placement_id in placement_ids:
+            for offer_id in self._offers_by_placement.get(placement_id, ()):
+                offer = offers.get(offer_id)
+                if offer is not None:
+                    offers[offer_id] = offer.with_placement(placements[placement_id])
+
+    def _emit_changed(self, kind, ids):
+        if not ids:
+            return
+        self.changed.emit(kind, ids)
+        if kind == "placements":
+            offers = {o for p in ids for o in self._offers_by_placement.get(p, ())}
+            if offers:
+                self.changed.emit("offers", sorted(offers))
+
+
+def follow(model, entities: EntityStore, kind: str):
+    """
+    Keep a RecordListModel's rows in step with the store: changed rows are swapped in place
+    (re-indexed for search), removed ones dropped. Rows the model does not show are ignored.
+    """
+    def on_changed(changed_kind, ids):
+        if changed_kind != kind:
+            return
+        for id_ in ids:
+            row = model.row_of(id_)
+            if row >= 0:
+                record = entities.get(kind, id_)
+                if record is not None:
+                    model.update_record(row, record)
+
+    def on_removed(removed_kind, ids):
+        if removed_kind != kind:
+            return
+        gone = set(ids)
+        if any(model.row_of(id_) >= 0 for id_ in gone):
+            model.set_records([r for r in model.records() if entity_id(r) not in gone])
+
+    entities.changed.connect(on_changed)
+    entities.removed.connect(on_removed)
@@ -0,0 +1,476 @@
+from bisect import bisect_left
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPen
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QStyle, QStyledItemDelegate, QTableView
+
+from entity_store import entity_id
+from search_index import RankedIndex, SearchIndex
+
+# item data roles
+RecordRole = Qt.UserRole          # the raw dict
+TitleRole = Qt.UserRole + 1
+SubtitleRole = Qt.UserRole + 2
+BadgeRole = Qt.UserRole + 3       # short red tag on the right ("⛔ SUSPENDED"), or ""
+SkeletonRole = Qt.UserRole + 4    # True for "Loading…" placeholder rows
+CellsRole = Qt.UserRole + 5       # the whole card tuple (ColumnCardDelegate columns)
+
+
+# ----------------- Model -----------------
+class RecordListModel(QAbstractListModel):
+    """
+    Read-only list of API dicts rendered as two-line cards.
+
+    `card(record) -> (title, subtitle, badge)` (or a tuple of column texts for
+    ColumnCardDelegate) is only called for rows that get painted and memoised per row.
+    `search(record) -> str` feeds a SearchIndex (or `index_type`, e.g. RankedIndex) keyed by
+    row that is built on the first search and then kept current by
+    append_records/update_record.
+    """
+    def __init__(self, card, search=None, parent=None, index_type=SearchIndex):
+        super().__init__(parent)
+        self.card = card
+        self.search = search
+        self.index_type = index_type
+        self._records = []
+        self._cards = []
+        self._index = None
+        self._rows_by_id = None
+        self._skeleton = 0
+
+    # ---------- contents ----------
+    def set_records(self, records):
+        self.beginResetModel()
+        self._records = list(records or [])
+        self._cards = [None] * len(self._records)
+        self._index = None
+        self._rows_by_id = None
+        self._skeleton = 0
+        self.endResetModel()
+
+    def append_records(self, records):
+        records = list(records or [])
+        if not records:
+            return
+        if self._skeleton:
+            self.set_records(records)
+            return
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._records.extend(records)
+        self._cards.extend([None] * len(records))
+        if self._index is not None:
+            self._index.add_many((row, self._search_text(row)) for row in range(first, len(self._records)))
+        if self._rows_by_id is not None:
+            self._rows_by_id.update((entity_id(r), row) for row, r in enumerate(records, first))
+        self.endInsertRows()
+
+    def update_record(self, row: int, record):
+        """Replace one row in place (e.g. after a status change) and re-index it."""
+        self._records[row] = record
+        self._cards[row] = None
+        if self._index is not None:
+            self._index.add(row, self._search_text(row))
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
+    def row_of(self, record_id) -> int:
+        """Row of the record with this id (entity_store.entity_id), or -1."""
+        if self._rows_by_id is None:
+            self._rows_by_id = {entity_id(r): row for row, r in enumerate(self._records)}
+        return self._rows_by_id.get(str(record_id), -1)
+
+    def show_skeleton(self, rows: int = 4):
+        """Greyed placeholder rows until the first set_records()."""
+        self.beginResetModel()
+        self._records, self._cards, self._index, self._rows_by_id = [], [], None, None
+        self._skeleton = rows
+        self.endResetModel()
+
+    def records(self) -> list:
+        return self._records
+
+    def record(self, row: int):
+        return self._records[row] if 0 <= row < len(self._records) else None
+
+    def search_index(self) -> SearchIndex:
+        if self._index is None:
+            self._index = self.index_type()
+            self._index.add_many((row, self._search_text(row)) for row in range(len(self._records)))
+        return self._index
+
+    def _search_text(self, row: int) -> str:
+        record = self._records[row]
+        if self.search is not None:
+            return self.search(record)
+        return " ".join(str(part) for part in self._card(row) if part)
+
+    def _card(self, row: int):
+        card = self._cards[row]
+        if card is None:
+            card = self._cards[row] = self.card(self._records[row])
+        return card
+
+    # ---------- QAbstractListModel ----------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._skeleton or len(self._records)
+
+    def flags(self, index):
+        if self._skeleton:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if self._skeleton:
+            if role == SkeletonRole:
+                return True
+            if role in (Qt.DisplayRole, TitleRole):
+                return "Loading…"
+            return None
+
+        row = index.row()
+        if role == RecordRole:
+            return self._records[row]
+        if role == SkeletonRole:
+            return False
+        if role == CellsRole:
+            return self._card(row)
+        if role in (Qt.DisplayRole, TitleRole, SubtitleRole, BadgeRole):
+            title, subtitle, badge = self._card(row)[:3]
+            if role == TitleRole:
+                return title
+            if role == SubtitleRole:
+                return subtitle
+            if role == BadgeRole:
+                return badge
+            return f"{title}\n{subtitle}"
+        return None
+
+
+# ----------------- Filtering -----------------
+class RecordFilterProxy(QAbstractListModel):
+    """
+    Filter over a RecordListModel, answered by the model's SearchIndex (every query word
+    must appear; see search_index).
+
+    The matching source rows are kept as a plain sorted list, so a new query is an index
+    lookup plus a model reset. When the index is a RankedIndex the rows are kept best match
+    first instead, and inserts/changes simply re-rank. It is a list model rather than a QSortFilterProxyModel /
+    QAbstractProxyModel on purpose: those call filterAcceptsRow / index() back into Python
+    for every row on each refilter, which costs ~0.5 s at 100k rows.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = None
+        self._query = ""
+        self._rows = []
+        self._positions = None  # source row -> proxy row while ranked, else rows are sorted
+
+    def setSourceModel(self, source: RecordListModel):
+        self._source = source
+        source.modelReset.connect(self._on_source_reset)
+        source.rowsInserted.connect(self._on_source_rows_inserted)
+        source.dataChanged.connect(self._on_source_data_changed)
+        self._on_source_reset()
+
+    def sourceModel(self) -> RecordListModel:
+        return self._source
+
+    # ---------- filtering ----------
+    def set_query(self, text: str):
+        query = " ".join((text or "").split())
+        if query == self._query:
+            return
+        self._query = query
+        self._refilter()
+
+    def query(self) -> str:
+        return self._query
+
+    def _match(self, candidates=None) -> list:
+        source = self._source
+        n = len(source.records())
+        if not n:
+            return list(range(source.rowCount()))  # skeleton rows
+        if candidates is None:
+            candidates = range(n)
+        hits = source.search_index().search(self._query) if self._query else None
+        if hits is None:
+            return list(candidates)
+        if isinstance(candidates, range) and len(hits) < len(candidates):
+            return sorted(row for row in hits if row in candidates)
+        return [row for row in candidates if row in hits]
+
+    def _rank(self):
+        """Source rows best-first when the model's index ranks (RankedIndex), else None."""
+        if not self._query or not self._source.records():
+            return None
+        index = self._source.search_index()
+        return index.rank(self._query) if isinstance(index, RankedIndex) else None
+
+    def _refilter(self):
+        self.beginResetModel()
+        ranked = self._rank()
+        if ranked is None:
+            self._rows, self._positions = self._match(), None
+        else:
+            self._rows, self._positions = ranked, {row: pos for pos, row in enumerate(ranked)}
+        self.endResetModel()
+
+    def _on_source_reset(self):
+        self._refilter()
+
+    def _on_source_rows_inserted(self, _parent, first, last):
+        if self._positions is not None:
+            self._refilter()
+            return
+        added = self._match(range(first, last + 1))
+        if not added:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+        self._rows.extend(added)
+        self.endInsertRows()
+
+    def _on_source_data_changed(self, top, bottom, _roles=()):
+        if self._positions is not None:
+            self._refilter()
+            return
+        if not self._query:
+            self.dataChanged.emit(self.mapFromSource(top), self.mapFromSource(bottom))
+            return
+        index = self._source.search_index()
+        for row in range(top.row(), bottom.row() + 1):
+            pos = bisect_left(self._rows, row)
+            listed = pos < len(self._rows) and self._rows[pos] == row
+            wanted = index.matches(row, self._query)
+            if listed and wanted:
+                changed = self.index(pos, 0)
+                self.dataChanged.emit(changed, changed)
+            elif listed:
+                self.beginRemoveRows(QModelIndex(), pos, pos)
+                del self._rows[pos]
+                self.endRemoveRows()
+            elif wanted:
+                self.beginInsertRows(QModelIndex(), pos, pos)
+                self._rows.insert(pos, row)
+                self.endInsertRows()
+
+    # ---------- mapping ----------
+    def mapToSource(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self._source.index(self._rows[index.row()], 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._positions is not None:
+            pos = self._positions.get(source_index.row())
+            return QModelIndex() if pos is None else self.index(pos, 0)
+        pos = bisect_left(self._rows, source_index.row())
+        if pos < len(self._rows) and self._rows[pos] == source_index.row():
+            return self.index(pos, 0)
+        return QModelIndex()
+
+    def source_record(self, index):
+        return self._source.record(self.mapToSource(index).row())
+
+    def records(self) -> list:
+        """The source records currently passing the filter, in display order."""
+        records = self._source.records()
+        return [records[row] for row in self._rows if row < len(records)]
+
+    # ---------- QAbstractListModel ----------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def flags(self, index):
+        return self._source.flags(self.mapToSource(index))
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        return self._source.data(self.mapToSource(index), role)
+
+
+# ----------------- Painting -----------------
+class CardDelegate(QStyledItemDelegate):
+    """Paints the white rounded two-line cards the QListWidget stylesheets used to draw."""
+    MARGIN = 6
+    PADDING = 14
+    RADIUS = 14
+    ACCENT = QColor("#5B5CE5")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._title_font = QFont()
+        self._title_font.setBold(True)
+        self._sub_font = QFont()
+        self._line_h = max(QFontMetrics(self._title_font).height(), QFontMetrics(self._sub_font).height())
+
+    def row_height(self) -> int:
+        return 2 * self._line_h + 4 + 2 * (self.MARGIN + self.PADDING)
+
+    def sizeHint(self, option, index):
+        return QSize(200, self.row_height())
+
+    def paint(self, painter: QPainter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = QRectF(option.rect).adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        path = QPainterPath()
+        path.addRoundedRect(card, self.RADIUS, self.RADIUS)
+
+        skeleton = bool(index.data(SkeletonRole))
+        painter.fillPath(path, QColor("#F4F5F8") if skeleton else QColor("white"))
+        if option.state & QStyle.State_Selected:
+            painter.setPen(QPen(self.ACCENT, 2))
+            painter.drawPath(path)
+
+        inner = card.adjusted(self.PADDING, self.PADDING - 2, -self.PADDING, -self.PADDING + 2).toRect()
+        title = index.data(TitleRole) or ""
+        subtitle = index.data(SubtitleRole) or ""
+        badge = index.data(BadgeRole) or ""
+
+        title_fm = QFontMetrics(self._title_font)
+        title_w = inner.width()
+        if badge:
+            badge_w = title_fm.horizontalAdvance(badge)
+            painter.setFont(self._title_font)
+            painter.setPen(QColor("#C62828"))
+            painter.drawText(inner.x(), inner.y(), inner.width(), self._line_h, Qt.AlignRight | Qt.AlignVCenter, badge)
+            title_w -= badge_w + 12
+
+        painter.setFont(self._title_font)
+        painter.setPen(QColor("#9AA3B2") if skeleton else QColor("#111"))
+        painter.drawText(
+            inner.x(), inner.y(), title_w, self._line_h, Qt.AlignLeft | Qt.AlignVCenter,
+            title_fm.elidedText(title, Qt.ElideRight, title_w),
+        )
+
+        if subtitle:
+            sub_fm = QFontMetrics(self._sub_font)
+            painter.setFont(self._sub_font)
+            painter.setPen(QColor("#555"))
+            painter.drawText(
+                inner.x(), inner.y() + self._line_h + 4, inner.width(), self._line_h,
+                Qt.AlignLeft | Qt.AlignVCenter,
+                sub_fm.elidedText(subtitle, Qt.ElideRight, inner.width()),
+            )
+        painter.restore()
+
+
+class ColumnCardDelegate(QStyledItemDelegate):
+    """
+    Paints a CellsRole tuple as one white rounded card of fixed-width columns: the painted
+    version of a QFrame row holding a QLabel per column.
+
+    `columns` is [(width, alignment, bold)] in cell order; a width of None takes whatever
+    the fixed columns leave over. With `hover`, the row under the mouse (and the selected
+    one) gets the light blue hover background.
+    """
+    GAP = 10        # between cards, like QListWidget.setSpacing(10)
+    SPACING = 6     # between columns, like a QHBoxLayout
+    HOVER = QColor("#f2f6ff")
+
+    def __init__(self, columns, height: int, radius: int = 14, padding: int = 14, hover: bool = False, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self.height = height
+        self.radius = radius
+        self.padding = padding
+        self.hover = hover
+        self._font = QFont()
+        self._bold = QFont()
+        self._bold.setPixelSize(14)
+        self._bold.setWeight(QFont.DemiBold)
+
+    def row_height(self) -> int:
+        return self.height + self.GAP
+
+    def sizeHint(self, option, index):
+        return QSize(200, self.row_height())
+
+    def paint(self, painter: QPainter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = QRectF(option.rect).adjusted(0, self.GAP / 2, 0, -self.GAP / 2)
+        path = QPainterPath()
+        path.addRoundedRect(card, self.radius, self.radius)
+
+        skeleton = bool(index.data(SkeletonRole))
+        if skeleton:
+            background = QColor("#F4F5F8")
+        elif self.hover and option.state & (QStyle.State_MouseOver | QStyle.State_Selected):
+            background = self.HOVER
+        else:
+            background = QColor("white")
+        painter.fillPath(path, background)
+
+        cells = ("Loading…",) if skeleton else (index.data(CellsRole) or ())
+        inner = card.adjusted(self.padding, 0, -self.padding, 0)
+        fixed = sum(width for width, _align, _bold in self.columns if width)
+        spare = inner.width() - fixed - self.SPACING * (len(self.columns) - 1)
+
+        x = inner.left()
+        painter.setPen(QColor("#9AA3B2") if skeleton else QColor("#111"))
+        for (width, align, bold), text in zip(self.columns, cells):
+            width = width or max(0, spare)
+            font = self._bold if bold else self._font
+            painter.setFont(font)
+            painter.drawText(
+                QRectF(x, inner.top(), width, inner.height()), (align or Qt.AlignLeft) | Qt.AlignVCenter,
+                QFontMetrics(font).elidedText(str(text), Qt.ElideRight, int(width)),
+            )
+            x += width + self.SPACING
+        painter.restore()
+
+
+def card_list_view(model, parent=None, delegate=None) -> QTableView:
+    """
+    Single-column, header-less QTableView showing card rows (CardDelegate unless another
+    delegate is given).
+
+    A table rather than a QListView because its rows are fixed-height header sections: the
+    view never walks the model to lay rows out, so 100k rows cost the same as 10 and only
+    the rows on screen are ever painted.
+    """
+    view = QTableView(parent)
+    view.setModel(model)
+    delegate = delegate or CardDelegate(view)
+    delegate.setParent(view)
+    view.setItemDelegate(delegate)
+    view.setMouseTracking(getattr(delegate, "hover", False))
+
+    view.horizontalHeader().hide()
+    view.horizontalHeader().setStretchLastSection(True)
+    rows = view.verticalHeader()
+    rows.hide()
+    rows.setSectionResizeMode(QHeaderView.Fixed)
+    rows.setDefaultSectionSize(delegate.row_height())
+
+    view.setShowGrid(False)
+    view.setWordWrap(False)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    view.setSelectionMode(QAbstractItemView.SingleSelection)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setFocusPolicy(Qt.NoFocus)
+    view.setStyleSheet("""
+        QTableView {
+            background: rgba(255,255,255,0.55);
+            border: none;
+            border-radius: 18px;
+            padding: 8px;
+            outline: 0px;
+        }
+    """)
+    return view
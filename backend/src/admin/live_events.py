@@ -0,0 +1,146 @@
+import json
+import random
+import socket
+import threading
+
+import requests
+import urllib3
+from PySide6.QtCore import QObject, Signal
+
+
+def parse_sse(lines):
+    """
+    Server-Sent Events from decoded lines -> (id, event, data) per event. Comments
+    (heartbeats) and events without data (e.g. a bare "retry:") are skipped.
+    """
+    event_id, event, data = None, "message", []
+    for line in lines:
+        if line:
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "id":
+                event_id = value
+            elif field == "event":
+                event = value
+            elif field == "data":
+                data.append(value)
+            continue
+        if data:
+            yield event_id, event, "\n".join(data)
+        event_id, event, data = None, "message", []
+
+
+def stream_lines(response):
+    """
+    Decoded lines of a streaming response as soon as each arrives (requests' iter_lines
+    holds them back until a whole chunk is buffered, delaying every event).
+    """
+    pending = b""
+    while True:
+        data = response.raw.read1(65536)
+        if not data:
+            break
+        *lines, pending = (pending + data).split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r").decode("utf-8")
+    if pending:
+        yield pending.decode("utf-8")
+
+
+def _socket_of(response):
+    """The socket under a streaming requests response, or None."""
+    raw = response.raw
+    sock = getattr(getattr(raw, "connection", None), "sock", None)
+    if sock is None:
+        # http.client lets go of the connection's socket for "Connection: close" responses
+        fp = getattr(getattr(raw, "_fp", None), "fp", None)
+        sock = getattr(getattr(fp, "raw", None), "_sock", None)
+    return sock
+
+
+# ----------------- Subscriber -----------------
+class EventStream(QObject):
+    """
+    Follows GET /admin/events (utils/events.js) on its own thread and hands each event to
+    the GUI thread as event(type, data). Pages apply them as diffs instead of reloading.
+
+    Drops are retried with jittered exponential backoff, resuming from the last event id
+    seen (Last-Event-ID). When the server can no longer resume (restart, or too long away)
+    it answers "reset": whatever the pages show may have missed changes and should reload.
+    """
+    event = Signal(str, object)      # type, decoded data
+    reset = Signal()
+    connected_changed = Signal(bool)
+
+    def __init__(self, api, parent=None, backoff_base: float = 1.0, backoff_max: float = 30.0):
+        super().__init__(parent)
+        self.api = api
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.last_id = None
+        self.connected = False
+        self.reconnects = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._response = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="event-stream", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        # shutting the socket down wakes the blocked read (close() would wait for it)
+        sock = _socket_of(self._response) if self._response is not None else None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _run(self):
+        attempt = 0
+        while not self._stop.is_set():
+            try:
+                with self.api.open_events(self.last_id) as r:
+                    r.raise_for_status()
+                    self._response = r
+                    self._set_connected(True)
+                    attempt = 0
+                    self._read(r)
+            except (requests.RequestException, urllib3.exceptions.HTTPError, OSError,
+                    ValueError, AttributeError):
+                # refused, dropped mid-event (raw reads raise urllib3's ProtocolError, not a
+                # requests error) or closed by stop(): retry below
+                pass
+            finally:
+                self._response = None
+                self._set_connected(False)
+
+            if self._stop.is_set():
+                break
+            delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+            attempt += 1
+            self.reconnects += 1
+            self._stop.wait(delay * (0.5 + random.random() / 2))
+
+    def _read(self, response):
+        for event_id, kind, data in parse_sse(stream_lines(response)):
+            if self._stop.is_set():
+                return
+            if event_id:
+                self.last_id = event_id
+            if kind == "reset":
+                self.reset.emit()
+            elif kind != "hello":
+                self.event.emit(kind, json.loads(data))
+
+    def _set_connected(self, connected: bool):
+        if connected != self.connected:
+            self.connected = connected
+            self.connected_changed.emit(connected)
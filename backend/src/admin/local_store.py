@@ -0,0 +1,205 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+SCHEMA_VERSION = 2
+
+# version -> statements that bring the previous version up to it
+MIGRATIONS = {
+    1: [
+        """
+        CREATE TABLE responses (
+            scope TEXT NOT NULL,
+            path TEXT NOT NULL,
+            params TEXT NOT NULL DEFAULT '',
+            body BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (scope, path, params)
+        )
+        """,
+        "CREATE INDEX responses_fetched_at ON responses (fetched_at)",
+    ],
+    2: [
+        # immutable documents (closed payroll periods) by content hash, and the names they go by
+        """
+        CREATE TABLE snapshots (
+            hash TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            stored_at REAL NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE snapshot_names (
+            scope TEXT NOT NULL,
+            name TEXT NOT NULL,
+            hash TEXT NOT NULL,
+            PRIMARY KEY (scope, name)
+        )
+        """,
+    ],
+}
+
+
+class StoredResponse:
+    __slots__ = ("value", "etag", "last_modified", "fetched_at", "size")
+
+    def __init__(self, value, etag, last_modified, fetched_at, size):
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.size = size
+
+
+class LocalStore:
+    """
+    On-disk (SQLite) copy of the last good response for each read ApiClient writes through.
+    Rows are scoped per backend + login so one admin never sees another manager's roster.
+
+    Bodies are zlib-compressed JSON. The schema is versioned with PRAGMA user_version;
+    a file from a newer build is discarded (it's only a cache).
+    """
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = self._open()
+
+    # ---------- schema ----------
+    def _open(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        version = db.execute("PRAGMA user_version").fetchone()[0]
+
+        if version > SCHEMA_VERSION:
+            db.close()
+            os.remove(self.path)
+            return self._open()
+
+        for v in range(version + 1, SCHEMA_VERSION + 1):
+            db.execute("BEGIN")
+            for stmt in MIGRATIONS[v]:
+                db.execute(stmt)
+            db.execute(f"PRAGMA user_version={v}")
+            db.execute("COMMIT")
+        return db
+
+    @staticmethod
+    def _params(params) -> str:
+        return json.dumps(sorted((params or {}).items())) if params else ""
+
+    # ---------- reads / writes ----------
+    def get(self, scope: str, path: str, params=None) -> StoredResponse | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses "
+                "WHERE scope = ? AND path = ? AND params = ?",
+                (scope, path, self._params(params)),
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, fetched_at = row
+        try:
+            value = json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError):
+            return None
+        return StoredResponse(value, etag, last_modified, fetched_at, len(body))
+
+    def put(self, scope: str, path: str, params, value, etag=None, last_modified=None):
+        body = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"), 1)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(scope, path, params, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (scope, path, self._params(params), body, etag, last_modified, time.time()),
+            )
+
+    def touch(self, scope: str, path: str, params=None):
+        """Server said 304 — the stored copy is current as of now."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET fetched_at = ? WHERE scope = ? AND path = ? AND params = ?",
+                (time.time(), scope, path, self._params(params)),
+            )
+
+    # ---------- snapshots ----------
+    def get_snapshot(self, scope: str, name: str):
+        """The immutable document stored under name (e.g. a pay date), or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT s.body FROM snapshot_names n JOIN snapshots s ON s.hash = n.hash "
+                "WHERE n.scope = ? AND n.name = ?",
+                (scope, name),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError):
+            return None
+
+    def put_snapshot(self, scope: str, name: str, hash_: str, value):
+        """Keep an immutable document by its content hash (stored once however many names point at it)."""
+        body = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"), 6)
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO snapshots (hash, body, stored_at) VALUES (?, ?, ?)",
+                    (hash_, body, time.time()),
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO snapshot_names (scope, name, hash) VALUES (?, ?, ?)",
+                    (scope, name, hash_),
+                )
+            except sqlite3.Error:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    # ---------- maintenance ----------
+    def compact(self, max_age_days: float = 30, max_bytes: int = 64 * 1024 * 1024) -> dict:
+        """
+        Drop rows not refreshed in max_age_days, then oldest rows until the bodies fit in
+        max_bytes, then VACUUM if at least a quarter of the file is free pages. Snapshots never
+        go stale; only ones no name points at any more are dropped.
+        """
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            removed = self._db.execute("DELETE FROM responses WHERE fetched_at < ?", (cutoff,)).rowcount
+            removed += self._db.execute(
+                "DELETE FROM snapshots WHERE hash NOT IN (SELECT hash FROM snapshot_names)"
+            ).rowcount
+
+            total = self._db.execute("SELECT COALESCE(SUM(length(body)), 0) FROM responses").fetchone()[0]
+            if total > max_bytes:
+                rows = self._db.execute(
+                    "SELECT rowid, length(body) FROM responses ORDER BY fetched_at ASC"
+                ).fetchall()
+                doomed = []
+                for rowid, size in rows:
+                    if total <= max_bytes:
+                        break
+                    doomed.append((rowid,))
+                    total -= size
+                self._db.executemany("DELETE FROM responses WHERE rowid = ?", doomed)
+                removed += len(doomed)
+
+            pages = self._db.execute("PRAGMA page_count").fetchone()[0]
+            free = self._db.execute("PRAGMA freelist_count").fetchone()[0]
+            vacuumed = pages > 0 and free * 4 >= pages
+            if vacuumed:
+                self._db.execute("VACUUM")
+                self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        return {"removed": removed, "bytes": total, "vacuumed": vacuumed}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,79 @@
+from PySide6.QtCore import QObject, Signal
+
+from workers import TaskRunner
+
+
+# ----------------- Cursor paging -----------------
+class CursorPager(QObject):
+    """
+    Incrementally loads a cursor-paginated list through a page's TaskRunner.
+
+    `fetch(cursor=..., limit=..., **filters)` must return {"items": [...], "nextCursor": str | None}.
+    reset() starts over (new filters); fetch_more() asks for the next page and is a no-op while
+    a page is in flight or the server said there is nothing left. A page whose task is cancelled
+    is simply not loaded: fetch_more() asks for it again. watch(scrollbar) calls fetch_more()
+    when the user scrolls near the bottom.
+    """
+    page_loaded = Signal(list, bool)  # (new rows, first page of a reset)
+    failed = Signal(object)
+
+    def __init__(self, runner: TaskRunner, fetch, key: str = "page", page_size: int = 50, parent=None):
+        super().__init__(parent)
+        self.runner = runner
+        self.fetch = fetch
+        self.key = key
+        self.page_size = page_size
+        runner.cancelled.connect(self._on_cancelled)
+
+        self.filters = {}
+        self.cursor = None
+        self.has_more = False
+        self.loading = False
+        self.loaded = 0
+
+    def reset(self, **filters):
+        self.runner.cancel(self.key)
+        self.filters = {k: v for k, v in filters.items() if v}
+        self.cursor = None
+        self.has_more = True
+        self.loading = False
+        self.loaded = 0
+        self._load(first=True)
+
+    def fetch_more(self):
+        if self.has_more and not self.loading:
+            self._load(first=self.cursor is None)  # nothing shown yet if the first page was cancelled
+
+    def watch(self, scrollbar):
+        # within one page-step of the bottom (works for per-item and per-pixel scrolling)
+        def on_scroll(value):
+            if value >= scrollbar.maximum() - scrollbar.pageStep():
+                self.fetch_more()
+        scrollbar.valueChanged.connect(on_scroll)
+        scrollbar.rangeChanged.connect(lambda _lo, _hi: on_scroll(scrollbar.value()))
+
+    def _load(self, first: bool):
+        self.loading = True
+        self.runner.submit(
+            self.key, self.fetch,
+            cursor=self.cursor, limit=self.page_size, **self.filters,
+            on_result=lambda page: self._on_page(page, first),
+            on_error=self._on_error,
+        )
+
+    def _on_page(self, page, first: bool):
+        self.loading = False
+        items = list(page.get("items") or [])
+        self.cursor = page.get("nextCursor")
+        self.has_more = bool(self.cursor)
+        self.loaded += len(items)
+        self.page_loaded.emit(items, first)
+
+    def _on_cancelled(self, key):
+        if key == self.key:
+            self.loading = False  # cursor and has_more still describe what is loaded
+
+    def _on_error(self, e):
+        self.loading = False
+        self.has_more = False
+        self.failed.emit(e)
@@ -0,0 +1,220 @@
+from dataclasses import dataclass
+from operator import itemgetter
+
+import numpy as np
+
+from records import PayrollTotal, parse_day, pay_pence
+
+# numpy day numbers count from 1970-01-01; records.py uses date ordinals
+_EPOCH_ORDINAL = parse_day("1970-01-01")
+
+
+def to_hundredths(values) -> np.ndarray:
+    """
+    Decimal amounts (rates in pounds, hours) -> int64 hundredths, rounded half up like
+    records.parse_pence. JSON numbers are decimal: the tiny bias puts values such as 1.005,
+    stored just below the half in binary, back on the side they were written on.
+    """
+    values = np.nan_to_num(np.asarray(values, dtype=np.float64))  # null -> nan -> 0
+    return np.floor(values * 100 + 0.5 + 1e-7).astype(np.int64)
+
+
+def to_ordinals(dates) -> np.ndarray:
+    """"YYYY-MM-DD" strings (or ISO timestamps) -> int32 date ordinals; a pay period has few distinct dates."""
+    codes, labels = _codes(dates)
+    days = np.asarray([str(d or "")[:10] or "NaT" for d in labels], dtype="datetime64[D]")
+    ordinals = np.where(np.isnat(days), 0, days.astype(np.int64) + _EPOCH_ORDINAL).astype(np.int32)
+    return ordinals[codes]
+
+
+def _codes(values, blank=None):
+    """Factorize labels: (int32 code per value, labels in first-seen order). Empty labels become blank."""
+    index = {v: i for i, v in enumerate(dict.fromkeys(values))}
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int32, count=len(values))
+    labels = tuple(v if v or blank is None else blank for v in index)
+    return codes, labels
+
+
+# ----------------- Columnar shifts -----------------
+@dataclass(slots=True, frozen=True)
+class ShiftColumns:
+    """
+    Shifts as parallel arrays, one element per shift: staff and venue are codes into
+    staff_names / venue_names, day a date ordinal, hours hundredths of an hour and rate
+    pence per hour (the same fixed-point units as records.py).
+    """
+    staff: np.ndarray
+    venue: np.ndarray
+    day: np.ndarray
+    hours: np.ndarray
+    rate: np.ndarray
+    staff_names: tuple = ()
+    venue_names: tuple = ()
+
+    def __len__(self):
+        return len(self.day)
+
+    @classmethod
+    def from_rows(cls, fields, rows) -> "ShiftColumns":
+        """Columns straight from a payroll bundle's positional rows (see PayrollShift.FIELDS)."""
+        at = {field: i for i, field in enumerate(fields)}
+
+        def column(field, default):
+            i = at.get(field)
+            return list(map(itemgetter(i), rows)) if i is not None else [default] * len(rows)
+
+        staff, staff_names = _codes(column("username", None), blank="Unknown")
+        venue, venue_names = _codes(column("venue", ""), blank="")
+        return cls(
+            staff=staff,
+            venue=venue,
+            day=to_ordinals(column("date", "")),
+            hours=to_hundredths(column("hours", 0)),
+            rate=to_hundredths(column("rate", 0)),
+            staff_names=staff_names,
+            venue_names=venue_names,
+        )
+
+    @classmethod
+    def from_records(cls, shifts) -> "ShiftColumns":
+        """Columns from already decoded records.PayrollShift rows."""
+        n = len(shifts)
+        staff, staff_names = _codes([s.username for s in shifts], blank="Unknown")
+        venue, venue_names = _codes([s.venue for s in shifts], blank="")
+        return cls(
+            staff=staff,
+            venue=venue,
+            day=np.fromiter((s.day for s in shifts), dtype=np.int32, count=n),
+            hours=np.fromiter((s.hours for s in shifts), dtype=np.int64, count=n),
+            rate=np.fromiter((s.rate for s in shifts), dtype=np.int64, count=n),
+            staff_names=staff_names,
+            venue_names=venue_names,
+        )
+
+    def rows_of(self, username) -> np.ndarray:
+        """Positions of one staff member's shifts, in their original order."""
+        try:
+            code = self.staff_names.index(username)
+        except ValueError:
+            return np.zeros(0, dtype=np.intp)
+        return np.flatnonzero(self.staff == code)
+
+    def rates_with(self, venue_rates=None, uplift_pct=0) -> np.ndarray:
+        """
+        What-if hourly rates: venue_rates {venue name: pence} replaces a venue's rate, then
+        uplift_pct raises (or cuts) every rate, rounded half up to the penny.
+        """
+        rate = self.rate.copy()
+        for name, pence in (venue_rates or {}).items():
+            if name in self.venue_names:
+                rate[self.venue == self.venue_names.index(name)] = pence
+        if uplift_pct:
+            rate = np.floor(rate * (1 + uplift_pct / 100) + 0.5 + 1e-7).astype(np.int64)
+        return rate
+
+
+# ----------------- Totals -----------------
+@dataclass(slots=True, frozen=True)
+class PayrollTotals:
+    """
+    Shift counts, hours (hundredths) and pay (pence) per pay period x staff and per pay
+    period x venue. Row i is pay_dates[i]; columns follow the shifts' staff_names / venue_names.
+    """
+    pay_dates: tuple
+    staff_names: tuple
+    venue_names: tuple
+    staff_shifts: np.ndarray
+    staff_hours: np.ndarray
+    staff_pay: np.ndarray
+    venue_shifts: np.ndarray
+    venue_hours: np.ndarray
+    venue_pay: np.ndarray
+    unmatched: int = 0   # shifts dated outside every pay period
+
+    def period(self, pay_date) -> int:
+        return self.pay_dates.index(pay_date)
+
+    def staff_totals(self, pay_date, year_to_date=False) -> list:
+        """PayrollTotal per staff member who worked in the period (or any period up to it)."""
+        i = self.period(pay_date)
+        rows = slice(0, i + 1) if year_to_date else slice(i, i + 1)
+        shifts = self.staff_shifts[rows].sum(axis=0)
+        hours, pay = self.staff_hours[rows].sum(axis=0), self.staff_pay[rows].sum(axis=0)
+        return [
+            PayrollTotal(name, int(hours[s]), int(pay[s]))
+            for s, name in enumerate(self.staff_names) if shifts[s]
+        ]
+
+    def venue_totals(self, pay_date) -> dict:
+        """venue -> (hours, pay) for one period."""
+        i = self.period(pay_date)
+        return {
+            name: (int(self.venue_hours[i, v]), int(self.venue_pay[i, v]))
+            for v, name in enumerate(self.venue_names) if self.venue_shifts[i, v]
+        }
+
+    def mismatches(self, pay_date, server_totals) -> list:
+        """(username, local, server) for every staff member whose totals differ from the server's."""
+        local = {t.username: t for t in self.staff_totals(pay_date)}
+        server = {t.username: t for t in server_totals}
+        out = []
+        for name in sorted(local.keys() | server.keys()):
+            mine, theirs = local.get(name, PayrollTotal(name)), server.get(name, PayrollTotal(name))
+            if (mine.hours, mine.pay) != (theirs.hours, theirs.pay):
+                out.append((name, mine, theirs))
+        return out
+
+
+class PayrollEngine:
+    """
+    Vectorized payroll over the pay calendar (GET /admin/payroll/periods).
+
+    totals() buckets every shift into its pay period with one searchsorted, prices each
+    shift in whole pence (records.pay_pence, so a shift costs exactly what its payslip line
+    says) and sums hours and pay per period x staff and period x venue with bincount.
+    A million shifts take a few tens of milliseconds.
+    """
+
+    def __init__(self, periods):
+        periods = sorted(periods or [], key=lambda p: p["from"])
+        self.pay_dates = tuple(p["payDate"] for p in periods)
+        self._starts = np.array([parse_day(p["from"]) for p in periods], dtype=np.int32)
+        self._ends = np.array([parse_day(p["to"]) for p in periods], dtype=np.int32)
+
+    def period_of(self, days) -> np.ndarray:
+        """Pay period index of each day ordinal, -1 outside the calendar."""
+        days = np.asarray(days)
+        if not len(self._starts):
+            return np.full(days.shape, -1, dtype=np.intp)
+        i = np.searchsorted(self._starts, days, side="right") - 1
+        inside = (i >= 0) & (days <= self._ends[np.maximum(i, 0)])
+        return np.where(inside, i, -1)
+
+    def totals(self, shifts: ShiftColumns, rate=None) -> PayrollTotals:
+        """Totals for every period at once; rate overrides the shifts' rates (what-if)."""
+        pay = pay_pence(shifts.rate if rate is None else np.asarray(rate, dtype=np.int64), shifts.hours)
+        period = self.period_of(shifts.day)
+        inside = period >= 0
+        period, pay, hours = period[inside], pay[inside], shifts.hours[inside]
+
+        def by(codes, size):
+            # shift count, hours, pay; float64 sums are exact for whole pence up to 2**53
+            keys = period * size + codes[inside]
+            shape = (len(self.pay_dates), size)
+            sums = [np.bincount(keys, weights=values, minlength=shape[0] * size) for values in (None, hours, pay)]
+            return [np.rint(s).astype(np.int64).reshape(shape) for s in sums]
+
+        staff_shifts, staff_hours, staff_pay = by(shifts.staff, len(shifts.staff_names))
+        venue_shifts, venue_hours, venue_pay = by(shifts.venue, len(shifts.venue_names))
+        return PayrollTotals(
+            pay_dates=self.pay_dates,
+            staff_names=shifts.staff_names,
+            venue_names=shifts.venue_names,
+            staff_shifts=staff_shifts,
+            staff_hours=staff_hours,
+            staff_pay=staff_pay,
+            venue_shifts=venue_shifts,
+            venue_hours=venue_hours,
+            venue_pay=venue_pay,
+            unmatched=int((~inside).sum()),
+        )
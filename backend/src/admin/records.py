@@ -0,0 +1,259 @@
+import sys
+from dataclasses import dataclass, replace
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+NO_DAY = 0        # day ordinal for a missing or malformed date
+NO_TIME = -1      # minutes for a missing or malformed time
+DAY_MINUTES = 24 * 60
+
+
+# ----------------- Field decoding -----------------
+# dates, times and rates repeat across thousands of rows, so the parsers are memoised
+@lru_cache(maxsize=4096)
+def parse_day(value) -> int:
+    """"2026-01-05" or an ISO timestamp -> date ordinal (NO_DAY when missing or malformed)."""
+    try:
+        return date.fromisoformat(str(value or "")[:10]).toordinal()
+    except ValueError:
+        return NO_DAY
+
+
+def day_text(day: int) -> str:
+    return date.fromordinal(day).isoformat() if day > NO_DAY else ""
+
+
+@lru_cache(maxsize=4096)
+def parse_time(value) -> int:
+    """"HH:MM" -> minutes since midnight (NO_TIME when missing or malformed)."""
+    hours, sep, minutes = str(value or "").strip().partition(":")
+    if not sep or not hours.isdigit() or not minutes.isdigit() or len(minutes) != 2:
+        return NO_TIME
+    hours, minutes = int(hours), int(minutes)
+    return hours * 60 + minutes if hours < 24 and minutes < 60 else NO_TIME
+
+
+def time_text(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}" if minutes >= 0 else ""
+
+
+def shift_minutes(start: int, end: int) -> int:
+    """Length of a shift; an end before the start is on the next day (22:00-06:00 is 480)."""
+    if start < 0 or end < 0:
+        return 0
+    return end - start if end >= start else end + DAY_MINUTES - start
+
+
+@lru_cache(maxsize=4096)
+def parse_pence(value) -> int:
+    """Money (12.5, "12.50") -> whole pence, rounded half up; 0 when missing or malformed."""
+    try:
+        return int((Decimal(str(value).strip()) * 100).quantize(Decimal(1), ROUND_HALF_UP))
+    except (ArithmeticError, ValueError):
+        return 0
+
+
+def pence_text(pence: int) -> str:
+    whole, frac = divmod(abs(pence), 100)
+    return f"{'-' if pence < 0 else ''}{whole}.{frac:02d}"
+
+
+def parse_hours(value) -> int:
+    """Decimal hours (7.5) -> hundredths of an hour (750), like money; 0 when missing or malformed."""
+    return parse_pence(value)
+
+
+def minutes_hours(minutes: int) -> int:
+    """Minutes -> hundredths of an hour, rounded half up (8h20m is 833)."""
+    return (minutes * 100 + 30) // 60
+
+
+def hours_text(hours: int, places: int = 2) -> str:
+    return f"{hours / 100:.{places}f}"
+
+
+def pay_pence(rate: int, hours: int) -> int:
+    """Pay in pence for hours (hundredths) at an hourly rate in pence, rounded half up."""
+    return (rate * hours + 50) // 100
+
+
+def _text(value) -> str:
+    # venue names, roles and statuses repeat across thousands of rows: keep one copy each
+    return sys.intern(str(value)) if value not in (None, "") else ""
+
+
+def _id(value) -> str:
+    if isinstance(value, dict):
+        value = value.get("_id") or value.get("id")
+    return str(value or "")
+
+
+# ----------------- Records -----------------
+@dataclass(slots=True, frozen=True)
+class Placement:
+    """
+    A shift as the pages use it, decoded once from the API's JSON.
+
+    day is a date ordinal, start/end are minutes since midnight (an end before the start
+    finishes the next day), hours is the paid length in hundredths of an hour (totalHours; 0
+    when missing, as the server's payroll counts it) and rate the hourly rate in pence.
+    """
+    id: str
+    venue: str = ""
+    role: str = ""
+    day: int = NO_DAY
+    start: int = NO_TIME
+    end: int = NO_TIME
+    hours: int = 0
+    rate: int = 0
+    address: str = ""
+    city: str = ""
+    postcode: str = ""
+    notes: str = ""
+
+    @classmethod
+    def from_json(cls, d: dict) -> "Placement":
+        return cls(
+            id=_id(d),
+            venue=_text(d.get("venue")),
+            role=_text(d.get("roleTitle") or d.get("position")),
+            day=parse_day(d.get("date")),
+            start=parse_time(d.get("startTime")),
+            end=parse_time(d.get("endTime")),
+            # payroll pays totalHours || 0, not the shift length: totals must match what is paid
+            hours=parse_hours(d.get("totalHours")),
+            rate=parse_pence(d.get("hourlyRate")),
+            address=str(d.get("addressLine") or ""),
+            city=_text(d.get("city")),
+            postcode=str(d.get("postcode") or ""),
+            notes=str(d.get("notes") or d.get("note") or ""),
+        )
+
+    @property
+    def date_text(self) -> str:
+        return day_text(self.day)
+
+    @property
+    def start_text(self) -> str:
+        return time_text(self.start)
+
+    @property
+    def end_text(self) -> str:
+        return time_text(self.end)
+
+    @property
+    def overnight(self) -> bool:
+        return 0 <= self.end < self.start
+
+    @property
+    def rate_text(self) -> str:
+        return pence_text(self.rate)
+
+    @property
+    def hours_text(self) -> str:
+        return hours_text(self.hours)
+
+    @property
+    def pay(self) -> int:
+        return pay_pence(self.rate, self.hours)
+
+
+@dataclass(slots=True, frozen=True)
+class Offer:
+    """
+    An offer with its Placement attached (shared by every offer of that placement).
+    created/updated keep the API's timestamps as text: they are only ever displayed.
+    """
+    id: str
+    status: str = ""
+    placement_id: str = ""
+    placement: Placement | None = None
+    staff_id: str = ""
+    username: str = ""
+    cancel_reason: str = ""
+    created: str = ""
+    updated: str = ""
+
+    @classmethod
+    def from_json(cls, d: dict, placement: Placement | None = None, previous: "Offer | None" = None) -> "Offer":
+        """
+        Decode one offer. placement overrides a populated placementId; previous fills in
+        what an unpopulated response leaves out (the staff username).
+        """
+        raw_placement, user = d.get("placementId"), d.get("userId")
+        if placement is None and isinstance(raw_placement, dict):
+            placement = Placement.from_json(raw_placement)
+        username = user.get("username") if isinstance(user, dict) else None
+        return cls(
+            id=_id(d),
+            status=_text(d.get("status")),
+            placement_id=_id(raw_placement),
+            placement=placement,
+            staff_id=_id(user),
+            username=_text(username if username is not None else (previous.username if previous else "")),
+            cancel_reason=str(d.get("cancelReason") or ""),
+            created=str(d.get("createdAt") or ""),
+            updated=str(d.get("updatedAt") or ""),
+        )
+
+    def with_placement(self, placement: Placement | None) -> "Offer":
+        return replace(self, placement=placement)
+
+
+@dataclass(slots=True, frozen=True)
+class PayrollShift:
+    """One completed shift from a payroll bundle (see GET /admin/payroll/period/:payDate/bundle)."""
+    username: str
+    day: int = NO_DAY
+    venue: str = ""
+    start: int = NO_TIME
+    end: int = NO_TIME
+    hours: int = 0
+    rate: int = 0
+    pay: int = 0
+
+    FIELDS = ("username", "date", "venue", "startTime", "endTime", "hours", "rate", "pay")
+
+    @classmethod
+    def from_json(cls, d: dict) -> "PayrollShift":
+        return cls(
+            username=_text(d.get("username") or "Unknown"),
+            day=parse_day(d.get("date")),
+            venue=_text(d.get("venue")),
+            start=parse_time(d.get("startTime")),
+            end=parse_time(d.get("endTime")),
+            hours=parse_hours(d.get("hours")),
+            rate=parse_pence(d.get("rate")),
+            pay=parse_pence(d.get("pay")),
+        )
+
+    @classmethod
+    def from_rows(cls, fields, rows) -> list:
+        """Decode the bundle's positional rows (one list of values per shift, in fields order)."""
+        at = {field: i for i, field in enumerate(fields)}
+        columns = [at.get(field) for field in cls.FIELDS]
+        if None in columns:
+            return [cls.from_json(dict(zip(fields, row))) for row in rows]
+        u, d, v, s, e, h, r, p = columns
+        return [
+            cls(_text(row[u] or "Unknown"), parse_day(row[d]), _text(row[v]), parse_time(row[s]),
+                parse_time(row[e]), parse_hours(row[h]), parse_pence(row[r]), parse_pence(row[p]))
+            for row in rows
+        ]
+
+
+@dataclass(slots=True, frozen=True)
+class PayrollTotal:
+    """One staff member's totals for a pay period."""
+    username: str
+    hours: int = 0
+    pay: int = 0
+
+    @classmethod
+    def from_json(cls, d: dict) -> "PayrollTotal":
+        return cls(
+            username=_text(d.get("username") or "Unknown"),
+            hours=parse_hours(d.get("totalHours")),
+            pay=parse_pence(d.get("totalPay")),
+        )
@@ -0,0 +1,74 @@
+import threading
+
+
+class Replica:
+    """
+    Local copy of one delta-synced list (GET <path>?since=<cursor>, utils/deltaSync.js):
+    records by _id plus the cursor to ask for the next delta with.
+
+    order: (field, newest_first) the server sorts the full list by; merged records are
+    kept in that order (ties by _id). limit: rows kept, for lists the server caps.
+
+    A capped list only holds the server's first `limit` rows: when a delta removes one of
+    them, the row that moves up into the window is one this copy has never seen, so
+    needs_full turns on and the owner fetches the list whole (since=0) instead.
+    """
+    def __init__(self, items=(), cursor=None, order=("_id", False), limit=None):
+        self.cursor = cursor
+        self.order = order
+        self.limit = limit
+        self.size = 0  # approximate bytes of the rows kept (cache accounting)
+        self.lock = threading.Lock()  # one sync of this list at a time
+        self._records = {}
+        self._sizes = {}  # _id -> that record's share of the response it arrived in
+        self._items = []
+        self.needs_full = False
+        self._reset(items)
+
+    def apply(self, delta: dict, size: int = 0) -> list:
+        """Merge one ?since response; a full one replaces the copy. Returns items()."""
+        items = [r for r in delta.get("items") or [] if isinstance(r, dict)]
+        share = size // len(items) if items else 0
+        if delta.get("full"):
+            self._reset(items, share)
+        else:
+            removed = {str(record_id) for record_id in delta.get("removed") or []}
+            if self._capped and any(str(r.get("_id")) in removed for r in self._items):
+                # the rows that move up into the window are not all known here
+                self.needs_full = True
+            for record_id in removed:
+                self._records.pop(record_id, None)
+                self._sizes.pop(record_id, None)
+            for record in items:
+                record_id = str(record.get("_id"))
+                self._records[record_id] = record
+                self._sizes[record_id] = share  # replaces the old version's bytes
+            self._items = self._sorted()
+            self._measure()
+        self.cursor = delta.get("cursor") or None
+        return self._items
+
+    def items(self) -> list:
+        """The records in server order (shared, read-only)."""
+        return self._items
+
+    def _reset(self, items, share: int = 0):
+        self._records = {str(r.get("_id")): r for r in items if isinstance(r, dict)}
+        self._sizes = dict.fromkeys(self._records, share)
+        self._capped = self.limit is not None and len(self._records) >= self.limit
+        self.needs_full = False
+        self._items = self._sorted()
+        self._measure()
+
+    def _measure(self):
+        # only what is kept counts: replaced, removed and capped-off rows no longer do
+        sizes = self._sizes
+        self.size = sum(sizes.get(str(r.get("_id")), 0) for r in self._items)
+
+    def _sorted(self) -> list:
+        field, newest_first = self.order
+        rows = sorted(self._records.values(), key=lambda r: str(r.get("_id")), reverse=newest_first)
+        rows.sort(key=lambda r: str(r.get(field) or ""), reverse=newest_first)
+        if self.limit is not None:
+            del rows[self.limit:]
+        return rows
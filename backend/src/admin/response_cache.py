@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import OrderedDict
+
+# path prefix -> seconds a cached response is served without asking the server.
+# 0 = keep it, but always revalidate (a 304 still saves the download).
+DEFAULT_TTLS = [
+    ("/admin/payroll/periods", 24 * 3600),  # hardcoded calendar on the server
+    ("/admin/venues", 300),
+    ("/admin/staff/", 30),                  # one profile
+    ("/admin/staff", 60),                   # roster
+    ("/admin/offers/by-staff/", 15),
+    ("/admin/payroll/period/", 60),
+    ("/admin/calendar", 30),
+]
+
+
+class CacheEntry:
+    __slots__ = ("value", "etag", "last_modified", "stored_at", "ttl", "size")
+
+    def __init__(self, value, etag, last_modified, ttl, size):
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.monotonic()
+        self.ttl = ttl
+        self.size = size
+
+    def is_fresh(self) -> bool:
+        return self.ttl > 0 and (time.monotonic() - self.stored_at) < self.ttl
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU of decoded GET responses, keyed by (path, params).
+
+    Fresh entries are served locally; stale ones are kept so ApiClient can send
+    If-None-Match / If-Modified-Since and reuse the body on a 304. Any invalidate()
+    bumps a generation so a GET that started before a mutation can't store stale data.
+    """
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, ttls=None):
+        self.max_bytes = max_bytes
+        self.ttls = list(ttls if ttls is not None else DEFAULT_TTLS)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.bytes_saved = 0
+
+    def ttl_for(self, path: str) -> int:
+        for prefix, ttl in self.ttls:
+            if path.startswith(prefix):
+                return ttl
+        return 0
+
+    # ---------- lookups ----------
+    def fresh(self, key):
+        """Cached entry if it is still within its TTL, else None (counts hit/miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_fresh():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.bytes_saved += entry.size
+                return entry
+            self.misses += 1
+            return None
+
+    def stale(self, key):
+        """Entry to revalidate against, fresh or not."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def mark_revalidated(self, key, entry: CacheEntry):
+        with self._lock:
+            entry.stored_at = time.monotonic()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.revalidated += 1
+            self.bytes_saved += entry.size
+
+    # ---------- writes ----------
+    def store(self, key, value, etag=None, last_modified=None, size=0, generation=None):
+        path = key[0]
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return  # a mutation landed while this GET was in flight
+            if size > self.max_bytes:
+                return
+            self._drop(key)
+            entry = CacheEntry(value, etag, last_modified, self.ttl_for(path), size)
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, *prefixes: str):
+        """Evict every entry whose path starts with one of the prefixes."""
+        with self._lock:
+            self.generation += 1
+            for key in [k for k in self._entries if k[0].startswith(prefixes)]:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def find(self, prefix: str, predicate):
+        """Paths of cached entries under prefix whose value matches predicate."""
+        with self._lock:
+            items = [(k[0], e.value) for k, e in self._entries.items() if k[0].startswith(prefix)]
+        return [path for path, value in items if predicate(value)]
+
+    # ---------- stats ----------
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "hit_ratio": round((self.hits + self.revalidated) / lookups, 3) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+            }
@@ -0,0 +1,293 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+
+# dates (2026-01-05), times (09:00) and rates (12.5) stay single tokens
+_TOKEN = re.compile(r"[0-9a-z]+(?:[-:./][0-9a-z]+)*")
+_WORD = re.compile(r"[0-9a-z]+")
+
+
+def normalize(text) -> str:
+    """Case- and accent-insensitive form used for both documents and queries."""
+    text = unicodedata.normalize("NFKD", str(text or ""))
+    return "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+
+
+def tokenize(text) -> list:
+    return _TOKEN.findall(normalize(text))
+
+
+def words(text) -> list:
+    """Plain alphanumeric words: "j.smith@mail.com" -> ["j", "smith", "mail", "com"]."""
+    return _WORD.findall(normalize(text))
+
+
+def trigrams(word) -> set:
+    """Trigrams of "$" + word; the "$" marks the start so prefixes share their first gram."""
+    padded = "$" + word
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def typo_budget(term) -> int:
+    """How many edits a query word may be away from a match: none up to 3 letters, then 1, then 2."""
+    return 0 if len(term) < 4 else 1 if len(term) < 8 else 2
+
+
+def prefix_distance(term, word, limit) -> int:
+    """
+    Fewest edits (insert, delete, substitute, swap neighbours) turning term into some prefix
+    of word, or limit + 1 when it takes more than limit.
+    """
+    if len(word) < len(term) - limit:
+        return limit + 1
+    word = word[:len(term) + limit]  # longer prefixes cost more than limit edits anyway
+    # optimal string alignment DP; rows walk term, columns walk word
+    prev2 = None
+    prev = list(range(len(word) + 1))
+    for i in range(1, len(term) + 1):
+        cur = [i] + [0] * len(word)
+        for j in range(1, len(word) + 1):
+            cost = 0 if term[i - 1] == word[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and term[i - 1] == word[j - 2] and term[i - 2] == word[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    lo, hi = max(1, len(term) - limit), min(len(word), len(term) + limit)
+    best = min(prev[lo:hi + 1], default=limit + 1)
+    return best if best <= limit else limit + 1
+
+
+class SearchIndex:
+    """
+    Inverted index of token -> keys, built once per data load and kept up to date with
+    add()/remove(). A query is split into terms the same way documents are; a document
+    matches when every term is a substring of one of its tokens ("roy 2026-01" finds
+    "The Royal | 2026-01-05").
+
+    Term lookups scan the vocabulary (distinct tokens, small next to the documents) and are
+    memoised until the index changes, so repeated keystrokes over 100k documents cost a
+    few set intersections.
+    """
+    tokenize = staticmethod(tokenize)
+
+    def __init__(self):
+        self._postings = {}   # token -> set(keys)
+        self._docs = {}       # key -> tuple(tokens)
+        self._term_cache = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, key):
+        return key in self._docs
+
+    # ---------- updates ----------
+    def add(self, key, text):
+        """Index (or re-index) one document."""
+        if key in self._docs:
+            self.remove(key)
+        tokens = tuple(set(self.tokenize(text)))
+        self._docs[key] = tokens
+        for token in tokens:
+            keys = self._postings.get(token)
+            if keys is None:
+                keys = self._postings[token] = set()
+            keys.add(key)
+        self._changed()
+
+    def add_many(self, items):
+        for key, text in items:
+            self.add(key, text)
+
+    def remove(self, key):
+        tokens = self._docs.pop(key, None)
+        if tokens is None:
+            return
+        for token in tokens:
+            keys = self._postings.get(token)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[token]
+        self._changed()
+
+    def clear(self):
+        self._postings.clear()
+        self._docs.clear()
+        self._changed()
+
+    def warm(self):
+        """Build anything queries would otherwise build lazily (nothing here)."""
+
+    def _changed(self):
+        self._term_cache.clear()
+
+    # ---------- queries ----------
+    def search(self, query):
+        """
+        Keys matching every term of query, or None when the query has no terms (= all).
+        The result may be shared with the index: treat it as read-only.
+        """
+        terms = self.tokenize(query)
+        if not terms:
+            return None
+        postings = sorted((self._term_keys(t) for t in set(terms)), key=len)
+        if len(postings) == 1:
+            return postings[0]
+        result = set(postings[0])
+        for keys in postings[1:]:
+            if not result:
+                break
+            result &= keys
+        return result
+
+    def matches(self, key, query) -> bool:
+        """Does one indexed document match (without touching the postings)?"""
+        tokens = self._docs.get(key)
+        if tokens is None:
+            return False
+        return all(any(term in token for token in tokens) for term in self.tokenize(query))
+
+    def _term_keys(self, term):
+        keys = self._term_cache.get(term)
+        if keys is None:
+            hits = [self._postings[token] for token in self._postings if term in token]
+            if not hits:
+                keys = frozenset()
+            elif len(hits) == 1:
+                keys = hits[0]
+            else:
+                keys = set().union(*hits)
+            self._term_cache[term] = keys
+        return keys
+
+
+class RankedIndex(SearchIndex):
+    """
+    SearchIndex for short documents such as people (name, username, email) that ranks hits.
+
+    Each query word scores a document by its best word: exact, then prefix, then substring,
+    then a prefix within typo_budget() edits that starts with the same letter ("jonh" finds
+    "John", "smtih" finds "Smith"). rank() orders documents by their summed tiers, then by
+    typos, then by key, and every query word has to match something.
+
+    Prefixes are a bisect range over the sorted vocabulary; substring and typo candidates
+    come from a trigram index over the vocabulary. Both are rebuilt lazily after changes.
+    """
+    tokenize = staticmethod(words)
+
+    EXACT, PREFIX, SUBSTRING, FUZZY = range(4)
+
+    def __init__(self):
+        super().__init__()
+        self._vocab = None   # sorted distinct words
+        self._grams = None   # trigram -> set(words)
+
+    def _changed(self):
+        super()._changed()
+        self._vocab = self._grams = None
+
+    # ---------- queries ----------
+    def search(self, query):
+        ranked = self.rank(query)
+        return None if ranked is None else set(ranked)
+
+    def matches(self, key, query) -> bool:
+        tokens = self._docs.get(key)
+        if tokens is None:
+            return False
+        return all(any(word in self._postings and self._score(term, word) for word in tokens)
+                   for term in self.tokenize(query))
+
+    def rank(self, query):
+        """Matching keys best-first, or None when the query has no terms (= all)."""
+        terms = list(dict.fromkeys(self.tokenize(query)))
+        if not terms:
+            return None
+        best = None  # key -> (tier sum, typo sum)
+        for term in terms:
+            scores = {}
+            for word, score in self._term_words(term):  # best words first
+                for key in self._postings[word]:
+                    scores.setdefault(key, score)
+            if best is None:
+                best = scores
+            else:
+                best = {key: (tier + scores[key][0], typos + scores[key][1])
+                        for key, (tier, typos) in best.items() if key in scores}
+            if not best:
+                return []
+        return sorted(best, key=lambda key: (best[key], key))
+
+    def _term_words(self, term):
+        hits = self._term_cache.get(term)
+        if hits is None:
+            hits = self._term_cache[term] = sorted(self._classify(term).items(), key=lambda kv: kv[1])
+        return hits
+
+    def _classify(self, term) -> dict:
+        """word -> (tier, typos) for every vocabulary word the query word matches."""
+        vocab, grams = self._vocabulary()
+        found = {word: (self.EXACT if word == term else self.PREFIX, 0) for word in self._prefixed(vocab, term)}
+
+        if len(term) < 3:
+            return found
+        query_grams = trigrams(term)
+        counts = Counter()
+        for gram in query_grams:
+            counts.update(grams.get(gram, ()))
+        # a substring misses only the "$" gram; each typo spoils at most three more
+        need = max(1, len(query_grams) - 1 - 3 * typo_budget(term))
+        candidates = [word for word, shared in counts.items() if shared >= need]
+        if typo_budget(term) and len(term) < 6:
+            # a typo in the second or third letter of a short term can leave no gram in
+            # common ("jhon" / "john"), so also try every word starting like the term could
+            for head in {term[0] + term[1], term[0] + term[2]}:
+                candidates.extend(self._prefixed(vocab, head))
+        typos_cache = {}  # many words share the prefix the distance looks at ("jsmith1", "jsmith2")
+        for word in candidates:
+            if word not in found:
+                score = self._score(term, word, typos_cache)
+                if score:
+                    found[word] = score
+        return found
+
+    @staticmethod
+    def _prefixed(vocab, prefix):
+        i = bisect_left(vocab, prefix)
+        while i < len(vocab) and vocab[i].startswith(prefix):
+            yield vocab[i]
+            i += 1
+
+    def _score(self, term, word, typos_cache=None):
+        if word == term:
+            return self.EXACT, 0
+        if word.startswith(term):
+            return self.PREFIX, 0
+        if term in word:
+            return self.SUBSTRING, 0
+        budget = typo_budget(term)
+        if not budget or word[0] != term[0]:
+            return None
+        head = word[:len(term) + budget]
+        typos = typos_cache.get(head) if typos_cache is not None else None
+        if typos is None:
+            typos = prefix_distance(term, head, budget)
+            if typos_cache is not None:
+                typos_cache[head] = typos
+        return (self.FUZZY, typos) if typos <= budget else None
+
+    def warm(self):
+        self._vocabulary()
+
+    def _vocabulary(self):
+        if self._vocab is None:
+            self._vocab = sorted(self._postings)
+            self._grams = {}
+            for word in self._vocab:
+                for gram in trigrams(word):
+                    self._grams.setdefault(gram, set()).add(word)
+        return self._vocab, self._grams
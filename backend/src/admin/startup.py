@@ -0,0 +1,120 @@
+import time
+
+from PySide6.QtCore import QObject, QEvent, Signal
+
+from workers import TaskRunner
+
+
+# ----------------- Startup warm-up -----------------
+class WarmupOrchestrator(QObject):
+    """
+    Fires every endpoint the initial pages need exactly once, concurrently, and fans the
+    results out to each page.
+
+    Pages opt in with a `warmup` tuple of ApiClient method names (no arguments) and an
+    `apply_warmup(name, data)` method. Follow-up loads a page starts from apply_warmup
+    (e.g. payroll summary after the period list) count towards "fully loaded".
+
+    If the ApiClient has an on-disk copy (api.last_known), pages are rendered from it
+    first and flagged stale until the network answer replaces it.
+    """
+    failed = Signal(str, object)          # (endpoint name, exception) — once per endpoint
+    ready = Signal(dict)                  # metrics
+    stale_changed = Signal(object, object)  # (page, fetched_at epoch seconds | None when fresh)
+
+    def __init__(self, api, pages, window=None, started_at: float | None = None, parent=None):
+        super().__init__(parent)
+        self.api = api
+        self.pages = [p for p in pages if getattr(p, "warmup", None)]
+        self.window = window
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.tasks = TaskRunner(self)
+
+        self.metrics = {"endpoints": 0, "cached_ms": None, "first_paint_ms": None, "ready_ms": None}
+        self._outstanding = set()
+        self._done = False
+        self._stale = {}  # page -> {endpoint name: fetched_at}
+
+        if window is not None:
+            window.installEventFilter(self)
+
+    def endpoints(self) -> dict:
+        """endpoint name -> pages that asked for it (dedup happens here)."""
+        needs = {}
+        for page in self.pages:
+            for name in page.warmup:
+                needs.setdefault(name, []).append(page)
+        return needs
+
+    def start(self):
+        needs = self.endpoints()
+        self.metrics["endpoints"] = len(needs)
+        self._outstanding = set(needs)
+
+        for page in self.pages:
+            runner = getattr(page, "tasks", None)
+            if runner is not None:
+                runner.busy_changed.connect(self._check_ready)
+
+        self._render_last_known(needs)
+
+        for name, pages in needs.items():
+            self.tasks.submit(
+                name, getattr(self.api, name),
+                on_result=lambda data, name=name, pages=pages: self._deliver(name, pages, data),
+                on_error=lambda e, name=name: self.failed.emit(name, e),
+                on_finished=lambda name=name: self._endpoint_done(name),
+            )
+        self._check_ready()
+
+    def _render_last_known(self, needs):
+        last_known = getattr(self.api, "last_known", None)
+        if last_known is None:
+            return
+        for name, pages in needs.items():
+            snap = last_known(name)
+            if snap is None:
+                continue
+            for page in pages:
+                page.apply_warmup(name, snap.value)
+                self._stale.setdefault(page, {})[name] = snap.fetched_at
+                self.stale_changed.emit(page, self.stale_since(page))
+        if self._stale:
+            self.metrics["cached_ms"] = self._elapsed_ms()
+
+    def stale_since(self, page):
+        """Oldest fetch time of the offline data a page is showing, or None if it is live."""
+        marks = self._stale.get(page)
+        return min(marks.values()) if marks else None
+
+    def _deliver(self, name, pages, data):
+        for page in pages:
+            page.apply_warmup(name, data)
+            marks = self._stale.get(page)
+            if marks and marks.pop(name, None) is not None:
+                self.stale_changed.emit(page, self.stale_since(page))
+
+    def _endpoint_done(self, name):
+        self._outstanding.discard(name)
+        self._check_ready()
+
+    def _elapsed_ms(self) -> int:
+        return int((time.perf_counter() - self.started_at) * 1000)
+
+    def _check_ready(self, *_args):
+        if self._done or self._outstanding:
+            return
+        if self.window is not None and self.metrics["first_paint_ms"] is None:
+            return
+        if any(getattr(p, "tasks", None) is not None and p.tasks.is_busy() for p in self.pages):
+            return
+        self._done = True
+        self.metrics["ready_ms"] = self._elapsed_ms()
+        self.ready.emit(dict(self.metrics))
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Paint and self.metrics["first_paint_ms"] is None:
+            self.metrics["first_paint_ms"] = self._elapsed_ms()
+            self.window.removeEventFilter(self)
+            self._check_ready()
+        return False
@@ -0,0 +1,173 @@
+import json
+import re
+import threading
+import time
+from collections import deque
+
+# upper bounds (ms) of the latency histogram buckets; the last bucket is everything slower
+LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500)
+
+_ID_SEGMENT = re.compile(r"^[0-9a-f]{24}$")
+_DATE_SEGMENT = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def endpoint_of(path: str) -> str:
+    """Path with ids and dates folded, so every staff member's offers count as one endpoint."""
+    parts = []
+    for part in path.split("/"):
+        if _ID_SEGMENT.match(part):
+            part = ":id"
+        elif _DATE_SEGMENT.match(part):
+            part = ":date"
+        elif part.isdigit():
+            part = ":n"
+        parts.append(part)
+    return "/".join(parts)
+
+
+def percentile(sorted_values, p: float):
+    """Nearest-rank percentile of an already sorted list (None when empty)."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * p // 100))  # ceil without floats drifting
+    return sorted_values[int(rank) - 1]
+
+
+def _latency_stats(ms: list) -> dict:
+    ms = sorted(ms)
+    histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+    for value in ms:
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value < bound:
+                histogram[i] += 1
+                break
+        else:
+            histogram[-1] += 1
+    return {
+        "p50": percentile(ms, 50),
+        "p95": percentile(ms, 95),
+        "p99": percentile(ms, 99),
+        "max": ms[-1] if ms else None,
+        "histogram": histogram,
+    }
+
+
+class RequestTelemetry:
+    """
+    The last `capacity` ApiClient requests and GUI-thread result handlers, kept as plain
+    tuples in fixed-size ring buffers: recording is an append, and the aggregation
+    (percentiles, histograms) only runs when something asks for a snapshot().
+
+    Request sources: "network" (went to the server; a 304 is a revalidation), "cache"
+    (fresh in the response cache), "coalesced" (joined an identical in-flight GET) and
+    "disk" (served from the local store).
+    """
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.started_at = time.time()
+        self._requests = deque(maxlen=capacity)  # (at, method, endpoint, status, ms, bytes, retries, source)
+        self._handlers = deque(maxlen=capacity)  # (at, task, wait_ms, handler_ms)
+        self._lock = threading.Lock()
+
+    def record_request(self, method: str, path: str, status: int, ms: float, size: int = 0,
+                       retries: int = 0, source: str = "network"):
+        sample = (time.time(), method, endpoint_of(path), status, ms, size, retries, source)
+        with self._lock:
+            self._requests.append(sample)
+
+    def record_local(self, path: str, source: str):
+        """A GET answered without the network."""
+        self.record_request("GET", path, 200, 0.0, 0, 0, source)
+
+    def record_handler(self, task: str, wait_ms: float, handler_ms: float):
+        """
+        One TaskRunner result handed to the GUI: wait_ms is how long it queued for the
+        event loop, handler_ms how long the page took to render it.
+        """
+        sample = (time.time(), task, wait_ms, handler_ms)
+        with self._lock:
+            self._handlers.append(sample)
+
+    def clear(self):
+        with self._lock:
+            self._requests.clear()
+            self._handlers.clear()
+        self.started_at = time.time()
+
+    def snapshot(self) -> dict:
+        """Per-endpoint and per-handler aggregates over what the buffers currently hold."""
+        with self._lock:
+            requests = list(self._requests)
+            handlers = list(self._handlers)
+
+        endpoints = {}
+        for _at, method, endpoint, status, ms, size, retries, source in requests:
+            e = endpoints.get((method, endpoint))
+            if e is None:
+                e = endpoints[(method, endpoint)] = {
+                    "method": method, "endpoint": endpoint, "count": 0, "network": 0,
+                    "cache": 0, "coalesced": 0, "disk": 0, "revalidated": 0, "errors": 0,
+                    "retries": 0, "bytes": 0, "statuses": {}, "_ms": [],
+                }
+            e["count"] += 1
+            e[source] += 1
+            if source != "network":
+                continue
+            e["_ms"].append(ms)
+            e["bytes"] += size
+            e["retries"] += retries
+            e["statuses"][str(status)] = e["statuses"].get(str(status), 0) + 1
+            if status == 304:
+                e["revalidated"] += 1
+            elif not status or status >= 400:
+                e["errors"] += 1
+
+        rows = []
+        for e in endpoints.values():
+            ms = e.pop("_ms")
+            e.update(_latency_stats(ms))
+            e["avg_bytes"] = e["bytes"] // e["network"] if e["network"] else 0
+            e["total_ms"] = round(sum(ms), 1)
+            rows.append(e)
+        rows.sort(key=lambda e: e["total_ms"], reverse=True)  # where the waiting went, first
+
+        by_task = {}
+        for _at, task, wait_ms, handler_ms in handlers:
+            waits, runs = by_task.setdefault(task, ([], []))
+            waits.append(wait_ms)
+            runs.append(handler_ms)
+        ui = []
+        for task, (waits, runs) in by_task.items():
+            stats = _latency_stats(runs)
+            ui.append({
+                "task": task, "count": len(runs),
+                "p50": stats["p50"], "p95": stats["p95"], "max": stats["max"],
+                "wait_p95": percentile(sorted(waits), 95),
+                "total_ms": round(sum(runs), 1),
+            })
+        ui.sort(key=lambda h: h["total_ms"], reverse=True)
+
+        network = sum(e["network"] for e in rows)
+        return {
+            "started_at": self.started_at,
+            "capacity": self.capacity,
+            "samples": len(requests),
+            "totals": {
+                "requests": len(requests),
+                "network": network,
+                "local": len(requests) - network,
+                "bytes": sum(e["bytes"] for e in rows),
+                "retries": sum(e["retries"] for e in rows),
+                "errors": sum(e["errors"] for e in rows),
+            },
+            "latency_buckets_ms": list(LATENCY_BUCKETS),
+            "endpoints": rows,
+            "handlers": ui,
+        }
+
+    def dump(self, path: str, extra: dict | None = None) -> dict:
+        """Write snapshot() (plus `extra`, e.g. cache stats) as JSON for a bug report."""
+        data = dict(self.snapshot(), dumped_at=time.time(), **(extra or {}))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return data
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the admin app imports its modules flat (run from backend/src/admin)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,110 @@
+"""EventStream against a local SSE server that drops the connection mid-event."""
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PySide6.QtCore import QCoreApplication
+
+from api_client import ApiClient
+from live_events import EventStream
+
+
+def chunk(text: str) -> bytes:
+    data = text.encode("utf-8")
+    return b"%x\r\n%s\r\n" % (len(data), data)
+
+
+class DroppingSSEServer:
+    """
+    First connection: event 1, then half of event 2, then a TCP reset (a dyno restart).
+    Later connections: everything after the client's Last-Event-ID, then held open.
+    """
+    EVENTS = [
+        ("1", "offer.updated", '{"_id": "a"}'),
+        ("2", "offer.updated", '{"_id": "b"}'),
+    ]
+
+    def __init__(self):
+        self.requests = []  # Last-Event-ID of each connection
+        self.release = threading.Event()
+        server = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                head = b""
+                while b"\r\n\r\n" not in head:
+                    data = self.request.recv(4096)
+                    if not data:
+                        return
+                    head += data
+                last_id = None
+                for line in head.decode("latin-1").split("\r\n"):
+                    name, _, value = line.partition(":")
+                    if name.lower() == "last-event-id":
+                        last_id = value.strip()
+                server.requests.append(last_id)
+
+                self.request.sendall(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                    b"Transfer-Encoding: chunked\r\n\r\n"
+                )
+                events = [e for e in server.EVENTS if last_id is None or int(e[0]) > int(last_id)]
+                text = "".join(f"id: {i}\nevent: {kind}\ndata: {data}\n\n" for i, kind, data in events)
+                if len(server.requests) == 1:
+                    first, second = text.split("\n\n", 1)
+                    self.request.sendall(chunk(first + "\n\n" + second[:len(second) // 2]))
+                    time.sleep(0.05)
+                    # RST instead of FIN: the read fails mid-chunk
+                    self.request.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                    return
+                self.request.sendall(chunk(text))
+                server.release.wait(5)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.release.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def sse():
+    server = DroppingSSEServer()
+    yield server
+    server.close()
+
+
+def test_stream_dropped_mid_event_reconnects_and_resumes(app, sse):
+    stream = EventStream(ApiClient(sse.url, token="t"), backoff_base=0.01, backoff_max=0.05)
+    seen = []
+    stream.event.connect(lambda kind, data: seen.append((kind, data["_id"])))
+    stream.start()
+    try:
+        deadline = time.monotonic() + 10
+        while len(seen) < 2 and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+    finally:
+        stream.stop()
+
+    # the half-sent event is not delivered twice nor lost: the reconnect resumes after id 1
+    assert seen == [("offer.updated", "a"), ("offer.updated", "b")]
+    assert sse.requests[:2] == [None, "1"]
+    assert stream.last_id == "2"
+    assert stream.reconnects >= 1
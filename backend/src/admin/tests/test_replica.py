@@ -0,0 +1,50 @@
+"""Replica merging of ?since deltas, capped lists included."""
+from replica import Replica
+
+
+def offer(n: int) -> dict:
+    return {"_id": f"o{n:03d}", "createdAt": f"2026-01-01T00:00:{n:02d}"}
+
+
+def capped(total: int, limit: int = 3) -> Replica:
+    """A copy loaded the way the server sends it: the newest `limit` of `total` rows."""
+    rows = sorted((offer(n) for n in range(total)), key=lambda r: r["createdAt"], reverse=True)
+    return Replica(rows[:limit], "c0", ("createdAt", True), limit)
+
+
+def ids(rows) -> list:
+    return [r["_id"] for r in rows]
+
+
+def test_delta_merges_and_removes():
+    replica = Replica([offer(1), offer(2)], "c0", ("createdAt", True))
+    rows = replica.apply({"items": [offer(3)], "removed": ["o001"], "cursor": "c1", "full": False})
+    assert ids(rows) == ["o003", "o002"]
+    assert replica.cursor == "c1"
+    assert not replica.needs_full
+
+
+def test_removal_from_a_full_window_asks_for_the_whole_list():
+    replica = capped(total=10)
+    assert ids(replica.items()) == ["o009", "o008", "o007"]
+
+    replica.apply({"items": [], "removed": ["o008"], "cursor": "c1", "full": False})
+    assert replica.needs_full  # o006 moved up into the window and is not known here
+
+    rows = replica.apply({"items": [offer(9), offer(7), offer(6)], "removed": [], "cursor": "c2", "full": True})
+    assert ids(rows) == ["o009", "o007", "o006"]
+    assert not replica.needs_full
+
+
+def test_removal_below_the_cap_stays_a_delta():
+    replica = Replica([offer(1), offer(2)], "c0", ("createdAt", True), limit=3)
+    replica.apply({"items": [], "removed": ["o001"], "cursor": "c1", "full": False})
+    assert not replica.needs_full  # the server never had more rows than these
+    assert ids(replica.items()) == ["o002"]
+
+
+def test_new_rows_push_old_ones_out_of_a_capped_window():
+    replica = capped(total=3)
+    rows = replica.apply({"items": [offer(5)], "removed": [], "cursor": "c1", "full": False})
+    assert ids(rows) == ["o005", "o002", "o001"]
+    assert not replica.needs_full
@@ -0,0 +1,200 @@
+"""Transport retries, backoff and circuit breaker against a scripted local HTTP server."""
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import transport
+from transport import CircuitBreaker, CircuitOpenError, Transport
+
+
+class StubServer:
+    """Answers each request with the next scripted status (200 once the script runs out)."""
+    def __init__(self):
+        self.statuses = []
+        self.hits = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _answer(self):
+                stub.hits.append((self.command, self.path))
+                status = stub.statuses.pop(0) if stub.statuses else 200
+                body = b'{"ok": true}'
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = _answer
+
+            def log_message(self, *_args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def dead_url():
+    # a port nothing listens on: connection refused straight away
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff delays the transport asked for, without waiting them out."""
+    delays = []
+    monkeypatch.setattr(transport.time, "sleep", delays.append)
+    return delays
+
+
+def make(**kwargs) -> Transport:
+    kwargs.setdefault("breaker", CircuitBreaker(failure_threshold=100))
+    return Transport(**kwargs)
+
+
+# ---------- retries ----------
+def test_get_retries_gateway_errors_until_success(stub, sleeps):
+    stub.statuses = [503, 502]
+    t = make()
+    r = t.request("GET", f"{stub.url}/admin/staff", "/admin/staff")
+    assert r.status_code == 200
+    assert r.retries == 2
+    assert t.retries == 2
+    assert len(stub.hits) == 3
+    assert len(sleeps) == 2
+
+
+def test_post_is_not_retried(stub, sleeps):
+    stub.statuses = [503]
+    t = make()
+    r = t.request("POST", f"{stub.url}/offers/send", "/offers/send")
+    assert r.status_code == 503
+    assert r.retries == 0
+    assert len(stub.hits) == 1
+    assert sleeps == []
+
+
+def test_client_errors_are_not_retried(stub, sleeps):
+    stub.statuses = [404]
+    r = make().request("GET", f"{stub.url}/admin/staff/x", "/admin/staff/x")
+    assert r.status_code == 404
+    assert len(stub.hits) == 1
+
+
+def test_gives_up_after_max_retries(stub, sleeps):
+    stub.statuses = [503] * 10
+    r = make(max_retries=2).request("GET", f"{stub.url}/admin/staff", "/admin/staff")
+    assert r.status_code == 503
+    assert r.retries == 2
+    assert len(stub.hits) == 3
+
+
+def test_connection_error_is_raised_after_retries(dead_url, sleeps):
+    with pytest.raises(requests.ConnectionError) as raised:
+        make(max_retries=2).request("GET", f"{dead_url}/admin/staff", "/admin/staff")
+    assert raised.value.retries == 2
+    assert len(sleeps) == 2
+
+
+# ---------- backoff ----------
+def test_backoff_doubles_with_jitter_and_is_capped(monkeypatch):
+    t = make(backoff_base=0.25, backoff_max=1.0)
+    monkeypatch.setattr(transport.random, "random", lambda: 1.0)  # no jitter
+    assert [t._backoff(a) for a in range(4)] == [0.25, 0.5, 1.0, 1.0]
+    monkeypatch.setattr(transport.random, "random", lambda: 0.0)  # most jitter: half the delay
+    assert [t._backoff(a) for a in range(4)] == [0.125, 0.25, 0.5, 0.5]
+
+
+def test_retry_sleeps_follow_backoff(stub, sleeps, monkeypatch):
+    monkeypatch.setattr(transport.random, "random", lambda: 1.0)
+    stub.statuses = [504, 504, 504]
+    make(backoff_base=0.1, backoff_max=10).request("GET", f"{stub.url}/admin/staff", "/admin/staff")
+    assert sleeps == pytest.approx([0.1, 0.2, 0.4])
+
+
+# ---------- circuit breaker ----------
+def test_breaker_opens_and_fails_fast(stub, sleeps):
+    stub.statuses = [503, 503]
+    t = Transport(max_retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+    for _ in range(2):
+        t.request("GET", f"{stub.url}/admin/staff", "/admin/staff")
+    assert t.breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        t.request("GET", f"{stub.url}/admin/staff", "/admin/staff")
+    assert len(stub.hits) == 2  # refused without touching the network
+
+
+def test_breaker_half_open_probe_closes_it(stub):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == "open"
+    time.sleep(0.06)
+
+    breaker.before_request()  # the probe
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # only one probe at a time
+
+    t = Transport(breaker=breaker)
+    breaker.release_probe()
+    r = t.request("GET", f"{stub.url}/admin/staff", "/admin/staff")
+    assert r.status_code == 200
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+def test_failed_probe_reopens(dead_url, sleeps):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    t = Transport(max_retries=0, breaker=breaker)
+    with pytest.raises(requests.ConnectionError):
+        t.request("GET", f"{dead_url}/admin/staff", "/admin/staff")
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    with pytest.raises(requests.ConnectionError):
+        t.request("GET", f"{dead_url}/admin/staff", "/admin/staff")  # the probe
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        t.request("GET", f"{dead_url}/admin/staff", "/admin/staff")
+
+
+def test_probe_ending_in_another_error_does_not_wedge_the_breaker(stub, monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    t = Transport(breaker=breaker)
+
+    real = t.session.request
+
+    def broken(*args, **kwargs):
+        raise requests.TooManyRedirects("redirect loop")
+    monkeypatch.setattr(t.session, "request", broken)
+    with pytest.raises(requests.TooManyRedirects):
+        t.request("GET", f"{stub.url}/admin/staff", "/admin/staff")
+
+    monkeypatch.setattr(t.session, "request", real)
+    r = t.request("GET", f"{stub.url}/admin/staff", "/admin/staff")  # free to probe again
+    assert r.status_code == 200
+    assert breaker.state == "closed"
@@ -0,0 +1,139 @@
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({502, 503, 504})  # Heroku router / dyno restarts
+
+# (connect, read) seconds per endpoint class
+DEFAULT_TIMEOUTS = {
+    "auth": (3.05, 15),
+    "read": (3.05, 20),
+    "write": (3.05, 30),
+    "report": (3.05, 60),  # payroll / calendar / audit scans
+}
+
+
+def endpoint_class(method: str, path: str) -> str:
+    if path.startswith("/auth/login"):
+        return "auth"
+    if path.startswith(("/admin/payroll", "/admin/calendar", "/admin/audit")):
+        return "report"
+    return "read" if method in ("GET", "HEAD") else "write"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without touching the network while the backend is known to be down."""
+
+
+class CircuitBreaker:
+    """
+    closed -> open after `failure_threshold` consecutive failures; open fails fast for
+    `reset_timeout` seconds, then lets exactly one probe through (half-open). A successful
+    probe closes the circuit, a failed one re-opens it, and one that ends in some other error
+    (says nothing about the backend) lets the next request probe instead.
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 15.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return
+            wait = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            raise CircuitOpenError(f"Backend unavailable — retrying in {wait:.0f}s")
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+    def release_probe(self):
+        with self._lock:
+            self._probing = False
+
+
+class Transport:
+    """
+    requests.Session with a connection pool sized for the worker threads, per-class
+    timeouts, exponential-backoff retries for idempotent verbs and a circuit breaker.
+    """
+    def __init__(
+        self,
+        pool_size: int = 10,
+        timeouts: dict | None = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.25,
+        backoff_max: float = 4.0,
+        breaker: CircuitBreaker | None = None,
+    ):
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.retries = 0  # total retry attempts made
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)  # jitter so threads don't retry in lockstep
+
+    def request(self, method: str, url: str, path: str = "", **kwargs) -> requests.Response:
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeouts[endpoint_class(method, path)])
+        retryable = method in IDEMPOTENT_METHODS
+        attempt = 0
+
+        while True:
+            self.breaker.before_request()
+            try:
+                r = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.breaker.record_failure()
+                if not retryable or attempt >= self.max_retries:
+                    e.retries = attempt  # for request telemetry
+                    raise
+            except BaseException:
+                self.breaker.release_probe()  # bad URL, decode error...: not an outage
+                raise
+            else:
+                if r.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success()
+                    r.retries = attempt
+                    return r
+                self.breaker.record_failure()
+                if not retryable or attempt >= self.max_retries:
+                    r.retries = attempt
+                    return r
+
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+            self.retries += 1
@@ -0,0 +1,173 @@
+import time
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+
+# ----------------- Background tasks -----------------
+class _TaskSignals(QObject):
+    # (task_id, value) — emitted from the pool thread, delivered on the GUI thread
+    result = Signal(int, object)
+    error = Signal(int, object)
+
+
+class _ApiTask(QRunnable):
+    def __init__(self, task_id, fn, args, kwargs, signals):
+        super().__init__()
+        self.setAutoDelete(False)  # TaskRunner keeps the Python ref until it reports back
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = signals
+        self.cancelled = False
+        self.done_at = 0.0
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            value = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(self.task_id, e)
+            return
+        self.done_at = time.perf_counter()
+        self.signals.result.emit(self.task_id, value)
+
+
+def shared_pool() -> QThreadPool:
+    pool = QThreadPool.globalInstance()
+    if pool.maxThreadCount() < 6:
+        pool.setMaxThreadCount(6)
+    return pool
+
+
+class TaskRunner(QObject):
+    """
+    Runs ApiClient calls on the shared QThreadPool and hands results back on the GUI thread.
+
+    Tasks submitted with a key are "latest wins": submitting the same key again (or calling
+    cancel) drops the older result. Tasks without a key (mutations) are never treated as stale.
+    suspend() cancels the keyed tasks but remembers them, and resume() submits them again, for a
+    page that stops loading while hidden and picks up where it left off when shown.
+    """
+    busy_changed = Signal(bool)
+    cancelled = Signal(object)  # key of a task cancel() dropped (not one a newer submit replaced)
+
+    # telemetry.RequestTelemetry timing every runner's result handlers (MainWindow sets it)
+    telemetry = None
+
+    def __init__(self, parent=None, pool: QThreadPool | None = None):
+        super().__init__(parent)
+        self.pool = pool or shared_pool()
+        self._signals = _TaskSignals()
+        self._signals.result.connect(self._on_result)
+        self._signals.error.connect(self._on_error)
+
+        self._next_id = 0
+        self._pending = {}  # task_id -> (task, key, on_result, on_error, on_finished)
+        self._latest = {}   # key -> task_id
+        self._suspended = {}  # key -> (fn, args, kwargs, on_result, on_error, on_finished)
+
+    def submit(self, key, fn, *args, on_result=None, on_error=None, on_finished=None, **kwargs) -> int:
+        if key is not None:
+            self._drop(key)  # also forgets a suspended task with this key: this one replaces it
+
+        self._next_id += 1
+        task_id = self._next_id
+        task = _ApiTask(task_id, fn, args, kwargs, self._signals)
+
+        was_busy = self.is_busy()
+        self._pending[task_id] = (task, key, on_result, on_error, on_finished)
+        if key is not None:
+            self._latest[key] = task_id
+        self.pool.start(task)
+
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return task_id
+
+    def cancel(self, key=None):
+        """Drop keyed tasks (all of them when key is None). Queued ones never hit the network."""
+        for k in self._drop(key):
+            self.cancelled.emit(k)
+
+    def _drop(self, key) -> set:
+        was_busy = self.is_busy()
+        dropped = set()
+        for task_id, (task, k, *_rest) in list(self._pending.items()):
+            if k is None or (key is not None and k != key):
+                continue
+            task.cancelled = True
+            self.pool.tryTake(task)
+            self._pending.pop(task_id, None)
+            self._latest.pop(k, None)
+            dropped.add(k)
+        if key is None:
+            dropped.update(self._suspended)
+            self._suspended.clear()
+        elif self._suspended.pop(key, None) is not None:
+            dropped.add(key)
+        if was_busy and not self.is_busy():
+            self.busy_changed.emit(False)
+        return dropped
+
+    def suspend(self):
+        """Cancel every keyed task, keeping what resume() needs to submit it again."""
+        stopped = {
+            key: (task.fn, task.args, task.kwargs, on_result, on_error, on_finished)
+            for task, key, on_result, on_error, on_finished in self._pending.values()
+            if key is not None
+        }
+        self._drop(None)  # not cancelled: their owners still expect the results
+        self._suspended.update(stopped)
+
+    def resume(self):
+        """Submit the suspended tasks again (keys submitted since then already replaced them)."""
+        suspended, self._suspended = self._suspended, {}
+        for key, (fn, args, kwargs, on_result, on_error, on_finished) in suspended.items():
+            self.submit(key, fn, *args, on_result=on_result, on_error=on_error, on_finished=on_finished, **kwargs)
+
+    def is_busy(self) -> bool:
+        return bool(self._pending)
+
+    def _finish(self, task_id):
+        entry = self._pending.pop(task_id, None)
+        if entry is None:
+            return None  # cancelled / superseded
+        key = entry[1]
+        if key is not None and self._latest.get(key) == task_id:
+            self._latest.pop(key, None)
+        if not self._pending:
+            self.busy_changed.emit(False)
+        return entry
+
+    @Slot(int, object)
+    def _on_result(self, task_id, value):
+        entry = self._finish(task_id)
+        if entry is None:
+            return
+        task, key, on_result, _on_error, on_finished = entry
+        started = time.perf_counter()
+        try:
+            if on_result:
+                on_result(value)
+        finally:
+            if on_finished:
+                on_finished()
+            if self.telemetry is not None:
+                ended = time.perf_counter()
+                name = key if isinstance(key, str) else getattr(task.fn, "__name__", "task")
+                self.telemetry.record_handler(name, (started - task.done_at) * 1000, (ended - started) * 1000)
+
+    @Slot(int, object)
+    def _on_error(self, task_id, err):
+        entry = self._finish(task_id)
+        if entry is None:
+            return
+        _task, _key, _on_result, on_error, on_finished = entry
+        try:
+            if on_error:
+                on_error(err)
+        finally:
+            if on_finished:
+                on_finished()
@@ -0,0 +1,33 @@
+import crypto from "crypto";
+
+/**
+ * Strong ETag for a JSON-able value (or string).
+ */
+export function etagFor(value) {
+    const body = typeof value === "string" ? value : JSON.stringify(value);
+    return `"${crypto.createHash("sha1").update(body).digest("base64url")}"`;
+}
+
+/**
+ * Conditional GET before the route runs its heavy query.
+ * validators(req) -> { etag?, lastModified? (Date) } computed from something cheap
+ * (a constant, a count + max(updatedAt), ...). If the client's If-None-Match /
+ * If-Modified-Since still matches we answer 304 and skip the route entirely.
+ *
+ * Routes without a validator still get Express's default body ETag + 304 handling.
+ */
+export function conditional(validators) {
+    return async(req, res, next) => {
+        try {
+            const v = await validators(req);
+            if (v && v.etag) res.set("ETag", v.etag);
+            if (v && v.lastModified) res.set("Last-Modified", v.lastModified.toUTCString());
+            res.set("Cache-Control", "private, no-cache");
+
+            if (req.fresh) return res.status(304).end();
+        } catch (err) {
+            // validator failed -> fall through to the full response
+        }
+        return next();
+    };
+}
@@ -8,5 +8,11 @@ const auditLogSchema = new mongoose.Schema({
     meta: { type: Object, default: {} },
 }, { timestamps: true });
 
+// audit log pages (newest first), overall and per filter
+auditLogSchema.index({ createdAt: -1, _id: -1 });
+auditLogSchema.index({ actorId: 1, createdAt: -1, _id: -1 });
+auditLogSchema.index({ action: 1, createdAt: -1, _id: -1 });
+auditLogSchema.index({ targetType: 1, targetId: 1, createdAt: -1, _id: -1 });
+
 const AuditLog = mongoose.model("AuditLog", auditLogSchema);
 export default AuditLog;
\ No newline at end of file
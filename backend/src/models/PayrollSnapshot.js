@@ -0,0 +1,13 @@
+import mongoose from "mongoose";
+
+// A closed pay period's bundle, frozen once (see utils/payrollSnapshots.js) and never changed
+const PayrollSnapshotSchema = new mongoose.Schema({
+    payDate: { type: String, required: true, unique: true, immutable: true },
+    hash: { type: String, required: true, immutable: true }, // sha256 (hex) of the bundle JSON
+    body: { type: Buffer, required: true, immutable: true }, // gzipped response, served as stored
+    size: { type: Number, default: 0, immutable: true }, // uncompressed bytes
+    shiftCount: { type: Number, default: 0, immutable: true },
+    frozenAt: { type: Date, default: Date.now, immutable: true },
+});
+
+export default mongoose.model("PayrollSnapshot", PayrollSnapshotSchema);
@@ -14,4 +14,10 @@ const PlacementSchema = new mongoose.Schema({
     notes: String,
 }, { timestamps: true });
 
+// payroll / calendar look placements up by date range
+PlacementSchema.index({ date: 1 });
+
+// delta sync: an edited shift changes the offers showing it
+PlacementSchema.index({ updatedAt: 1 });
+
 export default mongoose.model("Placement", PlacementSchema);
\ No newline at end of file
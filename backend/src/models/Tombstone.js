@@ -0,0 +1,17 @@
+import mongoose from "mongoose";
+
+// A deleted record, kept so delta sync (utils/deltaSync.js) can tell clients to drop it
+const TombstoneSchema = new mongoose.Schema({
+    kind: { type: String, required: true }, // "offer" | "venue"
+    entityId: { type: String, required: true },
+    ownerId: { type: String, default: "" }, // staff member an offer belonged to
+    deletedAt: { type: Date, default: Date.now },
+});
+
+// ?since=: the kind's deletions after a time
+TombstoneSchema.index({ kind: 1, deletedAt: 1 });
+
+// nobody can ask about them after TOMBSTONE_TTL_DAYS (older cursors get the full list)
+TombstoneSchema.index({ deletedAt: 1 }, { expireAfterSeconds: 30 * 24 * 3600 });
+
+export default mongoose.model("Tombstone", TombstoneSchema);
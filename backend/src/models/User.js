@@ -1,4 +1,5 @@
 import mongoose from "mongoose";
+import { staffSearchKeys } from "../utils/staffSearch.js";
 
 const UserSchema = new mongoose.Schema({
     username: { type: String, unique: true, required: true, trim: true },
@@ -15,6 +16,55 @@ const UserSchema = new mongoose.Schema({
 
     isActive: { type: Boolean, default: true },
     availability: { type: Object, default: {} },
+
+    // offer stats rollup, kept up to date by the offer routes (see utils/staffStats.js)
+    stats: {
+        jobs: { type: Number, default: 0 },
+        hours: { type: Number, default: 0 }, // hundredths of an hour
+        pay: { type: Number, default: 0 }, // pence
+        lastJobAt: { type: Date, default: null },
+    },
+
+    // staff search keys (see utils/staffSearch.js); derived from fullName/username/email
+    searchTokens: { type: [String], default: undefined, select: false },
+    searchGrams: { type: [String], default: undefined, select: false },
 }, { timestamps: true });
 
+// prefix search = anchored regex on searchTokens; typo search = trigram overlap
+UserSchema.index({ role: 1, searchTokens: 1 });
+UserSchema.index({ role: 1, searchGrams: 1 });
+
+// delta sync: staff changed since a cursor
+UserSchema.index({ role: 1, updatedAt: 1 });
+
+// roster sorted by hours worked / most recent job
+UserSchema.index({ role: 1, "stats.hours": -1 });
+UserSchema.index({ role: 1, "stats.lastJobAt": -1 });
+
+UserSchema.pre("save", function() {
+    if (this.isNew || this.isModified("fullName") || this.isModified("username") || this.isModified("email")) {
+        Object.assign(this, staffSearchKeys(this));
+    }
+});
+
+// Fill search keys for users created before they existed (idempotent, batched)
+UserSchema.statics.backfillSearchKeys = async function(batchSize = 500) {
+    const cursor = this.find({ searchTokens: { $exists: false } })
+        .select("username fullName email")
+        .lean()
+        .cursor();
+
+    let ops = [];
+    let updated = 0;
+    for await (const user of cursor) {
+        ops.push({ updateOne: { filter: { _id: user._id }, update: { $set: staffSearchKeys(user) } } });
+        if (ops.length >= batchSize) {
+            updated += (await this.bulkWrite(ops, { ordered: false })).modifiedCount;
+            ops = [];
+        }
+    }
+    if (ops.length) updated += (await this.bulkWrite(ops, { ordered: false })).modifiedCount;
+    return updated;
+};
+
 export default mongoose.model("User", UserSchema);
\ No newline at end of file
@@ -11,4 +11,7 @@ const VenueTemplateSchema = new mongoose.Schema({
 
 VenueTemplateSchema.index({ name: 1 });
 
+// delta sync and the list's ETag (newest updatedAt)
+VenueTemplateSchema.index({ updatedAt: 1 });
+
 export default mongoose.model("VenueTemplate", VenueTemplateSchema);
\ No newline at end of file
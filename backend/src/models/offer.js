@@ -27,4 +27,13 @@ const OfferSchema = new mongoose.Schema({
     amountWorked: { type: Number, default: 0 },
 }, { timestamps: true });
 
+// history: one staff member's offers
+OfferSchema.index({ userId: 1 });
+
+// payroll: completed offers for a period's placements
+OfferSchema.index({ placementId: 1, status: 1 });
+
+// delta sync: offers changed since a cursor
+OfferSchema.index({ updatedAt: 1 });
+
 export default mongoose.model("offer", OfferSchema);
\ No newline at end of file
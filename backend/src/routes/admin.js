@@ -1,29 +1,176 @@
 // src/routes/admin.js
 import express from 'express';
+import mongoose from 'mongoose';
 import User from '../models/User.js';
 import Offer from '../models/offer.js';
+import Placement from '../models/Placement.js';
 import AuditLog from '../models/AuditLog.js';
 import VenueTemplate from "../models/VenueTemplate.js";
 import { PAYROLL_CALENDER_2026 } from "../config/payrollCalender.js";
 import { requireAuth, requireManagerOrAdmin } from "../middleware/auth.js";
+import { conditional, etagFor } from "../middleware/cache.js";
+import { queryGrams, rankBySearch, searchWords, typoBudget } from "../utils/staffSearch.js";
+import { publishOfferRemoved, publishOffers, streamEvents } from "../utils/events.js";
+import { audit } from "../utils/audit.js";
+import { deltaResponse, offersChangedFilter, recordTombstones } from "../utils/deltaSync.js";
+import { hundredths, shiftPayPence } from "../utils/pay.js";
+import { periodClosed, periodSnapshot, sendSnapshot, snapshotBundle } from "../utils/payrollSnapshots.js";
+import {
+    staffWithStats,
+    statsOfferRemoved,
+    transitionOffer,
+} from "../utils/staffStats.js";
 
 const router = express.Router();
 
+// Calendar is static for the process lifetime -> one ETag, computed once
+const PAYROLL_PERIODS_ETAG = etagFor(PAYROLL_CALENDER_2026);
+
+// Venues change rarely: count + newest updatedAt is enough to know if the list changed
+async function venuesValidators() {
+    const [count, newest] = await Promise.all([
+        VenueTemplate.countDocuments({}),
+        VenueTemplate.findOne({}).sort({ updatedAt: -1 }).select("updatedAt").lean(),
+    ]);
+    const stamp = newest && newest.updatedAt ? new Date(newest.updatedAt).getTime() : 0;
+    return { etag: `"venues-${count}-${stamp}"` };
+}
+
+const STAFF_FIELDS = 'username fullName email dob createdAt isActive availability stats';
+const STAFF_PROJECTION = Object.fromEntries(STAFF_FIELDS.split(' ').map(f => [f, 1]));
+const STAFF_SEARCH_LIMIT = 50;
+const STAFF_SEARCH_MAX = 200;
+const STAFF_FUZZY_CANDIDATES = 500;
+
+// GET /admin/staff?sort=: index order on the stats rollup, and the same order for search results
+const ROSTER_SORTS = {
+    hours: {
+        index: { "stats.hours": -1 },
+        compare: (a, b) => b.totalHoursWorked - a.totalHoursWorked,
+    },
+    lastJob: {
+        index: { "stats.lastJobAt": -1 },
+        compare: (a, b) => b.lastJobAt.localeCompare(a.lastJobAt),
+    },
+};
+
+function escapeRegex(text) {
+    return text.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+}
+
+// History search terms, split like the admin client's search index (search_index.tokenize):
+// accents and case folded, dates (2026-01-05), times (09:00) and rates (12.50) kept whole.
+const SEARCH_TERM = /[0-9a-z]+(?:[-:./][0-9a-z]+)*/g;
+
+function searchTerms(q) {
+    return q.normalize("NFKD").replace(/[\u0300-\u036f]/g, "").toLowerCase().match(SEARCH_TERM) || [];
+}
+
+// 12.5 -> "12.50", like the client's rate column
+function moneyText(field) {
+    return {
+        $let: {
+            vars: { p: { $toLong: { $round: [{ $multiply: [{ $ifNull: [field, 0] }, 100] }, 0] } } },
+            in: {
+                $concat: [
+                    { $toString: { $toLong: { $floor: { $divide: ["$$p", 100] } } } }, ".",
+                    { $cond: [{ $lt: [{ $mod: ["$$p", 100] }, 10] }, "0", ""] },
+                    { $toString: { $mod: ["$$p", 100] } },
+                ],
+            },
+        },
+    };
+}
+
+// Cursor = last row's (placement date, offer _id); opaque to clients.
+function encodeCursor(row) {
+    const date = row.placementId.date ? new Date(row.placementId.date).getTime() : 0;
+    return Buffer.from(JSON.stringify([date, String(row._id)])).toString("base64url");
+}
+
+function decodeCursor(cursor) {
+    try {
+        const [date, id] = JSON.parse(Buffer.from(String(cursor), "base64url").toString("utf8"));
+        return { date: new Date(date), id: new mongoose.Types.ObjectId(id) };
+    } catch (e) {
+        return null;
+    }
+}
+
 /**
- * Small helper: write audit logs safely (won't crash app if AuditLog fails)
+ * One page of a staff member's offers, newest placement date first.
+ * Week filters (from/to) and free-text search (q) run in the database.
  */
-async function audit(actorId, action, targetType, targetId, meta) {
-    try {
-        await AuditLog.create({
-            actorId,
-            action,
-            targetType,
-            targetId,
-            meta: meta || {},
+async function offersByStaffPage(staffId, query) {
+    const limit = Math.min(Math.max(parseInt(query.limit, 10) || 50, 1), 200);
+    const from = (query.from || "").toString().trim();
+    const to = (query.to || "").toString().trim();
+    const q = (query.q || "").toString().trim();
+
+    const placementMatch = {};
+    if (from || to) {
+        placementMatch["placementId.date"] = {};
+        if (from) placementMatch["placementId.date"].$gte = new Date(`${from}T00:00:00.000Z`);
+        if (to) placementMatch["placementId.date"].$lte = new Date(`${to}T23:59:59.999Z`);
+    }
+
+    const pipeline = [
+        { $match: { userId: new mongoose.Types.ObjectId(staffId) } },
+        { $lookup: { from: Placement.collection.name, localField: "placementId", foreignField: "_id", as: "placementId" } },
+        { $unwind: "$placementId" },
+        { $match: placementMatch },
+    ];
+
+    // every term must appear (the client filters loaded rows the same way while the user types)
+    const terms = searchTerms(q);
+    if (terms.length) {
+        pipeline.push({
+            $match: {
+                $expr: {
+                    $let: {
+                        vars: {
+                            text: {
+                                $concat: [
+                                    { $ifNull: ["$placementId.venue", ""] }, " ",
+                                    { $ifNull: ["$placementId.roleTitle", { $ifNull: ["$placementId.position", ""] }] }, " ",
+                                    { $ifNull: [{ $dateToString: { format: "%Y-%m-%d", date: "$placementId.date" } }, ""] }, " ",
+                                    { $ifNull: ["$placementId.startTime", ""] }, " ",
+                                    { $ifNull: ["$placementId.endTime", ""] }, " ",
+                                    moneyText("$placementId.hourlyRate"), " ",
+                                    { $ifNull: ["$status", ""] },
+                                ],
+                            },
+                        },
+                        in: { $and: terms.map(term => ({ $regexMatch: { input: "$$text", regex: escapeRegex(term), options: "i" } })) },
+                    },
+                },
+            },
+        });
+    }
+
+    if (query.cursor) {
+        const c = decodeCursor(query.cursor);
+        if (!c) throw Object.assign(new Error("Invalid cursor"), { status: 400 });
+        pipeline.push({
+            $match: {
+                $or: [
+                    { "placementId.date": { $lt: c.date } },
+                    { "placementId.date": c.date, _id: { $lt: c.id } },
+                ],
+            },
         });
-    } catch (err) {
-        // ignore audit failures
     }
+
+    pipeline.push({ $sort: { "placementId.date": -1, _id: -1 } }, { $limit: limit + 1 });
+
+    const rows = await Offer.aggregate(pipeline);
+    const hasMore = rows.length > limit;
+    const items = hasMore ? rows.slice(0, limit) : rows;
+
+    return {
+        items,
+        nextCursor: hasMore ? encodeCursor(items[items.length - 1]) : null,
+    };
 }
 
 /**
@@ -31,7 +178,7 @@ async function audit(actorId, action, targetType, targetId, meta) {
  * GET /admin/staff/:id
  * Returns:
  *  - username, fullName, email, dob, createdAt, isActive, availability
- *  - totalJobsWorked, totalHoursWorked, totalEarnings
+ *  - totalJobsWorked, totalHoursWorked, totalEarnings, lastJobAt (from User.stats)
  */
 router.post("/device-token", requireAuth, async(req, res) => {
     try {
@@ -45,30 +192,38 @@ router.post("/device-token", requireAuth, async(req, res) => {
     }
 });
 
+/**
+ * GET /admin/dashboard
+ *   staffTotal, offersPending, offersAccepted, offersCompleted: unchanged for existing clients
+ *     (counts of the statuses "pending", "accepted" and "completed")
+ *   offersByStatus: { <offer status>: count } for every status in use; the desktop app buckets
+ *     these itself and moves offers between its counters on live offer events
+ */
 router.get("/dashboard", requireAuth, requireManagerOrAdmin, async(req, res) => {
     try {
         const staffTotal = await User.countDocuments({ role: "staff" });
-        const offersPending = await Offer.countDocuments({ status: "pending" });
-        const offersAccepted = await Offer.countDocuments({ status: "accepted" });
-        const offersCompleted = await Offer.countDocuments({ status: "completed" });
+        const byStatus = await Offer.aggregate([{ $group: { _id: "$status", n: { $sum: 1 } } }]);
+        const offersByStatus = Object.fromEntries(byStatus.map((row) => [row._id, row.n]));
 
         return res.json({
             staffTotal,
-            offersPending,
-            offersAccepted,
-            offersCompleted
+            offersPending: offersByStatus.pending || 0,
+            offersAccepted: offersByStatus.accepted || 0,
+            offersCompleted: offersByStatus.completed || 0,
+            offersByStatus,
         });
     } catch (err) {
         return res.status(500).json({ message: err.message || "Server error" });
     }
 });
 
-
+// ✅ Live offer events (Server-Sent Events); see utils/events.js
+router.get("/events", requireAuth, requireManagerOrAdmin, streamEvents);
 
 router.get('/staff/:id', requireAuth, requireManagerOrAdmin, async(req, res) => {
     try {
         const staff = await User.findById(req.params.id).select(
-            "username fullName email dob createdAt isActive availability role managerId"
+            "username fullName email dob createdAt isActive availability role managerId stats"
         );
 
         if (!staff) return res.status(404).json({ message: "Staff not found" });
@@ -81,33 +236,8 @@ router.get('/staff/:id', requireAuth, requireManagerOrAdmin, async(req, res) =>
             }
         }
 
-
-
-        // Completed jobs only
-        const completedOffers = await Offer.find({
-            userId: staff._id,
-            status: 'completed',
-        }).select('placementId').populate('placementId');
-
-        let totalJobsWorked = completedOffers.length;
-        let totalHoursWorked = 0;
-        let totalEarnings = 0;
-
-        for (let i = 0; i < completedOffers.length; i += 1) {
-            const o = completedOffers[i];
-            const placement = o.placementId || {};
-            const hrs = Number(placement.totalHours || 0);
-            const rate = Number(placement.hourlyRate || 0);
-            totalHoursWorked += hrs;
-            totalEarnings += hrs * rate;
-        }
-
-        res.json({
-            ...staff.toObject(),
-            totalJobsWorked,
-            totalHoursWorked,
-            totalEarnings: Number(totalEarnings.toFixed(2)),
-        });
+        // stats are the materialized rollup (utils/staffStats.js)
+        res.json(staffWithStats(staff));
     } catch (err) {
         res.status(500).json({ message: err.message || 'Server error' });
     }
@@ -116,6 +246,7 @@ router.get('/staff/:id', requireAuth, requireManagerOrAdmin, async(req, res) =>
 /**
  * Staff list (search + active filter + optional sort)
  * GET /admin/staff?q=&active=true/false&sort=hours|lastJob
+ * GET /admin/staff?since=<cursor>&active=... -> delta (utils/deltaSync.js), unsorted
  */
 router.get('/staff', requireAuth, requireManagerOrAdmin, async(req, res) => {
     try {
@@ -132,67 +263,82 @@ router.get('/staff', requireAuth, requireManagerOrAdmin, async(req, res) => {
         if (active === 'true') filter.isActive = true;
         if (active === 'false') filter.isActive = false;
 
-        if (q) filter.username = { $regex: q, $options: 'i' };
-
-        const staffList = await User.find(filter).select(
-            'username fullName email dob createdAt isActive availability'
-        );
-
-        // If no special sorting requested, return directly
-        if (sort !== 'hours' && sort !== 'lastJob') {
-            return res.json(staffList);
-        }
-
-        // Compute stats for sorting (hours / lastJob)
-        const staffIds = staffList.map(s => s._id);
-        const offers = await Offer.find({ userId: { $in: staffIds } }).select(
-            'userId status placementId createdAt'
-        );
-
-        const stats = {};
-        for (let i = 0; i < staffList.length; i += 1) {
-            stats[String(staffList[i]._id)] = { hours: 0, lastJobAt: '' };
+        if (req.query.since !== undefined && !q) {
+            // A staff member moved to another manager (or deactivated, with ?active=true)
+            // has left this list: only their id goes out, in removed.
+            return res.json(await deltaResponse(req.query, {
+                full: async() => (await User.find(filter).select(STAFF_FIELDS).lean()).map(staffWithStats),
+                changed: async since => (await User.find({ role: 'staff', updatedAt: { $gte: since } })
+                    .select(`${STAFF_FIELDS} managerId`).lean()).map(staffWithStats),
+                belongs: u => (!filter.managerId || String(u.managerId) === String(filter.managerId)) &&
+                    (filter.isActive === undefined || u.isActive === filter.isActive),
+            }));
         }
 
-        for (let i = 0; i < offers.length; i += 1) {
-            const o = offers[i];
-            const sid = String(o.userId);
-            if (!stats[sid]) continue;
-
-            // hours only from completed
-            if (o.status === 'completed') {
-                const placement = o.placementId || {};
-                stats[sid].hours += Number(placement.totalHours || 0);
-            }
-
-            // last job time = latest offer createdAt
-            const createdAt = o.createdAt ? new Date(o.createdAt).toISOString() : '';
-            if (!stats[sid].lastJobAt || createdAt > stats[sid].lastJobAt) {
-                stats[sid].lastJobAt = createdAt;
-            }
+        // sorting reads the stats rollup: one indexed sort, no offers loaded
+        const order = ROSTER_SORTS[sort];
+        if (!q) {
+            let query = User.find(filter).select(STAFF_FIELDS).lean();
+            if (order) query = query.sort(order.index);
+            return res.json((await query).map(staffWithStats));
         }
 
-        const enriched = staffList.map(s => {
-            const sid = String(s._id);
-            return {
-                ...s.toObject(),
-                totalHoursWorked: stats[sid] ? stats[sid].hours : 0,
-                lastJobAt: stats[sid] ? stats[sid].lastJobAt : '',
-            };
-        });
-
-        if (sort === 'hours') {
-            enriched.sort((a, b) => Number(b.totalHoursWorked || 0) - Number(a.totalHoursWorked || 0));
-        } else if (sort === 'lastJob') {
-            enriched.sort((a, b) => String(b.lastJobAt || '').localeCompare(String(a.lastJobAt || '')));
-        }
-
-        return res.json(enriched);
+        const found = (await searchStaff(filter, q, req.query.limit)).map(staffWithStats);
+        if (order) found.sort(order.compare);
+        return res.json(found);
     } catch (err) {
         return res.status(500).json({ message: err.message || 'Server error' });
     }
 });
 
+/**
+ * Ranked staff search (GET /admin/staff?q=...&limit=50), best match first:
+ * 1) every query word equals a stored word, 2) is a prefix of one (anchored regexes walk the
+ * searchTokens index), 3) shares trigrams with one (searchGrams index) and is within a typo
+ * or two. Stages stop once `limit` good matches are found; the union is ranked with
+ * rankBySearch, the same ordering the desktop app uses locally.
+ */
+async function searchStaff(filter, q, limit) {
+    const terms = [...new Set(searchWords(q))];
+    if (!terms.length) return [];
+    limit = Math.min(Math.max(parseInt(limit, 10) || STAFF_SEARCH_LIMIT, 1), STAFF_SEARCH_MAX);
+
+    const found = [];
+    const seen = () => found.map(u => u._id);
+
+    found.push(...await User.find({ ...filter, searchTokens: { $all: terms } })
+        .select(`${STAFF_FIELDS} +searchTokens`).limit(limit).lean());
+
+    if (found.length < limit) {
+        found.push(...await User.find({
+            ...filter,
+            _id: { $nin: seen() },
+            searchTokens: { $all: terms.map(t => new RegExp(`^${escapeRegex(t)}`)) },
+        }).select(`${STAFF_FIELDS} +searchTokens`).limit(limit).lean());
+    }
+
+    const grams = queryGrams(terms);
+    if (found.length < limit && grams.length) {
+        // a typo early in a short word can leave no gram in common ("jhon" / "john")
+        const heads = terms.filter(t => typoBudget(t) && t.length < 6)
+            .flatMap(t => [t[0] + t[1], t[0] + t[2]])
+            .map(h => new RegExp(`^${escapeRegex(h)}`));
+        const match = heads.length ?
+            { $or: [{ searchGrams: { $in: grams } }, { searchTokens: { $in: heads } }] } :
+            { searchGrams: { $in: grams } };
+
+        found.push(...await User.aggregate([
+            { $match: { ...filter, _id: { $nin: seen() }, ...match } },
+            { $addFields: { overlap: { $size: { $setIntersection: [{ $ifNull: ["$searchGrams", []] }, grams] } } } },
+            { $sort: { overlap: -1, _id: 1 } },
+            { $limit: STAFF_FUZZY_CANDIDATES },
+            { $project: { ...STAFF_PROJECTION, searchTokens: 1 } },
+        ]));
+    }
+
+    return rankBySearch(terms, found).slice(0, limit).map(({ searchTokens, ...user }) => user);
+}
+
 /**
  * Update availability
  * PATCH /admin/staff/:id/availability
@@ -208,7 +354,7 @@ router.patch('/staff/:id/availability', requireAuth, requireManagerOrAdmin, asyn
 
         if (!u) return res.status(404).json({ message: 'Staff not found' });
 
-        await audit(req.user.id, 'UPDATE_AVAILABILITY', 'User', String(u._id), availability);
+        audit(req.user.id, 'UPDATE_AVAILABILITY', 'User', String(u._id), availability);
         return res.json(u);
     } catch (err) {
         return res.status(500).json({ message: err.message || 'Server error' });
@@ -230,7 +376,7 @@ router.patch('/staff/:id/active', requireAuth, requireManagerOrAdmin, async(req,
 
         if (!u) return res.status(404).json({ message: 'Staff not found' });
 
-        await audit(req.user.id, 'SET_STAFF_ACTIVE', 'User', String(u._id), { isActive });
+        audit(req.user.id, 'SET_STAFF_ACTIVE', 'User', String(u._id), { isActive });
         return res.json(u);
     } catch (err) {
         return res.status(500).json({ message: err.message || 'Server error' });
@@ -240,6 +386,13 @@ router.patch('/staff/:id/active', requireAuth, requireManagerOrAdmin, async(req,
 /**
  * 2) Offer history per staff
  * GET /admin/offers/by-staff/:staffId
+ *
+ * Without `limit`: legacy shape, newest 200 offers as an array.
+ * With `limit` (max 200): keyset page sorted by placement date (newest first)
+ *   ?limit=50&cursor=<nextCursor>&from=YYYY-MM-DD&to=YYYY-MM-DD&q=text
+ *   -> { items: [...populated offers], nextCursor: string | null }
+ * With `since`: delta of the legacy list (utils/deltaSync.js); an edited placement
+ *   counts as a change to its offer.
  */
 router.get("/offers/by-staff/:staffId", requireAuth, requireManagerOrAdmin, async(req, res) => {
     try {
@@ -256,6 +409,20 @@ router.get("/offers/by-staff/:staffId", requireAuth, requireManagerOrAdmin, asyn
             }
         }
 
+        if (req.query.limit !== undefined) {
+            return res.json(await offersByStaffPage(staffId, req.query));
+        }
+
+        if (req.query.since !== undefined) {
+            return res.json(await deltaResponse(req.query, {
+                kind: "offer",
+                owners: { ownerId: String(staffId) },
+                full: () => Offer.find({ userId: staffId }).populate("placementId").sort({ createdAt: -1 }).limit(200).lean(),
+                changed: async since => Offer.find(await offersChangedFilter({ userId: staffId }, since))
+                    .populate("placementId").lean(),
+            }));
+        }
+
         const offers = await Offer.find({ userId: staffId })
             .populate("placementId") // ✅ THIS is the key fix
             .sort({ createdAt: -1 })
@@ -263,7 +430,7 @@ router.get("/offers/by-staff/:staffId", requireAuth, requireManagerOrAdmin, asyn
 
         return res.json(offers);
     } catch (err) {
-        return res.status(500).json({ message: err.message || "Server error" });
+        return res.status(err.status || 500).json({ message: err.message || "Server error" });
     }
 });
 
@@ -304,6 +471,7 @@ router.patch("/offers/:offerId", requireAuth, requireManagerOrAdmin, async(req,
         const updatedOffer = await Offer.findById(offer._id)
             .populate("placementId")
             .populate("userId", "username");
+        publishOffers("offer.updated", [offer._id]);
 
         return res.json(updatedOffer);
     } catch (err) {
@@ -328,14 +496,14 @@ router.post('/offers/:offerId/cancel', requireAuth, requireManagerOrAdmin, async
 
         const reason = (req.body && req.body.reason) ? String(req.body.reason) : '';
 
-        offer.status = 'cancelled';
-        offer.cancelReason = reason;
-        offer.cancelledAt = new Date();
+        const previousStatus = offer.status;
+        const saved = await transitionOffer(offer, { status: 'cancelled', cancelReason: reason, cancelledAt: new Date() });
+        if (!saved) return res.status(409).json({ message: 'Offer was changed by someone else, reload and try again' });
+        publishOffers('offer.cancelled', [saved._id], {
+            [saved._id]: previousStatus });
+        audit(req.user.id, 'CANCEL_OFFER', 'Offer', String(saved._id), { reason });
 
-        await offer.save();
-        await audit(req.user.id, 'CANCEL_OFFER', 'Offer', String(offer._id), { reason });
-
-        return res.json(offer);
+        return res.json(saved);
     } catch (err) {
         return res.status(500).json({ message: err.message || 'Server error' });
     }
@@ -357,13 +525,14 @@ router.post('/offers/:offerId/complete', requireAuth, requireManagerOrAdmin, asy
         }
 
 
-        offer.status = 'completed';
-        offer.completedAt = new Date();
-
-        await offer.save();
-        await audit(req.user.id, 'COMPLETE_OFFER', 'Offer', String(offer._id));
+        const previousStatus = offer.status;
+        const saved = await transitionOffer(offer, { status: 'completed', completedAt: new Date() });
+        if (!saved) return res.status(409).json({ message: 'Offer was changed by someone else, reload and try again' });
+        publishOffers('offer.completed', [saved._id], {
+            [saved._id]: previousStatus });
+        audit(req.user.id, 'COMPLETE_OFFER', 'Offer', String(saved._id));
 
-        return res.json(offer);
+        return res.json(saved);
     } catch (err) {
         return res.status(500).json({ message: err.message || 'Server error' });
     }
@@ -373,6 +542,7 @@ router.post('/offers/:offerId/complete', requireAuth, requireManagerOrAdmin, asy
  * 4) Calendar / Weekly schedule
  * GET /admin/calendar?from=YYYY-MM-DD&to=YYYY-MM-DD
  * Returns offers in the date window (excluding cancelled), with populated userId.username
+ * and placementId
  */
 router.get('/calendar', requireAuth, requireManagerOrAdmin, async(req, res) => {
     try {
@@ -383,12 +553,26 @@ router.get('/calendar', requireAuth, requireManagerOrAdmin, async(req, res) => {
             return res.status(400).json({ message: 'from and to are required' });
         }
 
+        // placementId is a reference: find the window's placements (Placement.date is
+        // indexed), then their offers, instead of filtering on an unpopulated path
+        const placements = await Placement.find({
+            date: {
+                $gte: new Date(`${from}T00:00:00.000Z`),
+                $lte: new Date(`${to}T23:59:59.999Z`),
+            },
+        }).select('venue roleTitle date startTime endTime hourlyRate totalHours').lean();
+        if (!placements.length) return res.json([]);
+
+        const byId = new Map(placements.map(p => [String(p._id), p]));
         const offers = await Offer.find({
-            'placementId.date': { $gte: from, $lte: to },
+            placementId: { $in: placements.map(p => p._id) },
             status: { $ne: 'cancelled' },
-        }).populate('userId', 'username');
+        })
+            .select('userId placementId status')
+            .populate('userId', 'username')
+            .lean();
 
-        return res.json(offers);
+        return res.json(offers.map(o => ({ ...o, placementId: byId.get(String(o.placementId)) || o.placementId })));
     } catch (err) {
         return res.status(500).json({ message: err.message || 'Server error' });
     }
@@ -429,7 +613,7 @@ router.get('/payroll', requireAuth, requireManagerOrAdmin, async(req, res) => {
                 venue: placement.venue || '',
                 totalHours: hrs,
                 hourlyRate: rate,
-                pay: Number((hrs * rate).toFixed(2)),
+                pay: shiftPayPence(hrs, rate) / 100,
             };
         });
 
@@ -439,23 +623,139 @@ router.get('/payroll', requireAuth, requireManagerOrAdmin, async(req, res) => {
     }
 });
 
+// Audit cursor = last row's (createdAt, _id), read back with decodeCursor
+function encodeAuditCursor(row) {
+    return Buffer.from(JSON.stringify([new Date(row.createdAt).getTime(), String(row._id)])).toString("base64url");
+}
+
+// ?actor=<username>&action=&targetType=&targetId= -> AuditLog filter; null when no such actor
+async function auditFilter(query) {
+    const filter = {};
+    const actor = (query.actor || "").toString().trim();
+    if (actor) {
+        const user = await User.findOne({ username: actor }).select("_id").lean();
+        if (!user) return null;
+        filter.actorId = user._id;
+    }
+    for (const field of ["action", "targetType", "targetId"]) {
+        const value = (query[field] || "").toString().trim();
+        if (value) filter[field] = value;
+    }
+    return filter;
+}
+
 /**
- * 10) Audit log (last 200)
+ * 10) Audit log, newest first
  * GET /admin/audit
+ *
+ * Without `limit`: legacy shape, newest 200 entries as an array.
+ * With `limit` (max 200): keyset page on (createdAt, _id)
+ *   ?limit=50&cursor=<nextCursor>&actor=<username>&action=&targetType=&targetId=
+ *   -> { items: [...entries, actorId populated with username], nextCursor: string | null }
  */
 router.get('/audit', requireAuth, requireManagerOrAdmin, async(req, res) => {
     try {
-        const logs = await AuditLog.find()
-            .sort({ createdAt: -1 })
-            .limit(200)
-            .populate('actorId', 'username');
+        if (req.query.limit === undefined) {
+            const logs = await AuditLog.find()
+                .sort({ createdAt: -1 })
+                .limit(200)
+                .populate('actorId', 'username');
+
+            return res.json(logs);
+        }
+
+        const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 50, 1), 200);
+        const filter = await auditFilter(req.query);
+        if (!filter) return res.json({ items: [], nextCursor: null });
+
+        if (req.query.cursor) {
+            const c = decodeCursor(req.query.cursor);
+            if (!c) return res.status(400).json({ message: 'Invalid cursor' });
+            filter.$or = [
+                { createdAt: { $lt: c.date } },
+                { createdAt: c.date, _id: { $lt: c.id } },
+            ];
+        }
 
-        return res.json(logs);
+        const rows = await AuditLog.find(filter)
+            .sort({ createdAt: -1, _id: -1 })
+            .limit(limit + 1)
+            .populate('actorId', 'username')
+            .lean();
+        const hasMore = rows.length > limit;
+        const items = hasMore ? rows.slice(0, limit) : rows;
+
+        return res.json({
+            items,
+            nextCursor: hasMore ? encodeAuditCursor(items[items.length - 1]) : null,
+        });
     } catch (err) {
         return res.status(500).json({ message: err.message || 'Server error' });
     }
 });
 
+const AUDIT_CSV_COLUMNS = ["time", "actor", "action", "targetType", "targetId", "meta"];
+
+// One CSV cell; a leading = + - @ is defused so spreadsheets don't run it as a formula
+function csvCell(value) {
+    let text = value === undefined || value === null ? "" : String(value);
+    if (/^[=+\-@]/.test(text)) text = `'${text}`;
+    return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+/**
+ * Audit log as CSV, every entry matching the filters (same as GET /admin/audit), newest first.
+ * GET /admin/audit/export.csv?actor=&action=&targetType=&targetId=
+ * Streamed from a database cursor: memory stays flat however long the log is.
+ */
+router.get('/audit/export.csv', requireAuth, requireManagerOrAdmin, async(req, res) => {
+    let cursor = null;
+    try {
+        const filter = await auditFilter(req.query);
+
+        res.set({
+            'Content-Type': 'text/csv; charset=utf-8',
+            'Content-Disposition': 'attachment; filename="audit-log.csv"',
+            'Cache-Control': 'no-store',
+        });
+        res.write(`${AUDIT_CSV_COLUMNS.join(",")}\n`);
+        if (!filter) return res.end();
+
+        let closed = false;
+        req.on('close', () => { closed = true; });
+
+        cursor = AuditLog.find(filter)
+            .sort({ createdAt: -1, _id: -1 })
+            .populate('actorId', 'username')
+            .lean()
+            .cursor({ batchSize: 500 });
+
+        for await (const row of cursor) {
+            if (closed) break;
+            const line = [
+                new Date(row.createdAt).toISOString(),
+                row.actorId && row.actorId.username ? row.actorId.username : "",
+                row.action,
+                row.targetType,
+                row.targetId,
+                row.meta && Object.keys(row.meta).length ? JSON.stringify(row.meta) : "",
+            ].map(csvCell).join(",");
+            // respect backpressure: wait for the socket before buffering more
+            if (!res.write(`${line}\n`)) {
+                await new Promise(resolve => {
+                    res.once('drain', resolve);
+                    res.once('close', resolve);
+                });
+            }
+        }
+        return res.end();
+    } catch (err) {
+        if (cursor) cursor.close().catch(() => {});
+        if (res.headersSent) return res.destroy(err);
+        return res.status(500).json({ message: err.message || 'Server error' });
+    }
+});
+
 router.post("/create-manager", requireAuth, requireManagerOrAdmin, async(req, res) => {
     const { username, password, fullName } = req.body;
 
@@ -488,13 +788,21 @@ router.delete("/offers/:offerId", requireAuth, requireManagerOrAdmin, async(req,
         }
 
         const placementId = offer.placementId;
+        const placement = placementId ?
+            await Placement.findById(placementId).select("totalHours hourlyRate").lean() :
+            null;
 
         await Offer.deleteOne({ _id: offer._id });
+        await recordTombstones("offer", [offer._id], offer.userId);
+        await statsOfferRemoved(offer, placement);
 
         if (placementId) {
             await Placement.deleteOne({ _id: placementId });
         }
 
+        const owner = await User.findById(offer.userId).select("managerId").lean();
+        publishOfferRemoved(offer, owner && owner.managerId);
+
         res.json({ success: true });
     } catch (err) {
         console.error(err);
@@ -503,10 +811,88 @@ router.delete("/offers/:offerId", requireAuth, requireManagerOrAdmin, async(req,
 });
 
 // ✅ List payroll pay dates
-router.get("/payroll/periods", requireAuth, requireManagerOrAdmin, (req, res) => {
+router.get("/payroll/periods", requireAuth, requireManagerOrAdmin, conditional(() => ({ etag: PAYROLL_PERIODS_ETAG })), (req, res) => {
     res.json(PAYROLL_CALENDER_2026);
 });
 
+// Completed shifts whose placement date falls inside the pay period.
+// Only the period's placements are read (Placement.date is indexed), not every completed offer.
+async function completedShiftsInPeriod(period, username) {
+    const placements = await Placement.find({
+        date: {
+            $gte: new Date(`${period.from}T00:00:00.000Z`),
+            $lte: new Date(`${period.to}T23:59:59.999Z`),
+        },
+    }).select("date venue startTime endTime totalHours hourlyRate").lean();
+    if (!placements.length) return [];
+
+    const byId = new Map(placements.map(p => [String(p._id), p]));
+    const filter = { status: "completed", placementId: { $in: placements.map(p => p._id) } };
+    if (username) {
+        const user = await User.findOne({ username }).select("_id").lean();
+        if (!user) return [];
+        filter.userId = user._id;
+    }
+
+    const offers = await Offer.find(filter)
+        .select("userId placementId")
+        .populate("userId", "username")
+        .lean();
+
+    const rows = [];
+    for (const o of offers) {
+        const p = byId.get(String(o.placementId));
+        if (!p) continue;
+        const hrs = Number(p.totalHours || 0);
+        const rate = Number(p.hourlyRate || 0);
+        rows.push({
+            username: (o.userId && o.userId.username) ? o.userId.username : "Unknown",
+            date: new Date(p.date).toISOString().slice(0, 10),
+            venue: p.venue || "",
+            startTime: p.startTime || "",
+            endTime: p.endTime || "",
+            hours: hrs,
+            rate,
+            pay: shiftPayPence(hrs, rate) / 100,
+        });
+    }
+    rows.sort((a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0));
+    return rows;
+}
+
+function payrollSummary(rows) {
+    const summary = {};
+    for (const r of rows) {
+        if (!summary[r.username]) summary[r.username] = { hours: 0, pay: 0 };
+        summary[r.username].hours += hundredths(r.hours);
+        summary[r.username].pay += shiftPayPence(r.hours, r.rate);
+    }
+    return Object.entries(summary).map(([username, s]) => ({
+        username,
+        totalHours: s.hours / 100,
+        totalPay: s.pay / 100,
+    }));
+}
+
+const PAYROLL_SHIFT_FIELDS = ["username", "date", "venue", "startTime", "endTime", "hours", "rate", "pay"];
+
+// Summary + every shift row; shifts are positional arrays (see `fields`) to keep it small
+async function payrollBundle(period) {
+    const rows = await completedShiftsInPeriod(period);
+    return {
+        period,
+        staff: payrollSummary(rows),
+        fields: PAYROLL_SHIFT_FIELDS,
+        shifts: rows.map(r => PAYROLL_SHIFT_FIELDS.map(f => r[f])),
+    };
+}
+
+// A closed period's frozen bundle (utils/payrollSnapshots.js), or null while it is open
+async function frozenBundle(period) {
+    if (!periodClosed(period)) return null;
+    return snapshotBundle(await periodSnapshot(period, () => payrollBundle(period)));
+}
+
 // ✅ Payroll summary by pay date
 router.get("/payroll/period/:payDate", requireAuth, requireManagerOrAdmin, async(req, res) => {
     try {
@@ -517,36 +903,33 @@ router.get("/payroll/period/:payDate", requireAuth, requireManagerOrAdmin, async
             return res.status(404).json({ message: "Payroll period not found" });
         }
 
-        const offers = await Offer.find({ status: "completed" })
-            .populate("userId", "username")
-            .populate("placementId");
-
-        const summary = {};
+        const frozen = await frozenBundle(period);
+        if (frozen) return res.json({ period, staff: frozen.staff });
 
-        for (const o of offers) {
-            const p = o.placementId;
-            if (!p || !p.date) continue;
-
-            const iso = new Date(p.date).toISOString().slice(0, 10);
-            if (iso < period.from || iso > period.to) continue;
+        const rows = await completedShiftsInPeriod(period);
+        res.json({ period, staff: payrollSummary(rows) });
+    } catch (err) {
+        res.status(500).json({ message: err.message });
+    }
+});
 
-            const name = (o.userId && o.userId.username) ? o.userId.username : "Unknown";
-            const hrs = Number(p.totalHours || 0);
-            const rate = Number(p.hourlyRate || 0);
+// ✅ Whole pay period in one response: summary + every shift row.
+// Shifts are positional arrays (see `fields`) to keep the payload small.
+// Closed periods are served from their snapshot, gzipped, with the content hash as ETag
+// and in the body as `snapshot: { hash, frozenAt }`.
+router.get("/payroll/period/:payDate/bundle", requireAuth, requireManagerOrAdmin, async(req, res) => {
+    try {
+        const payDate = req.params.payDate;
+        const period = PAYROLL_CALENDER_2026.find(p => p.payDate === payDate);
 
-            if (!summary[name]) summary[name] = { hours: 0, pay: 0 };
-            summary[name].hours += hrs;
-            summary[name].pay += hrs * rate;
+        if (!period) {
+            return res.status(404).json({ message: "Payroll period not found" });
         }
 
-        res.json({
-            period,
-            staff: Object.entries(summary).map(([username, s]) => ({
-                username,
-                totalHours: Number(s.hours.toFixed(2)),
-                totalPay: Number(s.pay.toFixed(2)),
-            })),
-        });
+        if (periodClosed(period)) {
+            return sendSnapshot(req, res, await periodSnapshot(period, () => payrollBundle(period)));
+        }
+        res.json(await payrollBundle(period));
     } catch (err) {
         res.status(500).json({ message: err.message });
     }
@@ -566,39 +949,21 @@ router.get(
                 return res.status(404).json({ message: "Payroll period not found" });
             }
 
-            const offers = await Offer.find({ status: "completed" })
-                .populate("userId", "username")
-                .populate("placementId");
-
-            const rows = [];
-
-            for (const o of offers) {
-                if (!o.userId || o.userId.username !== username) continue;
-
-                const p = o.placementId;
-                if (!p || !p.date) continue;
-
-                const d = new Date(p.date).toISOString().slice(0, 10);
-                if (d < period.from || d > period.to) continue;
-
-                const hrs = Number(p.totalHours || 0);
-                const rate = Number(p.hourlyRate || 0);
-
-                rows.push({
-                    date: d,
-                    venue: p.venue || "",
-                    startTime: p.startTime || "",
-                    endTime: p.endTime || "",
-                    hours: hrs,
-                    rate,
-                    pay: Number((hrs * rate).toFixed(2)),
-                });
+            const frozen = await frozenBundle(period);
+            if (frozen) {
+                const shifts = frozen.shifts
+                    .map(row => Object.fromEntries(frozen.fields.map((f, i) => [f, row[i]])))
+                    .filter(shift => shift.username === username)
+                    .map(({ username: _u, ...shift }) => shift);
+                return res.json({ period, username, shifts });
             }
 
+            const rows = await completedShiftsInPeriod(period, username);
+
             res.json({
                 period,
                 username,
-                shifts: rows,
+                shifts: rows.map(({ username: _u, ...shift }) => shift),
             });
         } catch (err) {
             res.status(500).json({ message: err.message });
@@ -607,9 +972,17 @@ router.get(
 );
 
 // ---------- Venues (templates) ----------
-router.get("/venues", requireAuth, requireManagerOrAdmin, async(req, res) => {
+router.get("/venues", requireAuth, requireManagerOrAdmin, conditional(venuesValidators), async(req, res) => {
     try {
         // If you want per-admin venues, filter by createdBy: req.user.id
+        if (req.query.since !== undefined) {
+            return res.json(await deltaResponse(req.query, {
+                kind: "venue",
+                full: () => VenueTemplate.find({}).sort({ createdAt: -1 }).lean(),
+                changed: since => VenueTemplate.find({ updatedAt: { $gte: since } }).lean(),
+            }));
+        }
+
         const venues = await VenueTemplate.find({}).sort({ createdAt: -1 });
         res.json(venues);
     } catch (e) {
@@ -671,6 +1044,7 @@ router.delete("/venues/:id", requireAuth, requireManagerOrAdmin, async(req, res)
     try {
         const deleted = await VenueTemplate.findByIdAndDelete(req.params.id);
         if (!deleted) return res.status(404).json({ message: "Venue not found" });
+        await recordTombstones("venue", [deleted._id]);
         res.json({ ok: true });
     } catch (e) {
         res.status(500).json({ message: e.message });
@@ -1,9 +1,13 @@
 import express from "express";
+import mongoose from "mongoose";
 import Offer from "../models/offer.js";
 import User from "../models/User.js";
 import Placement from "../models/Placement.js";
 import admin from "../config/firebaseAdmin.js";
 import { requireAuth, requireManagerOrAdmin } from "../middleware/auth.js";
+import { publishOffers } from "../utils/events.js";
+import { deltaResponse, offersChangedFilter } from "../utils/deltaSync.js";
+import { statsOffersCreated, transitionOffer } from "../utils/staffStats.js";
 
 const router = express.Router();
 
@@ -29,6 +33,103 @@ function overlap(aStart, aEnd, bStart, bEnd) {
     return aStart < bEnd && aEnd > bStart;
 }
 
+const DAY_MINUTES = 24 * 60;
+
+// Normalized shift: day "YYYY-MM-DD", minutes start/end (end past midnight for an overnight
+// shift, end <= start e.g. 22:00-06:00) and from/to on one absolute minute axis so shifts on
+// neighbouring days compare too. null when date or times are invalid.
+function shiftWindow(date, startTime, endTime) {
+    const day = toIsoDay(date);
+    const start = hmToMin(startTime);
+    let end = hmToMin(endTime);
+    if (!day || start === null || end === null) return null;
+    if (end <= start) end += DAY_MINUTES;
+    const base = (Date.parse(`${day}T00:00:00.000Z`) / 86400000) * DAY_MINUTES;
+    return { day, start, end, from: base + start, to: base + end };
+}
+
+// Existing offers (placementId populated) whose shift overlaps `shift` (a shiftWindow)
+function findConflicts(existing, shift) {
+    const conflicts = [];
+
+    for (const o of existing) {
+        const p = o.placementId;
+        if (!p) continue;
+
+        const other = shiftWindow(p.date, p.startTime, p.endTime);
+        if (!other) continue;
+
+        if (overlap(shift.from, shift.to, other.from, other.to)) {
+            conflicts.push({
+                offerId: o._id.toString(),
+                status: o.status,
+                venue: p.venue || "",
+                date: other.day,
+                startTime: p.startTime || "",
+                endTime: p.endTime || "",
+            });
+        }
+    }
+    return conflicts;
+}
+
+// Active bookings (offers with placementId populated, cancelled/rejected left out) of these
+// staff on `days` ("YYYY-MM-DD") and the day either side, so overnight shifts are seen too.
+// One query on the Placement date index (one range per run of nearby days), one on the
+// offers of those placements.
+async function bookingsAround(userIds, days) {
+    const ranges = [];
+    for (const day of [...new Set(days)].sort()) {
+        const from = new Date(`${day}T00:00:00.000Z`);
+        const to = new Date(`${day}T23:59:59.999Z`);
+        from.setUTCDate(from.getUTCDate() - 1);
+        to.setUTCDate(to.getUTCDate() + 1);
+
+        const last = ranges[ranges.length - 1];
+        if (last && from <= last.$lte) last.$lte = to;
+        else ranges.push({ $gte: from, $lte: to });
+    }
+    if (!ranges.length) return [];
+
+    const placements = await Placement.find({ $or: ranges.map((range) => ({ date: range })) })
+        .select("venue date startTime endTime")
+        .lean();
+    if (!placements.length) return [];
+    const placementById = new Map(placements.map((pl) => [String(pl._id), pl]));
+
+    const offers = await Offer.find({
+            userId: { $in: userIds },
+            placementId: { $in: placements.map((pl) => pl._id) },
+            status: { $nin: ["cancelled", "rejected"] },
+        })
+        .select("userId placementId status")
+        .lean();
+    return offers.map((o) => ({...o, placementId: placementById.get(String(o.placementId)) }));
+}
+
+// ✅ map desktop fields -> Placement schema fields
+function placementFields(placement, date) {
+    return {
+        venue: placement.venue || "",
+        roleTitle: placement.roleTitle || placement.position || "",
+        date: new Date(date),
+        startTime: placement.startTime || "",
+        endTime: placement.endTime || "",
+
+        hourlyRate: placement.hourlyRate !== undefined && placement.hourlyRate !== null ?
+            placement.hourlyRate : 0,
+
+        totalHours: placement.totalHours !== undefined && placement.totalHours !== null ?
+            placement.totalHours : 0,
+
+        addressLine: placement.addressLine || "",
+        city: placement.city || "",
+        postcode: placement.postcode || "",
+
+        notes: placement.notes || placement.note || placement._note || "",
+    };
+}
+
 /**
  * Send a push notification to one device token.
  * This won't crash your route if FCM fails.
@@ -65,7 +166,7 @@ async function sendPush(token, title, body, data = {}) {
             ),
         });
     } catch (err) {
-        console.error("FCM send error:", err ? .message || err);
+        console.error("FCM send error:", (err && err.message) || err);
     }
 }
 
@@ -102,58 +203,17 @@ router.post("/send", requireAuth, requireManagerOrAdmin, async(req, res) => {
         const force = !!(req.body && req.body.force);
 
         // Normalize incoming shift time
-        const day = toIsoDay(placement.date);
-        const newStart = hmToMin(placement.startTime);
-        const newEnd = hmToMin(placement.endTime);
-
-        if (!day || newStart === null || newEnd === null) {
+        const shift = shiftWindow(placement.date, placement.startTime, placement.endTime);
+        if (!shift) {
             return res.status(400).json({
                 message: "Valid date/startTime/endTime required (YYYY-MM-DD, HH:MM)",
             });
         }
 
-        // If end <= start, treat as overnight shift (e.g., 22:00-06:00)
-        let ns = newStart;
-        let ne = newEnd;
-        if (ne <= ns) ne += 24 * 60;
-
-        // Find existing shifts for this staff (ignore cancelled/rejected)
-        const existing = await Offer.find({
-                userId,
-                status: { $nin: ["cancelled", "rejected"] },
-            })
-            .populate("placementId")
-            .sort({ createdAt: -1 })
-            .limit(200);
-
-        const conflicts = [];
+        // Existing shifts for this staff around that day (ignore cancelled/rejected)
+        const existing = await bookingsAround([userId], [shift.day]);
 
-        for (const o of existing) {
-            const p = o.placementId;
-            if (!p) continue;
-
-            const pDay = toIsoDay(p.date);
-            if (pDay !== day) continue;
-
-            const es0 = hmToMin(p.startTime);
-            const ee0 = hmToMin(p.endTime);
-            if (es0 === null || ee0 === null) continue;
-
-            let es = es0;
-            let ee = ee0;
-            if (ee <= es) ee += 24 * 60;
-
-            if (overlap(ns, ne, es, ee)) {
-                conflicts.push({
-                    offerId: o._id.toString(),
-                    status: o.status,
-                    venue: p.venue || "",
-                    date: pDay,
-                    startTime: p.startTime || "",
-                    endTime: p.endTime || "",
-                });
-            }
-        }
+        const conflicts = findConflicts(existing, shift);
 
         if (conflicts.length && !force) {
             return res.status(409).json({
@@ -163,26 +223,7 @@ router.post("/send", requireAuth, requireManagerOrAdmin, async(req, res) => {
             });
         }
 
-        // ✅ map desktop fields -> Placement schema fields
-        const createdPlacement = await Placement.create({
-            venue: placement.venue || "",
-            roleTitle: placement.roleTitle || placement.position || "",
-            date: new Date(placement.date),
-            startTime: placement.startTime || "",
-            endTime: placement.endTime || "",
-
-            hourlyRate: placement.hourlyRate !== undefined && placement.hourlyRate !== null ?
-                placement.hourlyRate : 0,
-
-            totalHours: placement.totalHours !== undefined && placement.totalHours !== null ?
-                placement.totalHours : 0,
-
-            addressLine: placement.addressLine || "",
-            city: placement.city || "",
-            postcode: placement.postcode || "",
-
-            notes: placement.notes || placement.note || placement._note || "",
-        });
+        const createdPlacement = await Placement.create(placementFields(placement, placement.date));
 
         const offer = await Offer.create({
             userId,
@@ -190,6 +231,9 @@ router.post("/send", requireAuth, requireManagerOrAdmin, async(req, res) => {
             status: "offered",
         });
 
+        await statsOffersCreated([offer]);
+        publishOffers("offer.created", [offer._id]);
+
         // 🔔 Send push to staff
         await sendPush(
             targetStaff.fcmToken,
@@ -204,6 +248,134 @@ router.post("/send", requireAuth, requireManagerOrAdmin, async(req, res) => {
     }
 });
 
+// Largest bulk send accepted in one request (the desktop sends smaller chunks)
+const SEND_BATCH_MAX = 500;
+
+// ✅ Admin sends one placement template to many staff x dates (bulk send)
+// Body: { placement, items: [{ userId, date, force? }], force? }
+// Every item gets its own result, in order: { userId, date, status: "sent", offerId },
+// { ..., status: "conflict", conflicts } or { ..., status: "error", message }.
+// Staff and their bookings around the batch's days are loaded up front (bookingsAround), each
+// item's placement is validated before anything is written, and the placements and offers that
+// go out are created with one insertMany each. If the offers fail to insert, the placements
+// made for them are deleted again.
+router.post("/send-batch", requireAuth, requireManagerOrAdmin, async(req, res) => {
+    try {
+        const { placement, items } = req.body || {};
+
+        if (!placement || !Array.isArray(items) || !items.length) {
+            return res.status(400).json({ message: "placement and items required" });
+        }
+        if (items.length > SEND_BATCH_MAX) {
+            return res.status(400).json({ message: `At most ${SEND_BATCH_MAX} items per batch` });
+        }
+        const forceAll = !!req.body.force;
+
+        const userIds = [...new Set(items.map((i) => String((i && i.userId) || "")).filter(Boolean))];
+        const staff = await User.find({ _id: { $in: userIds } })
+            .select("role isActive managerId fcmToken")
+            .lean();
+        const staffById = new Map(staff.map((u) => [String(u._id), u]));
+
+        // existing bookings of these staff around the batch's days (ignore cancelled/rejected)
+        const days = items.map((i) => toIsoDay(i && i.date)).filter(Boolean);
+        const existingByUser = new Map();
+        const existing = await bookingsAround(userIds, days);
+        for (const o of existing) {
+            const key = String(o.userId);
+            if (!existingByUser.has(key)) existingByUser.set(key, []);
+            existingByUser.get(key).push(o);
+        }
+
+        const results = new Array(items.length);
+        const toCreate = [];
+
+        items.forEach((item, index) => {
+            const userId = String((item && item.userId) || "");
+            const base = { userId, date: (item && item.date) || "" };
+            const fail = (message) => { results[index] = {...base, status: "error", message }; };
+
+            const target = staffById.get(userId);
+            if (!target) return fail("Staff not found");
+            if (target.role !== "staff") return fail("Target user is not staff");
+            if (target.isActive === false) return fail("This staff account is suspended.");
+            if (req.user.role === "manager" &&
+                (!target.managerId || target.managerId.toString() !== String(req.user.id))) {
+                return fail("Forbidden: not your staff");
+            }
+
+            const shift = shiftWindow(base.date, placement.startTime, placement.endTime);
+            if (!shift) return fail("Valid date/startTime/endTime required (YYYY-MM-DD, HH:MM)");
+
+            // venue, roleTitle...: reported here instead of failing the whole insert
+            const fields = { _id: new mongoose.Types.ObjectId(), ...placementFields(placement, shift.day) };
+            const invalid = new Placement(fields).validateSync();
+            if (invalid) return fail(Object.values(invalid.errors).map((e) => e.message).join(" "));
+
+            if (!existingByUser.has(userId)) existingByUser.set(userId, []);
+            const booked = existingByUser.get(userId);
+            const conflicts = findConflicts(booked, shift);
+            if (conflicts.length && !(forceAll || item.force)) {
+                results[index] = {...base, status: "conflict", conflicts };
+                return;
+            }
+
+            // later items of this batch must not double-book the same staff either
+            booked.push({
+                _id: `batch-${index}`,
+                status: "offered",
+                placementId: {
+                    venue: placement.venue || "",
+                    date: shift.day,
+                    startTime: placement.startTime,
+                    endTime: placement.endTime,
+                },
+            });
+            toCreate.push({ index, base, target, fields });
+        });
+
+        if (toCreate.length) {
+            // ids are assigned up front, so a partial insert can be undone too
+            const placementIds = toCreate.map((c) => c.fields._id);
+            let createdPlacements;
+            let createdOffers;
+            try {
+                createdPlacements = await Placement.insertMany(toCreate.map((c) => c.fields));
+                createdOffers = await Offer.insertMany(
+                    toCreate.map((c) => ({
+                        userId: c.base.userId,
+                        placementId: c.fields._id,
+                        status: "offered",
+                    }))
+                );
+            } catch (err) {
+                // no placement may outlive its batch without an offer pointing at it
+                await Offer.deleteMany({ placementId: { $in: placementIds } });
+                await Placement.deleteMany({ _id: { $in: placementIds } });
+                throw err;
+            }
+
+            toCreate.forEach((c, i) => {
+                results[c.index] = {...c.base, status: "sent", offerId: createdOffers[i]._id.toString() };
+            });
+            await statsOffersCreated(createdOffers);
+            publishOffers("offer.created", createdOffers.map((o) => o._id));
+
+            // 🔔 pushes go out in the background (sendPush never throws)
+            Promise.allSettled(toCreate.map((c, i) => sendPush(
+                c.target.fcmToken,
+                "New Offer",
+                `${createdPlacements[i].roleTitle || "Shift"} • ${createdPlacements[i].venue || ""}`, { offerId: createdOffers[i]._id.toString() }
+            )));
+        }
+
+        return res.json({ results });
+    } catch (err) {
+        console.error("SEND OFFER BATCH ERROR:", err);
+        return res.status(500).json({ message: err.message || "Bulk send failed" });
+    }
+});
+
 // ✅ Staff: get my offers (optional status filter)
 router.get("/my", requireAuth, async(req, res) => {
     try {
@@ -234,11 +406,14 @@ router.patch("/:id/respond", requireAuth, async(req, res) => {
             return res.status(403).json({ message: "Not yours" });
         }
 
+        const previousStatus = offer.status;
         if (action === "accept") offer.status = "user_accepted";
         else if (action === "reject") offer.status = "rejected";
         else return res.status(400).json({ message: "Invalid action" });
 
         await offer.save();
+        publishOffers("offer.responded", [offer._id], {
+            [offer._id]: previousStatus });
         res.json({ ok: true, status: offer.status });
     } catch (err) {
         console.error("RESPOND ERROR:", err);
@@ -246,7 +421,7 @@ router.patch("/:id/respond", requireAuth, async(req, res) => {
     }
 });
 
-// ✅ Admin: pending confirmations
+// ✅ Admin: pending confirmations (?since=<cursor> -> delta, see utils/deltaSync.js)
 router.get("/pending", requireAuth, requireManagerOrAdmin, async(req, res) => {
     try {
         const filter = { status: "user_accepted" };
@@ -257,6 +432,25 @@ router.get("/pending", requireAuth, requireManagerOrAdmin, async(req, res) => {
             filter.userId = { $in: staffIds.map((s) => s._id) };
         }
 
+        if (req.query.since !== undefined) {
+            // changed offers of any status: ones no longer awaiting approval go in removed
+            const { status, ...scope } = filter;
+            return res.json(await deltaResponse(req.query, {
+                kind: "offer",
+                owners: scope.userId ? { ownerId: { $in: scope.userId.$in.map(String) } } : {},
+                full: () => Offer.find(filter)
+                    .sort({ createdAt: -1 })
+                    .populate("userId", "username fullName managerId")
+                    .populate("placementId")
+                    .lean(),
+                changed: async since => Offer.find(await offersChangedFilter(scope, since))
+                    .populate("userId", "username fullName managerId")
+                    .populate("placementId")
+                    .lean(),
+                belongs: offer => offer.status === status,
+            }));
+        }
+
         const offers = await Offer.find(filter)
             .sort({ createdAt: -1 })
             .populate("userId", "username fullName managerId")
@@ -277,11 +471,14 @@ router.patch("/:id/decision", requireAuth, requireManagerOrAdmin, async(req, res
         const offer = await Offer.findById(req.params.id);
         if (!offer) return res.status(404).json({ message: "Offer not found" });
 
+        const previousStatus = offer.status;
         if (decision === "approve") offer.status = "booking_confirmed";
         else if (decision === "reject") offer.status = "rejected";
         else return res.status(400).json({ message: "Invalid decision" });
 
         await offer.save();
+        publishOffers("offer.decided", [offer._id], {
+            [offer._id]: previousStatus });
         res.json({ ok: true, status: offer.status });
     } catch (err) {
         console.error("DECISION ERROR:", err);
@@ -303,10 +500,16 @@ router.put("/admin/offers/:id", requireAuth, requireManagerOrAdmin, async(req, r
             return res.status(400).json({ message: "Cannot edit this offer" });
         }
 
+        // not completed, so not in the stats yet: they count the hours as edited when it completes
         Object.assign(offer.placementId, req.body);
         await offer.placementId.save();
+        publishOffers("offer.updated", [offer._id]);
 
-        res.json({ success: true });
+        // populated like GET /offers/pending, so the admin app can patch its row in place
+        const updated = await Offer.findById(offer._id)
+            .populate("userId", "username fullName managerId")
+            .populate("placementId");
+        res.json({ success: true, offer: updated });
     } catch (err) {
         console.error(err);
         res.status(500).json({ message: "Edit failed" });
@@ -358,16 +561,19 @@ router.post("/:id/checkout", requireAuth, async(req, res) => {
         const amount = totalHours * hourlyRate;
 
         // Save for admin/payroll
-        if (!offer.checkInAt) offer.checkInAt = scheduledStart;
-        offer.checkOutAt = now;
-        offer.totalHoursWorked = Number(totalHours.toFixed(2));
-        offer.amountWorked = Number(amount.toFixed(2));
-        offer.completedAt = now;
-
-        offer.status = "completed";
-        await offer.save();
+        const saved = await transitionOffer(offer, {
+            checkInAt: offer.checkInAt || scheduledStart,
+            checkOutAt: now,
+            totalHoursWorked: Number(totalHours.toFixed(2)),
+            amountWorked: Number(amount.toFixed(2)),
+            completedAt: now,
+            status: "completed",
+        });
+        if (!saved) return res.status(409).json({ message: "Offer was already checked out or changed" });
+        publishOffers("offer.completed", [saved._id], {
+            [saved._id]: "booking_confirmed" });
 
-        return res.json({ ok: true, status: offer.status });
+        return res.json({ ok: true, status: saved.status });
     } catch (err) {
         console.error("CHECKOUT ERROR:", err);
         return res.status(500).json({ message: "Checkout failed" });
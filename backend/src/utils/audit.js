@@ -0,0 +1,72 @@
+// src/utils/audit.js
+//
+// Audit entries are buffered in memory and written in batches (one insertMany) every
+// AUDIT_FLUSH_MS, or as soon as AUDIT_BATCH are waiting, so recording an admin action costs
+// the request no database round trip. Each entry keeps the time of the action as createdAt.
+// A crash loses at most the last flush interval; server.js flushes on SIGTERM (dyno restarts).
+// A batch that fails to reach the database (nothing written) goes back in the buffer and is
+// retried on the next timer tick; while writes keep failing the buffer holds the newest
+// AUDIT_MAX_PENDING entries and drops older ones.
+
+import AuditLog from "../models/AuditLog.js";
+
+const AUDIT_BATCH = 200;
+const AUDIT_FLUSH_MS = 1000;
+const AUDIT_MAX_PENDING = 10000; // while writes fail, older entries beyond this are dropped
+
+let pending = [];
+let timer = null;
+let failing = false; // the last write failed: retry on the timer, not on every new entry
+const writing = new Set();
+
+/**
+ * Record an admin action (never throws, never waits).
+ */
+export function audit(actorId, action, targetType, targetId, meta) {
+    pending.push({ actorId, action, targetType, targetId, meta: meta || {}, createdAt: new Date() });
+    capPending();
+
+    if (pending.length >= AUDIT_BATCH && !failing) flushAudit();
+    else schedule();
+}
+
+function capPending() {
+    if (pending.length > AUDIT_MAX_PENDING) pending.splice(0, pending.length - AUDIT_MAX_PENDING);
+}
+
+function schedule() {
+    if (!timer) timer = setTimeout(flushAudit, AUDIT_FLUSH_MS);
+}
+
+// A write that failed outright (no writeErrors: the database was not reached) is retried;
+// entries the server rejected one by one would only fail again, and the rest were written.
+function requeue(batch, err) {
+    if (err && err.writeErrors) return;
+    failing = true;
+    pending = batch.concat(pending); // keep the order entries were recorded in
+    capPending();
+    schedule();
+}
+
+/**
+ * Write everything buffered now; resolves once every write in flight has finished.
+ * A failed batch is logged and re-queued (audit must not take the API down with it).
+ */
+export function flushAudit() {
+    clearTimeout(timer);
+    timer = null;
+
+    if (pending.length) {
+        const batch = pending;
+        pending = [];
+        const write = AuditLog.insertMany(batch, { ordered: false })
+            .then(() => { failing = false; })
+            .catch((err) => {
+                console.error("AUDIT FLUSH ERROR:", err.message || err);
+                requeue(batch, err);
+            })
+            .finally(() => writing.delete(write));
+        writing.add(write);
+    }
+    return Promise.all([...writing]).then(() => undefined);
+}
@@ -0,0 +1,101 @@
+// src/utils/deltaSync.js
+//
+// Delta sync for list endpoints: GET <list>?since=<cursor> returns only what changed.
+//
+//   ?since=0 (or an unreadable / expired cursor)
+//       -> { items: [...the whole list], removed: [], cursor, full: true }
+//   ?since=<cursor from the previous response>
+//       -> { items: [...changed records still in the list], removed: [ids], cursor, full: false }
+//
+// "Changed" is updatedAt (timestamps: true) at or after the cursor. removed holds tombstones
+// (deleted records) plus changed records that no longer belong in the list, e.g. an offer
+// that stopped being pending. The cursor is opaque to clients; it is the query's start time
+// less SYNC_SKEW_MS, so a write committed while the query ran (or stamped by a dyno whose
+// clock lags) is sent again next time rather than missed. Repeats are harmless: clients
+// merge by _id.
+
+import Placement from "../models/Placement.js";
+import Tombstone from "../models/Tombstone.js";
+
+const SYNC_SKEW_MS = 5000;
+const TOMBSTONE_TTL_DAYS = 30; // matches the TTL index on Tombstone.deletedAt
+
+export function encodeSince(ms) {
+    return Buffer.from(String(ms)).toString("base64url");
+}
+
+/**
+ * The cursor's time, or null when the client needs the full list: no cursor, "0",
+ * unreadable, or older than the tombstones we still keep.
+ */
+export function decodeSince(cursor) {
+    const ms = Number(Buffer.from(String(cursor || ""), "base64url").toString("utf8"));
+    if (!Number.isFinite(ms) || ms <= 0) return null;
+    if (ms < Date.now() - TOMBSTONE_TTL_DAYS * 24 * 3600 * 1000) return null;
+    return new Date(ms);
+}
+
+/**
+ * Remember deleted records for clients syncing later. ownerId: the staff member an offer
+ * belonged to, so /admin/offers/by-staff/:id only reports its own. Never throws: a lost
+ * tombstone leaves a stale row on a client until its next full load.
+ */
+export async function recordTombstones(kind, ids, ownerId = "") {
+    try {
+        if (!ids || !ids.length) return;
+        await Tombstone.insertMany(ids.map(id => ({
+            kind,
+            entityId: String(id),
+            ownerId: ownerId ? String(ownerId) : "",
+        })));
+    } catch (err) {
+        console.error("TOMBSTONE ERROR:", err);
+    }
+}
+
+/**
+ * Build the ?since response for one list.
+ *   full(): the whole list, as the endpoint returns it without ?since
+ *   changed(since): records updated since, including ones that may have left the list
+ *   belongs(record): whether a changed record is (still) in the list
+ *   owners: Tombstone filter narrowing which deletions this caller sees ({ ownerId: ... })
+ */
+export async function deltaResponse(query, { kind, full, changed, belongs = () => true, owners = {} }) {
+    const startedAt = Date.now();
+    const cursor = encodeSince(startedAt - SYNC_SKEW_MS);
+    const since = decodeSince(query.since);
+
+    if (!since) {
+        return { items: await full(), removed: [], cursor, full: true };
+    }
+
+    const [rows, tombstones] = await Promise.all([
+        changed(since),
+        kind ?
+        Tombstone.find({ ...owners, kind, deletedAt: { $gte: since } }).select("entityId").lean() :
+        [],
+    ]);
+
+    const items = [];
+    const removed = tombstones.map(t => t.entityId);
+    for (const row of rows) {
+        if (belongs(row)) items.push(row);
+        else removed.push(String(row._id));
+    }
+    return { items, removed, cursor, full: false };
+}
+
+/**
+ * Offer filter for "changed since": the offer itself, or the placement it is shown with
+ * (editing a shift saves the Placement, not the Offer).
+ */
+export async function offersChangedFilter(filter, since) {
+    const placements = await Placement.find({ updatedAt: { $gte: since } }).select("_id").lean();
+    return {
+        ...filter,
+        $or: [
+            { updatedAt: { $gte: since } },
+            { placementId: { $in: placements.map(p => p._id) } },
+        ],
+    };
+}
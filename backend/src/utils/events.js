@@ -0,0 +1,118 @@
+// src/utils/events.js
+//
+// Live offer events for the admin desktop app, streamed as Server-Sent Events from
+// GET /admin/events. Routes publish what changed (publishOffers / publishOfferRemoved);
+// every connected admin, and the manager owning the staff member, gets it.
+//
+// The last EVENT_BUFFER events are kept so a client reconnecting with Last-Event-ID gets
+// exactly what it missed. An id older than the buffer, or from before a restart (ids start
+// at the boot time), gets a "reset" event instead and the client reloads.
+// In-process only: with several dynos each stream sees the events of its own dyno.
+
+import Offer from "../models/offer.js";
+
+const EVENT_BUFFER = 1000;
+const HEARTBEAT_MS = 25000; // the Heroku router drops connections idle for 55s
+
+let lastId = Date.now();
+const buffer = []; // { id, type, data, managerId }
+const clients = new Set(); // { res, role, userId }
+
+function visible(client, event) {
+    return client.role === "admin" || (event.managerId && event.managerId === client.userId);
+}
+
+function write(res, event) {
+    res.write(`id: ${event.id}\nevent: ${event.type}\ndata: ${JSON.stringify(event.data)}\n\n`);
+}
+
+/**
+ * Send one event to every stream allowed to see it.
+ * managerId: owner of the staff member the event is about (managers only see their own).
+ */
+export function publish(type, data, managerId = "") {
+    lastId += 1;
+    const event = { id: lastId, type, data, managerId: managerId ? String(managerId) : "" };
+
+    buffer.push(event);
+    if (buffer.length > EVENT_BUFFER) buffer.shift();
+
+    for (const client of clients) {
+        if (visible(client, event)) write(client.res, event);
+    }
+    return event.id;
+}
+
+/**
+ * Publish offer events (offer.created, offer.responded, ...) with each offer as the
+ * desktop app reads it: userId (username, fullName, managerId) and placementId populated,
+ * all re-read in one query. previous: offer id -> status before the change.
+ * Never throws: a lost event only costs the client a refresh.
+ */
+export async function publishOffers(type, ids, previous = {}) {
+    try {
+        if (!ids || !ids.length) return;
+        const offers = await Offer.find({ _id: { $in: ids } })
+            .populate("userId", "username fullName managerId")
+            .populate("placementId")
+            .lean();
+
+        for (const offer of offers) {
+            const managerId = offer.userId && offer.userId.managerId;
+            publish(type, { offer, previousStatus: previous[String(offer._id)] || "" }, managerId);
+        }
+    } catch (err) {
+        console.error("PUBLISH EVENT ERROR:", err);
+    }
+}
+
+/**
+ * offer.removed for a deleted offer (there is nothing left to re-read).
+ * offer: the deleted document; managerId: owner of its staff member.
+ */
+export function publishOfferRemoved(offer, managerId) {
+    publish("offer.removed", {
+        offerId: String(offer._id),
+        userId: String(offer.userId),
+        previousStatus: offer.status,
+    }, managerId);
+}
+
+/**
+ * GET handler streaming events. Resumes after the Last-Event-ID header (or ?since=)
+ * when those events are still buffered; otherwise sends "reset" so the client reloads.
+ */
+export function streamEvents(req, res) {
+    res.set({
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        Connection: "keep-alive",
+        "X-Accel-Buffering": "no",
+    });
+    res.flushHeaders();
+
+    const client = { res, role: req.user.role, userId: String(req.user.id) };
+    const since = Number(req.get("Last-Event-ID") || req.query.since || 0);
+
+    res.write("retry: 3000\n\n");
+    if (since) {
+        const oldest = buffer.length ? buffer[0].id : lastId + 1;
+        if (since < oldest - 1 || since > lastId) {
+            write(res, { id: lastId, type: "reset", data: {} });
+        } else {
+            for (const event of buffer) {
+                if (event.id > since && visible(client, event)) write(res, event);
+            }
+        }
+    } else {
+        // where this stream starts, so the client can resume from here
+        write(res, { id: lastId, type: "hello", data: {} });
+    }
+
+    clients.add(client);
+    const heartbeat = setInterval(() => res.write(": ping\n\n"), HEARTBEAT_MS);
+    req.on("close", () => {
+        clearInterval(heartbeat);
+        clients.delete(client);
+    });
+}
@@ -0,0 +1,16 @@
+// src/utils/pay.js
+//
+// Fixed-point pay arithmetic shared by payroll (routes/admin.js) and the staff stats rollup
+// (utils/staffStats.js), so both add up the same pence.
+
+// Hours and pounds as whole hundredths, rounded half up (the same fixed point as the desktop
+// app's records.py); the bias keeps decimals such as 1.005 on the side they were written on.
+export function hundredths(value) {
+    return Math.floor(Number(value || 0) * 100 + 0.5 + 1e-7);
+}
+
+// One shift's pay in whole pence. Totals add these up, so they always equal the sum of the
+// payslip lines (and the desktop app's PayrollEngine).
+export function shiftPayPence(hours, rate) {
+    return Math.floor((hundredths(hours) * hundredths(rate) + 50) / 100);
+}
@@ -0,0 +1,90 @@
+// src/utils/payrollSnapshots.js
+//
+// Closed pay periods are frozen into PayrollSnapshot documents: the first request after a
+// period closes builds its bundle (summary + shift rows) from the offers one last time and
+// stores it gzipped under the sha256 of its JSON. From then on the period is served from
+// that document, as stored, and never recomputed; the hash is the ETag, so clients can keep
+// it forever (admin/api_client.py keeps it on disk).
+//
+// A period closes SNAPSHOT_GRACE_DAYS after its `to` date, so shifts checked out or
+// completed late still make it in. Anything completed for it after that is not in the
+// snapshot (and belongs on a later payslip).
+
+import crypto from "crypto";
+import zlib from "zlib";
+import { promisify } from "util";
+
+import PayrollSnapshot from "../models/PayrollSnapshot.js";
+
+const gzip = promisify(zlib.gzip);
+const gunzip = promisify(zlib.gunzip);
+
+const DAY_MS = 24 * 3600 * 1000;
+const SNAPSHOT_GRACE_DAYS = 3;
+
+export function periodClosed(period, now = Date.now()) {
+    const end = Date.parse(`${period.to}T00:00:00.000Z`) + DAY_MS; // end of the `to` day
+    return now >= end + SNAPSHOT_GRACE_DAYS * DAY_MS;
+}
+
+// lean() hands Buffer fields back as BSON Binary
+function bodyBytes(snapshot) {
+    const body = snapshot.body;
+    return Buffer.isBuffer(body) ? body : Buffer.from(body.buffer);
+}
+
+/**
+ * The closed period's snapshot (lean), frozen now from build() if it has none yet.
+ * build() -> the bundle, as GET /admin/payroll/period/:payDate/bundle returns it.
+ */
+export async function periodSnapshot(period, build) {
+    const found = await PayrollSnapshot.findOne({ payDate: period.payDate }).lean();
+    if (found) return found;
+
+    const bundle = await build();
+    const json = JSON.stringify(bundle);
+    const hash = crypto.createHash("sha256").update(json).digest("hex");
+    const frozenAt = new Date();
+    const body = await gzip(JSON.stringify({ ...bundle, snapshot: { hash, frozenAt } }));
+
+    try {
+        const created = await PayrollSnapshot.create({
+            payDate: period.payDate,
+            hash,
+            body,
+            size: Buffer.byteLength(json),
+            shiftCount: (bundle.shifts || []).length,
+            frozenAt,
+        });
+        return created.toObject();
+    } catch (err) {
+        // another request froze it first: theirs is the snapshot
+        if (err.code === 11000) return PayrollSnapshot.findOne({ payDate: period.payDate }).lean();
+        throw err;
+    }
+}
+
+/** The snapshot's bundle, decoded (for routes that serve part of it). */
+export async function snapshotBundle(snapshot) {
+    return JSON.parse((await gunzip(bodyBytes(snapshot))).toString("utf8"));
+}
+
+/**
+ * Send a snapshot as stored: gzip when the client accepts it, cacheable forever by hash.
+ */
+export async function sendSnapshot(req, res, snapshot) {
+    res.set({
+        ETag: `"${snapshot.hash}"`,
+        "Cache-Control": "private, max-age=31536000, immutable",
+        "X-Payroll-Snapshot": snapshot.hash,
+        Vary: "Accept-Encoding",
+    });
+    if (req.fresh) return res.status(304).end();
+
+    res.type("application/json");
+    if (req.acceptsEncodings("gzip")) {
+        res.set("Content-Encoding", "gzip");
+        return res.send(bodyBytes(snapshot));
+    }
+    return res.send(await gunzip(bodyBytes(snapshot)));
+}
@@ -0,0 +1,123 @@
+// src/utils/staffSearch.js
+//
+// Staff search keys and ranking, shared by the User model (which stores the keys) and
+// GET /admin/staff?q= (which queries and ranks them). Mirrors admin/search_index.py
+// (RankedIndex) so the desktop app and the server order results the same way.
+
+// Match tiers, best first
+export const EXACT = 0;
+export const PREFIX = 1;
+export const SUBSTRING = 2;
+export const FUZZY = 3;
+
+// Case- and accent-insensitive form: "Zoë Ångström" -> "zoe angstrom"
+export function normalizeText(text) {
+    return String(text || "").normalize("NFKD").replace(/\p{M}/gu, "").toLowerCase();
+}
+
+// Plain alphanumeric words: "j.smith@mail.com" -> ["j", "smith", "mail", "com"]
+export function searchWords(text) {
+    return normalizeText(text).match(/[0-9a-z]+/g) || [];
+}
+
+// Trigrams of "$" + word; the "$" marks the start so prefixes share their first gram
+export function trigrams(word) {
+    const padded = `$${word}`;
+    const grams = new Set();
+    for (let i = 0; i + 3 <= padded.length; i += 1) grams.add(padded.slice(i, i + 3));
+    return grams;
+}
+
+// Edits a query word may be away from a match: none up to 3 letters, then 1, then 2
+export function typoBudget(term) {
+    if (term.length < 4) return 0;
+    return term.length < 8 ? 1 : 2;
+}
+
+// Fewest edits (insert, delete, substitute, swap neighbours) turning term into some prefix
+// of word, or limit + 1 when it takes more than limit.
+export function prefixDistance(term, word, limit) {
+    if (word.length < term.length - limit) return limit + 1;
+    word = word.slice(0, term.length + limit); // longer prefixes cost more than limit edits anyway
+
+    let prev2 = null;
+    let prev = Array.from({ length: word.length + 1 }, (_, j) => j);
+    for (let i = 1; i <= term.length; i += 1) {
+        const cur = [i];
+        for (let j = 1; j <= word.length; j += 1) {
+            const cost = term[i - 1] === word[j - 1] ? 0 : 1;
+            cur[j] = Math.min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost);
+            if (i > 1 && j > 1 && term[i - 1] === word[j - 2] && term[i - 2] === word[j - 1]) {
+                cur[j] = Math.min(cur[j], prev2[j - 2] + 1);
+            }
+        }
+        if (Math.min(...cur) > limit) return limit + 1;
+        prev2 = prev;
+        prev = cur;
+    }
+
+    const lo = Math.max(1, term.length - limit);
+    const hi = Math.min(word.length, term.length + limit);
+    const best = lo <= hi ? Math.min(...prev.slice(lo, hi + 1)) : limit + 1;
+    return best <= limit ? best : limit + 1;
+}
+
+// [tier, typos] for how well one query word matches one stored word, or null
+export function scoreWord(term, word) {
+    if (word === term) return [EXACT, 0];
+    if (word.startsWith(term)) return [PREFIX, 0];
+    if (word.includes(term)) return [SUBSTRING, 0];
+
+    const budget = typoBudget(term);
+    if (!budget || word[0] !== term[0]) return null;
+    const typos = prefixDistance(term, word, budget);
+    return typos <= budget ? [FUZZY, typos] : null;
+}
+
+// Stored on each user: distinct words of name/username/email and their trigrams
+export function staffSearchKeys(user) {
+    const words = [...new Set(searchWords(`${user.fullName || ""} ${user.username || ""} ${user.email || ""}`))];
+    const grams = new Set();
+    for (const word of words) {
+        for (const gram of trigrams(word)) grams.add(gram);
+    }
+    return { searchTokens: words, searchGrams: [...grams] };
+}
+
+// Candidate trigrams for the fuzzy stage of a query
+export function queryGrams(terms) {
+    const grams = new Set();
+    for (const term of terms) {
+        if (term.length < 3) continue;
+        for (const gram of trigrams(term)) grams.add(gram);
+    }
+    return [...grams];
+}
+
+/**
+ * Orders docs (with searchTokens) best match first: every term must match some word; a doc
+ * scores the sum of its best tier per term, then the typos, then its original order.
+ * Docs that do not match every term are dropped.
+ */
+export function rankBySearch(terms, docs) {
+    const scored = [];
+    docs.forEach((doc, order) => {
+        let tier = 0;
+        let typos = 0;
+        for (const term of terms) {
+            let best = null;
+            for (const word of doc.searchTokens || []) {
+                const score = scoreWord(term, word);
+                if (score && (!best || score[0] < best[0] || (score[0] === best[0] && score[1] < best[1]))) {
+                    best = score;
+                }
+            }
+            if (!best) return;
+            tier += best[0];
+            typos += best[1];
+        }
+        scored.push({ doc, tier, typos, order });
+    });
+    scored.sort((a, b) => a.tier - b.tier || a.typos - b.typos || a.order - b.order);
+    return scored.map(s => s.doc);
+}
@@ -0,0 +1,193 @@
+// src/utils/staffStats.js
+//
+// Per-staff offer statistics materialized on User.stats, so the staff profile
+// (GET /admin/staff/:id) reads one document and the roster sorted by hours or last job
+// (GET /admin/staff?sort=) is one indexed sort, instead of aggregating every offer.
+//
+//   jobs       completed offers
+//   hours      their placements' totalHours, in hundredths
+//   pay        their pay in pence (shiftPayPence per shift, as payroll adds it up)
+//   lastJobAt  createdAt of the staff member's newest offer, any status
+//
+// Routes apply each change as a single $inc / $max / $set on the staff document right
+// after the offer write. Status changes the stats count go through transitionOffer, a
+// conditional update on the status that was read, so two requests racing to complete the
+// same offer cannot both count it. Placements are only editable before their offer completes
+// (PUT /offers/admin/offers/:id, PATCH /admin/offers/:offerId), so a counted shift's hours
+// and rate never change under the stats. rebuildStaffStats recomputes everything from
+// the offers: at boot for accounts without stats, and from rebuild_staff_stats.js to verify
+// or repair drift (e.g. a crash between an offer write and its stats update).
+
+import Offer from "../models/offer.js";
+import Placement from "../models/Placement.js";
+import User from "../models/User.js";
+import { hundredths, shiftPayPence } from "./pay.js";
+
+const COMPLETED = "completed";
+
+function emptyStats() {
+    return { jobs: 0, hours: 0, pay: 0, lastJobAt: null };
+}
+
+// What one completed shift adds to its staff member's stats
+function shiftStats(placement) {
+    const p = placement || {};
+    return { jobs: 1, hours: hundredths(p.totalHours), pay: shiftPayPence(p.totalHours, p.hourlyRate) };
+}
+
+// Stats writes never fail the request that changed the offer; a rebuild repairs the drift
+function guarded(update) {
+    return async(...args) => {
+        try {
+            await update(...args);
+        } catch (err) {
+            console.error("STAFF STATS ERROR:", err);
+        }
+    };
+}
+
+async function incStats(userId, delta, sign) {
+    if (!delta.jobs && !delta.hours && !delta.pay) return;
+    await User.updateOne({ _id: userId }, {
+        $inc: {
+            "stats.jobs": sign * delta.jobs,
+            "stats.hours": sign * delta.hours,
+            "stats.pay": sign * delta.pay,
+        },
+    });
+}
+
+// The offer's placement with totalHours / hourlyRate, populated or not
+async function placementOf(offer) {
+    const p = offer.placementId;
+    if (p && p.venue !== undefined) return p; // populated (venue is required)
+    return Placement.findById(p).select("totalHours hourlyRate").lean();
+}
+
+/**
+ * Profile / roster fields for a staff document: the rollup in the units the desktop app
+ * shows (hours and pounds) in place of the stored stats.
+ */
+export function staffWithStats(user) {
+    const { stats, ...rest } = user.toObject ? user.toObject() : user;
+    const s = stats || emptyStats();
+    return {
+        ...rest,
+        totalJobsWorked: s.jobs || 0,
+        totalHoursWorked: (s.hours || 0) / 100,
+        totalEarnings: (s.pay || 0) / 100,
+        lastJobAt: s.lastJobAt ? new Date(s.lastJobAt).toISOString() : "",
+    };
+}
+
+/** New offers: bump their staff members' lastJobAt. offers: [{ userId, createdAt }] */
+export const statsOffersCreated = guarded(async(offers) => {
+    const ops = offers.map(o => ({
+        updateOne: {
+            filter: { _id: o.userId },
+            update: { $max: { "stats.lastJobAt": o.createdAt || new Date() } },
+        },
+    }));
+    if (ops.length) await User.bulkWrite(ops, { ordered: false });
+});
+
+/** An offer's status was saved: count it in or out when it crossed "completed". */
+const statsStatusChanged = guarded(async(offer, previousStatus) => {
+    const was = previousStatus === COMPLETED;
+    const now = offer.status === COMPLETED;
+    if (was === now) return;
+    await incStats(offer.userId, shiftStats(await placementOf(offer)), now ? 1 : -1);
+});
+
+/**
+ * Save a status change (update: the fields to $set) only if the offer is still in the status
+ * it was read with, then count it. Returns the updated offer, or null when another request
+ * changed the status first (the caller answers 409).
+ */
+export async function transitionOffer(offer, update) {
+    const previousStatus = offer.status;
+    const saved = await Offer.findOneAndUpdate(
+        { _id: offer._id, status: previousStatus }, { $set: update }, { new: true });
+    if (saved) await statsStatusChanged(saved, previousStatus);
+    return saved;
+}
+
+/** An offer was deleted (placement: its placement, read before deleting). */
+export const statsOfferRemoved = guarded(async(offer, placement) => {
+    if (offer.status === COMPLETED) await incStats(offer.userId, shiftStats(placement), -1);
+
+    // lastJobAt can only go backwards by looking again
+    const newest = await Offer.findOne({ userId: offer.userId }).sort({ createdAt: -1 }).select("createdAt").lean();
+    await User.updateOne({ _id: offer.userId }, { $set: { "stats.lastJobAt": newest ? newest.createdAt : null } });
+});
+
+function sameStats(a, b) {
+    const t = d => (d ? new Date(d).getTime() : 0);
+    return !!a && a.jobs === b.jobs && a.hours === b.hours && a.pay === b.pay && t(a.lastJobAt) === t(b.lastJobAt);
+}
+
+/**
+ * Recompute stats from the offers and write the ones that drifted.
+ *   missingOnly: only accounts that have no stats yet (the boot-time backfill)
+ *   dryRun: report drift without writing (verify)
+ * Each write only lands if the stored stats are still what was read, so an offer completed
+ * meanwhile is not overwritten (that account is simply checked again next run).
+ * Returns { checked, drifted, fixed, sample: [first drifted ids] }.
+ */
+export async function rebuildStaffStats({ missingOnly = false, dryRun = false, batchSize = 500 } = {}) {
+    const staffFilter = { role: "staff" };
+    if (missingOnly) staffFilter["stats.jobs"] = { $exists: false };
+    const staff = await User.find(staffFilter).select("stats").lean();
+    if (!staff.length) return { checked: 0, drifted: 0, fixed: 0, sample: [] };
+
+    const fresh = new Map(staff.map(u => [String(u._id), emptyStats()]));
+    const offerFilter = missingOnly ? { userId: { $in: staff.map(u => u._id) } } : {};
+
+    const newest = await Offer.aggregate([
+        { $match: offerFilter },
+        { $group: { _id: "$userId", lastJobAt: { $max: "$createdAt" } } },
+    ]);
+    for (const row of newest) {
+        const s = fresh.get(String(row._id));
+        if (s) s.lastJobAt = row.lastJobAt;
+    }
+
+    const completed = Offer.find({ ...offerFilter, status: COMPLETED })
+        .select("userId placementId")
+        .populate("placementId", "totalHours hourlyRate")
+        .lean()
+        .cursor({ batchSize });
+    for await (const o of completed) {
+        const s = fresh.get(String(o.userId));
+        if (!s) continue;
+        const add = shiftStats(o.placementId);
+        s.jobs += add.jobs;
+        s.hours += add.hours;
+        s.pay += add.pay;
+    }
+
+    const drifted = [];
+    let fixed = 0;
+    let ops = [];
+    const flush = async() => {
+        if (ops.length) fixed += (await User.bulkWrite(ops, { ordered: false })).modifiedCount;
+        ops = [];
+    };
+    for (const u of staff) {
+        const s = fresh.get(String(u._id));
+        if (sameStats(u.stats, s)) continue;
+        drifted.push(String(u._id));
+        if (dryRun) continue;
+
+        const unchanged = u.stats ? {
+            "stats.jobs": u.stats.jobs,
+            "stats.hours": u.stats.hours,
+            "stats.pay": u.stats.pay,
+        } : { "stats.jobs": { $exists: false } };
+        ops.push({ updateOne: { filter: { _id: u._id, ...unchanged }, update: { $set: { stats: s } } } });
+        if (ops.length >= batchSize) await flush();
+    }
+    await flush();
+
+    return { checked: staff.length, drifted: drifted.length, fixed, sample: drifted.slice(0, 20) };
+}
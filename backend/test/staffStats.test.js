@@ -0,0 +1,98 @@
+// test/staffStats.test.js
+//
+// User.stats kept by the offer routes, checked against a real MongoDB:
+//   MONGO_TEST_URI=mongodb://localhost:27017/recruitment_test npm test
+// Skipped without MONGO_TEST_URI. The database is dropped afterwards.
+
+import { after, before, test } from "node:test";
+import assert from "node:assert/strict";
+import express from "express";
+import jwt from "jsonwebtoken";
+import mongoose from "mongoose";
+
+import offerRoutes from "../src/routes/offers.js";
+import adminRoutes from "../src/routes/admin.js";
+import Offer from "../src/models/offer.js";
+import Placement from "../src/models/Placement.js";
+import User from "../src/models/User.js";
+import { flushAudit } from "../src/utils/audit.js";
+
+const uri = process.env.MONGO_TEST_URI;
+const skip = uri ? false : "MONGO_TEST_URI not set";
+
+let server;
+let baseUrl;
+let token;
+
+before(async() => {
+    if (skip) return;
+    process.env.JWT_SECRET = process.env.JWT_SECRET || "test-secret";
+    await mongoose.connect(uri);
+    await mongoose.connection.dropDatabase();
+
+    const app = express();
+    app.use(express.json());
+    app.use("/offers", offerRoutes);
+    app.use("/admin", adminRoutes);
+    server = app.listen(0);
+    baseUrl = `http://127.0.0.1:${server.address().port}`;
+
+    const adminUser = await User.create({ username: "admin", passwordHash: "x", role: "admin" });
+    token = jwt.sign({ id: String(adminUser._id), role: "admin", username: "admin" }, process.env.JWT_SECRET);
+});
+
+after(async() => {
+    if (skip) return;
+    server.close();
+    await flushAudit(); // the routes' audit timer would keep the process alive
+    await mongoose.connection.dropDatabase();
+    await mongoose.disconnect();
+});
+
+function call(method, path, body) {
+    return fetch(`${baseUrl}${path}`, {
+        method,
+        headers: { Authorization: `Bearer ${token}`, "Content-Type": "application/json" },
+        body: body ? JSON.stringify(body) : undefined,
+    });
+}
+
+async function offerFor(username, placement) {
+    const staff = await User.create({ username, passwordHash: "x", role: "staff" });
+    const p = await Placement.create({ venue: "Hall", roleTitle: "Waiter", date: new Date(), ...placement });
+    const offer = await Offer.create({ userId: staff._id, placementId: p._id, status: "user_accepted" });
+    return { staff, offer };
+}
+
+async function statsOf(staff) {
+    return (await User.findById(staff._id).lean()).stats;
+}
+
+test("completing an offer counts its placement's hours as edited", { skip }, async() => {
+    const { staff, offer } = await offerFor("edited", { totalHours: 4, hourlyRate: 12 });
+
+    const edit = await call("PUT", `/offers/admin/offers/${offer._id}`, { totalHours: 6.5 });
+    assert.equal(edit.status, 200);
+    assert.equal((await statsOf(staff)).hours, 0); // not completed yet: nothing counted
+
+    const done = await call("POST", `/admin/offers/${offer._id}/complete`);
+    assert.equal(done.status, 200);
+    const stats = await statsOf(staff);
+    assert.equal(stats.jobs, 1);
+    assert.equal(stats.hours, 650);
+    assert.equal(stats.pay, 7800);
+});
+
+test("a completed offer's placement cannot be edited under its stats", { skip }, async() => {
+    const { staff, offer } = await offerFor("locked", { totalHours: 3, hourlyRate: 10 });
+    await call("POST", `/admin/offers/${offer._id}/complete`);
+
+    const put = await call("PUT", `/offers/admin/offers/${offer._id}`, { totalHours: 8 });
+    assert.equal(put.status, 400);
+    const patch = await call("PATCH", `/admin/offers/${offer._id}`, { placementId: { totalHours: 8 } });
+    assert.equal(patch.status, 400);
+
+    const stats = await statsOf(staff);
+    assert.equal(stats.hours, 300);
+    assert.equal((await Placement.findById(offer.placementId).lean()).totalHours, 3);
+});